@@ -0,0 +1,70 @@
+"""add_page_performance_metric_table
+
+Revision ID: 7b2f9c1d4e60
+Revises: 3346963c8a10
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+
+
+# revision identifiers, used by Alembic.
+revision = "7b2f9c1d4e60"
+down_revision = "3346963c8a10"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "page_performance_metric",
+        sa.Column("metric_id", sa.Integer(), primary_key=True),
+        sa.Column(
+            "page_id",
+            sa.Integer(),
+            sa.ForeignKey("page.page_id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column(
+            "environment_id",
+            sa.String(36),
+            sa.ForeignKey("environment.environment_id", ondelete="SET NULL"),
+            nullable=True,
+        ),
+        sa.Column("url", sa.String(2048), nullable=False),
+        sa.Column("browser", sa.String(32), nullable=True),
+        sa.Column("navigation_type", sa.String(32), nullable=True),
+        # Navigation Timing
+        sa.Column("time_to_first_byte_ms", sa.Float(), nullable=True),
+        sa.Column("dom_interactive_ms", sa.Float(), nullable=True),
+        sa.Column("dom_content_loaded_ms", sa.Float(), nullable=True),
+        sa.Column("load_event_ms", sa.Float(), nullable=True),
+        sa.Column("transfer_size_bytes", sa.BigInteger(), nullable=True),
+        # Paint Timing
+        sa.Column("first_paint_ms", sa.Float(), nullable=True),
+        sa.Column("first_contentful_paint_ms", sa.Float(), nullable=True),
+        # Resource Timing
+        sa.Column("resource_count", sa.Integer(), nullable=True),
+        sa.Column("resource_transfer_bytes", sa.BigInteger(), nullable=True),
+        sa.Column("slowest_resources", JSONB, nullable=True),
+        # Chrome DevTools Performance.getMetrics
+        sa.Column("cdp_metrics", JSONB, nullable=True),
+        sa.Column("collected_at", sa.DateTime(), nullable=False),
+    )
+
+    op.create_index(
+        "idx_page_performance_page_env_collected",
+        "page_performance_metric",
+        ["page_id", "environment_id", "collected_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "idx_page_performance_page_env_collected",
+        table_name="page_performance_metric",
+    )
+    op.drop_table("page_performance_metric")
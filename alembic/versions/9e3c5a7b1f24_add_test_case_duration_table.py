@@ -0,0 +1,47 @@
+"""add_test_case_duration_table
+
+Revision ID: 9e3c5a7b1f24
+Revises: 7b2f9c1d4e60
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "9e3c5a7b1f24"
+down_revision = "7b2f9c1d4e60"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "test_case_duration",
+        sa.Column("duration_id", sa.Integer(), primary_key=True),
+        sa.Column(
+            "test_case_id",
+            sa.String(36),
+            sa.ForeignKey("test_case.test_case_id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("duration_seconds", sa.Float(), nullable=False),
+        sa.Column("outcome", sa.String(16), nullable=False),
+        sa.Column("worker", sa.String(64), nullable=True),
+        sa.Column("recorded_at", sa.DateTime(), nullable=False),
+    )
+
+    op.create_index(
+        "idx_test_case_duration_test_recorded",
+        "test_case_duration",
+        ["test_case_id", "recorded_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "idx_test_case_duration_test_recorded", table_name="test_case_duration"
+    )
+    op.drop_table("test_case_duration")
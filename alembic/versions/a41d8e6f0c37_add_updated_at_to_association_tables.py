@@ -0,0 +1,29 @@
+"""add_updated_at_to_association_tables
+
+Revision ID: a41d8e6f0c37
+Revises: 9e3c5a7b1f24
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "a41d8e6f0c37"
+down_revision = "9e3c5a7b1f24"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # updated_at feeds the plan manifest version stamp; backfill from created_at
+    for table_name in ("plan_suite_association", "suite_test_case_association"):
+        op.add_column(table_name, sa.Column("updated_at", sa.DateTime(), nullable=True))
+        op.execute(f"UPDATE {table_name} SET updated_at = created_at")
+
+
+def downgrade() -> None:
+    op.drop_column("suite_test_case_association", "updated_at")
+    op.drop_column("plan_suite_association", "updated_at")
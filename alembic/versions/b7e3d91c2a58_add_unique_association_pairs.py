@@ -0,0 +1,48 @@
+"""add_unique_association_pairs
+
+Revision ID: b7e3d91c2a58
+Revises: a41d8e6f0c37
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "b7e3d91c2a58"
+down_revision = "a41d8e6f0c37"
+branch_labels = None
+depends_on = None
+
+PAIRS = (
+    ("plan_suite_association", "plan_id", "suite_id", "uq_plan_suite_pair"),
+    (
+        "suite_test_case_association",
+        "suite_id",
+        "test_case_id",
+        "uq_suite_test_case_pair",
+    ),
+)
+
+
+def upgrade() -> None:
+    # replace_* used to deactivate and re-insert, leaving duplicate pairs behind.
+    # Keep one row per pair, preferring the active and then the newest row.
+    for table_name, parent, child, constraint in PAIRS:
+        op.execute(
+            f"""
+            DELETE FROM {table_name} a
+            USING {table_name} b
+            WHERE a.{parent} = b.{parent}
+              AND a.{child} = b.{child}
+              AND (a.is_active, a.created_at, a.association_id)
+                < (b.is_active, b.created_at, b.association_id)
+            """
+        )
+        op.create_unique_constraint(constraint, table_name, [parent, child])
+
+
+def downgrade() -> None:
+    for table_name, _, _, constraint in reversed(PAIRS):
+        op.drop_constraint(constraint, table_name, type_="unique")
@@ -0,0 +1,30 @@
+"""add_entity_tag_name_trigram_index
+
+Revision ID: c8f2a6d4e913
+Revises: b7e3d91c2a58
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "c8f2a6d4e913"
+down_revision = "b7e3d91c2a58"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Fuzzy tag autocomplete uses pg_trgm word similarity (<%) on tag_name
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_entitytag_tag_name_trgm "
+        "ON entity_tag USING gin (tag_name gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    # The extension is left installed; other objects may depend on it
+    op.execute("DROP INDEX IF EXISTS idx_entitytag_tag_name_trgm")
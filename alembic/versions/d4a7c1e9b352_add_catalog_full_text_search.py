@@ -0,0 +1,62 @@
+"""add_catalog_full_text_search
+
+Revision ID: d4a7c1e9b352
+Revises: c8f2a6d4e913
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "d4a7c1e9b352"
+down_revision = "c8f2a6d4e913"
+branch_labels = None
+depends_on = None
+
+
+# (table, index prefix, name column, description column or None)
+SEARCHABLE_TABLES = [
+    ("test_case", "idx_testcase", "test_name", "description"),
+    ("suite", "idx_suite", "suite_name", "description"),
+    ("plan", "idx_plan", "plan_name", None),
+    ("action_chain", "idx_actionchain", "chain_name", "description"),
+]
+
+
+def _search_document(name_column: str, description_column) -> str:
+    document = f"setweight(to_tsvector('english', coalesce({name_column}, '')), 'A')"
+    if description_column:
+        document += (
+            " || setweight(to_tsvector('english', "
+            f"coalesce({description_column}, '')), 'B')"
+        )
+    return document
+
+
+def upgrade() -> None:
+    # Partial-name matching uses trigram indexes on the name columns
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    for table, prefix, name_column, description_column in SEARCHABLE_TABLES:
+        document = _search_document(name_column, description_column)
+        op.execute(
+            f'ALTER TABLE "{table}" ADD COLUMN IF NOT EXISTS search_vector tsvector '
+            f"GENERATED ALWAYS AS ({document}) STORED"
+        )
+        op.execute(
+            f"CREATE INDEX IF NOT EXISTS {prefix}_search "
+            f'ON "{table}" USING gin (search_vector)'
+        )
+        op.execute(
+            f"CREATE INDEX IF NOT EXISTS {prefix}_name_trgm "
+            f'ON "{table}" USING gin ({name_column} gin_trgm_ops)'
+        )
+
+
+def downgrade() -> None:
+    for table, prefix, _, _ in SEARCHABLE_TABLES:
+        op.execute(f"DROP INDEX IF EXISTS {prefix}_name_trgm")
+        op.execute(f"DROP INDEX IF EXISTS {prefix}_search")
+        op.execute(f'ALTER TABLE "{table}" DROP COLUMN IF EXISTS search_vector')
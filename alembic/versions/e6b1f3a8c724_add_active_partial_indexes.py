@@ -0,0 +1,76 @@
+"""add_active_partial_indexes
+
+Revision ID: e6b1f3a8c724
+Revises: d4a7c1e9b352
+Create Date: 2026-10-18 19:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "e6b1f3a8c724"
+down_revision = "d4a7c1e9b352"
+branch_labels = None
+depends_on = None
+
+
+# (index name, table, columns) - every index is WHERE is_active = true
+ACTIVE_INDEXES = [
+    ("idx_testcase_account_active", "test_case", ["account_id"]),
+    ("idx_testcase_sut_active", "test_case", ["sut_id"]),
+    ("idx_testcase_owner_active", "test_case", ["owner_user_id"]),
+    ("idx_suite_account_active", "suite", ["account_id"]),
+    ("idx_suite_sut_active", "suite", ["sut_id"]),
+    ("idx_suite_owner_active", "suite", ["owner_user_id"]),
+    ("idx_plan_account_active", "plan", ["account_id"]),
+    ("idx_plan_owner_active", "plan", ["owner_user_id"]),
+    ("idx_actionchain_account_active", "action_chain", ["account_id"]),
+    ("idx_actionchain_sut_active", "action_chain", ["sut_id"]),
+    ("idx_actionchain_owner_active", "action_chain", ["owner_user_id"]),
+    ("idx_entitytag_account_name_active", "entity_tag", ["account_id", "tag_name"]),
+    (
+        "idx_plan_suite_plan_active",
+        "plan_suite_association",
+        ["plan_id", "execution_order"],
+    ),
+    ("idx_plan_suite_suite_active", "plan_suite_association", ["suite_id"]),
+    (
+        "idx_suite_testcase_suite_active",
+        "suite_test_case_association",
+        ["suite_id", "execution_order"],
+    ),
+    (
+        "idx_suite_testcase_test_active",
+        "suite_test_case_association",
+        ["test_case_id"],
+    ),
+]
+
+
+def upgrade() -> None:
+    # Queries filter on is_active = true, so the planner only needs live rows.
+    # Build concurrently so writes to these tables are not blocked meanwhile.
+    with op.get_context().autocommit_block():
+        for index_name, table_name, columns in ACTIVE_INDEXES:
+            op.create_index(
+                index_name,
+                table_name,
+                columns,
+                postgresql_where=sa.text("is_active = true"),
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for index_name, table_name, _ in reversed(ACTIVE_INDEXES):
+            op.drop_index(
+                index_name,
+                table_name=table_name,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
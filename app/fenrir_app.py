@@ -17,6 +17,7 @@ from slowapi.errors import RateLimitExceeded
 from app.routes import API_ROUTERS
 from app.utils import get_project_root
 from app.middleware.https_middleware import HTTPSEnforcementMiddleware
+from app.middleware.read_your_writes_middleware import ReadYourWritesMiddleware
 from common.app_logging import create_logging
 
 from app.config import get_base_app_config
@@ -70,6 +71,7 @@ class ProxyHeadersMiddleware(BaseHTTPMiddleware):
 
 
 app.add_middleware(ProxyHeadersMiddleware)
+app.add_middleware(ReadYourWritesMiddleware)
 
 app.mount(
     path="/public",
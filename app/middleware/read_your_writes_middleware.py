@@ -0,0 +1,38 @@
+"""
+Read-your-writes middleware.
+
+Binds a per-client key for read replica routing so that a client's reads go to
+the primary database for a short window after that client writes.
+"""
+
+import hashlib
+
+from fastapi import Request
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from common.service_connections.db_service.database.replica_routing import (
+    bind_read_your_writes_key,
+    reset_read_your_writes_key,
+)
+
+
+class ReadYourWritesMiddleware(BaseHTTPMiddleware):
+    """
+    Middleware to scope read-your-writes pinning to the calling client.
+
+    The key is a hash of the Authorization header, so no token decoding is
+    needed; anonymous requests are not pinned.
+    """
+
+    async def dispatch(self, request: Request, call_next):
+        authorization = request.headers.get("authorization")
+        key = (
+            hashlib.sha256(authorization.encode()).hexdigest()
+            if authorization
+            else None
+        )
+        token = bind_read_your_writes_key(key)
+        try:
+            return await call_next(request)
+        finally:
+            reset_read_your_writes_key(token)
@@ -0,0 +1,180 @@
+"""
+Fast JSON responses for lists of Pydantic models, and conditional GETs.
+
+Returning a list of models from a route makes FastAPI validate every item
+against response_model again, convert it with jsonable_encoder and then
+json.dumps the result. model_list_response serializes the models straight to
+JSON bytes with pydantic-core's serializer instead. Routes keep their
+response_model for the OpenAPI schema; FastAPI skips it when a Response is
+returned.
+
+conditional_response answers GETs of catalog resources from a version stamp
+(see resource_version_model): 304 Not Modified when the client's ETag or
+Last-Modified is current, otherwise the body from ResponseCache when it was
+built for the same version, and only then a fresh query and serialization.
+"""
+
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from email.utils import format_datetime, parsedate_to_datetime
+from functools import lru_cache
+from typing import Callable, List, Optional, Sequence, Tuple, Type
+
+from fastapi import Request, Response
+from pydantic import BaseModel, TypeAdapter
+from starlette.status import HTTP_304_NOT_MODIFIED
+
+from common.service_connections.db_service.models.resource_version_model import (
+    ResourceVersionModel,
+)
+
+# Clients must revalidate every time; the ETag makes that a 304 when unchanged
+CACHE_CONTROL = "private, no-cache"
+
+
+class PydanticJSONResponse(Response):
+    """Response whose content is already-serialized JSON bytes."""
+
+    media_type = "application/json"
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(model_cls: Type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(List[model_cls])
+
+
+def model_list_json(model_cls: Type[BaseModel], models: Sequence[BaseModel]) -> bytes:
+    """Serialize a list of model_cls instances to JSON bytes."""
+    return _list_adapter(model_cls).dump_json(models)
+
+
+def model_json(model: BaseModel) -> bytes:
+    """Serialize one model to JSON bytes."""
+    return model.model_dump_json().encode()
+
+
+def model_list_response(
+    model_cls: Type[BaseModel], models: Sequence[BaseModel]
+) -> PydanticJSONResponse:
+    """Serialize a list of model_cls instances to a JSON response."""
+    return PydanticJSONResponse(content=model_list_json(model_cls, models))
+
+
+class ResponseCache:
+    """
+    Small LRU of serialized GET bodies keyed by request path and query.
+
+    Each entry remembers the ETag it was built for, so a changed resource is
+    rebuilt on its next request and never served stale.
+    """
+
+    max_entries = 512
+
+    # "path?query" -> (etag, body)
+    _cache: "OrderedDict[str, Tuple[str, bytes]]" = OrderedDict()
+    _lock = threading.Lock()
+    hits = 0
+    misses = 0
+
+    @classmethod
+    def get(cls, key: str, etag: str) -> Optional[bytes]:
+        """Return the cached body for key if it was built for etag."""
+        with cls._lock:
+            cached = cls._cache.get(key)
+            if cached is None or cached[0] != etag:
+                cls.misses += 1
+                return None
+            cls._cache.move_to_end(key)
+            cls.hits += 1
+            return cached[1]
+
+    @classmethod
+    def put(cls, key: str, etag: str, body: bytes) -> None:
+        """Store body for key, evicting the least recently used entries."""
+        with cls._lock:
+            cls._cache[key] = (etag, body)
+            cls._cache.move_to_end(key)
+            while len(cls._cache) > cls.max_entries:
+                cls._cache.popitem(last=False)
+
+    @classmethod
+    def invalidate(cls, key: Optional[str] = None) -> None:
+        """Drop one entry, or every entry when key is None."""
+        with cls._lock:
+            if key is None:
+                cls._cache.clear()
+            else:
+                cls._cache.pop(key, None)
+
+
+def _etag_matches(if_none_match: str, version: ResourceVersionModel) -> bool:
+    # "*" only matches a representation that exists (RFC 9110 13.1.2)
+    if if_none_match.strip() == "*":
+        return version.row_count > 0
+    # Weak comparison: W/ prefixes are ignored
+    candidates = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    return f'"{version.etag}"' in candidates
+
+
+def _not_modified_since(if_modified_since: str, last_modified: datetime) -> bool:
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        return False
+    # HTTP dates have one-second resolution
+    return last_modified.replace(microsecond=0) <= since
+
+
+def is_not_modified(request: Request, version: ResourceVersionModel) -> bool:
+    """True when the request's validators show the client copy is current.
+
+    If-None-Match takes precedence; If-Modified-Since is only consulted when
+    it is absent.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return _etag_matches(if_none_match, version)
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is not None and version.last_modified is not None:
+        return _not_modified_since(if_modified_since, version.last_modified)
+    return False
+
+
+def conditional_response(
+    request: Request,
+    version: ResourceVersionModel,
+    build_body: Callable[[], bytes],
+) -> Response:
+    """
+    Respond to a GET from a resource version stamp.
+
+    Routes for a single row must raise 404 before calling this when
+    version.row_count is 0, otherwise build_body is asked for a missing row.
+
+    Args:
+        request: Incoming request (its validators and URL are used)
+        version: Current version of the requested resource
+        build_body: Queries and serializes the resource to JSON bytes; only
+            called when neither the client nor ResponseCache has this version
+
+    Returns:
+        304 response with no body, or a JSON response carrying the validators
+    """
+    headers = {"ETag": f'"{version.etag}"', "Cache-Control": CACHE_CONTROL}
+    if version.last_modified is not None:
+        headers["Last-Modified"] = format_datetime(version.last_modified, usegmt=True)
+
+    if is_not_modified(request, version):
+        return Response(status_code=HTTP_304_NOT_MODIFIED, headers=headers)
+
+    key = request.url.path
+    if request.url.query:
+        key = f"{key}?{request.url.query}"
+    body = ResponseCache.get(key, version.etag)
+    if body is None:
+        body = build_body()
+        ResponseCache.put(key, version.etag, body)
+    return PydanticJSONResponse(content=body, headers=headers)
@@ -16,6 +16,7 @@ from app.routes import (
     pages,  # Migrated to JWT auth
     plans,  # Test execution plans
     purge,  # Admin data retention
+    search,  # Catalog full-text search
     suites,  # Test suite organization
     super_admin_dashboard,  # Super admin dashboard
     system_under_test,  # Systems being tested
@@ -48,6 +49,7 @@ API_ROUTERS = [
     suites.suite_api_router,
     plans.plan_api_router,
     entity_tags.tag_api_router,
+    search.search_api_router,
     audit_logs.audit_log_api_router,
     purge.purge_api_router,
     email_processor.email_processor_api_router,
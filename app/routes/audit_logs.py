@@ -35,7 +35,7 @@ async def get_audit_log_by_id(
     current_user: TokenPayload = Depends(get_current_user),
 ):
     """Get a specific audit log entry by ID."""
-    with get_session(DB_ENGINE) as db_session:
+    with get_session(DB_ENGINE, read_only=True) as db_session:
         return query_audit_log_by_id(
             audit_log_id=audit_log_id, session=db_session, engine=DB_ENGINE
         )
@@ -52,7 +52,7 @@ async def get_audit_logs_by_entity(
     current_user: TokenPayload = Depends(get_current_user),
 ):
     """Get audit log history for a specific entity."""
-    with get_session(DB_ENGINE) as db_session:
+    with get_session(DB_ENGINE, read_only=True) as db_session:
         return query_audit_logs_by_entity(
             entity_type=entity_type,
             entity_id=entity_id,
@@ -70,7 +70,7 @@ async def get_audit_logs_by_account(
     current_user: TokenPayload = Depends(get_current_user),
 ):
     """Get audit logs for a specific account."""
-    with get_session(DB_ENGINE) as db_session:
+    with get_session(DB_ENGINE, read_only=True) as db_session:
         return query_audit_logs_by_account(
             account_id=account_id,
             limit=limit,
@@ -87,7 +87,7 @@ async def get_audit_logs_by_user(
     current_user: TokenPayload = Depends(get_current_user),
 ):
     """Get all audit logs for actions performed by a specific user."""
-    with get_session(DB_ENGINE) as db_session:
+    with get_session(DB_ENGINE, read_only=True) as db_session:
         return query_audit_logs_by_user(
             user_id=user_id,
             account_id=account_id,
@@ -106,7 +106,7 @@ async def get_audit_logs_by_action(
     current_user: TokenPayload = Depends(get_current_user),
 ):
     """Get audit logs filtered by action type."""
-    with get_session(DB_ENGINE) as db_session:
+    with get_session(DB_ENGINE, read_only=True) as db_session:
         return query_audit_logs_by_action(
             action=action,
             account_id=account_id,
@@ -125,7 +125,7 @@ async def get_sensitive_audit_logs(
 ):
     """Get all sensitive audit logs (admin only)."""
     # Note: In production, add additional authorization check for admin role
-    with get_session(DB_ENGINE) as db_session:
+    with get_session(DB_ENGINE, read_only=True) as db_session:
         return query_sensitive_audit_logs(
             account_id=account_id,
             limit=limit,
@@ -141,7 +141,7 @@ async def get_audit_log_count_endpoint(
     current_user: TokenPayload = Depends(get_current_user),
 ):
     """Get the total count of audit logs."""
-    with get_session(DB_ENGINE) as db_session:
+    with get_session(DB_ENGINE, read_only=True) as db_session:
         count = get_audit_log_count(
             account_id=account_id,
             entity_type=entity_type,
@@ -2,8 +2,10 @@
 Entity Tag routes for polymorphic tagging and categorization.
 """
 
-from fastapi import APIRouter, Depends, Query
-from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
+from starlette.status import HTTP_400_BAD_REQUEST
+from pydantic import BaseModel
+from typing import Dict, List, Optional
 
 from common.service_connections.db_service.db_manager import DB_ENGINE
 from common.service_connections.db_service.database.engine import (
@@ -17,32 +19,58 @@ from app.dependencies.authorization_dependency import (
 from app.models.auth_models import TokenPayload
 
 from common.service_connections.db_service.models.entity_tag_model import (
+    BulkTagResultModel,
     EntityTagModel,
+    TagSearchResultModel,
     insert_entity_tag,
     query_entity_tag_by_id,
     query_all_entity_tags,
     query_tags_for_entity,
     query_entities_by_tag,
+    search_entities_by_tags,
     query_tags_by_category,
     query_unique_tag_names,
     add_tags_to_entity,
+    bulk_tag_entities,
     replace_entity_tags,
     update_entity_tag,
     deactivate_entity_tag,
     reactivate_entity_tag,
     drop_entity_tag,
 )
+from common.service_connections.db_service.models.tag_autocomplete_model import (
+    TagAutocompleteResultModel,
+    suggest_tag_names,
+)
 
 
 tag_api_router = APIRouter(prefix="/api/tags", tags=["tags-api"])
 
 
+class BulkTagEntity(BaseModel):
+    """An entity to tag in a bulk request."""
+
+    entity_type: str
+    entity_id: str
+
+
+class BulkTagRequest(BaseModel):
+    """Request model for tagging many entities with the same tags."""
+
+    entities: List[BulkTagEntity]
+    tag_names: List[str]
+    tag_category: str
+    account_id: str
+    tag_values: Optional[Dict[str, str]] = None
+    replace: bool = False
+
+
 @tag_api_router.get("/", response_model=List[EntityTagModel])
 async def get_all_tags(
     current_user: TokenPayload = Depends(require_member),
 ):
     """Get all entity tags."""
-    with get_session(DB_ENGINE) as db_session:
+    with get_session(DB_ENGINE, read_only=True) as db_session:
         return query_all_entity_tags(session=db_session, engine=DB_ENGINE)
 
 
@@ -57,7 +85,7 @@ async def get_tags_for_entity(
 ):
     """Get all tags for a specific entity."""
     validate_account_access(current_user, account_id)
-    with get_session(DB_ENGINE) as db_session:
+    with get_session(DB_ENGINE, read_only=True) as db_session:
         return query_tags_for_entity(
             entity_type=entity_type,
             entity_id=entity_id,
@@ -77,7 +105,7 @@ async def get_entities_by_tag(
 ):
     """Get all entity IDs with a specific tag."""
     validate_account_access(current_user, account_id)
-    with get_session(DB_ENGINE) as db_session:
+    with get_session(DB_ENGINE, read_only=True) as db_session:
         return query_entities_by_tag(
             tag_name=tag_name,
             entity_type=entity_type,
@@ -88,6 +116,57 @@ async def get_entities_by_tag(
         )
 
 
+@tag_api_router.get("/search", response_model=TagSearchResultModel)
+async def search_entities_by_tag_expression(
+    q: str = Query(
+        ..., description="Tag expression, e.g. smoke AND (login OR checkout) AND NOT flaky"
+    ),
+    entity_type: str = Query(...),
+    account_id: str = Query(...),
+    limit: int = Query(100, ge=1, le=1000),
+    offset: int = Query(0, ge=0),
+    current_user: TokenPayload = Depends(require_member),
+):
+    """Find entities matching a boolean tag expression, with per-tag facet counts."""
+    validate_account_access(current_user, account_id)
+    with get_session(DB_ENGINE, read_only=True) as db_session:
+        try:
+            return search_entities_by_tags(
+                expression=q,
+                entity_type=entity_type,
+                account_id=account_id,
+                token=current_user,
+                db_session=db_session,
+                engine=DB_ENGINE,
+                limit=limit,
+                offset=offset,
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@tag_api_router.get("/autocomplete", response_model=TagAutocompleteResultModel)
+async def autocomplete_tag_names(
+    prefix: str = Query(..., min_length=1),
+    account_id: str = Query(...),
+    limit: int = Query(10, ge=1, le=50),
+    fuzzy: bool = Query(True),
+    current_user: TokenPayload = Depends(require_member),
+):
+    """Suggest tag names starting with prefix, most used first."""
+    validate_account_access(current_user, account_id)
+    with get_session(DB_ENGINE, read_only=True) as db_session:
+        return suggest_tag_names(
+            prefix=prefix,
+            account_id=account_id,
+            token=current_user,
+            db_session=db_session,
+            engine=DB_ENGINE,
+            limit=limit,
+            fuzzy=fuzzy,
+        )
+
+
 @tag_api_router.get("/category/{category}", response_model=List[EntityTagModel])
 async def get_tags_by_category(
     category: str,
@@ -96,7 +175,7 @@ async def get_tags_by_category(
 ):
     """Get all tags in a specific category."""
     validate_account_access(current_user, account_id)
-    with get_session(DB_ENGINE) as db_session:
+    with get_session(DB_ENGINE, read_only=True) as db_session:
         return query_tags_by_category(
             category=category,
             account_id=account_id,
@@ -114,7 +193,7 @@ async def get_unique_tag_names(
 ):
     """Get unique tag names for autocomplete (optionally filtered by category)."""
     validate_account_access(current_user, account_id)
-    with get_session(DB_ENGINE) as db_session:
+    with get_session(DB_ENGINE, read_only=True) as db_session:
         return query_unique_tag_names(
             account_id=account_id,
             token=current_user,
@@ -130,7 +209,7 @@ async def get_tag_by_id(
     current_user: TokenPayload = Depends(require_member),
 ):
     """Get a specific entity tag by ID."""
-    with get_session(DB_ENGINE) as db_session:
+    with get_session(DB_ENGINE, read_only=True) as db_session:
         return query_entity_tag_by_id(tag_id=tag_id, session=db_session, engine=DB_ENGINE)
 
 
@@ -145,6 +224,28 @@ async def create_tag(
         return query_entity_tag_by_id(tag_id=tag_id, session=db_session, engine=DB_ENGINE)
 
 
+@tag_api_router.post("/bulk", response_model=BulkTagResultModel)
+async def bulk_tag(
+    request: BulkTagRequest,
+    current_user: TokenPayload = Depends(require_admin),
+):
+    """Tag many entities at once, optionally replacing their tags in the category."""
+    validate_account_access(current_user, request.account_id)
+    try:
+        return bulk_tag_entities(
+            entities=[(e.entity_type, e.entity_id) for e in request.entities],
+            tag_names=request.tag_names,
+            tag_category=request.tag_category,
+            account_id=request.account_id,
+            created_by_user_id=current_user.user_id,
+            engine=DB_ENGINE,
+            tag_values=request.tag_values,
+            replace=request.replace,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=HTTP_400_BAD_REQUEST, detail=str(e))
+
+
 @tag_api_router.post("/bulk/add")
 async def add_tags_bulk(
     entity_type: str,
@@ -191,8 +292,8 @@ async def replace_tags_bulk(
     )
     return {
         "status": "success",
-        "deactivated_count": result["deactivated_count"],
-        "new_tag_ids": result["new_tag_ids"],
+        "deactivated_count": len(result["deactivated"]),
+        "new_tag_ids": result["created"],
     }
 
 
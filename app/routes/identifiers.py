@@ -12,8 +12,13 @@ from sqlalchemy.orm import Session
 from starlette.status import HTTP_400_BAD_REQUEST, HTTP_404_NOT_FOUND
 
 from common.service_connections.db_service.db_manager import DB_ENGINE
+from common.service_connections.db_service.database import IdentifierTable
 from app.dependencies.jwt_auth_dependency import get_current_user
 from app.models.auth_models import TokenPayload
+from app.responses import conditional_response, model_json, model_list_json
+from common.service_connections.db_service.models.resource_version_model import (
+    query_resource_version,
+)
 from common.service_connections.db_service.models.user_interface_models.identifier_model import (
     IdentifierModel,
     query_all_identifiers,
@@ -38,12 +43,21 @@ identifiers_api_router = APIRouter(prefix="/api/identifiers", tags=["identifiers
 
 
 @identifiers_api_router.get("/", response_model=List[dict])
-async def list_identifiers_api(current_user: TokenPayload = Depends(get_current_user)):
+async def list_identifiers_api(
+    request: Request, current_user: TokenPayload = Depends(get_current_user)
+):
     """List all identifiers."""
     try:
         with Session(DB_ENGINE) as db_session:
-            identifiers = query_all_identifiers(session=db_session, engine=DB_ENGINE)
-        return [identifier.model_dump() for identifier in identifiers]
+            version = query_resource_version(db_session, IdentifierTable)
+            return conditional_response(
+                request,
+                version,
+                lambda: model_list_json(
+                    IdentifierModel,
+                    query_all_identifiers(session=db_session, engine=DB_ENGINE),
+                ),
+            )
     except Exception as e:
         logger.error(f"Error listing identifiers: {e}")
         raise HTTPException(status_code=HTTP_400_BAD_REQUEST, detail=str(e))
@@ -53,15 +67,31 @@ async def list_identifiers_api(current_user: TokenPayload = Depends(get_current_
     "/{record_id}", response_model=dict, name="get_identifier_api"
 )
 async def get_identifier_api(
-    record_id: int, current_user: TokenPayload = Depends(get_current_user)
+    record_id: int,
+    request: Request,
+    current_user: TokenPayload = Depends(get_current_user),
 ):
     """Get a specific identifier by ID."""
     try:
         with Session(DB_ENGINE) as db_session:
-            identifier = query_identifier_by_id(
-                identifier_id=record_id, session=db_session, engine=DB_ENGINE
+            version = query_resource_version(
+                db_session, IdentifierTable, IdentifierTable.identifier_id == record_id
+            )
+            if version.row_count == 0:
+                raise HTTPException(
+                    status_code=HTTP_404_NOT_FOUND, detail=f"Identifier {record_id} not found"
+                )
+            return conditional_response(
+                request,
+                version,
+                lambda: model_json(
+                    query_identifier_by_id(
+                        identifier_id=record_id, session=db_session, engine=DB_ENGINE
+                    )
+                ),
             )
-        return identifier.model_dump()
+    except HTTPException:
+        raise
     except ValueError as e:
         raise HTTPException(status_code=HTTP_404_NOT_FOUND, detail=str(e))
     except Exception as e:
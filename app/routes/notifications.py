@@ -407,6 +407,9 @@ async def list_notifications(
     include_read: bool = Query(False, description="Include read notifications"),
     limit: int = Query(50, ge=1, le=100, description="Maximum number of notifications"),
     offset: int = Query(0, ge=0, description="Offset for pagination"),
+    approximate: bool = Query(
+        False, description="Estimate notification counts instead of counting exactly"
+    ),
     current_user: TokenPayload = Depends(get_current_user),
 ):
     """
@@ -416,6 +419,7 @@ async def list_notifications(
         include_read: Whether to include read notifications
         limit: Maximum number of notifications to return
         offset: Offset for pagination
+        approximate: Estimate total and unread above the exact-count threshold
         current_user: JWT token payload
 
     Returns:
@@ -430,6 +434,7 @@ async def list_notifications(
                 include_read=include_read,
                 limit=limit,
                 offset=offset,
+                approximate_counts=approximate,
             )
 
         return [
@@ -487,6 +492,9 @@ async def get_unread_notification_count(
 )
 async def mark_notification_read(
     notification_id: str,
+    approximate: bool = Query(
+        False, description="Estimate notification counts instead of counting exactly"
+    ),
     current_user: TokenPayload = Depends(get_current_user),
 ):
     """
@@ -494,6 +502,7 @@ async def mark_notification_read(
 
     Args:
         notification_id: Notification ID to mark as read
+        approximate: Estimate the ownership lookup's counts when large
         current_user: JWT token payload
 
     Returns:
@@ -507,6 +516,7 @@ async def mark_notification_read(
                 db_session=db_session,
                 engine=DB_ENGINE,
                 include_read=True,
+                approximate_counts=approximate,
             )
             notif = next(
                 (n for n in notifications if n.notification_id == notification_id), None
@@ -561,6 +571,9 @@ async def mark_all_notifications_read(
 )
 async def delete_notification_endpoint(
     notification_id: str,
+    approximate: bool = Query(
+        False, description="Estimate notification counts instead of counting exactly"
+    ),
     current_user: TokenPayload = Depends(get_current_user),
 ):
     """
@@ -568,6 +581,7 @@ async def delete_notification_endpoint(
 
     Args:
         notification_id: Notification ID to delete
+        approximate: Estimate the ownership lookup's counts when large
         current_user: JWT token payload
     """
     try:
@@ -578,6 +592,7 @@ async def delete_notification_endpoint(
                 db_session=db_session,
                 engine=DB_ENGINE,
                 include_read=True,
+                approximate_counts=approximate,
             )
             notif = next(
                 (n for n in notifications if n.notification_id == notification_id), None
@@ -610,6 +625,9 @@ async def delete_notification_endpoint(
 )
 async def create_notification_endpoint(
     body: CreateNotificationRequest,
+    approximate: bool = Query(
+        False, description="Estimate notification counts instead of counting exactly"
+    ),
     current_user: TokenPayload = Depends(require_admin),
 ):
     """
@@ -619,6 +637,7 @@ async def create_notification_endpoint(
 
     Args:
         body: Notification creation data
+        approximate: Estimate the read-back lookup's counts when large
         current_user: JWT token payload
 
     Returns:
@@ -651,6 +670,7 @@ async def create_notification_endpoint(
                 db_session=db_session,
                 engine=DB_ENGINE,
                 include_read=True,
+                approximate_counts=approximate,
             )
             created = next(
                 (n for n in notifications if n.notification_id == notification_id), None
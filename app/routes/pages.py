@@ -3,13 +3,23 @@ Page routes for environments Pages are the identifiers for the web pages that
 Selenium will interact with.
 """
 
-from fastapi import Request, APIRouter, Depends
+import json
+from typing import Optional
+
+from fastapi import Request, APIRouter, Depends, HTTPException, status
 
 from sqlalchemy.orm import Session
 
 from common.service_connections.db_service.db_manager import DB_ENGINE
+from common.service_connections.db_service.database import IdentifierTable, PageTable
 from app.dependencies.jwt_auth_dependency import get_current_user
 from app.models.auth_models import TokenPayload
+from app.responses import conditional_response, model_json
+
+from common.service_connections.db_service.models.resource_version_model import (
+    combine_resource_versions,
+    query_resource_version,
+)
 
 from common.service_connections.db_service.models.user_interface_models.page_model import (
     PageModel,
@@ -19,6 +29,11 @@ from common.service_connections.db_service.models.user_interface_models.page_mod
     query_page_by_id,
     update_page_by_id,
 )
+from common.service_connections.db_service.models.user_interface_models.page_performance_model import (
+    query_page_performance_metrics,
+    query_page_performance_regressions,
+    query_page_performance_trend,
+)
 
 page_api_router = APIRouter(prefix="/api/pages", tags=["pages"], include_in_schema=True)
 
@@ -36,14 +51,47 @@ def create_page(
 @page_api_router.get("/")
 def get_pages_api(request: Request, current_user: TokenPayload = Depends(get_current_user)):
     with Session(DB_ENGINE) as db_session:
-        pages = query_all_pages(session=db_session, engine=DB_ENGINE)
-    return {"data": [page.model_dump() for page in pages]}
+        # Pages embed their identifiers, so both tables version the list
+        version = combine_resource_versions(
+            query_resource_version(db_session, PageTable),
+            query_resource_version(db_session, IdentifierTable),
+        )
+
+        def build_body() -> bytes:
+            pages = query_all_pages(session=db_session, engine=DB_ENGINE)
+            return json.dumps(
+                {"data": [page.model_dump(mode="json") for page in pages]}
+            ).encode()
+
+        return conditional_response(request, version, build_body)
 
 
 @page_api_router.get("/{record_id}")
-def get_page(record_id: int, current_user: TokenPayload = Depends(get_current_user)):
+def get_page(
+    record_id: int, request: Request, current_user: TokenPayload = Depends(get_current_user)
+):
     with Session(DB_ENGINE) as db_session:
-        return query_page_by_id(page_id=record_id, session=db_session, engine=DB_ENGINE)
+        page_version = query_resource_version(
+            db_session, PageTable, PageTable.page_id == record_id
+        )
+        if page_version.row_count == 0:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Page {record_id} not found",
+            )
+        version = combine_resource_versions(
+            page_version,
+            query_resource_version(
+                db_session, IdentifierTable, IdentifierTable.page_id == record_id
+            ),
+        )
+        return conditional_response(
+            request,
+            version,
+            lambda: model_json(
+                query_page_by_id(page_id=record_id, session=db_session, engine=DB_ENGINE)
+            ),
+        )
 
 
 @page_api_router.patch("/{record_id}")
@@ -57,3 +105,61 @@ def edit_page(record_id: int, page: PageModel, current_user: TokenPayload = Depe
 def delete_page_api(record_id: int, current_user: TokenPayload = Depends(get_current_user)):
     drop_page_by_id(page_id=record_id, engine=DB_ENGINE)
     return {"message": "Page deleted successfully"}
+
+
+@page_api_router.get("/performance/regressions")
+def get_page_performance_regressions(
+    environment_id: Optional[str] = None,
+    metric: str = "load_event_ms",
+    recent_days: int = 1,
+    baseline_days: int = 14,
+    threshold: float = 1.2,
+    current_user: TokenPayload = Depends(get_current_user),
+):
+    with Session(DB_ENGINE) as db_session:
+        try:
+            regressions = query_page_performance_regressions(
+                session=db_session,
+                engine=DB_ENGINE,
+                environment_id=environment_id,
+                metric=metric,
+                recent_days=recent_days,
+                baseline_days=baseline_days,
+                threshold=threshold,
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return {"data": [regression.model_dump() for regression in regressions]}
+
+
+@page_api_router.get("/{record_id}/performance")
+def get_page_performance(
+    record_id: int,
+    environment_id: Optional[str] = None,
+    bucket: str = "day",
+    days: int = 30,
+    current_user: TokenPayload = Depends(get_current_user),
+):
+    with Session(DB_ENGINE) as db_session:
+        try:
+            trend = query_page_performance_trend(
+                page_id=record_id,
+                session=db_session,
+                engine=DB_ENGINE,
+                environment_id=environment_id,
+                bucket=bucket,
+                days=days,
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        latest = query_page_performance_metrics(
+            page_id=record_id,
+            session=db_session,
+            engine=DB_ENGINE,
+            environment_id=environment_id,
+            limit=1,
+        )
+    return {
+        "trend": [point.model_dump() for point in trend],
+        "latest": latest[0].model_dump() if latest else None,
+    }
@@ -2,10 +2,12 @@
 Plan routes for managing test execution plans.
 """
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Request
+from starlette.status import HTTP_404_NOT_FOUND
 from typing import List
 
 from common.service_connections.db_service.db_manager import DB_ENGINE
+from common.service_connections.db_service.database import PlanTable
 from common.service_connections.db_service.database.engine import (
     get_database_session as get_session,
 )
@@ -15,7 +17,11 @@ from app.dependencies.authorization_dependency import (
     validate_account_access,
 )
 from app.models.auth_models import TokenPayload
+from app.responses import conditional_response, model_json, model_list_json
 
+from common.service_connections.db_service.models.resource_version_model import (
+    query_resource_version,
+)
 from common.service_connections.db_service.models.plan_model import (
     PlanModel,
     insert_plan,
@@ -30,6 +36,10 @@ from common.service_connections.db_service.models.plan_model import (
     reactivate_plan,
     drop_plan,
 )
+from common.service_connections.db_service.models.plan_manifest_model import (
+    PlanManifestModel,
+    get_plan_manifest,
+)
 
 
 plan_api_router = APIRouter(prefix="/api/plans", tags=["plans-api"])
@@ -47,16 +57,27 @@ async def get_all_plans(
 @plan_api_router.get("/account/{account_id}", response_model=List[PlanModel])
 async def get_plans_by_account(
     account_id: str,
+    request: Request,
     current_user: TokenPayload = Depends(require_member),
 ):
     """Get all test plans for a specific account."""
     validate_account_access(current_user, account_id)
     with get_session(DB_ENGINE) as db_session:
-        return query_plans_by_account(
-            account_id=account_id,
-            token=current_user,
-            db_session=db_session,
-            engine=DB_ENGINE,
+        version = query_resource_version(
+            db_session, PlanTable, PlanTable.account_id == account_id
+        )
+        return conditional_response(
+            request,
+            version,
+            lambda: model_list_json(
+                PlanModel,
+                query_plans_by_account(
+                    account_id=account_id,
+                    token=current_user,
+                    db_session=db_session,
+                    engine=DB_ENGINE,
+                ),
+            ),
         )
 
 
@@ -87,11 +108,46 @@ async def get_plans_by_status(
 @plan_api_router.get("/{plan_id}", response_model=PlanModel)
 async def get_plan_by_id(
     plan_id: str,
+    request: Request,
     current_user: TokenPayload = Depends(require_member),
 ):
     """Get a specific test plan by ID."""
     with get_session(DB_ENGINE) as db_session:
-        return query_plan_by_id(plan_id=plan_id, db_session=db_session, engine=DB_ENGINE)
+        version = query_resource_version(
+            db_session, PlanTable, PlanTable.plan_id == plan_id
+        )
+        if version.row_count == 0:
+            raise HTTPException(
+                status_code=HTTP_404_NOT_FOUND, detail=f"Plan {plan_id} not found"
+            )
+        return conditional_response(
+            request,
+            version,
+            lambda: model_json(
+                query_plan_by_id(
+                    plan_id=plan_id, db_session=db_session, engine=DB_ENGINE
+                )
+            ),
+        )
+
+
+@plan_api_router.get("/{plan_id}/manifest", response_model=PlanManifestModel)
+async def get_plan_manifest_endpoint(
+    plan_id: str,
+    current_user: TokenPayload = Depends(require_member),
+):
+    """Get a plan's execution manifest: suites and test cases in execution order."""
+    with get_session(DB_ENGINE) as db_session:
+        manifest = get_plan_manifest(
+            plan_id=plan_id,
+            token=current_user,
+            db_session=db_session,
+            engine=DB_ENGINE,
+        )
+    if manifest is None:
+        raise HTTPException(status_code=HTTP_404_NOT_FOUND, detail=f"Plan {plan_id} not found")
+    validate_account_access(current_user, manifest.account_id)
+    return manifest
 
 
 @plan_api_router.post("/", response_model=PlanModel)
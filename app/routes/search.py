@@ -0,0 +1,58 @@
+"""
+Catalog search routes for finding test cases, suites, plans and action chains.
+"""
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from starlette.status import HTTP_400_BAD_REQUEST
+from typing import List, Optional
+
+from common.service_connections.db_service.db_manager import DB_ENGINE
+from common.service_connections.db_service.database.engine import (
+    get_database_session as get_session,
+)
+from app.dependencies.authorization_dependency import (
+    require_member,
+    validate_account_access,
+)
+from app.models.auth_models import TokenPayload
+
+from common.service_connections.db_service.models.search_model import (
+    SearchResultsModel,
+    search_catalog,
+)
+
+
+search_api_router = APIRouter(prefix="/api/search", tags=["search-api"])
+
+
+@search_api_router.get("/", response_model=SearchResultsModel)
+async def search(
+    q: str = Query(..., min_length=1, max_length=256),
+    account_id: str = Query(...),
+    entity_types: Optional[List[str]] = Query(None),
+    page: int = Query(1, ge=1),
+    page_size: int = Query(20, ge=1, le=100),
+    current_user: TokenPayload = Depends(require_member),
+):
+    """
+    Search an account's active catalog entities, best match first.
+
+    q accepts web search syntax ("exact phrase", or, -excluded) and also
+    matches partial names. Repeat entity_types to restrict the search, e.g.
+    ?entity_types=suite&entity_types=plan.
+    """
+    validate_account_access(current_user, account_id)
+    with get_session(DB_ENGINE, read_only=True) as db_session:
+        try:
+            return search_catalog(
+                query=q,
+                account_id=account_id,
+                token=current_user,
+                db_session=db_session,
+                engine=DB_ENGINE,
+                entity_types=entity_types,
+                page=page,
+                page_size=page_size,
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=HTTP_400_BAD_REQUEST, detail=str(e))
@@ -2,10 +2,12 @@
 Suite routes for managing test suite organization.
 """
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Request
+from starlette.status import HTTP_404_NOT_FOUND
 from typing import List
 
 from common.service_connections.db_service.db_manager import DB_ENGINE
+from common.service_connections.db_service.database import SuiteTable
 from common.service_connections.db_service.database.engine import (
     get_database_session as get_session,
 )
@@ -15,7 +17,11 @@ from app.dependencies.authorization_dependency import (
     validate_account_access,
 )
 from app.models.auth_models import TokenPayload
+from app.responses import conditional_response, model_json, model_list_json
 
+from common.service_connections.db_service.models.resource_version_model import (
+    query_resource_version,
+)
 from common.service_connections.db_service.models.suite_model import (
     SuiteModel,
     insert_suite,
@@ -42,27 +48,54 @@ async def get_all_suites(
 @suite_api_router.get("/account/{account_id}", response_model=List[SuiteModel])
 async def get_suites_by_account(
     account_id: str,
+    request: Request,
     current_user: TokenPayload = Depends(require_member),
 ):
     """Get all test suites for a specific account."""
     validate_account_access(current_user, account_id)
     with get_session(DB_ENGINE) as db_session:
-        return query_suites_by_account(
-            account_id=account_id,
-            token=current_user,
-            session=db_session,
-            engine=DB_ENGINE,
+        version = query_resource_version(
+            db_session, SuiteTable, SuiteTable.account_id == account_id
+        )
+        return conditional_response(
+            request,
+            version,
+            lambda: model_list_json(
+                SuiteModel,
+                query_suites_by_account(
+                    account_id=account_id,
+                    token=current_user,
+                    session=db_session,
+                    engine=DB_ENGINE,
+                ),
+            ),
         )
 
 
 @suite_api_router.get("/{suite_id}", response_model=SuiteModel)
 async def get_suite_by_id(
     suite_id: str,
+    request: Request,
     current_user: TokenPayload = Depends(require_member),
 ):
     """Get a specific test suite by ID."""
     with get_session(DB_ENGINE) as db_session:
-        return query_suite_by_id(suite_id=suite_id, session=db_session, engine=DB_ENGINE)
+        version = query_resource_version(
+            db_session, SuiteTable, SuiteTable.suite_id == suite_id
+        )
+        if version.row_count == 0:
+            raise HTTPException(
+                status_code=HTTP_404_NOT_FOUND, detail=f"Suite {suite_id} not found"
+            )
+        return conditional_response(
+            request,
+            version,
+            lambda: model_json(
+                query_suite_by_id(
+                    suite_id=suite_id, session=db_session, engine=DB_ENGINE
+                )
+            ),
+        )
 
 
 @suite_api_router.post("/", response_model=SuiteModel)
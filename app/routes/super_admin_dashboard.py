@@ -4,6 +4,7 @@ Super admin dashboard routes for system-wide management and monitoring.
 Provides endpoints for:
 - Listing all users across accounts
 - Viewing system-wide metrics and statistics
+- Viewing catalog cache hit ratio
 - Managing user accounts (suspend/activate)
 
 Security:
@@ -41,6 +42,11 @@ from common.service_connections.db_service.database.tables.audit_log import (
     AuditLogTable,
 )
 from common.service_connections.db_service.db_manager import DB_ENGINE
+from common.service_connections.db_service.models.catalog_cache import (
+    CatalogCache,
+    CatalogCacheStatsModel,
+)
+from common.service_connections.db_service.models.row_count_model import count_rows
 
 
 logger = logging.getLogger(__name__)
@@ -82,6 +88,7 @@ class UserListResponse(BaseModel):
     page: int
     page_size: int
     total_pages: int
+    approximate: bool = False  # total is a planner estimate
 
 
 class SystemMetrics(BaseModel):
@@ -105,6 +112,9 @@ class SystemMetrics(BaseModel):
     audit_logs_last_24_hours: int
     sensitive_actions_last_7_days: int
 
+    # True when any count above is a planner estimate
+    approximate: bool = False
+
 
 class UserSuspendRequest(BaseModel):
     """Request to suspend or activate a user."""
@@ -137,6 +147,9 @@ async def list_all_users(
     page_size: int = Query(50, ge=1, le=100, description="Items per page"),
     include_inactive: bool = Query(False, description="Include inactive users"),
     search: Optional[str] = Query(None, description="Search by email or name"),
+    approximate: bool = Query(
+        False, description="Estimate the total instead of counting large results"
+    ),
     current_user: TokenPayload = Depends(require_super_admin),
 ):
     """
@@ -150,13 +163,14 @@ async def list_all_users(
         page_size: Number of users per page
         include_inactive: Whether to include deactivated users
         search: Search term for email or name
+        approximate: Estimate the total above the exact-count threshold
         current_user: JWT token payload (must be super admin)
 
     Returns:
         UserListResponse: Paginated list of users with metadata
     """
     try:
-        with get_session(DB_ENGINE) as db_session:
+        with get_session(DB_ENGINE, read_only=True) as db_session:
             # Base query
             query = db_session.query(AuthUserTable)
 
@@ -175,7 +189,7 @@ async def list_all_users(
                 )
 
             # Get total count
-            total = query.count()
+            total = count_rows(db_session, query, approximate=approximate)
 
             # Pagination
             offset = (page - 1) * page_size
@@ -186,6 +200,12 @@ async def list_all_users(
                 .all()
             )
 
+            # A short, non-empty page is the last one, so its end is the total
+            if total.approximate and 0 < len(users_db) < page_size:
+                total = total.model_copy(
+                    update={"count": offset + len(users_db), "approximate": False}
+                )
+
             # Build response with account associations
             users_list = []
             for user_db in users_db:
@@ -235,7 +255,7 @@ async def list_all_users(
                     )
                 )
 
-        total_pages = (total + page_size - 1) // page_size
+        total_pages = (total.count + page_size - 1) // page_size
 
         logger.info(
             f"Super admin {current_user.user_id} listed {len(users_list)} users (page {page})"
@@ -243,10 +263,11 @@ async def list_all_users(
 
         return UserListResponse(
             users=users_list,
-            total=total,
+            total=total.count,
             page=page,
             page_size=page_size,
             total_pages=total_pages,
+            approximate=total.approximate,
         )
 
     except Exception as e:
@@ -259,6 +280,9 @@ async def list_all_users(
     response_model=SystemMetrics,
 )
 async def get_system_metrics(
+    approximate: bool = Query(
+        False, description="Estimate counts of large tables instead of counting"
+    ),
     current_user: TokenPayload = Depends(require_super_admin),
 ):
     """
@@ -268,65 +292,64 @@ async def get_system_metrics(
     for the super admin dashboard.
 
     Args:
+        approximate: Estimate counts above the exact-count threshold
         current_user: JWT token payload (must be super admin)
 
     Returns:
         SystemMetrics: System-wide statistics
     """
     try:
-        with get_session(DB_ENGINE) as db_session:
+        with get_session(DB_ENGINE, read_only=True) as db_session:
             now = datetime.now(timezone.utc)
             thirty_days_ago = now - timedelta(days=30)
             seven_days_ago = now - timedelta(days=7)
             twenty_four_hours_ago = now - timedelta(hours=24)
+            counts = []
+
+            def count(query) -> int:
+                counts.append(count_rows(db_session, query, approximate=approximate))
+                return counts[-1].count
 
             # User metrics
-            total_users = db_session.query(AuthUserTable).count()
-            active_users = (
+            total_users = count(db_session.query(AuthUserTable))
+            active_users = count(
                 db_session.query(AuthUserTable)
                 .filter(AuthUserTable.is_active == True)
-                .count()
             )
-            inactive_users = total_users - active_users
-            super_admins = (
+            inactive_users = max(total_users - active_users, 0)
+            super_admins = count(
                 db_session.query(AuthUserTable)
                 .filter(AuthUserTable.is_super_admin == True)
-                .count()
             )
-            users_created_last_30_days = (
+            users_created_last_30_days = count(
                 db_session.query(AuthUserTable)
                 .filter(AuthUserTable.created_at >= thirty_days_ago)
-                .count()
             )
 
             # Account metrics
-            total_accounts = db_session.query(AccountTable).count()
-            active_accounts = (
+            total_accounts = count(db_session.query(AccountTable))
+            active_accounts = count(
                 db_session.query(AccountTable)
                 .filter(AccountTable.is_active == True)
-                .count()
             )
-            inactive_accounts = total_accounts - active_accounts
-            accounts_created_last_30_days = (
+            inactive_accounts = max(total_accounts - active_accounts, 0)
+            accounts_created_last_30_days = count(
                 db_session.query(AccountTable)
                 .filter(AccountTable.created_at >= thirty_days_ago)
-                .count()
             )
 
             # Activity metrics
-            total_audit_logs = db_session.query(AuditLogTable).count()
-            audit_logs_last_24_hours = (
+            total_audit_logs = count(db_session.query(AuditLogTable))
+            audit_logs_last_24_hours = count(
                 db_session.query(AuditLogTable)
                 .filter(AuditLogTable.timestamp >= twenty_four_hours_ago)
-                .count()
             )
-            sensitive_actions_last_7_days = (
+            sensitive_actions_last_7_days = count(
                 db_session.query(AuditLogTable)
                 .filter(
                     AuditLogTable.timestamp >= seven_days_ago,
                     AuditLogTable.is_sensitive == True,
                 )
-                .count()
             )
 
         logger.info(f"Super admin {current_user.user_id} accessed system metrics")
@@ -344,6 +367,7 @@ async def get_system_metrics(
             total_audit_logs=total_audit_logs,
             audit_logs_last_24_hours=audit_logs_last_24_hours,
             sensitive_actions_last_7_days=sensitive_actions_last_7_days,
+            approximate=any(result.approximate for result in counts),
         )
 
     except Exception as e:
@@ -351,6 +375,25 @@ async def get_system_metrics(
         raise HTTPException(status_code=HTTP_400_BAD_REQUEST, detail=str(e))
 
 
+@super_admin_dashboard_api_router.get(
+    "/metrics/catalog-cache",
+    response_model=CatalogCacheStatsModel,
+)
+async def get_catalog_cache_metrics(
+    current_user: TokenPayload = Depends(require_super_admin),
+):
+    """
+    Get catalog cache counters for this worker process (super admin only).
+
+    Args:
+        current_user: JWT token payload (must be super admin)
+
+    Returns:
+        CatalogCacheStatsModel: Backend, hits, misses, hit ratio and entry count
+    """
+    return CatalogCache.stats()
+
+
 @super_admin_dashboard_api_router.post(
     "/users/{user_id}/status",
     response_model=UserSuspendResponse,
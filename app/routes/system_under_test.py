@@ -2,10 +2,12 @@
 System Under Test routes for managing applications and systems being tested.
 """
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Request
+from starlette.status import HTTP_404_NOT_FOUND
 from typing import List
 
 from common.service_connections.db_service.db_manager import DB_ENGINE
+from common.service_connections.db_service.database import SystemUnderTestTable
 from common.service_connections.db_service.database.engine import (
     get_database_session as get_session,
 )
@@ -15,7 +17,11 @@ from app.dependencies.authorization_dependency import (
     validate_account_access,
 )
 from app.models.auth_models import TokenPayload
+from app.responses import conditional_response, model_json, model_list_json
 
+from common.service_connections.db_service.models.resource_version_model import (
+    query_resource_version,
+)
 from common.service_connections.db_service.models.system_under_test_model import (
     SystemUnderTestModel,
     insert_system_under_test,
@@ -42,28 +48,55 @@ async def get_all_systems(
 @sut_api_router.get("/account/{account_id}", response_model=List[SystemUnderTestModel])
 async def get_systems_by_account(
     account_id: str,
+    request: Request,
     current_user: TokenPayload = Depends(require_member),
 ):
     """Get all systems under test for a specific account."""
     validate_account_access(current_user, account_id)
     with get_session(DB_ENGINE) as db_session:
-        return query_systems_under_test_by_account(
-            account_id=account_id,
-            token=current_user,
-            session=db_session,
-            engine=DB_ENGINE,
+        version = query_resource_version(
+            db_session,
+            SystemUnderTestTable,
+            SystemUnderTestTable.account_id == account_id,
+        )
+        return conditional_response(
+            request,
+            version,
+            lambda: model_list_json(
+                SystemUnderTestModel,
+                query_systems_under_test_by_account(
+                    account_id=account_id,
+                    token=current_user,
+                    session=db_session,
+                    engine=DB_ENGINE,
+                ),
+            ),
         )
 
 
 @sut_api_router.get("/{sut_id}", response_model=SystemUnderTestModel)
 async def get_system_by_id(
     sut_id: str,
+    request: Request,
     current_user: TokenPayload = Depends(require_member),
 ):
     """Get a specific system under test by ID."""
     with get_session(DB_ENGINE) as db_session:
-        return query_system_under_test_by_id(
-            sut_id=sut_id, session=db_session, engine=DB_ENGINE
+        version = query_resource_version(
+            db_session, SystemUnderTestTable, SystemUnderTestTable.sut_id == sut_id
+        )
+        if version.row_count == 0:
+            raise HTTPException(
+                status_code=HTTP_404_NOT_FOUND, detail=f"System under test {sut_id} not found"
+            )
+        return conditional_response(
+            request,
+            version,
+            lambda: model_json(
+                query_system_under_test_by_id(
+                    sut_id=sut_id, session=db_session, engine=DB_ENGINE
+                )
+            ),
         )
 
 
@@ -2,10 +2,12 @@
 Test Case routes for managing individual test definitions.
 """
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Request
+from starlette.status import HTTP_404_NOT_FOUND
 from typing import List
 
 from common.service_connections.db_service.db_manager import DB_ENGINE
+from common.service_connections.db_service.database import TestCaseTable
 from common.service_connections.db_service.database.engine import (
     get_database_session as get_session,
 )
@@ -15,6 +17,11 @@ from app.dependencies.authorization_dependency import (
     validate_account_access,
 )
 from app.models.auth_models import TokenPayload
+from app.responses import conditional_response, model_json, model_list_json
+
+from common.service_connections.db_service.models.resource_version_model import (
+    query_resource_version,
+)
 
 from common.service_connections.db_service.models.test_case_model import (
     TestCaseModel,
@@ -44,28 +51,50 @@ async def get_all_test_cases(
 @test_case_api_router.get("/account/{account_id}", response_model=List[TestCaseModel])
 async def get_test_cases_by_account(
     account_id: str,
+    request: Request,
     current_user: TokenPayload = Depends(require_member),
 ):
     """Get all test cases for a specific account."""
     validate_account_access(current_user, account_id)
     with get_session(DB_ENGINE) as db_session:
-        return query_test_cases_by_account(
-            account_id=account_id,
-            token=current_user,
-            session=db_session,
-            engine=DB_ENGINE,
+        version = query_resource_version(
+            db_session, TestCaseTable, TestCaseTable.account_id == account_id
+        )
+        return conditional_response(
+            request,
+            version,
+            lambda: model_list_json(
+                TestCaseModel,
+                query_test_cases_by_account(
+                    account_id=account_id,
+                    token=current_user,
+                    session=db_session,
+                    engine=DB_ENGINE,
+                ),
+            ),
         )
 
 
 @test_case_api_router.get("/sut/{sut_id}", response_model=List[TestCaseModel])
 async def get_test_cases_by_sut(
     sut_id: str,
+    request: Request,
     current_user: TokenPayload = Depends(require_member),
 ):
     """Get all test cases for a specific system under test."""
     with get_session(DB_ENGINE) as db_session:
-        return query_test_cases_by_sut(
-            sut_id=sut_id, session=db_session, engine=DB_ENGINE
+        version = query_resource_version(
+            db_session, TestCaseTable, TestCaseTable.sut_id == sut_id
+        )
+        return conditional_response(
+            request,
+            version,
+            lambda: model_list_json(
+                TestCaseModel,
+                query_test_cases_by_sut(
+                    sut_id=sut_id, session=db_session, engine=DB_ENGINE
+                ),
+            ),
         )
 
 
@@ -84,12 +113,26 @@ async def get_test_cases_by_type(
 @test_case_api_router.get("/{test_case_id}", response_model=TestCaseModel)
 async def get_test_case_by_id(
     test_case_id: str,
+    request: Request,
     current_user: TokenPayload = Depends(require_member),
 ):
     """Get a specific test case by ID."""
     with get_session(DB_ENGINE) as db_session:
-        return query_test_case_by_id(
-            test_case_id=test_case_id, session=db_session, engine=DB_ENGINE
+        version = query_resource_version(
+            db_session, TestCaseTable, TestCaseTable.test_case_id == test_case_id
+        )
+        if version.row_count == 0:
+            raise HTTPException(
+                status_code=HTTP_404_NOT_FOUND, detail=f"Test case {test_case_id} not found"
+            )
+        return conditional_response(
+            request,
+            version,
+            lambda: model_json(
+                query_test_case_by_id(
+                    test_case_id=test_case_id, session=db_session, engine=DB_ENGINE
+                )
+            ),
         )
 
 
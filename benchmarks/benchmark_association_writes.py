@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Benchmark set-based suite/test case association writes at scale.
+
+Creates N scratch test cases owned like an existing suite, then times bulk add,
+a full reversal, a single swap, and a diff-based replace through
+suite_test_case_helpers. The same operations are also timed with a row-at-a-time
+ORM loop for comparison. Scratch test cases are deleted at the end, which
+cascades to their associations.
+
+Usage:
+    python benchmarks/benchmark_association_writes.py --suite-id <suite_id> --rows 10000
+"""
+
+import argparse
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from uuid import uuid4
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from sqlalchemy import delete, insert
+
+from common.service_connections.db_service.database.engine import (
+    get_database_session as session,
+)
+from common.service_connections.db_service.database.tables.suite import SuiteTable
+from common.service_connections.db_service.database.tables.suite_test_case_association import (
+    SuiteTestCaseAssociation,
+)
+from common.service_connections.db_service.database.tables.test_case import (
+    TestCaseTable,
+)
+from common.service_connections.db_service.db_manager import DB_ENGINE
+from common.service_connections.db_service.models.suite_test_case_helpers import (
+    bulk_add_test_cases_to_suite,
+    reorder_suite_test_cases,
+    replace_suite_test_cases,
+)
+
+
+@contextmanager
+def timed(results: dict, name: str):
+    start = time.perf_counter()
+    yield
+    results[name] = (time.perf_counter() - start) * 1000
+
+
+def create_scratch_test_cases(suite_id: str, rows: int) -> list:
+    with session(DB_ENGINE) as db_session:
+        suite = db_session.get(SuiteTable, suite_id)
+        if suite is None:
+            raise SystemExit(f"Suite not found: {suite_id}")
+        run = uuid4().hex[:8]
+        now = datetime.now(timezone.utc)
+        test_cases = [
+            {
+                "test_case_id": str(uuid4()),
+                "test_name": f"bench-{run}-{i:05d}",
+                "test_type": "functional",
+                "sut_id": suite.sut_id,
+                "owner_user_id": suite.owner_user_id,
+                "account_id": suite.account_id,
+                "is_active": True,
+                "created_at": now,
+            }
+            for i in range(rows)
+        ]
+        db_session.execute(insert(TestCaseTable), test_cases)
+        db_session.commit()
+    return [tc["test_case_id"] for tc in test_cases]
+
+
+def clear_suite(suite_id: str, test_case_ids: list) -> None:
+    with session(DB_ENGINE) as db_session:
+        db_session.execute(
+            delete(SuiteTestCaseAssociation).where(
+                SuiteTestCaseAssociation.suite_id == suite_id,
+                SuiteTestCaseAssociation.test_case_id.in_(test_case_ids),
+            )
+        )
+        db_session.commit()
+
+
+def row_at_a_time(suite_id: str, test_case_ids: list, results: dict) -> None:
+    """Baseline: one ORM object per association, as the helpers used to do."""
+    with timed(results, "add"):
+        with session(DB_ENGINE) as db_session:
+            for i, test_case_id in enumerate(test_case_ids):
+                db_session.add(
+                    SuiteTestCaseAssociation(
+                        suite_id=suite_id, test_case_id=test_case_id, execution_order=i
+                    )
+                )
+            db_session.commit()
+
+    with timed(results, "reverse"):
+        with session(DB_ENGINE) as db_session:
+            assocs = {
+                assoc.test_case_id: assoc
+                for assoc in db_session.query(SuiteTestCaseAssociation).filter(
+                    SuiteTestCaseAssociation.suite_id == suite_id
+                )
+            }
+            for i, test_case_id in enumerate(reversed(test_case_ids)):
+                assocs[test_case_id].execution_order = i
+            db_session.commit()
+
+
+def set_based(suite_id: str, test_case_ids: list, results: dict) -> None:
+    with timed(results, "add"):
+        bulk_add_test_cases_to_suite(suite_id, test_case_ids, DB_ENGINE)
+
+    reversed_ids = list(reversed(test_case_ids))
+    with timed(results, "reverse"):
+        reorder_suite_test_cases(suite_id, reversed_ids, DB_ENGINE)
+
+    swapped = reversed_ids[:]
+    swapped[0], swapped[1] = swapped[1], swapped[0]
+    with timed(results, "swap two"):
+        reorder_suite_test_cases(suite_id, swapped, DB_ENGINE)
+
+    # Drop the last 10%, keep the rest in place
+    keep = swapped[: len(swapped) * 9 // 10]
+    with timed(results, "replace (drop 10%)"):
+        replace_suite_test_cases(suite_id, keep, DB_ENGINE)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--suite-id", required=True, help="Existing scratch suite")
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument(
+        "--skip-baseline", action="store_true", help="Only time the set-based helpers"
+    )
+    args = parser.parse_args()
+
+    test_case_ids = create_scratch_test_cases(args.suite_id, args.rows)
+    baseline, optimized = {}, {}
+    try:
+        if not args.skip_baseline:
+            row_at_a_time(args.suite_id, test_case_ids, baseline)
+            clear_suite(args.suite_id, test_case_ids)
+        set_based(args.suite_id, test_case_ids, optimized)
+    finally:
+        with session(DB_ENGINE) as db_session:
+            db_session.execute(
+                delete(TestCaseTable).where(TestCaseTable.test_case_id.in_(test_case_ids))
+            )
+            db_session.commit()
+
+    print(f"\n{args.rows} associations on suite {args.suite_id}")
+    print(f"{'operation':<22}{'row-at-a-time':>16}{'set-based':>13}")
+    for name, elapsed in optimized.items():
+        before = f"{baseline[name]:.0f}ms" if name in baseline else "-"
+        print(f"{name:<22}{before:>16}{elapsed:>11.0f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Benchmark session start and page load time for each browser profile.
+
+Starts a fresh browser per profile, then loads the target URL several times and
+reports wall-clock and Navigation Timing numbers so profiles can be compared
+for a given browser and driver location.
+
+Usage:
+    python benchmarks/benchmark_browser_profiles.py https://example.com \
+        --browser chrome --location local --loads 5
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from common.driver_factory import driver_factory
+from common.fenrir_enums import BrowserEnum, BrowserProfileEnum, DriverLocationEnum
+
+NAVIGATION_TIMING_SCRIPT = """
+var nav = performance.getEntriesByType('navigation')[0];
+if (!nav) return null;
+return {
+    domContentLoaded: nav.domContentLoadedEventEnd - nav.startTime,
+    load: nav.loadEventEnd > 0 ? nav.loadEventEnd - nav.startTime : null
+};
+"""
+
+
+def benchmark_profile(
+    url: str, browser: str, location: str, profile: str, loads: int
+) -> dict:
+    """Time one session start and `loads` navigations for a profile."""
+    start = time.perf_counter()
+    fenrir = driver_factory(
+        browser=browser, driver_location=DriverLocationEnum(location), profile=profile
+    )
+    session_start = time.perf_counter() - start
+
+    wall, dom_ready = [], []
+    try:
+        for _ in range(loads):
+            fenrir.driver.get("about:blank")
+            start = time.perf_counter()
+            fenrir.driver.get(url)
+            wall.append((time.perf_counter() - start) * 1000)
+            timing = fenrir.driver.execute_script(NAVIGATION_TIMING_SCRIPT)
+            if timing and timing.get("domContentLoaded") is not None:
+                dom_ready.append(timing["domContentLoaded"])
+    finally:
+        fenrir.quit()
+
+    return {
+        "profile": profile,
+        "session_start_ms": session_start * 1000,
+        "load_median_ms": statistics.median(wall),
+        "load_first_ms": wall[0],
+        "dcl_median_ms": statistics.median(dom_ready) if dom_ready else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("url", help="Page to load")
+    parser.add_argument(
+        "--browser", default="chrome", choices=BrowserEnum.get_valid_browsers()
+    )
+    parser.add_argument(
+        "--location",
+        default=DriverLocationEnum.LOCAL.value,
+        choices=[loc.value for loc in DriverLocationEnum],
+    )
+    parser.add_argument(
+        "--profiles",
+        nargs="+",
+        default=BrowserProfileEnum.get_valid_profiles(),
+        choices=BrowserProfileEnum.get_valid_profiles(),
+    )
+    parser.add_argument("--loads", type=int, default=5, help="Page loads per profile")
+    args = parser.parse_args()
+
+    results = [
+        benchmark_profile(args.url, args.browser, args.location, profile, args.loads)
+        for profile in args.profiles
+    ]
+
+    print(f"\n{args.browser} @ {args.location} -> {args.url} ({args.loads} loads)")
+    print(
+        f"{'profile':<15}{'session start':>15}{'first load':>13}"
+        f"{'median load':>14}{'median DCL':>13}"
+    )
+    for r in results:
+        dcl = f"{r['dcl_median_ms']:.0f}" if r["dcl_median_ms"] is not None else "-"
+        print(
+            f"{r['profile']:<15}{r['session_start_ms']:>13.0f}ms"
+            f"{r['load_first_ms']:>11.0f}ms{r['load_median_ms']:>12.0f}ms{dcl:>11}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
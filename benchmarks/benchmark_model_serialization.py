@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Benchmark list serialization of test cases from database rows to JSON bytes.
+
+Creates N scratch test cases on an existing system under test, then times the
+full read path for the account's test cases both ways:
+
+- before: ORM query, TestCaseModel(**row.__dict__), then what FastAPI does with a
+  returned list (validate against response_model, jsonable_encoder, json.dumps)
+- after: query_test_cases_by_account (projected columns, model_construct) and
+  model_list_response (pydantic-core dump_json)
+
+Scratch test cases are deleted at the end.
+
+Usage:
+    python benchmarks/benchmark_model_serialization.py --sut-id <sut_id> --rows 10000
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List
+from uuid import uuid4
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+from sqlalchemy import delete, insert
+
+from app.models.auth_models import TokenPayload
+from app.responses import model_list_response
+from common.service_connections.db_service.database.engine import (
+    get_database_session as session,
+)
+from common.service_connections.db_service.database.tables.system_under_test import (
+    SystemUnderTestTable,
+)
+from common.service_connections.db_service.database.tables.test_case import (
+    TestCaseTable,
+)
+from common.service_connections.db_service.db_manager import DB_ENGINE
+from common.service_connections.db_service.models.test_case_model import (
+    TestCaseModel,
+    query_test_cases_by_account,
+)
+
+
+def create_scratch_test_cases(sut_id: str, rows: int) -> tuple:
+    with session(DB_ENGINE) as db_session:
+        sut = db_session.get(SystemUnderTestTable, sut_id)
+        if sut is None:
+            raise SystemExit(f"System under test not found: {sut_id}")
+        run = uuid4().hex[:8]
+        now = datetime.now(timezone.utc)
+        test_cases = [
+            {
+                "test_case_id": str(uuid4()),
+                "test_name": f"bench-{run}-{i:05d}",
+                "description": "Serialization benchmark row",
+                "test_type": "functional",
+                "sut_id": sut.sut_id,
+                "owner_user_id": sut.owner_user_id,
+                "account_id": sut.account_id,
+                "is_active": True,
+                "created_at": now,
+            }
+            for i in range(rows)
+        ]
+        db_session.execute(insert(TestCaseTable), test_cases)
+        db_session.commit()
+    return sut.account_id, [tc["test_case_id"] for tc in test_cases]
+
+
+def before(account_id: str) -> bytes:
+    with session(DB_ENGINE) as db_session:
+        test_cases = (
+            db_session.query(TestCaseTable)
+            .filter(TestCaseTable.account_id == account_id)
+            .filter(TestCaseTable.is_active == True)
+            .all()
+        )
+        models = [TestCaseModel(**tc.__dict__) for tc in test_cases]
+    # FastAPI's handling of a returned list with response_model=List[TestCaseModel]
+    validated = TypeAdapter(List[TestCaseModel]).validate_python(
+        [model.model_dump() for model in models]
+    )
+    return json.dumps(jsonable_encoder(validated)).encode()
+
+
+def after(account_id: str, token: TokenPayload) -> bytes:
+    with session(DB_ENGINE) as db_session:
+        models = query_test_cases_by_account(
+            account_id=account_id, token=token, session=db_session, engine=DB_ENGINE
+        )
+    return model_list_response(TestCaseModel, models).body
+
+
+def time_runs(func, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sut-id", required=True, help="Existing system under test")
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    account_id, test_case_ids = create_scratch_test_cases(args.sut_id, args.rows)
+    token = TokenPayload(
+        user_id="benchmark",
+        email="benchmark@example.com",
+        is_admin=True,
+        exp=datetime.now(timezone.utc),
+        jti="benchmark",
+        is_super_admin=True,
+    )
+    try:
+        before_s = time_runs(lambda: before(account_id), args.repeat)
+        after_s = time_runs(lambda: after(account_id, token), args.repeat)
+        total = len(json.loads(after(account_id, token)))
+    finally:
+        with session(DB_ENGINE) as db_session:
+            db_session.execute(
+                delete(TestCaseTable).where(TestCaseTable.test_case_id.in_(test_case_ids))
+            )
+            db_session.commit()
+
+    print(f"\n{total} test cases in account {account_id}, median of {args.repeat}")
+    print(f"{'path':<10}{'total':>10}{'per row':>12}")
+    for name, seconds in (("before", before_s), ("after", after_s)):
+        print(f"{name:<10}{seconds * 1000:>8.0f}ms{seconds / total * 1e6:>10.1f}us")
+    print(f"speedup   {before_s / after_s:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
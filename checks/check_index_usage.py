@@ -0,0 +1,129 @@
+"""Report index usage, sequential scans, soft-deleted rows and bloat.
+
+Counters come from pg_stat_user_indexes / pg_stat_user_tables and accumulate
+since the last stats reset, so run this against a database that has served
+real traffic. Index bloat is measured with pgstatindex when the pgstattuple
+extension is installed.
+"""
+
+from common.service_connections.db_service.db_manager import DB_ENGINE
+from sqlalchemy import text
+
+# Tables whose queries filter on is_active = true
+SOFT_DELETE_TABLES = [
+    "test_case",
+    "suite",
+    "plan",
+    "action_chain",
+    "entity_tag",
+    "plan_suite_association",
+    "suite_test_case_association",
+]
+# Tables smaller than this are cheap to scan sequentially
+MIN_SEQ_SCAN_ROWS = 1000
+
+with DB_ENGINE.connect() as conn:
+    print("=== Index usage (least used first) ===")
+    result = conn.execute(
+        text(
+            """
+        SELECT s.relname, s.indexrelname, s.idx_scan,
+               pg_size_pretty(pg_relation_size(s.indexrelid)),
+               i.indisunique OR i.indisprimary,
+               i.indpred IS NOT NULL
+        FROM pg_stat_user_indexes s
+        JOIN pg_index i ON i.indexrelid = s.indexrelid
+        WHERE s.schemaname = 'public'
+        ORDER BY s.idx_scan, pg_relation_size(s.indexrelid) DESC
+    """
+        )
+    )
+    for table, index, scans, size, unique, partial in result:
+        flags = []
+        if partial:
+            flags.append("partial")
+        if scans == 0 and not unique:
+            flags.append("UNUSED")
+        suffix = f" [{', '.join(flags)}]" if flags else ""
+        print(f"  {table}.{index}: {scans} scans, {size}{suffix}")
+
+    print(f"\n=== Sequential scans on tables over {MIN_SEQ_SCAN_ROWS} rows ===")
+    result = conn.execute(
+        text(
+            """
+        SELECT relname, seq_scan, seq_tup_read, coalesce(idx_scan, 0), n_live_tup
+        FROM pg_stat_user_tables
+        WHERE schemaname = 'public'
+          AND n_live_tup >= :min_rows
+          AND seq_scan > coalesce(idx_scan, 0)
+        ORDER BY seq_tup_read DESC
+    """
+        ),
+        {"min_rows": MIN_SEQ_SCAN_ROWS},
+    )
+    rows = result.fetchall()
+    for table, seq_scan, seq_read, idx_scan, live in rows:
+        print(
+            f"  {table}: {seq_scan} seq scans ({seq_read} rows read) vs "
+            f"{idx_scan} index scans, {live} live rows"
+        )
+    if not rows:
+        print("  None - index scans dominate on all large tables")
+
+    print("\n=== Soft-deleted rows (is_active = false) ===")
+    for table in SOFT_DELETE_TABLES:
+        total, inactive = conn.execute(
+            text(
+                f'SELECT count(*), count(*) FILTER (WHERE NOT is_active) FROM "{table}"'
+            )
+        ).one()
+        ratio = inactive / total if total else 0.0
+        print(f"  {table}: {inactive}/{total} inactive ({ratio:.0%})")
+
+    print("\n=== Table bloat (dead tuples) ===")
+    result = conn.execute(
+        text(
+            """
+        SELECT relname, n_live_tup, n_dead_tup,
+               greatest(last_vacuum, last_autovacuum)
+        FROM pg_stat_user_tables
+        WHERE schemaname = 'public' AND n_dead_tup > 0
+        ORDER BY n_dead_tup DESC
+    """
+        )
+    )
+    for table, live, dead, vacuumed in result:
+        ratio = dead / (live + dead)
+        print(
+            f"  {table}: {dead} dead / {live} live ({ratio:.0%}), "
+            f"last vacuum: {vacuumed or 'never'}"
+        )
+
+    print("\n=== Index bloat (btree leaf density) ===")
+    has_pgstattuple = conn.execute(
+        text("SELECT EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pgstattuple')")
+    ).scalar()
+    if not has_pgstattuple:
+        print("  Skipped - run CREATE EXTENSION pgstattuple to measure index bloat")
+    else:
+        result = conn.execute(
+            text(
+                """
+            SELECT c.relname, pi.avg_leaf_density, pi.leaf_fragmentation,
+                   pg_size_pretty(pi.index_size)
+            FROM pg_class c
+            JOIN pg_namespace n ON n.oid = c.relnamespace
+            JOIN pg_am am ON am.oid = c.relam
+            CROSS JOIN LATERAL pgstatindex(c.oid) pi
+            WHERE n.nspname = 'public' AND c.relkind = 'i' AND am.amname = 'btree'
+            ORDER BY pi.avg_leaf_density
+        """
+            )
+        )
+        for index, density, fragmentation, size in result:
+            # Freshly built btrees sit near 90% density (the default fillfactor)
+            flag = " [REINDEX candidate]" if density < 50 else ""
+            print(
+                f"  {index}: {density:.0f}% leaf density, "
+                f"{fragmentation:.0f}% fragmented, {size}{flag}"
+            )
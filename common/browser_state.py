@@ -0,0 +1,439 @@
+"""
+Authenticated browser-state snapshots for skipping UI logins.
+
+A snapshot captures cookies plus local and session storage for one user in one
+environment. It is cached until the embedded token expires and injected into
+fresh or pooled sessions, so each test starts already authenticated instead of
+driving the login form.
+
+Usage:
+    def login_once() -> BrowserStateSnapshot:
+        LoginPage(fenrir, base_url).login(username, password)
+        return capture_browser_state(fenrir.driver, user=username, environment="dev")
+
+    cache = get_browser_state_cache()
+    snapshot = cache.get_or_create(user=username, environment="dev", factory=login_once)
+    restore_browser_state(fenrir.driver, snapshot, navigate_to=f"{base_url}/dashboard")
+"""
+
+import base64
+import json
+import logging
+import os
+import tempfile
+import threading
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from pydantic import BaseModel
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+log = logging.getLogger(__name__)
+
+# Snapshots are treated as expired this long before the token actually expires.
+EXPIRY_SKEW = timedelta(seconds=60)
+
+# Used when neither a token nor a cookie carries an expiry.
+DEFAULT_SNAPSHOT_TTL = timedelta(minutes=30)
+
+CAPTURE_SCRIPT = """
+const read = (storage) => {
+    const items = {};
+    for (let i = 0; i < storage.length; ++i) {
+        const key = storage.key(i);
+        items[key] = storage.getItem(key);
+    }
+    return items;
+};
+return {
+    origin: window.location.origin,
+    local_storage: read(window.localStorage),
+    session_storage: read(window.sessionStorage),
+};
+"""
+
+RESTORE_SCRIPT = """
+const localItems = arguments[0], sessionItems = arguments[1], cookies = arguments[2];
+window.localStorage.clear();
+window.sessionStorage.clear();
+for (const [key, value] of Object.entries(localItems)) {
+    window.localStorage.setItem(key, value);
+}
+for (const [key, value] of Object.entries(sessionItems)) {
+    window.sessionStorage.setItem(key, value);
+}
+for (const cookie of cookies) {
+    let entry = `${cookie.name}=${cookie.value}; path=${cookie.path || "/"}`;
+    if (cookie.expiry) { entry += `; expires=${new Date(cookie.expiry * 1000).toUTCString()}`; }
+    if (cookie.secure) { entry += "; secure"; }
+    if (cookie.sameSite) { entry += `; samesite=${cookie.sameSite}`; }
+    document.cookie = entry;
+}
+"""
+
+
+class BrowserStateSnapshot(BaseModel):
+    """
+    Cookies and web storage captured for one authenticated user.
+
+    Fields:
+    - user (str): Name of the test user the state belongs to
+    - environment (str): Target environment (dev, qa, ...)
+    - origin (str): Origin the storage belongs to, e.g. https://app.example.com
+    - cookies (List[dict]): Cookies as returned by WebDriver.get_cookies()
+    - local_storage (Dict[str, str]): window.localStorage contents
+    - session_storage (Dict[str, str]): window.sessionStorage contents
+    - captured_at (datetime): When the snapshot was taken
+    - expires_at (datetime | None): When the captured credentials expire
+    """
+
+    user: str
+    environment: str
+    origin: str
+    cookies: List[Dict[str, Any]] = []
+    local_storage: Dict[str, str] = {}
+    session_storage: Dict[str, str] = {}
+    captured_at: datetime
+    expires_at: Optional[datetime] = None
+
+    @property
+    def key(self) -> Tuple[str, str]:
+        return (self.user, self.environment)
+
+    def is_expired(self, now: Optional[datetime] = None) -> bool:
+        """True once the snapshot is within EXPIRY_SKEW of its expiry."""
+        now = now or datetime.now(timezone.utc)
+        expires_at = self.expires_at or (self.captured_at + DEFAULT_SNAPSHOT_TTL)
+        return now >= expires_at - EXPIRY_SKEW
+
+
+################ Capture & Restore ################
+
+
+def capture_browser_state(
+    driver: WebDriver,
+    user: str,
+    environment: str,
+    expires_at: Optional[datetime] = None,
+) -> BrowserStateSnapshot:
+    """
+    Capture cookies and both web storages from the current page.
+
+    Call this once after a successful login. Storage is read in one script call;
+    cookies need their own WebDriver command so HttpOnly cookies are included.
+
+    Args:
+        driver (WebDriver): Driver positioned on a page of the logged-in app.
+        user (str): Test user name the state belongs to.
+        environment (str): Target environment.
+        expires_at (datetime | None): Explicit expiry; derived from the stored
+            token or cookies when omitted.
+
+    Returns:
+        BrowserStateSnapshot: The captured state.
+    """
+    storage = driver.execute_script(CAPTURE_SCRIPT)
+    snapshot = BrowserStateSnapshot(
+        user=user,
+        environment=environment,
+        origin=storage["origin"],
+        cookies=driver.get_cookies(),
+        local_storage=storage["local_storage"] or {},
+        session_storage=storage["session_storage"] or {},
+        captured_at=datetime.now(timezone.utc),
+        expires_at=expires_at,
+    )
+    if snapshot.expires_at is None:
+        snapshot.expires_at = _derive_expiry(snapshot)
+    return snapshot
+
+
+def restore_browser_state(
+    driver: WebDriver,
+    snapshot: BrowserStateSnapshot,
+    navigate_to: Optional[str] = None,
+) -> None:
+    """
+    Inject a snapshot into a fresh or pooled session.
+
+    Storage and script-visible cookies are written in a single execute_script
+    call. On Chromium, all cookies (including HttpOnly) are set with one CDP
+    command; other browsers fall back to add_cookie for HttpOnly cookies only.
+
+    Args:
+        driver (WebDriver): The session to authenticate.
+        snapshot (BrowserStateSnapshot): Previously captured state.
+        navigate_to (str | None): URL to open afterwards. Defaults to reloading the origin.
+    """
+    if _origin_of(driver.current_url) != snapshot.origin:
+        # Storage and cookies are origin-scoped, so the session must be on the app.
+        driver.get(snapshot.origin)
+
+    script_cookies = [c for c in snapshot.cookies if not c.get("httpOnly")]
+    http_only_cookies = [c for c in snapshot.cookies if c.get("httpOnly")]
+    if http_only_cookies and _set_cookies_via_cdp(driver, snapshot):
+        script_cookies, http_only_cookies = [], []
+
+    driver.execute_script(
+        RESTORE_SCRIPT,
+        snapshot.local_storage,
+        snapshot.session_storage,
+        script_cookies,
+    )
+    for cookie in http_only_cookies:
+        driver.add_cookie(_webdriver_cookie(cookie))
+
+    driver.get(navigate_to or snapshot.origin)
+
+
+def snapshot_from_token(
+    access_token: str,
+    user: str,
+    environment: str,
+    origin: str,
+    storage_key: str = "access_token",
+    use_session_storage: bool = True,
+    refresh_token: Optional[str] = None,
+) -> BrowserStateSnapshot:
+    """
+    Build a snapshot from a minted token without driving the UI at all.
+
+    The Fenrir frontend keeps its JWT in sessionStorage; apps that use
+    localStorage can pass use_session_storage=False.
+
+    Args:
+        access_token (str): JWT access token.
+        user (str): Test user name.
+        environment (str): Target environment.
+        origin (str): Origin of the app under test.
+        storage_key (str, optional): Storage key for the token. Defaults to "access_token".
+        use_session_storage (bool, optional): Store in sessionStorage. Defaults to True.
+        refresh_token (str | None, optional): Stored under "refresh_token" when given.
+
+    Returns:
+        BrowserStateSnapshot: Snapshot expiring with the token's exp claim.
+    """
+    items = {storage_key: access_token}
+    if refresh_token:
+        items["refresh_token"] = refresh_token
+    return BrowserStateSnapshot(
+        user=user,
+        environment=environment,
+        origin=_origin_of(origin),
+        session_storage=items if use_session_storage else {},
+        local_storage={} if use_session_storage else items,
+        captured_at=datetime.now(timezone.utc),
+        expires_at=jwt_expiry(access_token),
+    )
+
+
+def request_access_token(
+    base_url: str, email: str, password: str, timeout: float = 10
+) -> Dict[str, Any]:
+    """
+    Log in through the JWT API (same endpoint as app/scripts/get_jwt_token.py).
+
+    Returns:
+        dict: The login response with access_token, refresh_token and expires_in.
+
+    Raises:
+        requests.HTTPError: If the login is rejected.
+    """
+    response = requests.post(
+        f"{base_url.rstrip('/')}/v1/api/auth/login",
+        json={"email": email, "password": password},
+        timeout=timeout,
+    )
+    response.raise_for_status()
+    return response.json()
+
+
+################ Snapshot Cache ################
+
+
+class BrowserStateCache:
+    """
+    Cache of snapshots keyed by (user, environment), valid until token expiry.
+
+    Snapshots live in memory and, when cache_dir is set, as JSON files so that
+    every pytest-xdist worker can reuse one login instead of each logging in.
+
+    Args:
+        cache_dir (str | Path | None): Directory for shared snapshot files. Defaults to None.
+    """
+
+    def __init__(self, cache_dir: str | Path | None = None):
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self._snapshots: Dict[Tuple[str, str], BrowserStateSnapshot] = {}
+        self._lock = threading.Lock()
+
+    def get(self, user: str, environment: str) -> Optional[BrowserStateSnapshot]:
+        """Return an unexpired snapshot, or None."""
+        key = (user, environment)
+        with self._lock:
+            snapshot = self._snapshots.get(key)
+        if snapshot is None:
+            snapshot = self._read_file(key)
+        if snapshot is None or snapshot.is_expired():
+            return None
+        with self._lock:
+            self._snapshots[key] = snapshot
+        return snapshot
+
+    def put(self, snapshot: BrowserStateSnapshot) -> None:
+        """Store a snapshot in memory and, if configured, on disk."""
+        with self._lock:
+            self._snapshots[snapshot.key] = snapshot
+        self._write_file(snapshot)
+
+    def get_or_create(
+        self,
+        user: str,
+        environment: str,
+        factory: Callable[[], BrowserStateSnapshot],
+    ) -> BrowserStateSnapshot:
+        """
+        Return the cached snapshot or build one with factory (e.g. a UI login).
+        """
+        snapshot = self.get(user, environment)
+        if snapshot is None:
+            log.info(f"Capturing browser state for {user} in {environment}")
+            snapshot = factory()
+            self.put(snapshot)
+        return snapshot
+
+    def invalidate(self, user: str, environment: str) -> None:
+        """Drop a snapshot, e.g. after the app rejected it."""
+        key = (user, environment)
+        with self._lock:
+            self._snapshots.pop(key, None)
+        path = self._path(key)
+        if path is not None:
+            path.unlink(missing_ok=True)
+
+    def _path(self, key: Tuple[str, str]) -> Optional[Path]:
+        if self.cache_dir is None:
+            return None
+        safe = "_".join(part.replace(os.sep, "_") for part in key)
+        return self.cache_dir / f"{safe}.json"
+
+    def _read_file(self, key: Tuple[str, str]) -> Optional[BrowserStateSnapshot]:
+        path = self._path(key)
+        if path is None or not path.exists():
+            return None
+        try:
+            return BrowserStateSnapshot.model_validate_json(path.read_text("utf-8"))
+        except (OSError, ValueError) as e:
+            log.warning(f"Ignoring unreadable browser state file {path}: {e}")
+            return None
+
+    def _write_file(self, snapshot: BrowserStateSnapshot) -> None:
+        path = self._path(snapshot.key)
+        if path is None:
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write then rename so concurrent workers never read a partial file.
+        with tempfile.NamedTemporaryFile(
+            "w", dir=path.parent, delete=False, encoding="utf-8", suffix=".tmp"
+        ) as file:
+            file.write(snapshot.model_dump_json())
+        os.replace(file.name, path)
+
+
+_cache: Optional[BrowserStateCache] = None
+
+
+def get_browser_state_cache() -> BrowserStateCache:
+    """
+    Get the process-wide snapshot cache.
+
+    Set BROWSER_STATE_CACHE_DIR to share snapshots across pytest-xdist workers.
+    """
+    global _cache
+    if _cache is None:
+        _cache = BrowserStateCache(cache_dir=os.getenv("BROWSER_STATE_CACHE_DIR"))
+    return _cache
+
+
+################ Helpers ################
+
+
+def jwt_expiry(token: str) -> Optional[datetime]:
+    """
+    Read the exp claim from a JWT without verifying it.
+
+    Returns:
+        datetime | None: Expiry in UTC, or None if the token is not a JWT with exp.
+    """
+    parts = token.split(".")
+    if len(parts) != 3:
+        return None
+    try:
+        payload = parts[1] + "=" * (-len(parts[1]) % 4)
+        claims = json.loads(base64.urlsafe_b64decode(payload))
+        return datetime.fromtimestamp(int(claims["exp"]), tz=timezone.utc)
+    except (ValueError, KeyError, TypeError):
+        return None
+
+
+def _derive_expiry(snapshot: BrowserStateSnapshot) -> Optional[datetime]:
+    """Earliest expiry among stored JWTs, falling back to auth cookie expiries."""
+    candidates = []
+    values = list(snapshot.local_storage.values())
+    values.extend(snapshot.session_storage.values())
+    values.extend(cookie.get("value", "") for cookie in snapshot.cookies)
+    for value in values:
+        expiry = jwt_expiry(value) if isinstance(value, str) else None
+        if expiry is not None:
+            candidates.append(expiry)
+    if not candidates:
+        candidates = [
+            datetime.fromtimestamp(cookie["expiry"], tz=timezone.utc)
+            for cookie in snapshot.cookies
+            if cookie.get("expiry")
+        ]
+    return min(candidates) if candidates else None
+
+
+def _origin_of(url: str) -> str:
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}" if parts.netloc else url
+
+
+def _webdriver_cookie(cookie: Dict[str, Any]) -> Dict[str, Any]:
+    allowed = {"name", "value", "path", "domain", "secure", "httpOnly", "expiry", "sameSite"}
+    return {key: value for key, value in cookie.items() if key in allowed}
+
+
+def _set_cookies_via_cdp(driver: WebDriver, snapshot: BrowserStateSnapshot) -> bool:
+    """Set every cookie in one Network.setCookies call on Chromium browsers."""
+    if not hasattr(driver, "execute_cdp_cmd"):
+        return False
+    cookies = []
+    for cookie in snapshot.cookies:
+        entry = {
+            "name": cookie["name"],
+            "value": cookie["value"],
+            "path": cookie.get("path", "/"),
+            "secure": cookie.get("secure", False),
+            "httpOnly": cookie.get("httpOnly", False),
+        }
+        if cookie.get("domain"):
+            entry["domain"] = cookie["domain"]
+        else:
+            entry["url"] = snapshot.origin
+        if cookie.get("expiry"):
+            entry["expires"] = cookie["expiry"]
+        if cookie.get("sameSite"):
+            entry["sameSite"] = cookie["sameSite"]
+        cookies.append(entry)
+    try:
+        driver.execute_cdp_cmd("Network.setCookies", {"cookies": cookies})
+        return True
+    except WebDriverException as e:
+        log.debug(f"CDP cookie injection unavailable, falling back: {e}")
+        return False
@@ -0,0 +1,349 @@
+"""
+Per-command WebDriver timing instrumentation.
+
+Wraps the WebDriver command executor so every wire command (findElement, click,
+executeScript, ...) is timed and tagged with the current test, step and phase.
+Time spent inside explicit waits is recorded as "wait", everything else as
+"action", which separates a slow application or grid from time burned polling.
+SeleniumController reports find_element/find_elements retries to the recorder.
+
+Load the fixtures with:
+
+    pytest_plugins = ["common.command_timing"]
+
+Each test gets a summary in the log and the whole session is written to a JSON
+trace file that is sent to the reporting service at session end.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Dict, Generator, List, Optional
+
+import pytest
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.support.wait import WebDriverWait
+
+from common.config import get_cloud_service_config, get_command_timing_config
+
+WAIT_PHASE = "wait"
+ACTION_PHASE = "action"
+
+
+@dataclass
+class CommandRecord:
+    """
+    One timed WebDriver command.
+
+    Fields:
+    - command (str): The Selenium Command name, e.g. "findElement"
+    - duration_ms (float): Round-trip latency of the command
+    - phase (str): "wait" when issued from an explicit wait, otherwise "action"
+    - test (str | None): pytest node id of the running test
+    - step (str | None): Step label set with CommandTimingRecorder.step()
+    - started_at (float): time.time() when the command was sent
+    - error (str | None): Exception class name if the command raised
+    """
+
+    command: str
+    duration_ms: float
+    phase: str
+    test: Optional[str]
+    step: Optional[str]
+    started_at: float
+    error: Optional[str] = None
+
+
+class CommandTimingRecorder:
+    """
+    Collects CommandRecords and retry counts for one or more tests.
+
+    Args:
+        log (logging.Logger, optional): Logger instance.
+
+    Usage:
+        recorder = CommandTimingRecorder()
+        fenrir.timing = recorder
+        recorder.start_test("tests/ui/test_login.py::test_login")
+        with instrument_driver(fenrir.driver, recorder):
+            with recorder.step("submit credentials"):
+                fenrir.click(fenrir.find_element(By.ID, "submit"))
+        recorder.summary()
+    """
+
+    def __init__(self, log: logging.Logger = logging.getLogger(__name__)):
+        self.log = log
+        self.records: List[CommandRecord] = []
+        self.retries: Dict[str, Counter] = defaultdict(Counter)
+        self.current_test: Optional[str] = None
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    @property
+    def current_step(self) -> Optional[str]:
+        return getattr(self._local, "step", None)
+
+    @property
+    def current_phase(self) -> str:
+        return getattr(self._local, "phase", ACTION_PHASE)
+
+    def start_test(self, test_name: str) -> None:
+        """Tag every following command with test_name."""
+        self.current_test = test_name
+
+    @contextmanager
+    def step(self, name: str) -> Generator[None, None, None]:
+        """Tag commands issued inside the block with a step label."""
+        previous = self.current_step
+        self._local.step = name
+        try:
+            yield
+        finally:
+            self._local.step = previous
+
+    @contextmanager
+    def phase(self, name: str) -> Generator[None, None, None]:
+        """Mark commands issued inside the block as "wait" or "action" time."""
+        previous = self.current_phase
+        self._local.phase = name
+        try:
+            yield
+        finally:
+            self._local.phase = previous
+
+    def record_command(
+        self,
+        command: str,
+        duration_ms: float,
+        started_at: float,
+        error: Optional[str] = None,
+    ) -> None:
+        record = CommandRecord(
+            command=command,
+            duration_ms=duration_ms,
+            phase=self.current_phase,
+            test=self.current_test,
+            step=self.current_step,
+            started_at=started_at,
+            error=error,
+        )
+        with self._lock:
+            self.records.append(record)
+
+    def record_retry(self, method: str) -> None:
+        """Count one retry of a SeleniumController lookup for the current test."""
+        with self._lock:
+            self.retries[self.current_test or ""][method] += 1
+
+    def summary(self, test_name: Optional[str] = None) -> dict:
+        """
+        Aggregate the records for one test (or all tests).
+
+        Args:
+            test_name (str | None): pytest node id; None summarises everything.
+
+        Returns:
+            dict: Command count, wait/action totals, per-command latency and retries.
+        """
+        with self._lock:
+            records = [
+                r for r in self.records if test_name is None or r.test == test_name
+            ]
+            if test_name is None:
+                retries = Counter()
+                for counts in self.retries.values():
+                    retries.update(counts)
+            else:
+                retries = Counter(self.retries.get(test_name, {}))
+
+        by_command: Dict[str, List[float]] = defaultdict(list)
+        totals = Counter()
+        for record in records:
+            by_command[record.command].append(record.duration_ms)
+            totals[record.phase] += record.duration_ms
+
+        return {
+            "test": test_name,
+            "commands": len(records),
+            "wait_ms": round(totals[WAIT_PHASE], 2),
+            "action_ms": round(totals[ACTION_PHASE], 2),
+            "retries": dict(retries),
+            "by_command": {
+                command: {
+                    "count": len(durations),
+                    "total_ms": round(sum(durations), 2),
+                    "max_ms": round(max(durations), 2),
+                    "p50_ms": round(_percentile(durations, 50), 2),
+                    "p95_ms": round(_percentile(durations, 95), 2),
+                }
+                for command, durations in sorted(
+                    by_command.items(), key=lambda item: -sum(item[1])
+                )
+            },
+        }
+
+    def write_trace(self, file_path: str) -> str:
+        """
+        Write every record plus per-test summaries as JSON.
+
+        Args:
+            file_path (str): Destination file; parent directories are created.
+
+        Returns:
+            str: The path written.
+        """
+        with self._lock:
+            records = [asdict(r) for r in self.records]
+            tests = sorted({r.test for r in self.records if r.test})
+        trace = {
+            "generated_at": datetime.now().isoformat(),
+            "worker": os.getenv("PYTEST_XDIST_WORKER", "main"),
+            "summary": self.summary(),
+            "tests": {test: self.summary(test) for test in tests},
+            "records": records,
+        }
+        os.makedirs(os.path.dirname(os.path.abspath(file_path)), exist_ok=True)
+        with open(file_path, "w") as trace_file:
+            json.dump(trace, trace_file)
+        return file_path
+
+
+class TimedWebDriverWait(WebDriverWait):
+    """
+    WebDriverWait whose polling commands are recorded as wait time.
+    """
+
+    def __init__(self, driver, recorder: CommandTimingRecorder, *args, **kwargs):
+        super().__init__(driver, *args, **kwargs)
+        self.recorder = recorder
+
+    def until(self, method, message: str = ""):
+        with self.recorder.phase(WAIT_PHASE):
+            return super().until(method, message)
+
+    def until_not(self, method, message: str = ""):
+        with self.recorder.phase(WAIT_PHASE):
+            return super().until_not(method, message)
+
+
+@contextmanager
+def instrument_driver(
+    driver: WebDriver, recorder: CommandTimingRecorder
+) -> Generator[WebDriver, None, None]:
+    """
+    Wrap driver.command_executor.execute so each command inside the block is timed.
+
+    The executor is restored on exit, so pooled drivers go back to the pool
+    uninstrumented. Nesting replaces the outer recorder for the inner block
+    rather than stacking wrappers.
+
+    Args:
+        driver (WebDriver): The driver to instrument.
+        recorder (CommandTimingRecorder): Where records are sent.
+
+    Yields:
+        WebDriver: The same driver.
+    """
+    executor = driver.command_executor
+    saved = {
+        name: vars(executor)[name]
+        for name in ("execute", "_fenrir_untimed_execute")
+        if name in vars(executor)
+    }
+    execute = getattr(executor, "_fenrir_untimed_execute", executor.execute)
+
+    def timed_execute(command, params):
+        started_at = time.time()
+        start = time.perf_counter()
+        error = None
+        try:
+            return execute(command, params)
+        except Exception as e:
+            error = type(e).__name__
+            raise
+        finally:
+            recorder.record_command(
+                command=command,
+                duration_ms=(time.perf_counter() - start) * 1000,
+                started_at=started_at,
+                error=error,
+            )
+
+    executor._fenrir_untimed_execute = execute
+    executor.execute = timed_execute
+    try:
+        yield driver
+    finally:
+        for name in ("execute", "_fenrir_untimed_execute"):
+            if name in saved:
+                setattr(executor, name, saved[name])
+            else:
+                vars(executor).pop(name, None)
+
+
+def _percentile(values: List[float], percent: float) -> float:
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, round(percent / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+################ Pytest Fixtures ################
+
+
+@pytest.fixture(scope="session")
+def command_timing() -> Generator[CommandTimingRecorder, None, None]:
+    """
+    Session recorder; writes the trace and sends it to the reporting service.
+    """
+    recorder = CommandTimingRecorder()
+    yield recorder
+
+    timing_config = get_command_timing_config()
+    if not timing_config.enabled or not recorder.records:
+        return
+    file_name = (
+        f"command-timing-{os.getenv('PYTEST_XDIST_WORKER', 'main')}-"
+        f"{datetime.now().strftime('%Y%m%d%H%M%S')}.json"
+    )
+    trace_path = recorder.write_trace(os.path.join(timing_config.trace_dir, file_name))
+    recorder.log.info(f"Command timing trace written to {trace_path}")
+    if timing_config.report_destination:
+        # Imported lazily: the reporting service pulls in cloud SDKs.
+        from common.service_connections.reporting_service import (
+            choose_report_service_based_on_environment,
+        )
+
+        reporting_service = choose_report_service_based_on_environment(
+            get_cloud_service_config().cloud_service
+        )
+        reporting_service.send_report(trace_path, timing_config.report_destination)
+
+
+@pytest.fixture
+def timed_fenrir(request, pooled_fenrir, command_timing):
+    """
+    pooled_fenrir with command timing attached for the duration of one test.
+
+    Requires common.driver_pool to be loaded as a plugin as well.
+    """
+    if not get_command_timing_config().enabled:
+        yield pooled_fenrir
+        return
+
+    command_timing.start_test(request.node.nodeid)
+    try:
+        with instrument_driver(pooled_fenrir.driver, command_timing):
+            pooled_fenrir.timing = command_timing
+            yield pooled_fenrir
+    finally:
+        pooled_fenrir.timing = None
+        command_timing.log.info(
+            f"Command timing: {json.dumps(command_timing.summary(request.node.nodeid))}"
+        )
+        command_timing.start_test(None)
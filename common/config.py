@@ -7,6 +7,8 @@ import os
 from dotenv import load_dotenv
 from pydantic import BaseModel
 
+from common.fenrir_enums import BrowserProfileEnum
+
 
 class ConfigException(Exception):
     pass
@@ -122,10 +124,28 @@ def get_email_service_config() -> EmailServiceConfig:
     )
 
 
+class EmailWorkerConfig(BaseModel):
+    max_workers: int = 4
+    batch_size: int = 10
+    poll_interval_seconds: float = 30.0
+    retry_after_seconds: float = 300.0
+
+
+def get_email_worker_config() -> EmailWorkerConfig:
+    load_dotenv()
+    return EmailWorkerConfig(
+        max_workers=int(os.getenv("EMAIL_WORKER_THREADS", "4")),
+        batch_size=int(os.getenv("EMAIL_WORKER_BATCH_SIZE", "10")),
+        poll_interval_seconds=float(os.getenv("EMAIL_WORKER_POLL_SECONDS", "30")),
+        retry_after_seconds=float(os.getenv("EMAIL_WORKER_RETRY_SECONDS", "300")),
+    )
+
+
 class TestRunnerConfig(BaseModel):
     browser: str | None = "chrome"
     target_environment: str | None = "dev"
     remote_driver: str | None = None
+    browser_profile: str | None = "default"
 
 
 def get_test_runner_config() -> TestRunnerConfig:
@@ -134,12 +154,18 @@ def get_test_runner_config() -> TestRunnerConfig:
         browser=os.getenv("BROWSER"),
         target_environment=os.getenv("TARGET_ENVIRONMENT").lower(),
         remote_driver=os.getenv("REMOTE_DRIVER_URL"),
+        browser_profile=(os.getenv("BROWSER_PROFILE") or "default").lower(),
     )
     if runner.target_environment not in ["dev", "qa", "uat", "staging", "production"]:
         raise BadConfiguration(
             f"Invalid target environment: {runner.target_environment}. "
             "Expected one of: dev, qa, uat, staging, production."
         )
+    if not BrowserProfileEnum.is_valid_profile(runner.browser_profile):
+        raise BadConfiguration(
+            f"Invalid browser profile: {runner.browser_profile}. "
+            f"Expected one of: {', '.join(BrowserProfileEnum.get_valid_profiles())}."
+        )
     return runner
 
 
@@ -156,6 +182,37 @@ def get_driver_factory_config() -> DriverFactoryConfig:
     )
 
 
+class CommandTimingConfig(BaseModel):
+    enabled: bool = False
+    trace_dir: str = "reports/command_timing"
+    report_destination: str | None = None
+
+
+def get_command_timing_config() -> CommandTimingConfig:
+    load_dotenv()
+    return CommandTimingConfig(
+        enabled=(os.getenv("COMMAND_TIMING_ENABLED") or "false").lower() == "true",
+        trace_dir=os.getenv("COMMAND_TIMING_TRACE_DIR") or "reports/command_timing",
+        report_destination=os.getenv("COMMAND_TIMING_REPORT_DESTINATION"),
+    )
+
+
+class DriverPoolConfig(BaseModel):
+    max_uses: int = 25
+    max_idle_per_key: int = 2
+    max_age_seconds: float | None = None
+
+
+def get_driver_pool_config() -> DriverPoolConfig:
+    load_dotenv()
+    max_age = os.getenv("DRIVER_POOL_MAX_AGE_SECONDS")
+    return DriverPoolConfig(
+        max_uses=int(os.getenv("DRIVER_POOL_MAX_USES", "25")),
+        max_idle_per_key=int(os.getenv("DRIVER_POOL_MAX_IDLE", "2")),
+        max_age_seconds=float(max_age) if max_age else None,
+    )
+
+
 class PipelineConfig(BaseModel):
     is_ci_job: bool | None = False
 
@@ -1,6 +1,9 @@
 import logging
 import os
+import tempfile
+from dataclasses import dataclass, replace
 from datetime import datetime
+from pathlib import Path
 
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
@@ -11,16 +14,121 @@ from selenium.webdriver.edge.webdriver import WebDriver as EdgeDriver
 from selenium.webdriver.remote.webdriver import WebDriver as RemoteWebDriver
 
 from common.selenium_controller import SeleniumController
-from common.fenrir_enums import BrowserEnum, DriverLocationEnum
+from common.fenrir_enums import BrowserEnum, BrowserProfileEnum, DriverLocationEnum
 
 
 class InvalidWebdriverException(Exception):
     pass
 
 
-def add_browser_options(browser: str) -> ChromeOptions | FirefoxOptions | EdgeOptions:
+@dataclass(frozen=True)
+class BrowserProfile:
     """
-    Adds browser-specific options.
+    Performance settings applied to browser options for every browser and location.
+
+    Fields:
+    - name (str): BrowserProfileEnum value
+    - headless (bool): Run without a visible window
+    - disable_images (bool): Do not download or decode images
+    - disable_fonts (bool): Do not download web fonts
+    - page_load_strategy (str): "normal", "eager" or "none"
+    - disable_background_throttling (bool): Keep timers/renderers at full speed in background tabs
+    - use_disk_cache (bool): Share one on-disk HTTP cache directory across sessions
+    """
+
+    name: str
+    headless: bool = False
+    disable_images: bool = False
+    disable_fonts: bool = False
+    page_load_strategy: str = "normal"
+    disable_background_throttling: bool = False
+    use_disk_cache: bool = False
+
+
+BROWSER_PROFILES: dict[str, BrowserProfile] = {
+    BrowserProfileEnum.DEFAULT.value: BrowserProfile(
+        name=BrowserProfileEnum.DEFAULT.value
+    ),
+    BrowserProfileEnum.HEADLESS.value: BrowserProfile(
+        name=BrowserProfileEnum.HEADLESS.value, headless=True
+    ),
+    # Eager loading, no background throttling and a warm cache; still visible.
+    BrowserProfileEnum.FAST.value: BrowserProfile(
+        name=BrowserProfileEnum.FAST.value,
+        page_load_strategy="eager",
+        disable_background_throttling=True,
+        use_disk_cache=True,
+    ),
+    BrowserProfileEnum.FAST_HEADLESS.value: BrowserProfile(
+        name=BrowserProfileEnum.FAST_HEADLESS.value,
+        headless=True,
+        page_load_strategy="eager",
+        disable_background_throttling=True,
+        use_disk_cache=True,
+    ),
+    # Only for suites that never assert on images or font rendering.
+    BrowserProfileEnum.MINIMAL.value: BrowserProfile(
+        name=BrowserProfileEnum.MINIMAL.value,
+        headless=True,
+        disable_images=True,
+        disable_fonts=True,
+        page_load_strategy="eager",
+        disable_background_throttling=True,
+        use_disk_cache=True,
+    ),
+}
+
+# Profile used when the legacy headless flag is set with a visible profile.
+HEADLESS_VARIANTS: dict[str, str] = {
+    BrowserProfileEnum.DEFAULT.value: BrowserProfileEnum.HEADLESS.value,
+    BrowserProfileEnum.FAST.value: BrowserProfileEnum.FAST_HEADLESS.value,
+}
+
+
+def get_browser_profile(
+    profile: str | BrowserProfileEnum | None = None, headless: bool = False
+) -> BrowserProfile:
+    """
+    Resolve a profile name, keeping the legacy headless flag working.
+
+    headless=True switches a visible profile to its headless variant (fast ->
+    fast-headless) instead of dropping the profile's other settings.
+    """
+    name = getattr(profile, "value", profile) or BrowserProfileEnum.DEFAULT.value
+    if name not in BROWSER_PROFILES:
+        raise InvalidWebdriverException(
+            f"Invalid browser profile: {name}. "
+            f"Expected one of: {BrowserProfileEnum.get_valid_profiles()}"
+        )
+    resolved = BROWSER_PROFILES[name]
+    if headless and not resolved.headless:
+        variant = HEADLESS_VARIANTS.get(name)
+        if variant is not None:
+            resolved = BROWSER_PROFILES[variant]
+        else:
+            resolved = replace(resolved, headless=True)
+    return resolved
+
+
+def get_browser_cache_dir(browser: str) -> str:
+    """
+    Shared on-disk cache directory for a browser (BROWSER_CACHE_DIR overrides the root).
+    """
+    root = os.getenv("BROWSER_CACHE_DIR") or os.path.join(
+        tempfile.gettempdir(), "fenrir_browser_cache"
+    )
+    path = Path(root) / browser
+    path.mkdir(parents=True, exist_ok=True)
+    return str(path)
+
+
+def add_browser_options(
+    browser: str,
+    profile: BrowserProfile | None = None,
+    driver_location: DriverLocationEnum | str | None = None,
+) -> ChromeOptions | FirefoxOptions | EdgeOptions:
+    """
+    Adds browser-specific options for the selected performance profile.
     """
     match browser:
         case BrowserEnum.CHROME.value:
@@ -31,18 +139,85 @@ def add_browser_options(browser: str) -> ChromeOptions | FirefoxOptions | EdgeOp
             options = EdgeOptions()
         case _:
             raise InvalidWebdriverException("Invalid Browser")
+
+    if profile is None:
+        return options
+
+    options.page_load_strategy = profile.page_load_strategy
+    # The cache directory lives on the machine running the browser, which is
+    # unknown for cloud sessions.
+    loc_val = getattr(driver_location, "value", driver_location)
+    use_disk_cache = profile.use_disk_cache and loc_val != DriverLocationEnum.CLOUD.value
+
+    if browser == BrowserEnum.FIREFOX.value:
+        _apply_firefox_profile(options, profile, use_disk_cache)
+    else:
+        _apply_chromium_profile(options, browser, profile, use_disk_cache)
     return options
 
 
+def _apply_chromium_profile(
+    options: ChromeOptions | EdgeOptions,
+    browser: str,
+    profile: BrowserProfile,
+    use_disk_cache: bool,
+) -> None:
+    prefs = {}
+    if profile.headless:
+        options.add_argument("--headless=new")
+        options.add_argument("--window-size=1920,1080")
+    if profile.disable_images:
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        prefs["profile.managed_default_content_settings.images"] = 2
+    if profile.disable_fonts:
+        options.add_argument("--disable-remote-fonts")
+    if profile.disable_background_throttling:
+        options.add_argument("--disable-background-timer-throttling")
+        options.add_argument("--disable-backgrounding-occluded-windows")
+        options.add_argument("--disable-renderer-backgrounding")
+    if use_disk_cache:
+        options.add_argument(f"--disk-cache-dir={get_browser_cache_dir(browser)}")
+    if prefs:
+        options.add_experimental_option("prefs", prefs)
+
+
+def _apply_firefox_profile(
+    options: FirefoxOptions, profile: BrowserProfile, use_disk_cache: bool
+) -> None:
+    if profile.headless:
+        options.add_argument("-headless")
+        options.add_argument("--width=1920")
+        options.add_argument("--height=1080")
+    if profile.disable_images:
+        options.set_preference("permissions.default.image", 2)
+    if profile.disable_fonts:
+        options.set_preference("gfx.downloadable_fonts.enabled", False)
+        options.set_preference("browser.display.use_document_fonts", 0)
+    if profile.disable_background_throttling:
+        options.set_preference("dom.min_background_timeout_value", 0)
+        options.set_preference("dom.timeout.enable_budget_timer_throttling", False)
+    if use_disk_cache:
+        options.set_preference(
+            "browser.cache.disk.parent_directory",
+            get_browser_cache_dir(BrowserEnum.FIREFOX.value),
+        )
+
+
 def driver_factory(
-    browser: str, driver_location: DriverLocationEnum, headless=False
+    browser: str,
+    driver_location: DriverLocationEnum,
+    headless=False,
+    profile: str | BrowserProfileEnum | None = None,
 ) -> SeleniumController:
     """
     browser: str - chrome
     driver_location: str - local-no-container
+    headless: bool - legacy switch, equivalent to profile="headless"
+    profile: str - BrowserProfileEnum value applied to every browser and location
     """
     driver = None
-    options = add_browser_options(browser)
+    browser_profile = get_browser_profile(profile, headless=headless)
+    options = add_browser_options(browser, browser_profile, driver_location)
 
     # NOTE:
     # Structural pattern matching with Enum members failed when duplicate Enum
@@ -58,8 +233,6 @@ def driver_factory(
         loc_val == DriverLocationEnum.LOCAL.value
         and browser_val == BrowserEnum.CHROME.value
     ):
-        if headless:
-            options.add_argument("--headless")
         driver = SeleniumController(
             driver=ChromeWebDriver(options=options), log=logging.getLogger(__name__)
         )
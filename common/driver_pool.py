@@ -0,0 +1,327 @@
+"""
+WebDriver session pool for reusing browser sessions across UI tests.
+
+Starting a browser dominates the runtime of short UI tests. The pool keeps idle
+SeleniumController sessions keyed by browser, driver location and options,
+resets their state between leases, health-checks them before reuse and recycles
+them after a fixed number of uses.
+
+Each pytest-xdist worker is its own process, so get_driver_pool() naturally gives
+every worker an isolated pool. Load the fixtures with:
+
+    pytest_plugins = ["common.driver_pool"]
+"""
+
+import atexit
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Dict, Generator, List, Optional, Tuple
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+from common.config import (
+    get_driver_factory_config,
+    get_driver_pool_config,
+    get_test_runner_config,
+)
+from common.driver_factory import driver_factory
+from common.fenrir_enums import DriverLocationEnum
+from common.selenium_controller import SeleniumController
+from common.web_local_storage_manager import WebLocalStorageManager
+from common.web_session_storage_manager import WebSessionStorageManager
+
+PoolKey = Tuple[str, str, bool, str]
+
+
+@dataclass
+class PooledSession:
+    """
+    Bookkeeping for a pooled SeleniumController.
+
+    Fields:
+    - key (PoolKey): (browser, driver_location, headless, profile) the session was created for
+    - controller (SeleniumController): The wrapped session
+    - uses (int): How many leases have been returned
+    - created_at (float): time.monotonic() when the browser started
+    """
+
+    key: PoolKey
+    controller: SeleniumController
+    uses: int = 0
+    created_at: float = field(default_factory=time.monotonic)
+
+
+class DriverSessionPool:
+    """
+    Pool of reusable SeleniumController sessions.
+
+    Args:
+        max_uses (int, optional): Leases before a session is quit and replaced. Defaults to 25.
+        max_idle_per_key (int, optional): Idle sessions kept per key; extras are quit. Defaults to 2.
+        max_age_seconds (float | None, optional): Quit sessions older than this on release. Defaults to None.
+        log (logging.Logger, optional): Logger instance.
+
+    Usage:
+        pool = get_driver_pool()
+        with pool.lease("chrome", DriverLocationEnum.LOCAL, headless=True) as fenrir:
+            fenrir.get(url)
+    """
+
+    def __init__(
+        self,
+        max_uses: int = 25,
+        max_idle_per_key: int = 2,
+        max_age_seconds: Optional[float] = None,
+        log: logging.Logger = logging.getLogger(__name__),
+    ):
+        self.max_uses = max_uses
+        self.max_idle_per_key = max_idle_per_key
+        self.max_age_seconds = max_age_seconds
+        self.log = log
+        self._idle: Dict[PoolKey, List[PooledSession]] = {}
+        self._leased: Dict[int, PooledSession] = {}
+        self._lock = threading.Lock()
+        self.created = 0
+        self.reused = 0
+        self.recycled = 0
+
+    def acquire(
+        self,
+        browser: str,
+        driver_location: DriverLocationEnum | str,
+        headless: bool = False,
+        profile: Optional[str] = None,
+    ) -> SeleniumController:
+        """
+        Lease a healthy session for the key, starting a new browser if none is idle.
+
+        Args:
+            browser (str): Browser name (BrowserEnum value).
+            driver_location (DriverLocationEnum | str): Where the driver runs.
+            headless (bool, optional): Whether the browser runs headless. Defaults to False.
+            profile (str | None, optional): BrowserProfileEnum value. Defaults to None.
+
+        Returns:
+            SeleniumController: A controller on a clean about:blank page.
+        """
+        key = _pool_key(browser, driver_location, headless, profile)
+        while True:
+            with self._lock:
+                idle = self._idle.get(key)
+                pooled = idle.pop() if idle else None
+            if pooled is None:
+                break
+            if self._is_healthy(pooled):
+                self.reused += 1
+                self._mark_leased(pooled)
+                return pooled.controller
+            self.log.warning(f"Discarding unhealthy pooled session for {key}")
+            self._quit(pooled)
+
+        controller = driver_factory(
+            browser=browser,
+            driver_location=driver_location,
+            headless=headless,
+            profile=profile,
+        )
+        self.created += 1
+        pooled = PooledSession(key=key, controller=controller)
+        self._mark_leased(pooled)
+        return controller
+
+    def release(self, controller: SeleniumController) -> None:
+        """
+        Return a leased session to the pool, resetting or recycling it.
+
+        Args:
+            controller (SeleniumController): A controller obtained from acquire().
+        """
+        with self._lock:
+            pooled = self._leased.pop(id(controller), None)
+        if pooled is None:
+            self.log.warning("Released a session that was not leased from this pool")
+            controller.quit()
+            return
+
+        pooled.uses += 1
+        expired = self.max_age_seconds is not None and (
+            time.monotonic() - pooled.created_at >= self.max_age_seconds
+        )
+        if pooled.uses >= self.max_uses or expired:
+            self.recycled += 1
+            self._quit(pooled)
+            return
+
+        if not self._reset(pooled):
+            self._quit(pooled)
+            return
+
+        with self._lock:
+            idle = self._idle.setdefault(pooled.key, [])
+            if len(idle) < self.max_idle_per_key:
+                idle.append(pooled)
+                pooled = None
+        if pooled is not None:
+            self._quit(pooled)
+
+    @contextmanager
+    def lease(
+        self,
+        browser: str,
+        driver_location: DriverLocationEnum | str,
+        headless: bool = False,
+        profile: Optional[str] = None,
+    ) -> Generator[SeleniumController, None, None]:
+        """Context manager wrapping acquire() and release()."""
+        controller = self.acquire(
+            browser, driver_location, headless=headless, profile=profile
+        )
+        try:
+            yield controller
+        finally:
+            self.release(controller)
+
+    def close_all(self) -> None:
+        """Quit every idle and leased session."""
+        with self._lock:
+            sessions = [s for idle in self._idle.values() for s in idle]
+            sessions.extend(self._leased.values())
+            self._idle.clear()
+            self._leased.clear()
+        for pooled in sessions:
+            self._quit(pooled)
+
+    def stats(self) -> Dict[str, int]:
+        """Counters for how many browsers were started, reused and recycled."""
+        with self._lock:
+            idle = sum(len(sessions) for sessions in self._idle.values())
+            leased = len(self._leased)
+        return {
+            "created": self.created,
+            "reused": self.reused,
+            "recycled": self.recycled,
+            "idle": idle,
+            "leased": leased,
+        }
+
+    def _mark_leased(self, pooled: PooledSession) -> None:
+        with self._lock:
+            self._leased[id(pooled.controller)] = pooled
+
+    def _is_healthy(self, pooled: PooledSession) -> bool:
+        """Check the session still responds; one cheap round-trip."""
+        driver = pooled.controller.driver
+        if driver is None or getattr(driver, "session_id", None) is None:
+            return False
+        try:
+            return driver.execute_script("return document.readyState") is not None
+        except WebDriverException:
+            return False
+
+    def _reset(self, pooled: PooledSession) -> bool:
+        """
+        Clear cookies and web storage, then park the session on about:blank.
+
+        Storage is origin-scoped, so it is cleared before leaving the page under test.
+        """
+        driver = pooled.controller.driver
+        try:
+            try:
+                WebLocalStorageManager(driver).clear()
+                WebSessionStorageManager(driver).clear()
+            except WebDriverException:
+                # Pages such as about:blank or data: URLs deny storage access.
+                pass
+            driver.delete_all_cookies()
+            if hasattr(driver, "execute_cdp_cmd"):
+                try:
+                    driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+                except WebDriverException:
+                    pass
+            driver.get("about:blank")
+            return True
+        except WebDriverException as e:
+            self.log.warning(f"Failed to reset pooled session for {pooled.key}: {e}")
+            return False
+
+    def _quit(self, pooled: PooledSession) -> None:
+        try:
+            pooled.controller.quit()
+        except WebDriverException as e:
+            self.log.warning(f"Failed to quit pooled session for {pooled.key}: {e}")
+
+
+def _pool_key(
+    browser: str,
+    driver_location: DriverLocationEnum | str,
+    headless: bool,
+    profile: Optional[str] = None,
+) -> PoolKey:
+    # Compare on .value strings for the same reason driver_factory does.
+    return (
+        browser,
+        getattr(driver_location, "value", driver_location),
+        bool(headless),
+        getattr(profile, "value", profile) or "default",
+    )
+
+
+_pool: Optional[DriverSessionPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_driver_pool() -> DriverSessionPool:
+    """
+    Get the process-wide session pool, creating it on first use.
+
+    Under pytest-xdist every worker is a separate process and so owns its own pool.
+    Sizing comes from DriverPoolConfig.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            pool_config = get_driver_pool_config()
+            _pool = DriverSessionPool(
+                max_uses=pool_config.max_uses,
+                max_idle_per_key=pool_config.max_idle_per_key,
+                max_age_seconds=pool_config.max_age_seconds,
+            )
+            _pool.log.info(
+                "Created driver pool for worker "
+                f"{os.getenv('PYTEST_XDIST_WORKER', 'main')}"
+            )
+            atexit.register(_pool.close_all)
+        return _pool
+
+
+################ Pytest Fixtures ################
+
+
+@pytest.fixture(scope="session")
+def driver_pool() -> Generator[DriverSessionPool, None, None]:
+    """Per-worker session pool, closed when the worker's session ends."""
+    pool = get_driver_pool()
+    yield pool
+    pool.log.info(f"Driver pool stats: {pool.stats()}")
+    pool.close_all()
+
+
+@pytest.fixture
+def pooled_fenrir(
+    driver_pool: DriverSessionPool,
+) -> Generator[SeleniumController, None, None]:
+    """Lease a SeleniumController for one test using the runner configuration."""
+    runner = get_test_runner_config()
+    factory_config = get_driver_factory_config()
+    with driver_pool.lease(
+        browser=runner.browser,
+        driver_location=factory_config.driver_location,
+        headless=factory_config.headless,
+        profile=runner.browser_profile,
+    ) as fenrir:
+        yield fenrir
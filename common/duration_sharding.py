@@ -0,0 +1,373 @@
+"""
+Duration-aware test sharding for pytest-xdist workers and Selenium grid nodes.
+
+Tests are linked to TestCaseTable rows with the fenrir_test_case marker:
+
+    @pytest.mark.fenrir_test_case("3f0c...")
+    def test_login(...): ...
+
+Historical durations (median of recent runs) are bin-packed onto N shards with
+longest-processing-time first, which keeps the slowest shard within 4/3 of the
+optimum. Suites whose test cases have distinct execution_order values are kept
+together as one ordered chain on a single shard; unordered tests are packed
+individually. Load the plugin with ``-p common.duration_sharding`` and either:
+
+    pytest -n 4 --dist loadgroup --fenrir-shards 4      # one shard per xdist worker
+    pytest --fenrir-shards 4 --fenrir-shard-index 2    # one shard per grid node / CI job
+
+Add --fenrir-record-durations to store this run's durations for future plans.
+"""
+
+import heapq
+import logging
+import os
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+import pytest
+
+log = logging.getLogger(__name__)
+
+TEST_CASE_MARKER = "fenrir_test_case"
+TEST_CASE_PROPERTY = "fenrir_test_case_id"
+DEFAULT_DURATION_SECONDS = 30.0
+
+
+@dataclass
+class ShardItem:
+    """
+    A schedulable test.
+
+    Fields:
+    - key (str): Unique key, the pytest node id when scheduling collected items
+    - estimated_seconds (float): Expected runtime
+    - test_case_id (str | None): Linked TestCaseTable row
+    - suite_id (str | None): Suite whose ordering the test must respect
+    - execution_order (int): Position inside the suite
+    """
+
+    key: str
+    estimated_seconds: float
+    test_case_id: Optional[str] = None
+    suite_id: Optional[str] = None
+    execution_order: int = 0
+
+
+@dataclass
+class ShardPlan:
+    """
+    Assignment of items to shards.
+
+    Fields:
+    - shards (List[List[str]]): Item keys per shard, in execution order
+    - loads (List[float]): Estimated seconds per shard
+    """
+
+    shards: List[List[str]]
+    loads: List[float]
+    _index: Dict[str, int] = field(default_factory=dict, repr=False)
+
+    def __post_init__(self):
+        self._index = {
+            key: shard for shard, keys in enumerate(self.shards) for key in keys
+        }
+
+    @property
+    def total_seconds(self) -> float:
+        return sum(self.loads)
+
+    @property
+    def makespan(self) -> float:
+        """Estimated wall-clock time: the load of the slowest shard."""
+        return max(self.loads, default=0.0)
+
+    @property
+    def ideal_seconds(self) -> float:
+        """Lower bound: total runtime divided evenly across shards."""
+        return self.total_seconds / len(self.loads) if self.loads else 0.0
+
+    def shard_of(self, key: str) -> int:
+        return self._index[key]
+
+
+def build_units(items: List[ShardItem]) -> List[List[ShardItem]]:
+    """
+    Group items into indivisible scheduling units.
+
+    A suite with more than one distinct execution_order becomes a single unit
+    sorted by execution_order; every other item is its own unit.
+    """
+    by_suite: Dict[str, List[ShardItem]] = defaultdict(list)
+    units: List[List[ShardItem]] = []
+    for item in items:
+        if item.suite_id is None:
+            units.append([item])
+        else:
+            by_suite[item.suite_id].append(item)
+
+    for suite_items in by_suite.values():
+        if len({item.execution_order for item in suite_items}) > 1:
+            units.append(
+                sorted(suite_items, key=lambda item: (item.execution_order, item.key))
+            )
+        else:
+            units.extend([item] for item in suite_items)
+    return units
+
+
+def plan_shards(items: List[ShardItem], shard_count: int) -> ShardPlan:
+    """
+    Bin-pack items onto shard_count shards, longest processing time first.
+
+    Deterministic for the same input, so every xdist worker computes the same plan.
+
+    Args:
+        items (List[ShardItem]): Tests to schedule.
+        shard_count (int): Number of workers or nodes.
+
+    Returns:
+        ShardPlan: Item keys per shard with estimated loads.
+
+    Raises:
+        ValueError: If shard_count is less than 1.
+    """
+    if shard_count < 1:
+        raise ValueError(f"shard_count must be >= 1, got {shard_count}")
+
+    units = build_units(items)
+    units.sort(
+        key=lambda unit: (-sum(item.estimated_seconds for item in unit), unit[0].key)
+    )
+
+    shards: List[List[str]] = [[] for _ in range(shard_count)]
+    loads = [0.0] * shard_count
+    heap = [(0.0, shard) for shard in range(shard_count)]
+    for unit in units:
+        load, shard = heapq.heappop(heap)
+        shards[shard].extend(item.key for item in unit)
+        load += sum(item.estimated_seconds for item in unit)
+        loads[shard] = load
+        heapq.heappush(heap, (load, shard))
+    return ShardPlan(shards=shards, loads=loads)
+
+
+def load_shard_items(
+    keys_to_test_case_ids: Dict[str, Optional[str]],
+    default_seconds: float = DEFAULT_DURATION_SECONDS,
+) -> List[ShardItem]:
+    """
+    Build ShardItems with duration estimates and suite ordering from the database.
+
+    Test cases without history are estimated at the median of the known estimates,
+    or default_seconds when nothing is known. A test case in several suites follows
+    the ordering of the first suite (by suite_id).
+    """
+    # Imported lazily so the plugin can be loaded without database configuration.
+    from common.service_connections.db_service.database.engine import (
+        get_database_session as session,
+    )
+    from common.service_connections.db_service.db_manager import DB_ENGINE
+    from common.service_connections.db_service.models.test_case_duration_model import (
+        query_test_case_duration_estimates,
+        query_test_case_suite_orders,
+    )
+
+    test_case_ids = sorted({tc for tc in keys_to_test_case_ids.values() if tc})
+    with session(DB_ENGINE) as db_session:
+        estimates = query_test_case_duration_estimates(
+            test_case_ids, session=db_session, engine=DB_ENGINE
+        )
+        suite_orders = query_test_case_suite_orders(
+            test_case_ids, session=db_session, engine=DB_ENGINE
+        )
+
+    first_suite: Dict[str, tuple] = {}
+    for test_case_id, suite_id, execution_order in suite_orders:
+        first_suite.setdefault(test_case_id, (suite_id, execution_order))
+
+    known = sorted(estimates.values())
+    fallback = known[len(known) // 2] if known else default_seconds
+
+    items = []
+    for key, test_case_id in keys_to_test_case_ids.items():
+        suite_id, execution_order = first_suite.get(test_case_id, (None, 0))
+        items.append(
+            ShardItem(
+                key=key,
+                estimated_seconds=estimates.get(test_case_id, fallback),
+                test_case_id=test_case_id,
+                suite_id=suite_id,
+                execution_order=execution_order,
+            )
+        )
+    return items
+
+
+################ Pytest Plugin ################
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("fenrir-sharding", "duration-aware test sharding")
+    group.addoption(
+        "--fenrir-shards",
+        type=int,
+        default=None,
+        help="Number of shards to bin-pack tests onto (defaults to -n under --dist loadgroup).",
+    )
+    group.addoption(
+        "--fenrir-shard-index",
+        type=int,
+        default=None,
+        help="Run only this shard (0-based); for one grid node or CI job per shard.",
+    )
+    group.addoption(
+        "--fenrir-record-durations",
+        action="store_true",
+        default=False,
+        help="Store test case durations from this run for future shard plans.",
+    )
+    group.addoption(
+        "--fenrir-default-duration",
+        type=float,
+        default=DEFAULT_DURATION_SECONDS,
+        help="Estimated seconds for tests with no history at all.",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        f"{TEST_CASE_MARKER}(test_case_id): link a test to a TestCaseTable row "
+        "for duration-aware sharding",
+    )
+    if config.getoption("fenrir_record_durations"):
+        config.pluginmanager.register(
+            DurationRecorder(config), "fenrir-duration-recorder"
+        )
+
+
+def _shard_count(config) -> Optional[int]:
+    shards = config.getoption("fenrir_shards")
+    if shards:
+        return shards
+    # Under xdist loadgroup, one group per worker.
+    numprocesses = getattr(config.option, "numprocesses", None)
+    if numprocesses and getattr(config.option, "dist", None) == "loadgroup":
+        return numprocesses
+    return None
+
+
+def _marker_test_case_id(item) -> Optional[str]:
+    marker = item.get_closest_marker(TEST_CASE_MARKER)
+    if marker is None:
+        return None
+    return marker.kwargs.get("test_case_id") or (marker.args[0] if marker.args else None)
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(session, config, items):
+    # tryfirst so the xdist_group markers exist before xdist rewrites node ids.
+    for item in items:
+        test_case_id = _marker_test_case_id(item)
+        if test_case_id:
+            # user_properties travel with reports back to the xdist controller.
+            item.user_properties.append((TEST_CASE_PROPERTY, test_case_id))
+
+    shard_count = _shard_count(config)
+    if not shard_count or not items:
+        return
+
+    plan = plan_shards(
+        load_shard_items(
+            {item.nodeid: _marker_test_case_id(item) for item in items},
+            default_seconds=config.getoption("fenrir_default_duration"),
+        ),
+        shard_count,
+    )
+    position = {
+        key: (shard, index)
+        for shard, keys in enumerate(plan.shards)
+        for index, key in enumerate(keys)
+    }
+    items.sort(key=lambda item: position[item.nodeid])
+
+    shard_index = config.getoption("fenrir_shard_index")
+    if shard_index is not None:
+        if not 0 <= shard_index < shard_count:
+            raise pytest.UsageError(
+                f"--fenrir-shard-index must be between 0 and {shard_count - 1}"
+            )
+        selected = [i for i in items if position[i.nodeid][0] == shard_index]
+        deselected = [i for i in items if position[i.nodeid][0] != shard_index]
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+    else:
+        for item in items:
+            item.add_marker(
+                pytest.mark.xdist_group(name=f"fenrir-shard-{position[item.nodeid][0]}")
+            )
+
+    if not hasattr(config, "workerinput"):
+        log.info(
+            f"Shard plan: {shard_count} shards, estimated makespan "
+            f"{plan.makespan:.0f}s vs ideal {plan.ideal_seconds:.0f}s"
+        )
+
+
+class DurationRecorder:
+    """
+    Plugin object that accumulates setup + call + teardown time per test and
+    stores it at session end.
+
+    Registered by pytest_configure when --fenrir-record-durations is given.
+    """
+
+    def __init__(self, config):
+        self.config = config
+        self.durations: Dict[str, dict] = {}
+
+    def pytest_runtest_logreport(self, report):
+        test_case_id = dict(report.user_properties).get(TEST_CASE_PROPERTY)
+        if not test_case_id:
+            return
+
+        entry = self.durations.setdefault(
+            report.nodeid,
+            {"test_case_id": test_case_id, "seconds": 0.0, "outcome": "passed"},
+        )
+        entry["seconds"] += report.duration
+        if report.failed:
+            entry["outcome"] = "failed"
+        elif report.skipped and entry["outcome"] == "passed":
+            entry["outcome"] = "skipped"
+        gateway = getattr(getattr(report, "node", None), "gateway", None)
+        entry["worker"] = getattr(gateway, "id", None) or os.getenv(
+            "PYTEST_XDIST_WORKER", "main"
+        )
+
+    def pytest_sessionfinish(self, session, exitstatus):
+        # Under xdist only the controller writes; it receives every worker's reports.
+        if hasattr(self.config, "workerinput") or not self.durations:
+            return
+
+        from common.service_connections.db_service.db_manager import DB_ENGINE
+        from common.service_connections.db_service.models.test_case_duration_model import (
+            TestCaseDurationModel,
+            insert_test_case_durations,
+        )
+
+        written = insert_test_case_durations(
+            [
+                TestCaseDurationModel(
+                    test_case_id=entry["test_case_id"],
+                    duration_seconds=entry["seconds"],
+                    outcome=entry["outcome"],
+                    worker=entry.get("worker"),
+                )
+                for entry in self.durations.values()
+            ],
+            engine=DB_ENGINE,
+        )
+        log.info(f"Recorded {written} test case durations")
@@ -32,6 +32,22 @@ class BrowserEnum(Enum):
         return browser in BrowserEnum.get_valid_browsers()
 
 
+class BrowserProfileEnum(Enum):
+    DEFAULT = "default"
+    HEADLESS = "headless"
+    FAST = "fast"
+    FAST_HEADLESS = "fast-headless"
+    MINIMAL = "minimal"
+
+    @staticmethod
+    def get_valid_profiles():
+        return [profile.value for profile in BrowserProfileEnum]
+
+    @staticmethod
+    def is_valid_profile(profile: str):
+        return profile in BrowserProfileEnum.get_valid_profiles()
+
+
 class DriverLocationEnum(Enum):
     LOCAL = "local"
     LOCAL_CONTAINER = "local-container"
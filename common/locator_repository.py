@@ -0,0 +1,274 @@
+"""
+Runtime locator repository for Selenium tests.
+
+Loads the identifiers stored in the database into an immutable in-memory map of
+(page_name, element_name) -> (By, value) once per session, so UI test loops can
+resolve locators by name without a database query per element lookup.
+"""
+
+import logging
+import threading
+from datetime import datetime
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
+
+from selenium.webdriver.common.by import By
+from sqlalchemy import Engine
+
+from common.service_connections.db_service.database.engine import (
+    get_database_session as session,
+)
+from common.service_connections.db_service.models.user_interface_models.identifier_model import (
+    query_identifier_locator_count,
+    query_identifier_locators,
+)
+
+Locator = Tuple[str, str]
+
+# Maps the locator_strategy strings stored on IdentifierTable to Selenium By values.
+LOCATOR_STRATEGIES: Dict[str, str] = {
+    "id": By.ID,
+    "xpath": By.XPATH,
+    "css": By.CSS_SELECTOR,
+    "css selector": By.CSS_SELECTOR,
+    "css_selector": By.CSS_SELECTOR,
+    "name": By.NAME,
+    "tag": By.TAG_NAME,
+    "tag name": By.TAG_NAME,
+    "tag_name": By.TAG_NAME,
+    "class": By.CLASS_NAME,
+    "class name": By.CLASS_NAME,
+    "class_name": By.CLASS_NAME,
+    "link text": By.LINK_TEXT,
+    "link_text": By.LINK_TEXT,
+    "partial link text": By.PARTIAL_LINK_TEXT,
+    "partial_link_text": By.PARTIAL_LINK_TEXT,
+}
+
+
+class LocatorNotFoundException(KeyError):
+    """
+    Raised when a locator is not present in the repository.
+    """
+
+    ...
+
+
+class InvalidLocatorStrategyException(ValueError):
+    """
+    Raised when an identifier uses a locator strategy Selenium does not support.
+    """
+
+    ...
+
+
+def resolve_locator_strategy(locator_strategy: str) -> str:
+    """
+    Convert a stored locator_strategy (e.g. "css", "xpath", "By.ID") to a By value.
+
+    Args:
+        locator_strategy (str): The strategy string stored on the identifier.
+
+    Returns:
+        str: The matching Selenium By value.
+
+    Raises:
+        InvalidLocatorStrategyException: If the strategy is not recognised.
+    """
+    key = locator_strategy.strip().lower()
+    if key.startswith("by."):
+        key = key[3:]
+    try:
+        return LOCATOR_STRATEGIES[key]
+    except KeyError:
+        raise InvalidLocatorStrategyException(
+            f"Unsupported locator strategy: {locator_strategy}"
+        ) from None
+
+
+class LocatorRepository:
+    """
+    Immutable, session-scoped cache of page element locators.
+
+    The repository is loaded once (typically in a session fixture) for a set of
+    pages or for every page enabled in an environment. Lookups never touch the
+    database; refresh() pulls only the rows changed since the last load using
+    the identifier and page updated_at columns.
+
+    Args:
+        engine (Engine): Database engine used for loading.
+        page_names (List[str] | None): Restrict the repository to these pages.
+        environment (str | None): Restrict the repository to pages enabled for
+            this environment key.
+        log (logging.Logger, optional): Logger instance.
+
+    Usage:
+        locators = LocatorRepository(DB_ENGINE, environment="dev").load()
+        fenrir = SeleniumController(driver, locators=locators)
+        fenrir.find_element_by_name("login_button", page_name="Login Page")
+    """
+
+    def __init__(
+        self,
+        engine: Engine,
+        page_names: Optional[List[str]] = None,
+        environment: Optional[str] = None,
+        log: logging.Logger = logging.getLogger(__name__),
+    ):
+        self.engine = engine
+        self.page_names = page_names
+        self.environment = environment
+        self.log = log
+        self._locators: Mapping[Locator, Locator] = MappingProxyType({})
+        self._by_element: Mapping[str, Locator] = MappingProxyType({})
+        self._loaded_at: Optional[datetime] = None
+        self._lock = threading.Lock()
+
+    @property
+    def locators(self) -> Mapping[Locator, Locator]:
+        """Read-only view of (page_name, element_name) -> (By, value)."""
+        return self._locators
+
+    @property
+    def loaded_at(self) -> Optional[datetime]:
+        """High-water mark of updated_at seen by the last load or refresh."""
+        return self._loaded_at
+
+    def load(self) -> "LocatorRepository":
+        """
+        Fully (re)load every active locator in scope.
+
+        Returns:
+            LocatorRepository: self, so the call can be chained at construction.
+        """
+        with session(self.engine) as db_session:
+            rows = query_identifier_locators(
+                session=db_session,
+                engine=self.engine,
+                page_names=self.page_names,
+                environment=self.environment,
+            )
+        locators: Dict[Locator, Locator] = {}
+        watermark = None
+        for page_name, element_name, strategy, query, _, updated_at in rows:
+            locators[(page_name, element_name)] = (
+                resolve_locator_strategy(strategy),
+                query,
+            )
+            watermark = _max_datetime(watermark, updated_at)
+        self._publish(locators, watermark)
+        self.log.info(f"Loaded {len(locators)} locators into repository")
+        return self
+
+    def refresh(self) -> int:
+        """
+        Incrementally apply identifier/page changes made since the last load.
+
+        Changed rows are upserted and deactivated rows dropped. Hard deletes do
+        not leave an updated_at trail, so if the active row count no longer
+        matches the map the repository falls back to a full load.
+
+        Returns:
+            int: The number of changed rows applied.
+        """
+        if self._loaded_at is None:
+            self.load()
+            return len(self._locators)
+
+        with session(self.engine) as db_session:
+            rows = query_identifier_locators(
+                session=db_session,
+                engine=self.engine,
+                page_names=self.page_names,
+                environment=self.environment,
+                updated_since=self._loaded_at,
+            )
+            active_count = query_identifier_locator_count(
+                session=db_session,
+                engine=self.engine,
+                page_names=self.page_names,
+                environment=self.environment,
+            )
+
+        locators = dict(self._locators)
+        watermark = self._loaded_at
+        for page_name, element_name, strategy, query, is_active, updated_at in rows:
+            key = (page_name, element_name)
+            if is_active:
+                locators[key] = (resolve_locator_strategy(strategy), query)
+            else:
+                locators.pop(key, None)
+            watermark = _max_datetime(watermark, updated_at)
+
+        if len(locators) != active_count:
+            self.log.info("Locator count drifted from database, reloading repository")
+            self.load()
+            return len(rows)
+
+        if rows:
+            self._publish(locators, watermark)
+            self.log.info(f"Refreshed {len(rows)} locators in repository")
+        return len(rows)
+
+    def get(self, element_name: str, page_name: Optional[str] = None) -> Locator:
+        """
+        Resolve a locator by element name, optionally scoped to a page.
+
+        Args:
+            element_name (str): The identifier element_name.
+            page_name (str | None): The page the element belongs to.
+
+        Returns:
+            Tuple[str, str]: The (By, value) locator.
+
+        Raises:
+            LocatorNotFoundException: If the locator is not in the repository.
+        """
+        if page_name is not None:
+            locator = self._locators.get((page_name, element_name))
+        else:
+            locator = self._by_element.get(element_name)
+        if locator is None:
+            raise LocatorNotFoundException(
+                f"No locator for element '{element_name}'"
+                + (f" on page '{page_name}'" if page_name else "")
+            )
+        return locator
+
+    def _publish(
+        self, locators: Dict[Locator, Locator], watermark: Optional[datetime]
+    ) -> None:
+        """Atomically swap in a new immutable snapshot of the locator map."""
+        by_element = {element: loc for (_, element), loc in locators.items()}
+        with self._lock:
+            self._locators = MappingProxyType(locators)
+            self._by_element = MappingProxyType(by_element)
+            self._loaded_at = watermark or self._loaded_at or datetime.min
+
+    def __getitem__(self, key: Locator) -> Locator:
+        page_name, element_name = key
+        return self.get(element_name, page_name=page_name)
+
+    def __contains__(self, key) -> bool:
+        if isinstance(key, tuple):
+            return key in self._locators
+        return key in self._by_element
+
+    def __len__(self) -> int:
+        return len(self._locators)
+
+    def __repr__(self) -> str:
+        return (
+            f"<LocatorRepository(locators={len(self)}, pages={self.page_names}, "
+            f"environment={self.environment})>"
+        )
+
+
+def _max_datetime(
+    current: Optional[datetime], candidate: Optional[datetime]
+) -> Optional[datetime]:
+    if candidate is None:
+        return current
+    if current is None or candidate > current:
+        return candidate
+    return current
@@ -0,0 +1,213 @@
+"""
+Opt-in browser performance metrics collection for pages under test.
+
+When a PerformanceMetricsCollector is attached to a SeleniumController, every
+document that wait_for_page_load() sees finish loading (after get() and after
+clicks that navigate) records Navigation Timing, Paint Timing
+and resource timing entries (plus Chrome DevTools Performance.getMetrics when
+the driver supports CDP) against the matching PageTable row and environment.
+Trend and regression queries live in page_performance_model.
+"""
+
+import logging
+import threading
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+from sqlalchemy import Engine
+
+from common.service_connections.db_service.database import PageTable
+from common.service_connections.db_service.database.engine import (
+    get_database_session as session,
+)
+from common.service_connections.db_service.models.user_interface_models.page_performance_model import (
+    PagePerformanceMetricModel,
+    insert_page_performance_metric,
+)
+
+# Reads every timing source in one round-trip. Values are milliseconds relative
+# to the navigation start of the current document.
+PERFORMANCE_METRICS_SCRIPT = """
+const limit = arguments[0];
+const nav = performance.getEntriesByType('navigation')[0];
+const paint = {};
+performance.getEntriesByType('paint').forEach(p => { paint[p.name] = p.startTime; });
+const resources = performance.getEntriesByType('resource');
+let transfer = 0;
+resources.forEach(r => { transfer += r.transferSize || 0; });
+const slowest = resources.slice()
+    .sort((a, b) => b.duration - a.duration)
+    .slice(0, limit)
+    .map(r => ({
+        name: r.name,
+        initiator_type: r.initiatorType,
+        duration_ms: r.duration,
+        transfer_size: r.transferSize || 0
+    }));
+const positive = v => (v && v > 0 ? v : null);
+return {
+    time_origin: performance.timeOrigin,
+    url: location.href,
+    navigation_type: nav ? nav.type : null,
+    time_to_first_byte_ms: nav ? positive(nav.responseStart) : null,
+    dom_interactive_ms: nav ? positive(nav.domInteractive) : null,
+    dom_content_loaded_ms: nav ? positive(nav.domContentLoadedEventEnd) : null,
+    load_event_ms: nav ? positive(nav.loadEventEnd) : null,
+    transfer_size_bytes: nav ? nav.transferSize : null,
+    first_paint_ms: paint['first-paint'] || null,
+    first_contentful_paint_ms: paint['first-contentful-paint'] || null,
+    resource_count: resources.length,
+    resource_transfer_bytes: transfer,
+    slowest_resources: slowest
+};
+"""
+
+
+def collect_performance_metrics(
+    driver: WebDriver, resource_limit: int = 10, include_cdp: bool = True
+) -> dict:
+    """
+    Read the timing entries for the current document.
+
+    Args:
+        driver (WebDriver): The driver on the page to measure.
+        resource_limit (int, optional): Slowest resources to keep. Defaults to 10.
+        include_cdp (bool, optional): Also read Performance.getMetrics when the
+            driver supports CDP. Defaults to True.
+
+    Returns:
+        dict: Metric values keyed like PagePerformanceMetricModel, plus time_origin.
+    """
+    metrics = driver.execute_script(PERFORMANCE_METRICS_SCRIPT, resource_limit)
+    metrics["cdp_metrics"] = _cdp_metrics(driver) if include_cdp else None
+    return metrics
+
+
+def _cdp_metrics(driver: WebDriver) -> Optional[dict]:
+    if not hasattr(driver, "execute_cdp_cmd"):
+        return None
+    try:
+        driver.execute_cdp_cmd("Performance.enable", {})
+        result = driver.execute_cdp_cmd("Performance.getMetrics", {})
+    except WebDriverException:
+        return None
+    return {metric["name"]: metric["value"] for metric in result.get("metrics", [])}
+
+
+class PerformanceMetricsCollector:
+    """
+    Collects and stores a timing sample per navigation.
+
+    Pages are matched by URL against PageTable.page_url (longest prefix wins, query
+    string and fragment ignored), loaded once per collector. Navigations to URLs
+    that match no page are skipped.
+
+    Args:
+        engine (Engine): Database engine used for page lookup and inserts.
+        environment_id (str | None): EnvironmentTable ID the samples belong to.
+        browser (str | None): Browser name stored with each sample.
+        resource_limit (int, optional): Slowest resources kept per sample. Defaults to 10.
+        log (logging.Logger, optional): Logger instance.
+
+    Usage:
+        collector = PerformanceMetricsCollector(DB_ENGINE, environment_id=env_id, browser="chrome")
+        fenrir.performance = collector
+        fenrir.get(url)  # sample stored for the matching page
+    """
+
+    def __init__(
+        self,
+        engine: Engine,
+        environment_id: Optional[str] = None,
+        browser: Optional[str] = None,
+        resource_limit: int = 10,
+        log: logging.Logger = logging.getLogger(__name__),
+    ):
+        self.engine = engine
+        self.environment_id = environment_id
+        self.browser = browser
+        self.resource_limit = resource_limit
+        self.log = log
+        self._pages: Optional[Dict[str, int]] = None
+        self._recorded_origins: set = set()
+        self._lock = threading.Lock()
+
+    def resolve_page_id(self, url: str) -> Optional[int]:
+        """Find the PageTable ID whose page_url is the longest prefix of url."""
+        pages = self._load_pages()
+        target = _normalise_url(url)
+        best_id, best_length = None, -1
+        for page_url, page_id in pages.items():
+            if target.startswith(page_url) and len(page_url) > best_length:
+                best_id, best_length = page_id, len(page_url)
+        return best_id
+
+    def time_origin(self, driver: WebDriver) -> Optional[float]:
+        """performance.timeOrigin of the current document, used to detect navigation."""
+        try:
+            return driver.execute_script("return performance.timeOrigin;")
+        except WebDriverException:
+            return None
+
+    def record(
+        self, driver: WebDriver, page_id: Optional[int] = None
+    ) -> Optional[int]:
+        """
+        Collect and store a sample for the current document.
+
+        A document is only recorded once, so calling record() again without a new
+        navigation is a no-op that costs a single timeOrigin lookup.
+
+        Args:
+            driver (WebDriver): The driver on the page to measure.
+            page_id (int | None): Page to store against; resolved from the URL if None.
+
+        Returns:
+            int | None: The stored metric_id, or None if nothing was recorded.
+        """
+        current_origin = self.time_origin(driver)
+        with self._lock:
+            if current_origin is not None and current_origin in self._recorded_origins:
+                return None
+        try:
+            metrics = collect_performance_metrics(driver, self.resource_limit)
+        except WebDriverException as e:
+            self.log.warning(f"Failed to collect performance metrics: {e}")
+            return None
+
+        time_origin = metrics.pop("time_origin", None)
+        with self._lock:
+            if time_origin in self._recorded_origins:
+                return None
+            self._recorded_origins.add(time_origin)
+
+        page_id = page_id or self.resolve_page_id(metrics["url"])
+        if page_id is None:
+            self.log.debug(f"No page matches {metrics['url']}, skipping metrics")
+            return None
+
+        metric = PagePerformanceMetricModel(
+            page_id=page_id,
+            environment_id=self.environment_id,
+            browser=self.browser,
+            **metrics,
+        )
+        return insert_page_performance_metric(metric=metric, engine=self.engine)
+
+    def _load_pages(self) -> Dict[str, int]:
+        if self._pages is None:
+            with session(self.engine) as db_session:
+                rows = (
+                    db_session.query(PageTable.page_url, PageTable.page_id)
+                    .filter(PageTable.is_active == True)
+                    .all()
+                )
+            self._pages = {_normalise_url(url): page_id for url, page_id in rows}
+        return self._pages
+
+
+def _normalise_url(url: str) -> str:
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}{parts.path}".rstrip("/").lower()
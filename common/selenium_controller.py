@@ -4,9 +4,11 @@ It is used to interact with the frontend of a web application.
 """
 
 import logging
+from contextlib import nullcontext
+from dataclasses import dataclass, field
 from enum import Enum
 import time
-from typing import Tuple
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Optional, Tuple
 
 from selenium.common.exceptions import (
     StaleElementReferenceException,
@@ -22,6 +24,11 @@ from selenium.webdriver.support import expected_conditions
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.common.action_chains import ActionChains
 
+if TYPE_CHECKING:
+    from common.command_timing import CommandTimingRecorder
+    from common.locator_repository import LocatorRepository
+    from common.performance_metrics import PerformanceMetricsCollector
+
 
 class MaxElementRetriesException(Exception):
     """
@@ -59,17 +66,138 @@ class ScrollOptionsEnum(Enum):
     NEAREST = "nearest"
 
 
+# Reads the header row and every body row of a table in a single round-trip.
+TABLE_EXTRACTION_SCRIPT = """
+const root = arguments[0] || document;
+const attributeNames = arguments[1] || [];
+const readAttributes = (el) => {
+    const out = {};
+    for (const name of attributeNames) { out[name] = el.getAttribute(name); }
+    return out;
+};
+const text = (el) => (el.innerText || el.textContent || "").trim();
+const headers = Array.from(root.querySelectorAll("thead th"));
+const rows = Array.from(root.querySelectorAll("tbody tr"));
+const cells = rows.map((tr) => Array.from(tr.cells));
+return {
+    headers: headers.map(text),
+    header_attributes: headers.map(readAttributes),
+    rows: cells.map((row) => row.map(text)),
+    cell_attributes: attributeNames.length
+        ? cells.map((row) => row.map(readAttributes))
+        : [],
+};
+"""
+
+
+@dataclass
+class TableData:
+    """
+    Client-side snapshot of an HTML table captured with one execute_script call.
+
+    Column and row indexes are 1-based to match the XPath-based table helpers.
+
+    Fields:
+    - headers (list[str]): Header cell text in column order.
+    - rows (list[list[str]]): Body cell text, one list per row.
+    - header_attributes (list[dict]): Requested attributes for each header cell.
+    - cell_attributes (list[list[dict]]): Requested attributes for each body cell.
+    """
+
+    headers: list[str] = field(default_factory=list)
+    rows: list[list[str]] = field(default_factory=list)
+    header_attributes: list[dict] = field(default_factory=list)
+    cell_attributes: list[list[dict]] = field(default_factory=list)
+
+    def column_index(self, column_text: str) -> int:
+        """
+        Get the 1-based column index whose header text matches column_text.
+
+        Raises:
+            ValueError: If no column with the specified text is found.
+        """
+        try:
+            return self.headers.index(column_text) + 1
+        except ValueError:
+            raise ValueError(f"Column with text '{column_text}' not found") from None
+
+    def cell(self, row_index: int, column_index: int) -> str:
+        """Get the text of the cell at the 1-based row and column."""
+        return self.rows[row_index - 1][column_index - 1]
+
+    def column(self, column_text: str) -> list[str]:
+        """Get every body cell of the column with the given header text."""
+        index = self.column_index(column_text) - 1
+        return [row[index] if index < len(row) else "" for row in self.rows]
+
+    def as_dicts(self) -> list[dict[str, str]]:
+        """Get each row as a mapping of header text to cell text."""
+        return [dict(zip(self.headers, row)) for row in self.rows]
+
+    def filter_rows(self, **criteria: str) -> list[dict[str, str]]:
+        """
+        Get rows whose cells equal every header=value pair in criteria.
+
+        Header text containing spaces can be passed with dict unpacking:
+        table.filter_rows(**{"Last Name": "Smith"}).
+        """
+        for column_text in criteria:
+            self.column_index(column_text)
+        return [
+            row
+            for row in self.as_dicts()
+            if all(row.get(key) == value for key, value in criteria.items())
+        ]
+
+    def is_sorted(
+        self,
+        column_text: str,
+        descending: bool = False,
+        key: Callable[[str], Any] | None = None,
+    ) -> bool:
+        """
+        Check whether the column is sorted, comparing values with an optional key.
+
+        Args:
+            column_text (str): Header text of the column to check.
+            descending (bool, optional): Expect descending order. Defaults to False.
+            key (Callable | None, optional): Converts cell text before comparing,
+                e.g. float or a date parser. Defaults to the raw text.
+        """
+        values = self.column(column_text)
+        if key is not None:
+            values = [key(value) for value in values]
+        return values == sorted(values, reverse=descending)
+
+
 class SeleniumController:
     """
     The SeleniumController class provides a wrapper around Selenium WebDriver
     with built-in retry logic, timeouts, and common web automation utilities.
 
+    All waiting is explicit: the implicit wait is disabled so it never stacks with
+    WebDriverWait, and every wait polls at poll_frequency up to a bounded timeout.
+
     Args:
         driver (WebDriver | None): The WebDriver instance to use for interacting with the web application.
         log (logging.Logger, optional): The logger instance to use for logging. Defaults to logging.getLogger(__name__).
         retry (int, optional): The number of times to retry an operation if it fails. Defaults to 2.
         timeout (int, optional): The maximum time to wait for an element to be visible or present. Defaults to 2.
         wait_time (float, optional): The time to wait between operations. Defaults to 0.25 seconds.
+        locators (LocatorRepository | None, optional): Preloaded locator repository used by
+            find_element_by_name and find_elements_by_name. Defaults to None.
+        poll_frequency (float, optional): How often explicit waits re-check their condition. Defaults to 0.05 seconds.
+        page_load_timeout (float, optional): Upper bound for get() to wait for document.readyState. Defaults to 30 seconds.
+        wait_for_dom_stable (bool, optional): If True, get() also waits for the DOM to stop mutating
+            using a MutationObserver. Defaults to False.
+        dom_quiet_period (float, optional): Seconds without DOM mutations that count as stable. Defaults to 0.25 seconds.
+        timing (CommandTimingRecorder | None, optional): Recorder that receives retry counts and
+            classifies commands issued from explicit waits as wait time. Defaults to None.
+        performance (PerformanceMetricsCollector | None, optional): Opt-in collector that stores
+            browser timing metrics whenever wait_for_page_load() sees a new document, which
+            covers get() and clicks that navigate. Defaults to None.
+        navigation_timeout (float, optional): How long click() waits for a navigation to
+            replace the document when performance is set. Defaults to 1 second.
     """
 
     def __init__(
@@ -79,41 +207,153 @@ class SeleniumController:
         retry: int = 2,
         timeout: int = 2,
         wait_time=0.25,
+        locators: Optional["LocatorRepository"] = None,
+        poll_frequency: float = 0.05,
+        page_load_timeout: float = 30,
+        wait_for_dom_stable: bool = False,
+        dom_quiet_period: float = 0.25,
+        timing: Optional["CommandTimingRecorder"] = None,
+        performance: Optional["PerformanceMetricsCollector"] = None,
+        navigation_timeout: float = 1,
     ):
         self.driver = driver
+        self.locators = locators
         self.retry = retry
         self.timeout = timeout
         self.log = log
+        self.poll_frequency = poll_frequency
+        self.page_load_timeout = page_load_timeout
+        self.wait_for_dom_stable = wait_for_dom_stable
+        self.dom_quiet_period = dom_quiet_period
+        self.timing = timing
+        self.performance = performance
+        self.navigation_timeout = navigation_timeout
         if self.driver is not None:
-            self.driver.implicitly_wait(2)
+            # Explicit waits only: an implicit wait would be added to every
+            # WebDriverWait poll and every retry.
+            self.driver.implicitly_wait(0)
         self.wait_time = wait_time
 
+    def wait(self, timeout: float | None = None) -> WebDriverWait:
+        """
+        Build an explicit wait using the controller's polling configuration.
+
+        Args:
+            timeout (float | None, optional): Maximum time to wait. Defaults to self.timeout.
+
+        Returns:
+            WebDriverWait: A wait bound to the current driver.
+        """
+        if self.timing is not None:
+            from common.command_timing import TimedWebDriverWait
+
+            return TimedWebDriverWait(
+                self.driver,
+                self.timing,
+                timeout=self.timeout if timeout is None else timeout,
+                poll_frequency=self.poll_frequency,
+            )
+        return WebDriverWait(
+            self.driver,
+            timeout=self.timeout if timeout is None else timeout,
+            poll_frequency=self.poll_frequency,
+        )
+
+    def wait_for_page_load(self, timeout: float | None = None) -> bool:
+        """
+        Wait until document.readyState is "complete", bounded by a timeout.
+
+        When a performance collector is attached, the loaded document is recorded;
+        documents that were already recorded are skipped.
+
+        Args:
+            timeout (float | None, optional): Maximum time to wait. Defaults to self.page_load_timeout.
+
+        Returns:
+            bool: True if the page finished loading, False if the timeout was reached.
+        """
+        try:
+            self.wait(
+                self.page_load_timeout if timeout is None else timeout
+            ).until(
+                lambda driver: driver.execute_script("return document.readyState")
+                == "complete"
+            )
+        except TimeoutException:
+            self.log.warning("Timed out waiting for document.readyState == complete")
+            return False
+        if self.performance is not None:
+            self.performance.record(self.driver)
+        return True
+
+    def wait_for_dom_to_settle(
+        self, quiet_period: float | None = None, timeout: float | None = None
+    ) -> bool:
+        """
+        Wait until the DOM has not mutated for quiet_period seconds.
+
+        Uses a MutationObserver inside a single execute_async_script call, so the
+        browser signals readiness instead of the client polling for it.
+
+        Args:
+            quiet_period (float | None, optional): Seconds without mutations. Defaults to self.dom_quiet_period.
+            timeout (float | None, optional): Upper bound for the wait. Defaults to self.page_load_timeout.
+
+        Returns:
+            bool: True if the DOM settled, False if the timeout was reached.
+        """
+        quiet_ms = int(
+            1000 * (self.dom_quiet_period if quiet_period is None else quiet_period)
+        )
+        timeout_ms = int(
+            1000 * (self.page_load_timeout if timeout is None else timeout)
+        )
+        try:
+            with self._wait_phase():
+                settled = self.driver.execute_async_script(
+                    "const quietMs = arguments[0], timeoutMs = arguments[1];"
+                    "const done = arguments[arguments.length - 1];"
+                    "let finished = false, timer = null;"
+                    "const finish = (settled) => {"
+                    "  if (finished) { return; }"
+                    "  finished = true; observer.disconnect();"
+                    "  clearTimeout(timer); clearTimeout(cap); done(settled);"
+                    "};"
+                    "const observer = new MutationObserver(() => {"
+                    "  clearTimeout(timer); timer = setTimeout(() => finish(true), quietMs);"
+                    "});"
+                    "observer.observe(document, {subtree: true, childList: true,"
+                    "  attributes: true, characterData: true});"
+                    "timer = setTimeout(() => finish(true), quietMs);"
+                    "const cap = setTimeout(() => finish(false), timeoutMs);",
+                    quiet_ms,
+                    timeout_ms,
+                )
+            return bool(settled)
+        except TimeoutException:
+            self.log.warning("Timed out waiting for the DOM to settle")
+            return False
+
     def get(self, url: str) -> str:
         """
         Navigate to the specified URL and wait for the page to load completely.
 
+        The wait is bounded by page_load_timeout and, when wait_for_dom_stable is
+        enabled, also waits for the DOM to stop mutating.
+
         Args:
             url (str): The URL to navigate to.
 
         Returns:
             str: The current URL after navigation.
-
-        Raises:
-            TimeoutException: If the URL doesn't load within the timeout period.
         """
         self.driver.get(url)
-        loading_done: bool = (
-            lambda complete: self.driver.execute_script("return document.readyState")
-            == complete
-        )
         try:
-            WebDriverWait(self.driver, timeout=self.timeout).until(
-                expected_conditions.url_contains(url)
-            )
-            while not loading_done("complete"):
-                time.sleep(self.wait_time)
+            self.wait().until(expected_conditions.url_contains(url))
         except TimeoutException:
             self.log.warning(f"TimeoutException caught while waiting for URL: {url}")
+        if self.wait_for_page_load() and self.wait_for_dom_stable:
+            self.wait_for_dom_to_settle()
         return self.driver.current_url
 
     def quit(self) -> None:
@@ -192,34 +432,37 @@ class SeleniumController:
         Note:
             When looking for potentially non-present elements, use the built-in Selenium method instead.
         """
-        time.sleep(0.020)
         _attempt = 0
         while _attempt < self.retry:
             try:
                 self.log.info(f"Fenrir Find Element: \n {by} - {value} - {_attempt}")
-                if WebDriverWait(self.driver, timeout=self.timeout).until(
+                if self.wait().until(
                     expected_conditions.visibility_of_element_located((str(by), value))
                 ):
                     element = self.driver.find_element(by, value)
                     break
             except TimeoutException:
                 _attempt += 1
+                self._record_retry("find_element")
                 if _attempt < self.retry:
                     self.log.warning(f"TimeoutException caught, retrying...{_attempt}")
             except StaleElementReferenceException:
                 _attempt += 1
+                self._record_retry("find_element")
                 if _attempt < self.retry:
                     self.log.warning(
                         f"StaleElementReferenceException caught, retrying...{_attempt}"
                     )
             except NoSuchElementException:
                 _attempt += 1
+                self._record_retry("find_element")
                 if _attempt < self.retry:
                     self.log.warning(
                         f"NoSuchElementException caught, retrying...{_attempt}"
                     )
             except ElementClickInterceptedException:
                 _attempt += 1
+                self._record_retry("find_element")
                 if _attempt < self.retry:
                     self.log.warning(
                         f"ClickElementInterceptException caught, retrying...{_attempt}"
@@ -247,28 +490,30 @@ class SeleniumController:
         Note:
             When looking for potentially non-present elements, use the built-in Selenium method instead.
         """
-        time.sleep(0.020)
         _attempt = 0
         while _attempt < self.retry:
             try:
                 self.log.info(f"\n Finding Element by: {by} with Selector: {value}")
-                if WebDriverWait(driver=self.driver, timeout=self.timeout).until(
+                if self.wait().until(
                     expected_conditions.presence_of_all_elements_located((str(by), value))
                 ):
                     elements = self.driver.find_elements(by=by, value=value)
                     break
             except TimeoutException:
                 _attempt += 1
+                self._record_retry("find_elements")
                 if _attempt < self.retry:
                     self.log.warning(f"TimeoutException caught, retrying...{_attempt}")
             except StaleElementReferenceException:
                 _attempt += 1
+                self._record_retry("find_elements")
                 if _attempt < self.retry:
                     self.log.warning(
                         f"StaleElementReferenceException caught, retrying...{_attempt}"
                     )
             except NoSuchElementException:
                 _attempt += 1
+                self._record_retry("find_elements")
                 if _attempt < self.retry:
                     self.log.warning(
                         f"NoSuchElementException caught, retrying...{_attempt}"
@@ -279,6 +524,83 @@ class SeleniumController:
             )
         return elements
 
+    def find_element_by_name(
+        self, element_name: str, page_name: str | None = None
+    ) -> WebElement:
+        """
+        Find a single element using a locator resolved from the locator repository.
+
+        Args:
+            element_name (str): The identifier element_name stored for the page.
+            page_name (str | None, optional): The page the element belongs to. Defaults to None.
+
+        Returns:
+            WebElement: The located web element.
+
+        Raises:
+            ValueError: If no locator repository is attached to the controller.
+            LocatorNotFoundException: If the locator is not in the repository.
+            MaxElementRetriesException: If the element cannot be found after maximum retry attempts.
+        """
+        by, value = self._resolve_locator(element_name, page_name)
+        return self.find_element(by, value)
+
+    def find_elements_by_name(
+        self, element_name: str, page_name: str | None = None
+    ) -> list[WebElement]:
+        """
+        Find multiple elements using a locator resolved from the locator repository.
+
+        Args:
+            element_name (str): The identifier element_name stored for the page.
+            page_name (str | None, optional): The page the elements belong to. Defaults to None.
+
+        Returns:
+            list[WebElement]: A list of located web elements.
+        """
+        by, value = self._resolve_locator(element_name, page_name)
+        return self.find_elements(by, value)
+
+    def _record_navigation_performance(self, document: WebElement) -> None:
+        """
+        Store performance metrics once a click has replaced document.
+
+        Navigation starts asynchronously after the click, so wait for the old
+        <html> element to go stale before waiting for the new page to load. A
+        navigation that commits after navigation_timeout is recorded by the next
+        wait_for_page_load().
+        """
+        try:
+            with self._wait_phase():
+                self.wait(self.navigation_timeout).until(
+                    expected_conditions.staleness_of(document)
+                )
+        except TimeoutException:
+            return
+        self.wait_for_page_load()
+
+    def _wait_phase(self):
+        """Count commands issued in the block as wait time when timing is enabled."""
+        if self.timing is None:
+            return nullcontext()
+        from common.command_timing import WAIT_PHASE
+
+        return self.timing.phase(WAIT_PHASE)
+
+    def _record_retry(self, method: str) -> None:
+        if self.timing is not None:
+            self.timing.record_retry(method)
+
+    def _resolve_locator(
+        self, element_name: str, page_name: str | None
+    ) -> Tuple[str, str]:
+        if self.locators is None:
+            raise ValueError(
+                "No LocatorRepository attached to SeleniumController; "
+                "pass locators= when constructing it."
+            )
+        return self.locators.get(element_name, page_name=page_name)
+
     def click(self, element: WebElement, corner: str = "center") -> None:
         """
         Clicks the element at a specific corner using JavaScript.
@@ -311,9 +633,10 @@ class SeleniumController:
             )
 
         offset = corners[corner]
-        WebDriverWait(self.driver, self.timeout).until(
-            expected_conditions.element_to_be_clickable(element)
-        )
+        self.wait().until(expected_conditions.element_to_be_clickable(element))
+        document = None
+        if self.performance is not None:
+            document = self.driver.find_element(By.TAG_NAME, "html")
         self.driver.execute_script(
             "const rect = arguments[0].getBoundingClientRect();"
             "const x = rect.left + arguments[1];"
@@ -324,6 +647,8 @@ class SeleniumController:
             offset["x"],
             offset["y"],
         )
+        if document is not None:
+            self._record_navigation_performance(document)
 
     def click_element_at_viewport_location(self, element: WebElement) -> None:
         """
@@ -433,14 +758,71 @@ class SeleniumController:
             )
         return self.find_element(By.XPATH, f"//thead//th[{index}]")
 
+    def get_table_data(
+        self,
+        table: WebElement | None = None,
+        attributes: Iterable[str] = (),
+    ) -> TableData:
+        """
+        Read a table's headers and body cells in a single execute_script call.
+
+        Lookups by header text, row filtering and sort checks can then run
+        client-side on the returned snapshot instead of one round-trip per cell.
+
+        Args:
+            table (WebElement | None, optional): The table (or container) to read.
+                Defaults to the first thead/tbody in the document.
+            attributes (Iterable[str], optional): Attribute names to capture for
+                every header and body cell (e.g. "aria-sort", "data-id"). Defaults to none.
+
+        Returns:
+            TableData: The table snapshot.
+        """
+        result = self.driver.execute_script(
+            TABLE_EXTRACTION_SCRIPT, table, list(attributes)
+        )
+        return TableData(
+            headers=result["headers"],
+            rows=result["rows"],
+            header_attributes=result["header_attributes"],
+            cell_attributes=result["cell_attributes"],
+        )
+
+    def get_table_headers(self, table: WebElement | None = None) -> list[str]:
+        """
+        Get the text of every table header in a single round-trip.
+
+        Waits for the headers to be present first, so a table that is still
+        rendering is not read as empty.
+
+        Args:
+            table (WebElement | None, optional): The table to read. Defaults to the document.
+
+        Returns:
+            list[str]: Header text in column order.
+        """
+        root = self.driver if table is None else table
+        try:
+            self.wait().until(
+                lambda _: root.find_elements(By.CSS_SELECTOR, "thead th")
+            )
+        except TimeoutException:
+            self.log.warning("TimeoutException caught while waiting for table headers")
+        return self.driver.execute_script(
+            "const root = arguments[0] || document;"
+            "return Array.from(root.querySelectorAll('thead th'))"
+            "  .map((th) => (th.innerText || th.textContent || '').trim());",
+            table,
+        )
+
     def get_table_column_length(self) -> int:
         """
-        Get the number of columns in the table.
+        Get the number of columns in the table, waiting for the headers to render.
 
         Returns:
             int: The total number of table header columns.
         """
-        return len(self.find_elements(By.XPATH, "//thead//th"))
+        return len(self.get_table_headers())
 
     def get_table_column_index_by_header_text(self, column_text: str) -> int:
         """
@@ -455,15 +837,34 @@ class SeleniumController:
         Raises:
             ValueError: If no column with the specified text is found.
         """
-        amount_of_table_headers = self.get_table_column_length()
-        header_index = 1
-        while header_index <= amount_of_table_headers:
-            header = self.find_element(By.XPATH, f"//thead//th[{header_index}]")
-            if header.text == column_text:
-                return header_index
-            header_index += 1
-        else:
-            raise ValueError(f"Column with text '{column_text}' not found")
+        try:
+            headers = self.wait().until(lambda _: self.get_table_headers())
+        except TimeoutException:
+            headers = []
+        return TableData(headers=headers).column_index(column_text)
+
+    def verify_table_column_sorted(
+        self,
+        column_text: str,
+        descending: bool = False,
+        key: Callable[[str], Any] | None = None,
+        table: WebElement | None = None,
+    ) -> bool:
+        """
+        Check that a table column is sorted using one table snapshot.
+
+        Args:
+            column_text (str): Header text of the column to check.
+            descending (bool, optional): Expect descending order. Defaults to False.
+            key (Callable | None, optional): Converts cell text before comparing. Defaults to None.
+            table (WebElement | None, optional): The table to read. Defaults to the document.
+
+        Returns:
+            bool: True if the column is sorted in the requested direction.
+        """
+        return self.get_table_data(table=table).is_sorted(
+            column_text, descending=descending, key=key
+        )
 
     def get_table_data_by_column_index(
         self, table_row_index: int, column_index: int = 1
@@ -501,8 +902,14 @@ class SeleniumController:
         current_sort = element.get_dom_attribute("aria-sort")
         retry = 0
         while current_sort != sort_string or (retry <= self.retry):
+            previous_sort = current_sort
             element.click()
-            time.sleep(self.wait_time)
+            try:
+                self.wait().until(
+                    lambda _: element.get_dom_attribute("aria-sort") != previous_sort
+                )
+            except TimeoutException:
+                pass
             current_sort = element.get_dom_attribute("aria-sort")
             if current_sort == sort_string:
                 break
@@ -529,7 +936,7 @@ class SeleniumController:
         """
         by, value = locator
         try:
-            WebDriverWait(self.driver, timeout).until_not(
+            self.wait(timeout).until_not(
                 expected_conditions.presence_of_element_located((by, value))
             )
             return True
@@ -23,6 +23,7 @@ from common.service_connections.db_service.database.tables import (
     IdentifierTable,
     EmailProcessorTable,
     AuthUserTable,
+    PagePerformanceMetricTable,
     # New core tables
     AccountTable,
     AuthTokenTable,
@@ -31,6 +32,7 @@ from common.service_connections.db_service.database.tables import (
     PlanTable,
     SuiteTable,
     TestCaseTable,
+    TestCaseDurationTable,
     ActionChainTable,
     EntityTagTable,
     PurgeTable,
@@ -70,6 +72,7 @@ __all__ = [
     "IdentifierTable",
     "EmailProcessorTable",
     "AuthUserTable",
+    "PagePerformanceMetricTable",
     # New core tables
     "AccountTable",
     "AuthTokenTable",
@@ -78,6 +81,7 @@ __all__ = [
     "PlanTable",
     "SuiteTable",
     "TestCaseTable",
+    "TestCaseDurationTable",
     "ActionChainTable",
     "EntityTagTable",
     "PurgeTable",
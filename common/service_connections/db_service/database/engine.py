@@ -12,6 +12,10 @@ from sqlalchemy import Engine, create_engine
 from sqlalchemy.orm import Session, sessionmaker
 
 from common.service_connections.db_service.database.base import Base
+from common.service_connections.db_service.database.replica_routing import (
+    RoutingSession,
+    get_replica_router,
+)
 
 
 def create_database_engine(database_url: str, echo: bool = False) -> Engine:
@@ -127,13 +131,19 @@ def _initialize_session_factory() -> sessionmaker[Session]:
 
 
 @contextmanager
-def get_database_session(engine) -> Generator[Session, None, None]:
+def get_database_session(
+    engine, read_only: bool = False
+) -> Generator[Session, None, None]:
     """
     Context manager for database sessions.
 
     Provides a database session with automatic transaction management.
     Commits on success, rolls back on exception.
 
+    With read_only=True and read replicas configured, reads are routed to a
+    healthy replica (or the primary when pinned by a recent write or when every
+    replica lags) while writes still go to engine. See replica_routing.
+
     Yields:
         Database session
 
@@ -141,8 +151,14 @@ def get_database_session(engine) -> Generator[Session, None, None]:
         with get_database_session(engine) as session:
             user = session.query(AuthUserTable).filter_by(email="test@example.com").first()
     """
-    session_factory = _initialize_session_factory()
-    session = session_factory()
+    read_engine = get_replica_router().read_engine(engine) if read_only else engine
+    if read_engine is not engine:
+        session = RoutingSession(
+            primary=engine, replica=read_engine, expire_on_commit=False
+        )
+    else:
+        session_factory = _initialize_session_factory()
+        session = session_factory()
     try:
         yield session
         session.commit()
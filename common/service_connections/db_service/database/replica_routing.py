@@ -0,0 +1,297 @@
+"""
+Read-replica routing for read_only database sessions.
+
+get_database_session(engine, read_only=True) returns a RoutingSession when
+replicas are configured. Its SELECTs go to a replica chosen by ReplicaRouter;
+INSERT/UPDATE/DELETE, SELECT ... FOR UPDATE, flushes and everything after the
+first write in the session go to the primary engine.
+
+ReplicaRouter health-checks each replica at most every
+health_check_interval_seconds, measuring replay lag. Replicas that are down or
+lag by more than max_lag_seconds are skipped; with none left, reads fall back to
+the primary.
+
+Read-your-writes: a session that commits a write pins the current
+read-your-writes key (see bind_read_your_writes_key, set per request by
+ReadYourWritesMiddleware) to the primary for read_your_writes_seconds. Pins are
+held per process.
+
+Configuration (environment):
+    DB_REPLICA_HOSTS: Comma-separated replica hosts, each optionally host:port.
+        The replica uses the primary's database name and credentials. Point it
+        at the primary's host for local testing.
+    DB_REPLICA_MAX_LAG_SECONDS: Maximum acceptable replay lag (default 5)
+    DB_REPLICA_CHECK_INTERVAL_SECONDS: Health check interval (default 10)
+    DB_READ_YOUR_WRITES_SECONDS: Primary pin window after a write (default 5)
+"""
+
+import itertools
+import logging
+import os
+import threading
+import time
+from contextvars import ContextVar, Token
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from dotenv import load_dotenv
+from pydantic import BaseModel
+from sqlalchemy import Engine, event, text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.dml import UpdateBase
+
+logger = logging.getLogger(__name__)
+
+# Expired pins are pruned once this many keys are pinned
+_MAX_PINS = 10_000
+
+# Seconds the replica has not yet replayed; 0 on a primary or a caught-up replica
+_REPLICA_LAG_SQL = text(
+    """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(
+            EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0
+        )
+    END
+    """
+)
+
+
+class ReplicaConfig(BaseModel):
+    replica_hosts: List[str] = []
+    max_lag_seconds: float = 5.0
+    health_check_interval_seconds: float = 10.0
+    read_your_writes_seconds: float = 5.0
+
+
+def get_replica_config() -> ReplicaConfig:
+    load_dotenv()
+    return ReplicaConfig(
+        replica_hosts=[
+            host.strip()
+            for host in os.getenv("DB_REPLICA_HOSTS", "").split(",")
+            if host.strip()
+        ],
+        max_lag_seconds=float(os.getenv("DB_REPLICA_MAX_LAG_SECONDS", "5")),
+        health_check_interval_seconds=float(
+            os.getenv("DB_REPLICA_CHECK_INTERVAL_SECONDS", "10")
+        ),
+        read_your_writes_seconds=float(os.getenv("DB_READ_YOUR_WRITES_SECONDS", "5")),
+    )
+
+
+# =====================================
+# Read-Your-Writes Key
+# =====================================
+
+# Identifies whose writes should pin reads to the primary (e.g. one per client)
+_read_your_writes_key: ContextVar[Optional[str]] = ContextVar(
+    "read_your_writes_key", default=None
+)
+
+
+def bind_read_your_writes_key(key: Optional[str]) -> Token:
+    """Set the read-your-writes key for the current request or task."""
+    return _read_your_writes_key.set(key)
+
+
+def reset_read_your_writes_key(token: Token) -> None:
+    _read_your_writes_key.reset(token)
+
+
+# =====================================
+# Replica Router
+# =====================================
+
+
+@dataclass
+class _ReplicaState:
+    engine: Engine
+    healthy: bool = True
+    lag_seconds: float = 0.0
+    checked_at: float = 0.0
+
+
+class ReplicaRouter:
+    """
+    Chooses the engine for read_only sessions.
+
+    Healthy replicas within the lag limit are used round-robin. Keys pinned by a
+    recent write, and every read when no replica qualifies, use the primary.
+    """
+
+    def __init__(
+        self,
+        replicas: List[Engine],
+        max_lag_seconds: float = 5.0,
+        health_check_interval_seconds: float = 10.0,
+        read_your_writes_seconds: float = 5.0,
+    ):
+        self.replicas = [_ReplicaState(engine) for engine in replicas]
+        self.max_lag_seconds = max_lag_seconds
+        self.health_check_interval_seconds = health_check_interval_seconds
+        self.read_your_writes_seconds = read_your_writes_seconds
+        self._round_robin = itertools.count()
+        self._check_lock = threading.Lock()
+        # read-your-writes key -> monotonic time the pin expires
+        self._pins: Dict[str, float] = {}
+
+    def pin(self, key: Optional[str]) -> None:
+        """Route reads for key to the primary for the read-your-writes window."""
+        if key is None or not self.replicas or self.read_your_writes_seconds <= 0:
+            return
+        now = time.monotonic()
+        if len(self._pins) >= _MAX_PINS:
+            self._pins = {k: t for k, t in self._pins.items() if t > now}
+        self._pins[key] = now + self.read_your_writes_seconds
+
+    def is_pinned(self, key: Optional[str]) -> bool:
+        if key is None:
+            return False
+        expires_at = self._pins.get(key)
+        if expires_at is None:
+            return False
+        if expires_at <= time.monotonic():
+            self._pins.pop(key, None)
+            return False
+        return True
+
+    def check_replicas(self, force: bool = False) -> None:
+        """Refresh health and lag of replicas whose last check is due.
+
+        Only one thread checks at a time; others keep using the last results.
+        """
+        if not self._check_lock.acquire(blocking=force):
+            return
+        try:
+            now = time.monotonic()
+            for state in self.replicas:
+                due = now - state.checked_at >= self.health_check_interval_seconds
+                if not force and not due:
+                    continue
+                try:
+                    with state.engine.connect() as conn:
+                        lag = conn.execute(_REPLICA_LAG_SQL).scalar()
+                    state.lag_seconds = float(lag)
+                    state.healthy = True
+                except SQLAlchemyError as e:
+                    if state.healthy:
+                        host = state.engine.url.host
+                        logger.warning(f"Replica {host} unavailable: {e}")
+                    state.healthy = False
+                state.checked_at = now
+        finally:
+            self._check_lock.release()
+
+    def read_engine(self, primary: Engine) -> Engine:
+        """Engine to serve reads for the current read-your-writes key."""
+        if not self.replicas or self.is_pinned(_read_your_writes_key.get()):
+            return primary
+
+        self.check_replicas()
+        candidates = [
+            state.engine
+            for state in self.replicas
+            if state.healthy and state.lag_seconds <= self.max_lag_seconds
+        ]
+        if not candidates:
+            logger.debug("No replica within lag limit, reading from primary")
+            return primary
+        return candidates[next(self._round_robin) % len(candidates)]
+
+
+_router: Optional[ReplicaRouter] = None
+_router_lock = threading.Lock()
+
+
+def _replica_engine(host: str) -> Engine:
+    # Import here to avoid circular imports
+    from common.service_connections.db_service.db_manager import (
+        get_database_service_config,
+        resolve_database_engine,
+    )
+
+    config = get_database_service_config()
+    server, _, port = host.partition(":")
+    config.database_server_name = server
+    if port:
+        config.database_port = int(port)
+    return resolve_database_engine(database_config=config)
+
+
+def get_replica_router() -> ReplicaRouter:
+    """Process-wide router, built from get_replica_config() on first use."""
+    global _router
+    with _router_lock:
+        if _router is None:
+            config = get_replica_config()
+            _router = ReplicaRouter(
+                replicas=[_replica_engine(host) for host in config.replica_hosts],
+                max_lag_seconds=config.max_lag_seconds,
+                health_check_interval_seconds=config.health_check_interval_seconds,
+                read_your_writes_seconds=config.read_your_writes_seconds,
+            )
+        return _router
+
+
+def set_replica_router(router: Optional[ReplicaRouter]) -> None:
+    """Replace the process-wide router (None rebuilds it from config)."""
+    global _router
+    with _router_lock:
+        _router = router
+
+
+# =====================================
+# Routing Session
+# =====================================
+
+
+class RoutingSession(Session):
+    """Session that sends reads to a replica engine and writes to the primary."""
+
+    def __init__(self, primary: Engine, replica: Engine, **kwargs):
+        super().__init__(bind=primary, **kwargs)
+        self.primary = primary
+        self.replica = replica
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if (
+            self._flushing
+            or self.info.get("wrote")
+            or isinstance(clause, UpdateBase)
+            or getattr(clause, "_for_update_arg", None) is not None
+        ):
+            return self.primary
+        return self.replica
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _track_statement_writes(orm_execute_state) -> None:
+    state = orm_execute_state
+    if state.is_insert or state.is_update or state.is_delete:
+        _mark_write(state.session)
+
+
+@event.listens_for(Session, "after_flush")
+def _track_flush_writes(session, flush_context) -> None:
+    _mark_write(session)
+
+
+def _mark_write(session: Session) -> None:
+    # has_writes lasts for the transaction; wrote keeps a RoutingSession on primary
+    session.info["has_writes"] = True
+    session.info["wrote"] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _pin_after_write(session) -> None:
+    if session.info.pop("has_writes", False):
+        get_replica_router().pin(_read_your_writes_key.get())
+
+
+@event.listens_for(Session, "after_rollback")
+def _clear_writes(session) -> None:
+    session.info.pop("has_writes", None)
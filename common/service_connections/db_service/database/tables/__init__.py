@@ -20,6 +20,9 @@ from common.service_connections.db_service.database.tables.action_tables.user_in
 from common.service_connections.db_service.database.tables.action_tables.user_interface_action.fenrir_actions import (
     FenrirActionsTable,
 )
+from common.service_connections.db_service.database.tables.action_tables.user_interface_action.page_performance_metric import (
+    PagePerformanceMetricTable,
+)
 from common.service_connections.db_service.database.tables.email_processor import (
     EmailProcessorTable,
 )
@@ -44,6 +47,9 @@ from common.service_connections.db_service.database.tables.system_under_test imp
 from common.service_connections.db_service.database.tables.plan import PlanTable
 from common.service_connections.db_service.database.tables.suite import SuiteTable
 from common.service_connections.db_service.database.tables.test_case import TestCaseTable
+from common.service_connections.db_service.database.tables.test_case_duration import (
+    TestCaseDurationTable,
+)
 from common.service_connections.db_service.database.tables.action_chain import (
     ActionChainTable,
 )
@@ -79,6 +85,7 @@ __all__ = [
     "TestEnvUserAccountsTable",
     "IdentifierTable",
     "FenrirActionsTable",
+    "PagePerformanceMetricTable",
     "EmailProcessorTable",
     "AuthUserTable",
     # New core tables
@@ -90,6 +97,7 @@ __all__ = [
     "PlanTable",
     "SuiteTable",
     "TestCaseTable",
+    "TestCaseDurationTable",
     "ActionChainTable",
     "EntityTagTable",
     "PurgeTable",
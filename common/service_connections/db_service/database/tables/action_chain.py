@@ -8,7 +8,7 @@ from uuid import uuid4
 
 import sqlalchemy as sql
 from sqlalchemy.orm import Mapped, mapped_column
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
 
 from common.service_connections.db_service.database.base import Base
 
@@ -106,6 +106,17 @@ class ActionChainTable(Base):
         nullable=True,
         onupdate=lambda: datetime.now(timezone.utc),
     )
+    # Full-text search document (name weighted above description); deferred so
+    # ordinary loads skip it
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        sql.Computed(
+            "setweight(to_tsvector('english', coalesce(chain_name, '')), 'A') || "
+            "setweight(to_tsvector('english', coalesce(description, '')), 'B')",
+            persisted=True,
+        ),
+        deferred=True,
+    )
 
     __table_args__ = (
         sql.Index("idx_actionchain_pk", "action_chain_id", postgresql_using="btree"),
@@ -116,6 +127,23 @@ class ActionChainTable(Base):
             "is_active",
             postgresql_where=sql.text("is_active = true"),
         ),
+        # Live-row indexes for the hot is_active = true filters
+        sql.Index(
+            "idx_actionchain_account_active",
+            "account_id",
+            postgresql_where=sql.text("is_active = true"),
+        ),
+        sql.Index(
+            "idx_actionchain_sut_active",
+            "sut_id",
+            postgresql_where=sql.text("is_active = true"),
+        ),
+        sql.Index(
+            "idx_actionchain_owner_active",
+            "owner_user_id",
+            postgresql_where=sql.text("is_active = true"),
+        ),
+        sql.Index("idx_actionchain_search", "search_vector", postgresql_using="gin"),
     )
 
     def __repr__(self) -> str:
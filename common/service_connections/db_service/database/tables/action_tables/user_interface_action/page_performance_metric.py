@@ -0,0 +1,94 @@
+"""
+Page performance metric table model for browser timing samples.
+"""
+
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+import sqlalchemy as sql
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.dialects.postgresql import JSONB
+
+from common.service_connections.db_service.database.base import Base
+
+
+class PagePerformanceMetricTable(Base):
+    """Page performance metric model storing one browser timing sample per navigation.
+
+    Business Logic Documentation:
+
+    1. Define at a high level what this table is suppose to represent in terms of a goal
+       or goals that need to be accomplished by a user?
+       - Records Navigation Timing, Paint Timing, resource timing and Chrome CDP
+         Performance.getMetrics values collected while UI tests drive a page. Trending
+         these samples per page and environment surfaces performance regressions in the
+         systems under test.
+
+    2. What level of user should be interacting with this table?
+       - Test Automation Framework: Inserts samples during test execution
+       - Test Automation Engineers / Admin: Read access to trend and regression queries
+
+    3. What are the names of the tables that are either above or below this table in the
+       data structure? This is to understand where to put in in a architecture diagram.
+       - Above: PageTable (via page_id), EnvironmentTable (via environment_id)
+       - Below: None (leaf node in hierarchy)
+
+    4. Should a record in this table be deleted based on the deletion of a record in a
+       different table? If so, what table?
+       - Yes. CASCADE delete when the parent PageTable record is deleted; environment_id
+         is set to NULL when the EnvironmentTable record is deleted.
+
+    5. Will this table be require a connection a secure cloud provider service?
+       - No direct cloud connection required.
+    """
+
+    __tablename__ = "page_performance_metric"
+
+    metric_id: Mapped[int] = mapped_column(sql.Integer, primary_key=True)
+    page_id: Mapped[int] = mapped_column(
+        sql.Integer, sql.ForeignKey("page.page_id", ondelete="CASCADE"), nullable=False
+    )
+    environment_id: Mapped[Optional[str]] = mapped_column(
+        sql.String(36),
+        sql.ForeignKey("environment.environment_id", ondelete="SET NULL"),
+        nullable=True,
+    )
+    url: Mapped[str] = mapped_column(sql.String(2048), nullable=False)
+    browser: Mapped[Optional[str]] = mapped_column(sql.String(32), nullable=True)
+    navigation_type: Mapped[Optional[str]] = mapped_column(sql.String(32), nullable=True)
+    # Navigation Timing, milliseconds relative to navigation start
+    time_to_first_byte_ms: Mapped[Optional[float]] = mapped_column(sql.Float)
+    dom_interactive_ms: Mapped[Optional[float]] = mapped_column(sql.Float)
+    dom_content_loaded_ms: Mapped[Optional[float]] = mapped_column(sql.Float)
+    load_event_ms: Mapped[Optional[float]] = mapped_column(sql.Float)
+    transfer_size_bytes: Mapped[Optional[int]] = mapped_column(sql.BigInteger)
+    # Paint Timing
+    first_paint_ms: Mapped[Optional[float]] = mapped_column(sql.Float)
+    first_contentful_paint_ms: Mapped[Optional[float]] = mapped_column(sql.Float)
+    # Resource Timing
+    resource_count: Mapped[Optional[int]] = mapped_column(sql.Integer)
+    resource_transfer_bytes: Mapped[Optional[int]] = mapped_column(sql.BigInteger)
+    slowest_resources: Mapped[List] = mapped_column(JSONB, default=list)
+    # Chrome DevTools Performance.getMetrics, when available
+    cdp_metrics: Mapped[Optional[Dict]] = mapped_column(JSONB, nullable=True)
+    collected_at: Mapped[datetime] = mapped_column(
+        sql.DateTime, nullable=False, default=lambda: datetime.now(timezone.utc)
+    )
+
+    __table_args__ = (
+        sql.Index(
+            "idx_page_performance_page_env_collected",
+            "page_id",
+            "environment_id",
+            "collected_at",
+        ),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<PagePerformanceMetric(id={self.metric_id}, page_id={self.page_id}, "
+            f"environment_id={self.environment_id}, load={self.load_event_ms})>"
+        )
+
+
+__all__ = ["PagePerformanceMetricTable"]
@@ -128,6 +128,13 @@ class EntityTagTable(Base):
             "is_active",
             postgresql_where=sql.text("is_active = true"),
         ),
+        # Active tag names within an account (autocomplete, unique names)
+        sql.Index(
+            "idx_entitytag_account_name_active",
+            "account_id",
+            "tag_name",
+            postgresql_where=sql.text("is_active = true"),
+        ),
         # Composite index for tag filtering within account
         sql.Index(
             "idx_entitytag_account_entity_category",
@@ -5,6 +5,7 @@ Docstring for common.service_connections.db_service.database.tables.plan_table
 from typing import Optional, List, TYPE_CHECKING
 from common.service_connections.db_service.database.base import Base
 from sqlalchemy import String as sqlString, DateTime as sqlDateTime, Enum as sqlEnum
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from datetime import datetime, timezone
 import sqlalchemy as sql
@@ -78,6 +79,17 @@ class PlanTable(Base):
         nullable=True,
     )
 
+    # Full-text search document (plans have no description); deferred so
+    # ordinary loads skip it
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        sql.Computed(
+            "setweight(to_tsvector('english', coalesce(plan_name, '')), 'A')",
+            persisted=True,
+        ),
+        deferred=True,
+    )
+
     # Relationships
     suites: Mapped[List["SuiteTable"]] = relationship(
         "SuiteTable",
@@ -91,6 +103,18 @@ class PlanTable(Base):
         sql.Index(
             "idx_plan_active", "is_active", postgresql_where=sql.text("is_active = true")
         ),
+        # Live-row indexes for the hot is_active = true filters
+        sql.Index(
+            "idx_plan_account_active",
+            "account_id",
+            postgresql_where=sql.text("is_active = true"),
+        ),
+        sql.Index(
+            "idx_plan_owner_active",
+            "owner_user_id",
+            postgresql_where=sql.text("is_active = true"),
+        ),
+        sql.Index("idx_plan_search", "search_vector", postgresql_using="gin"),
     )
 
     def __repr__(self) -> str:
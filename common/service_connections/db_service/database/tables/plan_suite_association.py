@@ -3,6 +3,7 @@ Plan suite association table for linking test plans to test suites.
 """
 
 from datetime import datetime, timezone
+from typing import Optional
 from uuid import uuid4
 
 import sqlalchemy as sql
@@ -61,11 +62,29 @@ class PlanSuiteAssociation(Base):
     created_at: Mapped[datetime] = mapped_column(
         sql.DateTime, nullable=False, default=lambda: datetime.now(timezone.utc)
     )
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        sql.DateTime,
+        nullable=True,
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+    )
 
     __table_args__ = (
+        sql.UniqueConstraint("plan_id", "suite_id", name="uq_plan_suite_pair"),
         sql.Index("idx_plan_suite_plan", "plan_id"),
         sql.Index("idx_plan_suite_suite", "suite_id"),
         sql.Index("idx_plan_suite_order", "plan_id", "execution_order"),
+        sql.Index(
+            "idx_plan_suite_plan_active",
+            "plan_id",
+            "execution_order",
+            postgresql_where=sql.text("is_active = true"),
+        ),
+        sql.Index(
+            "idx_plan_suite_suite_active",
+            "suite_id",
+            postgresql_where=sql.text("is_active = true"),
+        ),
     )
 
     def __repr__(self) -> str:
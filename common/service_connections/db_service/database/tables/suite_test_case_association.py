@@ -3,6 +3,7 @@ Suite test case association table for linking test suites to test cases.
 """
 
 from datetime import datetime, timezone
+from typing import Optional
 from uuid import uuid4
 
 import sqlalchemy as sql
@@ -61,11 +62,29 @@ class SuiteTestCaseAssociation(Base):
     created_at: Mapped[datetime] = mapped_column(
         sql.DateTime, nullable=False, default=lambda: datetime.now(timezone.utc)
     )
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        sql.DateTime,
+        nullable=True,
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+    )
 
     __table_args__ = (
+        sql.UniqueConstraint("suite_id", "test_case_id", name="uq_suite_test_case_pair"),
         sql.Index("idx_suite_testcase_suite", "suite_id"),
         sql.Index("idx_suite_testcase_test", "test_case_id"),
         sql.Index("idx_suite_testcase_order", "suite_id", "execution_order"),
+        sql.Index(
+            "idx_suite_testcase_suite_active",
+            "suite_id",
+            "execution_order",
+            postgresql_where=sql.text("is_active = true"),
+        ),
+        sql.Index(
+            "idx_suite_testcase_test_active",
+            "test_case_id",
+            postgresql_where=sql.text("is_active = true"),
+        ),
     )
 
     def __repr__(self) -> str:
@@ -7,6 +7,7 @@ from typing import Optional, List, TYPE_CHECKING
 from uuid import uuid4
 
 import sqlalchemy as sql
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from common.service_connections.db_service.database.base import Base
@@ -93,6 +94,17 @@ class TestCaseTable(Base):
         nullable=True,
         onupdate=lambda: datetime.now(timezone.utc),
     )
+    # Full-text search document (name weighted above description); deferred so
+    # ordinary loads skip it
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        sql.Computed(
+            "setweight(to_tsvector('english', coalesce(test_name, '')), 'A') || "
+            "setweight(to_tsvector('english', coalesce(description, '')), 'B')",
+            persisted=True,
+        ),
+        deferred=True,
+    )
 
     # Relationships
     suites: Mapped[List["SuiteTable"]] = relationship(
@@ -111,6 +123,23 @@ class TestCaseTable(Base):
             "is_active",
             postgresql_where=sql.text("is_active = true"),
         ),
+        # Live-row indexes for the hot is_active = true filters
+        sql.Index(
+            "idx_testcase_account_active",
+            "account_id",
+            postgresql_where=sql.text("is_active = true"),
+        ),
+        sql.Index(
+            "idx_testcase_sut_active",
+            "sut_id",
+            postgresql_where=sql.text("is_active = true"),
+        ),
+        sql.Index(
+            "idx_testcase_owner_active",
+            "owner_user_id",
+            postgresql_where=sql.text("is_active = true"),
+        ),
+        sql.Index("idx_testcase_search", "search_vector", postgresql_using="gin"),
     )
 
     def __repr__(self) -> str:
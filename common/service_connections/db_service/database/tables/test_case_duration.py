@@ -0,0 +1,71 @@
+"""
+Test case duration table model for historical execution timings.
+"""
+
+from datetime import datetime, timezone
+from typing import Optional
+
+import sqlalchemy as sql
+from sqlalchemy.orm import Mapped, mapped_column
+
+from common.service_connections.db_service.database.base import Base
+
+
+class TestCaseDurationTable(Base):
+    """Test case duration model recording how long each test case run took.
+
+    Business Logic Documentation:
+
+    1. Define at a high level what this table is suppose to represent in terms of a goal
+       or goals that need to be accomplished by a user?
+       - Stores one row per executed test case with its wall-clock duration. The
+         scheduler uses recent samples to estimate runtimes and bin-pack tests onto
+         pytest-xdist workers and grid nodes so a plan finishes as early as possible.
+
+    2. What level of user should be interacting with this table?
+       - Test Automation Framework: Inserts samples after each run, reads estimates
+         when building a shard plan
+       - Admin: Read access for reporting
+
+    3. What are the names of the tables that are either above or below this table in the
+       data structure? This is to understand where to put in in a architecture diagram.
+       - Above: TestCaseTable (via test_case_id)
+       - Below: None (leaf node in hierarchy)
+
+    4. Should a record in this table be deleted based on the deletion of a record in a
+       different table? If so, what table?
+       - Yes. CASCADE delete when the parent TestCaseTable record is deleted.
+
+    5. Will this table be require a connection a secure cloud provider service?
+       - No direct cloud connection required.
+    """
+
+    __tablename__ = "test_case_duration"
+
+    duration_id: Mapped[int] = mapped_column(sql.Integer, primary_key=True)
+    test_case_id: Mapped[str] = mapped_column(
+        sql.String(36),
+        sql.ForeignKey("test_case.test_case_id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    duration_seconds: Mapped[float] = mapped_column(sql.Float, nullable=False)
+    outcome: Mapped[str] = mapped_column(sql.String(16), nullable=False)
+    worker: Mapped[Optional[str]] = mapped_column(sql.String(64), nullable=True)
+    recorded_at: Mapped[datetime] = mapped_column(
+        sql.DateTime, nullable=False, default=lambda: datetime.now(timezone.utc)
+    )
+
+    __table_args__ = (
+        sql.Index(
+            "idx_test_case_duration_test_recorded", "test_case_id", "recorded_at"
+        ),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<TestCaseDuration(test_case_id='{self.test_case_id}', "
+            f"seconds={self.duration_seconds}, outcome='{self.outcome}')>"
+        )
+
+
+__all__ = ["TestCaseDurationTable"]
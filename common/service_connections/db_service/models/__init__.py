@@ -12,7 +12,7 @@ Export Categories:
 5. Association Helpers: Relationship management utilities
 6. Validators & Utilities: Validation config and helper functions
 7. Context Managers: RLS and connection management
-8. Cache Management: ActionChain reference cache utilities
+8. Cache Management: ActionChain reference and catalog list caches
 """
 
 # ============================================================================
@@ -225,6 +225,7 @@ from common.service_connections.db_service.models.suite_test_case_helpers import
     remove_test_case_from_suite,
     reorder_suite_test_cases,
     update_test_case_execution_order,
+    move_test_case_in_suite,
     query_suite_with_test_cases,
     query_test_cases_for_suite,
     query_suites_for_test_case,
@@ -243,6 +244,7 @@ from common.service_connections.db_service.models.plan_suite_helpers import (
     remove_suite_from_plan,
     reorder_plan_suites,
     update_suite_execution_order,
+    move_suite_in_plan,
     query_plan_with_suites,
     query_suites_for_plan,
     query_plans_for_suite,
@@ -259,9 +261,11 @@ from common.service_connections.db_service.models.plan_suite_helpers import (
 from common.service_connections.db_service.models.entity_tag_model import (
     query_tags_for_entity,
     query_entities_by_tag,
+    search_entities_by_tags,
     query_tags_by_category,
     query_unique_tag_names,
     add_tags_to_entity,
+    bulk_tag_entities,
     replace_entity_tags,
 )
 
@@ -310,6 +314,7 @@ from common.config import (
 
 from common.service_connections.db_service.models.entity_tag_model import (
     AccountRLSContext,
+    current_rls_account_id,
 )
 
 
@@ -321,6 +326,10 @@ from common.service_connections.db_service.models.action_chain_model import (
     ActionReferenceCache,
     clear_action_cache,
 )
+from common.service_connections.db_service.models.catalog_cache import (
+    CatalogCache,
+    CatalogCacheStatsModel,
+)
 
 
 # ============================================================================
@@ -429,6 +438,7 @@ __all__ = [
     "remove_test_case_from_suite",
     "reorder_suite_test_cases",
     "update_test_case_execution_order",
+    "move_test_case_in_suite",
     "query_suite_with_test_cases",
     "query_test_cases_for_suite",
     "query_suites_for_test_case",
@@ -440,6 +450,7 @@ __all__ = [
     "remove_suite_from_plan",
     "reorder_plan_suites",
     "update_suite_execution_order",
+    "move_suite_in_plan",
     "query_plan_with_suites",
     "query_suites_for_plan",
     "query_plans_for_suite",
@@ -449,9 +460,11 @@ __all__ = [
     # Polymorphic Query Helpers - EntityTag
     "query_tags_for_entity",
     "query_entities_by_tag",
+    "search_entities_by_tags",
     "query_tags_by_category",
     "query_unique_tag_names",
     "add_tags_to_entity",
+    "bulk_tag_entities",
     "replace_entity_tags",
     # JSONB Helpers - ActionChain
     "add_step_to_chain",
@@ -472,7 +485,10 @@ __all__ = [
     "should_validate_write",
     # Context Managers
     "AccountRLSContext",
+    "current_rls_account_id",
     # Cache Management
     "ActionReferenceCache",
     "clear_action_cache",
+    "CatalogCache",
+    "CatalogCacheStatsModel",
 ]
@@ -19,6 +19,10 @@ from common.service_connections.db_service.database import ActionChainTable
 from common.service_connections.db_service.database.engine import (
     get_database_session as session,
 )
+from common.service_connections.db_service.models.catalog_cache import (
+    ACTION_CHAIN,
+    CatalogCache,
+)
 from common.config import should_validate_write
 
 
@@ -232,6 +236,7 @@ def insert_action_chain(
         db_session.add(db_chain)
         db_session.commit()
         db_session.refresh(db_chain)
+        CatalogCache.invalidate(ACTION_CHAIN, db_chain.account_id)
         return ActionChainModel(**db_chain.__dict__)
 
 
@@ -273,15 +278,17 @@ def update_action_chain_by_id(
     if not db_chain:
         raise ValueError(f"Action Chain ID {action_chain_id} not found.")
 
-        action_chain.updated_at = datetime.now(timezone.utc)
-        chain_data = action_chain.model_dump(exclude_unset=True)
+    previous_account_id = db_chain.account_id
+    action_chain.updated_at = datetime.now(timezone.utc)
+    chain_data = action_chain.model_dump(exclude_unset=True)
 
-        for key, value in chain_data.items():
-            setattr(db_chain, key, value)
+    for key, value in chain_data.items():
+        setattr(db_chain, key, value)
 
-        db_session.commit()
-        db_session.refresh(db_chain)
-        return ActionChainModel(**db_chain.__dict__)
+    db_session.commit()
+    db_session.refresh(db_chain)
+    CatalogCache.invalidate(ACTION_CHAIN, previous_account_id, db_chain.account_id)
+    return ActionChainModel(**db_chain.__dict__)
 
 
 def drop_action_chain_by_id(
@@ -291,9 +298,11 @@ def drop_action_chain_by_id(
     db_chain = db_session.get(ActionChainTable, action_chain_id)
     if not db_chain:
         raise ValueError(f"Action Chain ID {action_chain_id} not found.")
+    account_id = db_chain.account_id
     db_session.delete(db_chain)
     db_session.commit()
     logging.info(f"Action Chain ID {action_chain_id} deleted.")
+    CatalogCache.invalidate(ACTION_CHAIN, account_id)
     return 1
 
 
@@ -304,13 +313,19 @@ def query_action_chains_by_account(
     account_id: str, db_session: Session, engine: Engine
 ) -> List[ActionChainModel]:
     """Query active action chains filtered by account_id."""
-    chains = (
-        db_session.query(ActionChainTable)
-        .filter(ActionChainTable.account_id == account_id)
-        .filter(ActionChainTable.is_active == True)
-        .all()
+
+    def load() -> List[ActionChainModel]:
+        chains = (
+            db_session.query(ActionChainTable)
+            .filter(ActionChainTable.account_id == account_id)
+            .filter(ActionChainTable.is_active == True)
+            .all()
+        )
+        return [ActionChainModel(**chain.__dict__) for chain in chains]
+
+    return CatalogCache.get_or_load(
+        ACTION_CHAIN, account_id, "active", ActionChainModel, load
     )
-    return [ActionChainModel(**chain.__dict__) for chain in chains]
 
 
 def query_action_chains_by_sut(
@@ -334,13 +349,14 @@ def deactivate_action_chain_by_id(
     if not db_chain:
         raise ValueError(f"Action Chain ID {action_chain_id} not found.")
 
-        db_chain.is_active = False
-        db_chain.deactivated_at = datetime.now(timezone.utc)
-        db_chain.deactivated_by_user_id = deactivated_by_user_id
+    db_chain.is_active = False
+    db_chain.deactivated_at = datetime.now(timezone.utc)
+    db_chain.deactivated_by_user_id = deactivated_by_user_id
 
-        db_session.commit()
-        db_session.refresh(db_chain)
-        return ActionChainModel(**db_chain.__dict__)
+    db_session.commit()
+    db_session.refresh(db_chain)
+    CatalogCache.invalidate(ACTION_CHAIN, db_chain.account_id)
+    return ActionChainModel(**db_chain.__dict__)
 
 
 def reactivate_action_chain_by_id(
@@ -351,14 +367,15 @@ def reactivate_action_chain_by_id(
     if not db_chain:
         raise ValueError(f"Action Chain ID {action_chain_id} not found.")
 
-        db_chain.is_active = True
-        db_chain.deactivated_at = None
-        db_chain.deactivated_by_user_id = None
-        db_chain.updated_at = datetime.now(timezone.utc)
+    db_chain.is_active = True
+    db_chain.deactivated_at = None
+    db_chain.deactivated_by_user_id = None
+    db_chain.updated_at = datetime.now(timezone.utc)
 
-        db_session.commit()
-        db_session.refresh(db_chain)
-        return ActionChainModel(**db_chain.__dict__)
+    db_session.commit()
+    db_session.refresh(db_chain)
+    CatalogCache.invalidate(ACTION_CHAIN, db_chain.account_id)
+    return ActionChainModel(**db_chain.__dict__)
 
 
 ################ JSONB Action Steps Helper Methods ################
@@ -402,6 +419,7 @@ def add_step_to_chain(
 
         db_session.commit()
         db_session.refresh(db_chain)
+        CatalogCache.invalidate(ACTION_CHAIN, db_chain.account_id)
         return ActionChainModel(**db_chain.__dict__)
 
 
@@ -436,6 +454,7 @@ def remove_step_from_chain(
 
         db_session.commit()
         db_session.refresh(db_chain)
+        CatalogCache.invalidate(ACTION_CHAIN, db_chain.account_id)
         return ActionChainModel(**db_chain.__dict__)
 
 
@@ -474,6 +493,7 @@ def update_step_at_index(
 
         db_session.commit()
         db_session.refresh(db_chain)
+        CatalogCache.invalidate(ACTION_CHAIN, db_chain.account_id)
         return ActionChainModel(**db_chain.__dict__)
 
 
@@ -517,6 +537,7 @@ def reorder_steps(
 
         db_session.commit()
         db_session.refresh(db_chain)
+        CatalogCache.invalidate(ACTION_CHAIN, db_chain.account_id)
         return ActionChainModel(**db_chain.__dict__)
 
 
@@ -0,0 +1,492 @@
+"""
+Set-based write operations shared by plan_suite_helpers and suite_test_case_helpers.
+
+Both association tables have the same shape (association_id, a parent id, a child
+id, execution_order, is_active, created_at, updated_at) and are unique on
+(parent, child). Writes here are issued as a handful of statements regardless of
+the number of rows:
+
+- reorder: one UPDATE ... FROM (VALUES ...) touching only rows whose order changed
+- add: one multi-row INSERT ... ON CONFLICT DO UPDATE that reactivates or reorders
+  existing pairs
+- replace: a diff against the current associations; unchanged rows are not written
+
+execution_order is a sparse ordering key: positions are spaced ORDER_GAP apart,
+so inserting or moving one item takes the midpoint of its neighbours and writes a
+single row. When two neighbours are adjacent integers the parent is rebalanced
+(renumbered to (i + 1) * ORDER_GAP) in the same transaction, and
+rebalance_crowded_associations renumbers crowded parents ahead of time.
+
+Statements are chunked to _BATCH_SIZE rows to keep bind parameter counts bounded.
+Callers own the session and the commit.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+from uuid import uuid4
+
+from sqlalchemy import (
+    Integer,
+    String,
+    Table,
+    column,
+    delete,
+    func,
+    or_,
+    select,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import InstrumentedAttribute, Session
+
+_BATCH_SIZE = 1000
+
+ORDER_GAP = 1024
+
+
+@dataclass(frozen=True)
+class AssociationSpec:
+    """
+    Describes one association table to the set-based operations.
+
+    Fields:
+    - table (Table): Core table of the association ORM class
+    - parent_column (str): Owning side, e.g. plan_id
+    - child_column (str): Ordered side, e.g. suite_id
+    - child_label (str): Human name of the child used in error messages
+    """
+
+    table: Table
+    parent_column: str
+    child_column: str
+    child_label: str
+
+    @property
+    def parent(self):
+        return self.table.c[self.parent_column]
+
+    @property
+    def child(self):
+        return self.table.c[self.child_column]
+
+
+def _chunks(items: Sequence, size: int = _BATCH_SIZE) -> Iterator[Sequence]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def spaced_order(index: int) -> int:
+    """Ordering key for the index-th item of a freshly numbered list."""
+    return (index + 1) * ORDER_GAP
+
+
+def order_key_between(lower: Optional[int], upper: Optional[int]) -> Optional[int]:
+    """Pick an ordering key strictly between two neighbours.
+
+    Args:
+        lower: Key of the item before, or None at the start
+        upper: Key of the item after, or None at the end
+
+    Returns:
+        The midpoint key, or None if there is no free integer between them
+    """
+    if upper is None:
+        return spaced_order(0) if lower is None else lower + ORDER_GAP
+    lower = -1 if lower is None else lower
+    if upper - lower < 2:
+        return None
+    return (lower + upper) // 2
+
+
+def _reject_duplicates(spec: AssociationSpec, child_ids: Sequence[str]) -> None:
+    if len(set(child_ids)) != len(child_ids):
+        seen, duplicates = set(), set()
+        for child_id in child_ids:
+            (duplicates if child_id in seen else seen).add(child_id)
+        raise ValueError(f"Duplicate {spec.child_label} IDs: {duplicates}")
+
+
+def verify_ids_exist(
+    db_session: Session, id_column: InstrumentedAttribute, ids: Sequence[str], label: str
+) -> None:
+    """Raise ValueError naming the first missing ID, using one SELECT per batch.
+
+    Args:
+        db_session: Active database session
+        id_column: Primary key column of the referenced table
+        ids: IDs that must exist
+        label: Human name of the entity for the error message
+
+    Raises:
+        ValueError: If any ID does not exist
+    """
+    wanted = list(dict.fromkeys(ids))
+    found = set()
+    for chunk in _chunks(wanted):
+        found.update(db_session.scalars(select(id_column).where(id_column.in_(chunk))))
+    for entity_id in wanted:
+        if entity_id not in found:
+            raise ValueError(f"{label} not found: {entity_id}")
+
+
+def query_active_associations(
+    db_session: Session, spec: AssociationSpec, parent_id: str
+) -> Dict[str, Tuple[str, int]]:
+    """Map child_id -> (association_id, execution_order) for active associations."""
+    rows = db_session.execute(
+        select(spec.child, spec.table.c.association_id, spec.table.c.execution_order)
+        .where(spec.parent == parent_id, spec.table.c.is_active == True)
+    ).all()
+    return {child_id: (assoc_id, order) for child_id, assoc_id, order in rows}
+
+
+def upsert_associations(
+    db_session: Session,
+    spec: AssociationSpec,
+    parent_id: str,
+    child_orders: Sequence[Tuple[str, int]],
+    is_active: bool = True,
+) -> Dict[str, str]:
+    """Insert associations, reactivating or reordering pairs that already exist.
+
+    Existing rows whose is_active and execution_order already match are left
+    untouched and are not returned.
+
+    Args:
+        db_session: Active database session
+        spec: Association table description
+        parent_id: Owning plan or suite
+        child_orders: (child_id, execution_order) pairs
+        is_active: Active flag for inserted and updated rows
+
+    Returns:
+        Mapping of child_id to association_id for every row inserted or updated
+    """
+    _reject_duplicates(spec, [child_id for child_id, _ in child_orders])
+    now = datetime.now(timezone.utc)
+    written: Dict[str, str] = {}
+    for chunk in _chunks(child_orders):
+        stmt = pg_insert(spec.table).values(
+            [
+                {
+                    "association_id": str(uuid4()),
+                    spec.parent_column: parent_id,
+                    spec.child_column: child_id,
+                    "execution_order": execution_order,
+                    "is_active": is_active,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for child_id, execution_order in chunk
+            ]
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[spec.parent_column, spec.child_column],
+            set_={
+                "execution_order": stmt.excluded.execution_order,
+                "is_active": stmt.excluded.is_active,
+                "updated_at": now,
+            },
+            where=or_(
+                spec.table.c.is_active != stmt.excluded.is_active,
+                spec.table.c.execution_order != stmt.excluded.execution_order,
+            ),
+        ).returning(spec.child, spec.table.c.association_id)
+        for child_id, association_id in db_session.execute(stmt):
+            written[child_id] = association_id
+    return written
+
+
+def reorder_associations(
+    db_session: Session,
+    spec: AssociationSpec,
+    parent_id: str,
+    ordered_child_ids: Sequence[str],
+) -> int:
+    """Renumber children to spaced keys in the given order with UPDATE ... FROM (VALUES).
+
+    Only rows whose order actually changes are sent and updated.
+
+    Args:
+        db_session: Active database session
+        spec: Association table description
+        parent_id: Owning plan or suite
+        ordered_child_ids: Child IDs in the desired execution order
+
+    Returns:
+        Number of associations updated
+
+    Raises:
+        ValueError: If an ID has no active association or is listed twice
+    """
+    _reject_duplicates(spec, ordered_child_ids)
+    current = query_active_associations(db_session, spec, parent_id)
+    missing_ids = set(ordered_child_ids) - set(current)
+    if missing_ids:
+        raise ValueError(
+            f"{spec.child_label} IDs not found in associations: {missing_ids}"
+        )
+
+    changed = [
+        (child_id, spaced_order(index))
+        for index, child_id in enumerate(ordered_child_ids)
+        if current[child_id][1] != spaced_order(index)
+    ]
+    return _update_orders(db_session, spec, parent_id, changed)
+
+
+def _update_orders(
+    db_session: Session,
+    spec: AssociationSpec,
+    parent_id: str,
+    child_orders: Sequence[Tuple[str, int]],
+) -> int:
+    updated = 0
+    for chunk in _chunks(child_orders):
+        new_order = values(
+            column("child_id", String),
+            column("execution_order", Integer),
+            name="new_order",
+        ).data(list(chunk))
+        result = db_session.execute(
+            update(spec.table)
+            .where(
+                spec.parent == parent_id,
+                spec.child == new_order.c.child_id,
+                spec.table.c.is_active == True,
+            )
+            .values(
+                execution_order=new_order.c.execution_order,
+                updated_at=datetime.now(timezone.utc),
+            )
+        )
+        updated += result.rowcount
+    return updated
+
+
+def replace_associations(
+    db_session: Session,
+    spec: AssociationSpec,
+    parent_id: str,
+    new_child_ids: Sequence[str],
+    soft_delete_old: bool = True,
+) -> Dict[str, List[str]]:
+    """Make the active associations equal new_child_ids, in that order.
+
+    Children no longer listed are deactivated (or deleted); new or previously
+    deactivated children are upserted; kept children are only updated when their
+    position changed.
+
+    Args:
+        db_session: Active database session
+        spec: Association table description
+        parent_id: Owning plan or suite
+        new_child_ids: Child IDs in the desired execution order
+        soft_delete_old: If True, deactivate removed rows; if False, delete them
+
+    Returns:
+        Dict with 'removed', 'added' and 'reordered' association_id lists
+    """
+    _reject_duplicates(spec, new_child_ids)
+    current = query_active_associations(db_session, spec, parent_id)
+    keep = set(new_child_ids)
+
+    removed = [
+        assoc_id for child_id, (assoc_id, _) in current.items() if child_id not in keep
+    ]
+    for chunk in _chunks(removed):
+        id_filter = spec.table.c.association_id.in_(chunk)
+        if soft_delete_old:
+            db_session.execute(
+                update(spec.table)
+                .where(id_filter)
+                .values(is_active=False, updated_at=datetime.now(timezone.utc))
+            )
+        else:
+            db_session.execute(delete(spec.table).where(id_filter))
+
+    reordered_pairs = [
+        (child_id, spaced_order(index))
+        for index, child_id in enumerate(new_child_ids)
+        if child_id in current and current[child_id][1] != spaced_order(index)
+    ]
+    _update_orders(db_session, spec, parent_id, reordered_pairs)
+
+    added = upsert_associations(
+        db_session,
+        spec,
+        parent_id,
+        [
+            (child_id, spaced_order(index))
+            for index, child_id in enumerate(new_child_ids)
+            if child_id not in current
+        ],
+    )
+
+    return {
+        "removed": removed,
+        "added": [added[child_id] for child_id in new_child_ids if child_id in added],
+        "reordered": [current[child_id][0] for child_id, _ in reordered_pairs],
+    }
+
+
+# ============================================================================
+# Gap-Based Ordering
+# ============================================================================
+
+
+def _ordered_keys(spec: AssociationSpec, parent_id: str, exclude_child: Optional[str]):
+    stmt = select(spec.table.c.execution_order).where(
+        spec.parent == parent_id, spec.table.c.is_active == True
+    )
+    if exclude_child is not None:
+        stmt = stmt.where(spec.child != exclude_child)
+    return stmt
+
+
+def order_key_for_position(
+    db_session: Session,
+    spec: AssociationSpec,
+    parent_id: str,
+    position: Optional[int] = None,
+    exclude_child: Optional[str] = None,
+) -> int:
+    """Ordering key that places an item at position among the active children.
+
+    Reads at most the two neighbouring keys. Rebalances the parent first if the
+    neighbours leave no room.
+
+    Args:
+        db_session: Active database session
+        spec: Association table description
+        parent_id: Owning plan or suite
+        position: 0-based target position; None or past the end appends
+        exclude_child: Child being moved, ignored when locating neighbours
+
+    Returns:
+        execution_order value for the item
+    """
+    order = spec.table.c.execution_order
+    keys = _ordered_keys(spec, parent_id, exclude_child)
+
+    if position is None or position < 0:
+        neighbours = []
+    elif position == 0:
+        neighbours = [None] + list(
+            db_session.scalars(keys.order_by(order, spec.child).limit(1))
+        )
+    else:
+        neighbours = list(
+            db_session.scalars(
+                keys.order_by(order, spec.child).offset(position - 1).limit(2)
+            )
+        )
+    if not neighbours:
+        # Append after the current last item
+        last = db_session.scalar(select(func.max(keys.subquery().c.execution_order)))
+        neighbours = [last]
+
+    lower = neighbours[0]
+    upper = neighbours[1] if len(neighbours) > 1 else None
+    key = order_key_between(lower, upper)
+    if key is not None:
+        return key
+
+    rebalance_associations(db_session, spec, parent_id)
+    return order_key_for_position(
+        db_session, spec, parent_id, position, exclude_child
+    )
+
+
+def move_association(
+    db_session: Session,
+    spec: AssociationSpec,
+    parent_id: str,
+    child_id: str,
+    position: int,
+) -> bool:
+    """Move one active child to position by rewriting only its ordering key.
+
+    Returns:
+        True if moved, False if the child has no active association
+    """
+    key = order_key_for_position(
+        db_session, spec, parent_id, position, exclude_child=child_id
+    )
+    result = db_session.execute(
+        update(spec.table)
+        .where(
+            spec.parent == parent_id,
+            spec.child == child_id,
+            spec.table.c.is_active == True,
+        )
+        .values(execution_order=key, updated_at=datetime.now(timezone.utc))
+    )
+    return result.rowcount > 0
+
+
+def rebalance_associations(
+    db_session: Session, spec: AssociationSpec, parent_id: str
+) -> int:
+    """Renumber a parent's active children to evenly spaced keys, keeping order.
+
+    Returns:
+        Number of associations updated
+    """
+    order = spec.table.c.execution_order
+    ordered_child_ids = db_session.scalars(
+        select(spec.child)
+        .where(spec.parent == parent_id, spec.table.c.is_active == True)
+        .order_by(order, spec.child)
+    ).all()
+    return reorder_associations(db_session, spec, parent_id, ordered_child_ids)
+
+
+def query_crowded_parents(
+    db_session: Session, spec: AssociationSpec, min_gap: int = 2
+) -> List[str]:
+    """Parents with two adjacent active children closer than min_gap.
+
+    Args:
+        db_session: Active database session
+        spec: Association table description
+        min_gap: Smallest acceptable distance between adjacent keys
+
+    Returns:
+        List of parent IDs that should be rebalanced
+    """
+    order = spec.table.c.execution_order
+    gaps = (
+        select(
+            spec.parent.label("parent_id"),
+            (order - func.lag(order).over(partition_by=spec.parent, order_by=order)).label(
+                "gap"
+            ),
+        )
+        .where(spec.table.c.is_active == True)
+        .subquery()
+    )
+    return list(
+        db_session.scalars(
+            select(gaps.c.parent_id).where(gaps.c.gap < min_gap).distinct()
+        )
+    )
+
+
+def rebalance_crowded_associations(
+    db_session: Session, spec: AssociationSpec, min_gap: int = ORDER_GAP // 64
+) -> Dict[str, int]:
+    """Rebalance every parent whose keys are running out of room.
+
+    Meant to run periodically (see manage_db.py rebalance-orders) so that the
+    inline rebalance in order_key_for_position is rarely needed.
+
+    Returns:
+        Mapping of parent_id to number of associations renumbered
+    """
+    return {
+        parent_id: rebalance_associations(db_session, spec, parent_id)
+        for parent_id in query_crowded_parents(db_session, spec, min_gap)
+    }
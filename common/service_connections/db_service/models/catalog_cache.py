@@ -0,0 +1,422 @@
+"""
+Per-account read-through cache for catalog list queries.
+
+The account-scoped list queries for test cases, suites, plans, action chains and
+systems under test go through CatalogCache.get_or_load(). Entries are keyed by
+entity, account and query, and are invalidated explicitly: every insert_,
+update_, deactivate_, reactivate_ and drop_ function for those entities calls
+CatalogCache.invalidate() after committing. The TTL is only a safety net for
+writes that bypass the model layer (migrations, manual SQL, purges).
+
+Invalidation bumps a generation counter for the (entity, account) scope rather
+than deleting keys. Keys embed the generation read before the query ran, so a
+result loaded concurrently with a write is stored under a key no reader will
+look up again and can never be served stale.
+
+Backends:
+- memory: in-process LRU (default). Cached models are shared between callers
+  and must be treated as read-only.
+- sqlite: a SQLite file shared by all worker processes on one host, so an
+  invalidation in one worker is seen by the others. Values are stored as JSON.
+- none: caching disabled.
+
+Configuration (environment):
+    CATALOG_CACHE_BACKEND: memory, sqlite or none (default memory)
+    CATALOG_CACHE_MAX_ENTRIES: LRU size of the memory backend (default 2048)
+    CATALOG_CACHE_TTL_SECONDS: Safety-net expiry of entries (default 300)
+    CATALOG_CACHE_SQLITE_PATH: Database file of the sqlite backend
+"""
+
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, TypeVar
+
+from dotenv import load_dotenv
+from pydantic import BaseModel, TypeAdapter
+
+logger = logging.getLogger(__name__)
+
+M = TypeVar("M", bound=BaseModel)
+
+# Cached entities; invalidate() and get_or_load() must use the same names
+TEST_CASE = "test_case"
+SUITE = "suite"
+PLAN = "plan"
+ACTION_CHAIN = "action_chain"
+SYSTEM_UNDER_TEST = "system_under_test"
+
+# Generation scope covering every account of an entity
+_ALL_ACCOUNTS = "*"
+
+
+class CatalogCacheConfig(BaseModel):
+    backend: str = "memory"
+    max_entries: int = 2048
+    ttl_seconds: float = 300.0
+    sqlite_path: str = os.path.join(tempfile.gettempdir(), "fenrir_catalog.sqlite3")
+
+
+def get_catalog_cache_config() -> CatalogCacheConfig:
+    load_dotenv()
+    config = CatalogCacheConfig(
+        backend=os.getenv("CATALOG_CACHE_BACKEND", "memory").strip().lower(),
+        max_entries=int(os.getenv("CATALOG_CACHE_MAX_ENTRIES", "2048")),
+        ttl_seconds=float(os.getenv("CATALOG_CACHE_TTL_SECONDS", "300")),
+    )
+    sqlite_path = os.getenv("CATALOG_CACHE_SQLITE_PATH")
+    if sqlite_path:
+        config.sqlite_path = sqlite_path
+    return config
+
+
+class CatalogCacheStatsModel(BaseModel):
+    """
+    Counters of the catalog cache for this process.
+
+    Fields:
+    - backend: str - Configured backend name
+    - hits: int - Lookups answered from the cache
+    - misses: int - Lookups that ran the query
+    - hit_ratio: float - hits / (hits + misses), 0.0 before any lookup
+    - entries: int - Entries currently held by the backend
+    """
+
+    backend: str
+    hits: int
+    misses: int
+    hit_ratio: float
+    entries: int
+
+
+# =====================================
+# Backends
+# =====================================
+
+
+class CacheBackend(ABC):
+    """Storage for cache entries and invalidation generations."""
+
+    name: str
+    # True when values must be bytes (the caller serializes them)
+    stores_bytes: bool = False
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        """Return the unexpired value for key, or None."""
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl_seconds: float) -> None:
+        """Store value under key for ttl_seconds."""
+
+    @abstractmethod
+    def generation(self, scope: str) -> int:
+        """Current generation of an invalidation scope (0 if never bumped)."""
+
+    @abstractmethod
+    def bump_generation(self, scope: str) -> None:
+        """Invalidate every entry keyed with the scope's current generation."""
+
+    @abstractmethod
+    def size(self) -> int:
+        """Number of stored entries, expired ones included."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Drop all entries and generations."""
+
+
+class MemoryCacheBackend(CacheBackend):
+    """In-process LRU holding values as-is."""
+
+    name = "memory"
+
+    def __init__(self, max_entries: int = 2048):
+        self.max_entries = max_entries
+        # key -> (expires_at, value)
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._generations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: str, value: Any, ttl_seconds: float) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def generation(self, scope: str) -> int:
+        return self._generations.get(scope, 0)
+
+    def bump_generation(self, scope: str) -> None:
+        with self._lock:
+            self._generations[scope] = self._generations.get(scope, 0) + 1
+
+    def size(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._generations.clear()
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """SQLite file shared by the processes of one host; values are bytes."""
+
+    name = "sqlite"
+    stores_bytes = True
+
+    # Expired rows are purged on every Nth set()
+    _PURGE_EVERY = 256
+
+    def __init__(self, path: str):
+        self.path = path
+        self._local = threading.local()
+        self._sets = 0
+        conn = self._connection()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache_entries "
+            "(key TEXT PRIMARY KEY, expires_at REAL NOT NULL, value BLOB NOT NULL)"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache_generations "
+            "(scope TEXT PRIMARY KEY, generation INTEGER NOT NULL)"
+        )
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str) -> Optional[bytes]:
+        row = (
+            self._connection()
+            .execute(
+                "SELECT value FROM cache_entries WHERE key = ? AND expires_at > ?",
+                (key, time.time()),
+            )
+            .fetchone()
+        )
+        return row[0] if row else None
+
+    def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        conn = self._connection()
+        now = time.time()
+        conn.execute(
+            "INSERT OR REPLACE INTO cache_entries (key, expires_at, value) "
+            "VALUES (?, ?, ?)",
+            (key, now + ttl_seconds, value),
+        )
+        self._sets += 1
+        if self._sets % self._PURGE_EVERY == 0:
+            conn.execute("DELETE FROM cache_entries WHERE expires_at <= ?", (now,))
+
+    def generation(self, scope: str) -> int:
+        row = (
+            self._connection()
+            .execute(
+                "SELECT generation FROM cache_generations WHERE scope = ?", (scope,)
+            )
+            .fetchone()
+        )
+        return row[0] if row else 0
+
+    def bump_generation(self, scope: str) -> None:
+        self._connection().execute(
+            "INSERT INTO cache_generations (scope, generation) VALUES (?, 1) "
+            "ON CONFLICT(scope) DO UPDATE SET generation = generation + 1",
+            (scope,),
+        )
+
+    def size(self) -> int:
+        row = self._connection().execute("SELECT count(*) FROM cache_entries")
+        return row.fetchone()[0]
+
+    def clear(self) -> None:
+        conn = self._connection()
+        conn.execute("DELETE FROM cache_entries")
+        conn.execute("DELETE FROM cache_generations")
+
+
+def create_cache_backend(config: CatalogCacheConfig) -> Optional[CacheBackend]:
+    """Backend named by config.backend, or None when caching is disabled."""
+    if config.backend == "none":
+        return None
+    if config.backend == "sqlite":
+        try:
+            return SQLiteCacheBackend(config.sqlite_path)
+        except sqlite3.Error as e:
+            logger.warning(
+                f"Catalog cache: cannot open {config.sqlite_path} ({e}), "
+                f"falling back to the memory backend"
+            )
+    elif config.backend != "memory":
+        logger.warning(f"Unknown catalog cache backend {config.backend!r}")
+    return MemoryCacheBackend(config.max_entries)
+
+
+# =====================================
+# Catalog Cache
+# =====================================
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(model_cls: Type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(List[model_cls])
+
+
+class CatalogCache:
+    """
+    Read-through cache of account-scoped catalog lists.
+
+    The backend is created from get_catalog_cache_config() on first use;
+    configure() replaces it (tests, or a process that wants another backend).
+    """
+
+    _backend: Optional[CacheBackend] = None
+    _ttl_seconds: float = 300.0
+    _configured = False
+    _lock = threading.Lock()
+    hits = 0
+    misses = 0
+
+    @classmethod
+    def configure(
+        cls, backend: Optional[CacheBackend], ttl_seconds: Optional[float] = None
+    ) -> None:
+        """Use backend (None disables caching) and reset the counters."""
+        with cls._lock:
+            cls._backend = backend
+            if ttl_seconds is not None:
+                cls._ttl_seconds = ttl_seconds
+            cls._configured = True
+            cls.hits = 0
+            cls.misses = 0
+
+    @classmethod
+    def backend(cls) -> Optional[CacheBackend]:
+        if not cls._configured:
+            config = get_catalog_cache_config()
+            backend = create_cache_backend(config)
+            with cls._lock:
+                if not cls._configured:
+                    cls._backend = backend
+                    cls._ttl_seconds = config.ttl_seconds
+                    cls._configured = True
+        return cls._backend
+
+    @classmethod
+    def _key(
+        cls, backend: CacheBackend, entity: str, account_id: str, query_key: str
+    ) -> str:
+        entity_generation = backend.generation(f"{entity}:{_ALL_ACCOUNTS}")
+        account_generation = backend.generation(f"{entity}:{account_id}")
+        return (
+            f"{entity}:{entity_generation}:{account_id}:{account_generation}:"
+            f"{query_key}"
+        )
+
+    @classmethod
+    def get_or_load(
+        cls,
+        entity: str,
+        account_id: str,
+        query_key: str,
+        model_cls: Type[M],
+        load: Callable[[], List[M]],
+    ) -> List[M]:
+        """
+        Return the cached list for (entity, account_id, query_key), loading it
+        with load() on a miss.
+
+        Args:
+            entity: Entity name (TEST_CASE, SUITE, PLAN, ...)
+            account_id: Account the list belongs to
+            query_key: Distinguishes queries of the same entity and account
+            model_cls: Model of the list items (used to serialize for sqlite)
+            load: Runs the query
+
+        Returns:
+            List of model_cls instances (a new list; the models may be shared)
+        """
+        backend = cls.backend()
+        if backend is None:
+            return load()
+
+        key = cls._key(backend, entity, account_id, query_key)
+        cached = backend.get(key)
+        if cached is not None:
+            cls.hits += 1
+            if backend.stores_bytes:
+                return _list_adapter(model_cls).validate_json(cached)
+            return list(cached)
+
+        cls.misses += 1
+        models = load()
+        if backend.stores_bytes:
+            value = _list_adapter(model_cls).dump_json(models)
+        else:
+            value = list(models)
+        backend.set(key, value, cls._ttl_seconds)
+        return models
+
+    @classmethod
+    def invalidate(cls, entity: str, *account_ids: Optional[str]) -> None:
+        """
+        Invalidate an entity's cached lists for the given accounts.
+
+        With no account IDs (or only None) every account of the entity is
+        invalidated.
+        """
+        backend = cls.backend()
+        if backend is None:
+            return
+        scopes = {f"{entity}:{account_id}" for account_id in account_ids if account_id}
+        for scope in scopes or {f"{entity}:{_ALL_ACCOUNTS}"}:
+            backend.bump_generation(scope)
+
+    @classmethod
+    def clear(cls) -> None:
+        """Drop every entry and reset the counters."""
+        backend = cls.backend()
+        if backend is not None:
+            backend.clear()
+        cls.hits = 0
+        cls.misses = 0
+
+    @classmethod
+    def hit_ratio(cls) -> float:
+        lookups = cls.hits + cls.misses
+        return cls.hits / lookups if lookups else 0.0
+
+    @classmethod
+    def stats(cls) -> CatalogCacheStatsModel:
+        backend = cls.backend()
+        return CatalogCacheStatsModel(
+            backend=backend.name if backend else "none",
+            hits=cls.hits,
+            misses=cls.misses,
+            hit_ratio=cls.hit_ratio(),
+            entries=backend.size() if backend else 0,
+        )
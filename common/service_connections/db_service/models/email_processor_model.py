@@ -1,7 +1,8 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 import logging
-from typing import List
+from typing import Dict, List
 
+from sqlalchemy import or_, select, update
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
 
@@ -153,6 +154,9 @@ def retrieve_unprocessed_email_items(
 ) -> List[EmailProcessorModel]:
     """
     Retrieves all email_items that require processing from the database
+
+    Read-only listing; workers that send emails must claim items with
+    claim_unprocessed_email_items so concurrent workers never share a row.
     """
     with session(engine) as session:
         email_items = (
@@ -163,6 +167,72 @@ def retrieve_unprocessed_email_items(
     return [EmailProcessorModel(**email_item.__dict__) for email_item in email_items]
 
 
+def claim_unprocessed_email_items(
+    db_session: Session, batch_size: int, retry_after_seconds: float = 0
+) -> List[EmailProcessorModel]:
+    """
+    Locks up to batch_size email_items that require processing, oldest first.
+
+    Rows are selected FOR UPDATE SKIP LOCKED, so rows already claimed by another
+    worker's open transaction are skipped rather than waited on. The locks last
+    until db_session's transaction ends; mark the results with
+    mark_email_item_results in that same transaction. Items that failed less
+    than retry_after_seconds ago and multi-email items (not supported yet) are
+    not claimed.
+    """
+    retry_before = datetime.now() - timedelta(seconds=retry_after_seconds)
+    email_items = db_session.scalars(
+        select(EmailProcessorTable)
+        .where(
+            EmailProcessorTable.requires_processing == True,
+            EmailProcessorTable.multi_email_flag.isnot(True),
+            or_(
+                EmailProcessorTable.last_processed_at.is_(None),
+                EmailProcessorTable.last_processed_at < retry_before,
+            ),
+        )
+        .order_by(EmailProcessorTable.email_processor_id)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    ).all()
+    return [EmailProcessorModel(**email_item.__dict__) for email_item in email_items]
+
+
+def mark_email_item_results(
+    db_session: Session, sent: Dict[int, List[str]], failed: List[int]
+) -> None:
+    """
+    Records the outcome of a claimed batch in the claiming transaction.
+
+    Args:
+        db_session: Session holding the claim locks
+        sent: email_processor_id -> names of the files that were emailed
+        failed: email_processor_ids to retry after the retry delay
+    """
+    now = datetime.now()
+    if sent:
+        db_session.execute(
+            update(EmailProcessorTable),
+            [
+                {
+                    "email_processor_id": email_processor_id,
+                    "multi_item_email_ids": file_names,
+                    "requires_processing": False,
+                    "last_processed_at": now,
+                    "updated_at": now,
+                }
+                for email_processor_id, file_names in sent.items()
+            ],
+        )
+    if failed:
+        # Stays queued; last_processed_at holds the attempt time for the backoff
+        db_session.execute(
+            update(EmailProcessorTable)
+            .where(EmailProcessorTable.email_processor_id.in_(failed))
+            .values(last_processed_at=now, updated_at=now)
+        )
+
+
 def fetch_item_item_ids(engine) -> List[str]:
     """
     Retrieve email items from the Fenrir database.
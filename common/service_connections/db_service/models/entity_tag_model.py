@@ -2,23 +2,39 @@
 Entity tag model with polymorphic queries and row-level security context manager.
 
 This module provides:
-1. AccountRLSContext: Thread-safe context manager for PostgreSQL RLS session variables
+1. AccountRLSContext: contextvars-based RLS scope applied with SET LOCAL per transaction
 2. EntityTagModel: Pydantic model with validation for polymorphic tagging
 3. CRUD operations for entity tags with multi-tenant isolation
 4. Polymorphic query helpers for tag-based entity filtering
+5. Boolean tag expression search with facet counts
+6. Set-based bulk tagging with INSERT ... ON CONFLICT DO UPDATE
 """
 
 from __future__ import annotations
 
 import logging
-import threading
+import re
 import traceback
+from contextvars import ContextVar, Token
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING, Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple, Union
+from uuid import uuid4
 
 from fastapi import HTTPException
 from pydantic import BaseModel, field_validator
-from sqlalchemy import and_, func, select
+from sqlalchemy import (
+    and_,
+    event,
+    func,
+    literal_column,
+    not_,
+    or_,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.engine import Engine
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
@@ -37,16 +53,41 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-# Thread-local storage for RLS context stack
-_thread_local = threading.local()
+# Stack of account IDs for the current thread or asyncio task
+_rls_account_stack: ContextVar[Tuple[str, ...]] = ContextVar(
+    "rls_account_stack", default=()
+)
+
+
+def current_rls_account_id() -> Optional[str]:
+    """Account ID of the innermost active AccountRLSContext, if any."""
+    stack = _rls_account_stack.get()
+    return stack[-1] if stack else None
+
+
+def _set_local_account_id(executor, account_id: str) -> None:
+    """SET LOCAL app.current_account_id on a session or connection."""
+    executor.execute(
+        select(func.set_config("app.current_account_id", account_id, True))
+    )
+
+
+@event.listens_for(Session, "after_begin")
+def _apply_rls_account_id(session, transaction, connection) -> None:
+    """Scope each new transaction to the active RLS account, if one is set."""
+    account_id = current_rls_account_id()
+    if account_id is not None:
+        _set_local_account_id(connection, account_id)
 
 
 class AccountRLSContext:
-    """Thread-safe context manager for PostgreSQL row-level security session variables.
+    """Context manager scoping PostgreSQL row-level security to an account.
 
-    Sets the app.current_account_id session variable for PostgreSQL RLS policies.
-    Supports nested contexts with maximum stack depth of 10 to prevent infinite recursion.
-    Includes verification mode to detect session variable reset failures.
+    The account ID is held in a contextvars stack, so it follows the current
+    thread or asyncio task. Sessions apply it with SET LOCAL (set_config(...,
+    true)) once per transaction from an after_begin event, and Postgres resets
+    it when the transaction ends. Entering or leaving a context only talks to
+    the database when the session already has a transaction open.
 
     Usage:
         with AccountRLSContext(session, account_id="uuid-here"):
@@ -60,9 +101,9 @@ class AccountRLSContext:
                 pass
             # Restored to account-1
 
-    Thread Safety:
-        - Uses threading.local() for isolated context stacks per thread
-        - Safe for concurrent test execution with pytest-xdist
+    Concurrency:
+        - contextvars isolate stacks per thread and per asyncio task
+        - Safe for concurrent test execution with pytest-xdist and async sessions
 
     Stack Limit Protection:
         - Maximum depth of 10 contexts to prevent accidental infinite loops
@@ -81,7 +122,7 @@ class AccountRLSContext:
         """Initialize RLS context manager.
 
         Args:
-            session: SQLAlchemy session to set variable on
+            session: SQLAlchemy session the context applies to
             account_id: UUID string to set as current account
             verify_reset: If True, verify session variable reset after __exit__
         """
@@ -89,21 +130,17 @@ class AccountRLSContext:
         self.account_id = account_id
         self.verify_reset = verify_reset
         self.previous_account_id: Optional[str] = None
+        self._token: Optional[Token] = None
 
     def __enter__(self):
-        """Push account_id onto context stack and set session variable."""
-        # Initialize thread-local stack if not exists
-        if not hasattr(_thread_local, "rls_stack"):
-            _thread_local.rls_stack = []
+        """Push account_id onto the stack and apply it to an open transaction."""
+        stack = _rls_account_stack.get()
 
         # Check stack depth limit
-        if len(_thread_local.rls_stack) >= self.MAX_STACK_DEPTH:
+        if len(stack) >= self.MAX_STACK_DEPTH:
             # Log full stack trace of account IDs for debugging
             stack_info = "\n".join(
-                [
-                    f"  [{i}] account_id={acc_id}"
-                    for i, acc_id in enumerate(_thread_local.rls_stack)
-                ]
+                [f"  [{i}] account_id={acc_id}" for i, acc_id in enumerate(stack)]
             )
             logger.error(
                 f"AccountRLSContext stack limit reached ({self.MAX_STACK_DEPTH})\n"
@@ -116,55 +153,36 @@ class AccountRLSContext:
                 "Check for infinite recursion or excessive context nesting."
             )
 
-        # Save previous account_id if stack has entries
-        if _thread_local.rls_stack:
-            self.previous_account_id = _thread_local.rls_stack[-1]
-
-        # Push new account_id onto stack
-        _thread_local.rls_stack.append(self.account_id)
-
-        # Set PostgreSQL session variable for RLS policy
-        try:
-            self.session.execute(
-                func.set_config("app.current_account_id", self.account_id, False)
-            )
-            logger.debug(
-                f"Set RLS account_id={self.account_id} "
-                f"(stack depth: {len(_thread_local.rls_stack)})"
-            )
-        except SQLAlchemyError as e:
-            # Rollback stack push on failure
-            _thread_local.rls_stack.pop()
-            logger.error(f"Failed to set RLS session variable: {e}")
-            raise
-
+        self.previous_account_id = stack[-1] if stack else None
+        self._token = _rls_account_stack.set(stack + (self.account_id,))
+
+        # A transaction that is already open missed after_begin; apply now
+        if self.session.in_transaction():
+            try:
+                _set_local_account_id(self.session, self.account_id)
+            except SQLAlchemyError as e:
+                # Rollback stack push on failure
+                _rls_account_stack.reset(self._token)
+                logger.error(f"Failed to set RLS session variable: {e}")
+                raise
+
+        logger.debug(
+            f"Set RLS account_id={self.account_id} (stack depth: {len(stack) + 1})"
+        )
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        """Pop account_id from stack and restore previous or reset."""
-        # Pop current account_id from stack
-        if hasattr(_thread_local, "rls_stack") and _thread_local.rls_stack:
-            _thread_local.rls_stack.pop()
+        """Pop account_id and restore the previous one in an open transaction."""
+        _rls_account_stack.reset(self._token)
+        expected_value = self.previous_account_id or ""
+
+        # Outside a transaction there is nothing to undo: SET LOCAL ended with it
+        if not self.session.in_transaction():
+            return
 
-        # Restore previous account_id or reset to empty
         try:
-            if self.previous_account_id is not None:
-                # Restore previous context
-                self.session.execute(
-                    func.set_config(
-                        "app.current_account_id", self.previous_account_id, False
-                    )
-                )
-                expected_value = self.previous_account_id
-                logger.debug(
-                    f"Restored RLS account_id={self.previous_account_id} "
-                    f"(stack depth: {len(_thread_local.rls_stack)})"
-                )
-            else:
-                # Reset to empty (no active context)
-                self.session.execute(func.set_config("app.current_account_id", "", False))
-                expected_value = ""
-                logger.debug("Reset RLS account_id (stack empty)")
+            _set_local_account_id(self.session, expected_value)
+            logger.debug(f"Restored RLS account_id={expected_value!r}")
 
             # Verify reset if requested
             if self.verify_reset:
@@ -631,11 +649,483 @@ def query_unique_tag_names(
     return sorted([row[0] for row in results])
 
 
+# ============================================================================
+# Tag Expression Search
+# ============================================================================
+
+
+@dataclass(frozen=True)
+class TagTerm:
+    """A single tag name in a tag expression."""
+
+    tag_name: str
+
+
+@dataclass(frozen=True)
+class TagNot:
+    """Negation of a tag expression."""
+
+    operand: "TagExpression"
+
+
+@dataclass(frozen=True)
+class TagAnd:
+    """Conjunction of tag expressions."""
+
+    operands: Tuple["TagExpression", ...]
+
+
+@dataclass(frozen=True)
+class TagOr:
+    """Disjunction of tag expressions."""
+
+    operands: Tuple["TagExpression", ...]
+
+
+TagExpression = Union[TagTerm, TagNot, TagAnd, TagOr]
+
+_TAG_TOKEN_PATTERN = re.compile(r'\s*(?:(\()|(\))|"([^"]*)"|([^\s()"]+))')
+_TAG_KEYWORDS = {"AND", "OR", "NOT"}
+
+
+def parse_tag_expression(expression: str) -> TagExpression:
+    """Parse a boolean tag expression.
+
+    Grammar (keywords are case-insensitive, NOT binds tighter than AND, AND
+    tighter than OR; adjacent terms without an operator are ANDed):
+
+        smoke AND (login OR checkout) AND NOT flaky
+        "needs data" OR -flaky
+
+    A leading "-" is shorthand for NOT. Quote tag names containing spaces,
+    parentheses or keywords.
+
+    Args:
+        expression: Expression text
+
+    Returns:
+        Parsed expression tree
+
+    Raises:
+        ValueError: If the expression is empty or malformed
+    """
+    tokens: List[Tuple[str, str]] = []
+    position = 0
+    text = expression.strip()
+    while position < len(text):
+        match = _TAG_TOKEN_PATTERN.match(text, position)
+        if not match or match.end() == position:
+            raise ValueError(f"Invalid tag expression near: {text[position:]!r}")
+        position = match.end()
+        open_paren, close_paren, quoted, word = match.groups()
+        if open_paren:
+            tokens.append(("(", open_paren))
+        elif close_paren:
+            tokens.append((")", close_paren))
+        elif quoted is not None:
+            tokens.append(("TAG", quoted))
+        elif word.upper() in _TAG_KEYWORDS:
+            tokens.append((word.upper(), word))
+        elif word.startswith("-") and len(word) > 1:
+            tokens.extend([("NOT", "-"), ("TAG", word[1:])])
+        else:
+            tokens.append(("TAG", word))
+
+    if not tokens:
+        raise ValueError("Tag expression is empty")
+
+    index = 0
+
+    def peek() -> Optional[str]:
+        return tokens[index][0] if index < len(tokens) else None
+
+    def take(kind: str) -> str:
+        nonlocal index
+        if peek() != kind:
+            found = tokens[index][1] if index < len(tokens) else "end of expression"
+            raise ValueError(f"Expected {kind} in tag expression, found {found!r}")
+        index += 1
+        return tokens[index - 1][1]
+
+    def parse_or() -> TagExpression:
+        operands = [parse_and()]
+        while peek() == "OR":
+            take("OR")
+            operands.append(parse_and())
+        return operands[0] if len(operands) == 1 else TagOr(tuple(operands))
+
+    def parse_and() -> TagExpression:
+        operands = [parse_not()]
+        while peek() in ("AND", "NOT", "TAG", "("):
+            if peek() == "AND":
+                take("AND")
+            operands.append(parse_not())
+        return operands[0] if len(operands) == 1 else TagAnd(tuple(operands))
+
+    def parse_not() -> TagExpression:
+        if peek() == "NOT":
+            take("NOT")
+            return TagNot(parse_not())
+        if peek() == "(":
+            take("(")
+            inner = parse_or()
+            take(")")
+            return inner
+        return TagTerm(take("TAG"))
+
+    tree = parse_or()
+    if index != len(tokens):
+        raise ValueError(f"Unexpected {tokens[index][1]!r} in tag expression")
+    return tree
+
+
+def _expression_tag_names(expression: TagExpression) -> List[str]:
+    if isinstance(expression, TagTerm):
+        return [expression.tag_name]
+    if isinstance(expression, TagNot):
+        return _expression_tag_names(expression.operand)
+    return [
+        name
+        for operand in expression.operands
+        for name in _expression_tag_names(operand)
+    ]
+
+
+def _expression_has_negation(expression: TagExpression) -> bool:
+    if isinstance(expression, TagNot):
+        return True
+    if isinstance(expression, TagTerm):
+        return False
+    return any(_expression_has_negation(operand) for operand in expression.operands)
+
+
+def _compile_having(expression: TagExpression):
+    """Compile an expression to a HAVING clause over one entity's tag rows."""
+    if isinstance(expression, TagTerm):
+        return func.bool_or(EntityTagTable.tag_name == expression.tag_name)
+    if isinstance(expression, TagNot):
+        return not_(_compile_having(expression.operand))
+    clauses = [_compile_having(operand) for operand in expression.operands]
+    return and_(*clauses) if isinstance(expression, TagAnd) else or_(*clauses)
+
+
+class TagFacetModel(BaseModel):
+    """Number of matching entities carrying a tag."""
+
+    tag_name: str
+    count: int
+
+
+class TagSearchResultModel(BaseModel):
+    """Page of entity IDs matching a tag expression, with facet counts."""
+
+    entity_type: str
+    expression: str
+    entity_ids: List[str] = []
+    total: int = 0
+    facets: List[TagFacetModel] = []
+
+
+def search_entities_by_tags(
+    expression: str,
+    entity_type: str,
+    account_id: str,
+    token: TokenPayload,
+    db_session: Session,
+    engine: Engine,
+    limit: int = 100,
+    offset: int = 0,
+    facet_limit: int = 25,
+) -> TagSearchResultModel:
+    """Find entities matching a boolean tag expression, with tag facet counts.
+
+    The expression compiles to one GROUP BY entity_id ... HAVING query over the
+    account's active tags for entity_type, where each tag term becomes
+    bool_or(tag_name = ...). Expressions without NOT only read rows for the
+    named tags. Entities with no active tags at all are never matched, even by
+    a pure NOT expression.
+
+    Facets count, for every tag on the matching entities, how many of them carry
+    it, so the UI can show how a further filter would narrow the result.
+
+    Args:
+        expression: Boolean tag expression (see parse_tag_expression)
+        entity_type: Type of entity to search (suite, test_case, etc.)
+        account_id: Account ID for multi-tenant filtering
+        token: JWT token payload for authorization
+        db_session: Active database session
+        engine: Database engine
+        limit: Maximum entity IDs to return
+        offset: Entity IDs to skip, ordered by entity_id
+        facet_limit: Maximum facets to return, most common first
+
+    Returns:
+        TagSearchResultModel with the page of entity IDs, total and facets
+
+    Raises:
+        HTTPException: 403 if user attempts to access another account's data
+        ValueError: If the expression is malformed
+    """
+    # Validate account access (defense-in-depth)
+    if not token.is_super_admin and token.account_id != account_id:
+        raise HTTPException(
+            status_code=403,
+            detail="Access denied: Cannot query entities for a different account",
+        )
+
+    tree = parse_tag_expression(expression)
+    filters = [
+        EntityTagTable.account_id == account_id,
+        EntityTagTable.entity_type == entity_type,
+        EntityTagTable.is_active == True,
+    ]
+    if not _expression_has_negation(tree):
+        filters.append(EntityTagTable.tag_name.in_(set(_expression_tag_names(tree))))
+
+    matches = (
+        select(EntityTagTable.entity_id)
+        .where(*filters)
+        .group_by(EntityTagTable.entity_id)
+        .having(_compile_having(tree))
+        .cte("tag_matches")
+    )
+
+    rows = db_session.execute(
+        select(matches.c.entity_id, func.count().over().label("total"))
+        .order_by(matches.c.entity_id)
+        .limit(limit)
+        .offset(offset)
+    ).all()
+    total = rows[0].total if rows else 0
+    if not rows and offset:
+        total = db_session.scalar(select(func.count()).select_from(matches)) or 0
+
+    facets = []
+    if total:
+        facet_count = func.count(func.distinct(EntityTagTable.entity_id))
+        facets = [
+            TagFacetModel(tag_name=tag_name, count=count)
+            for tag_name, count in db_session.execute(
+                select(EntityTagTable.tag_name, facet_count)
+                .join(matches, matches.c.entity_id == EntityTagTable.entity_id)
+                .where(
+                    EntityTagTable.account_id == account_id,
+                    EntityTagTable.entity_type == entity_type,
+                    EntityTagTable.is_active == True,
+                )
+                .group_by(EntityTagTable.tag_name)
+                .order_by(facet_count.desc(), EntityTagTable.tag_name)
+                .limit(facet_limit)
+            ).all()
+        ]
+
+    return TagSearchResultModel(
+        entity_type=entity_type,
+        expression=expression,
+        entity_ids=[row.entity_id for row in rows],
+        total=total,
+        facets=facets,
+    )
+
+
 # ============================================================================
 # Bulk Operations
 # ============================================================================
 
 
+_BULK_TAG_BATCH_SIZE = 1000
+
+
+class BulkTagResultModel(BaseModel):
+    """Outcome of a bulk tagging call, as tag IDs.
+
+    Tags that already existed active with the same category and value are left
+    untouched and appear in no list.
+    """
+
+    created: List[str] = []
+    updated: List[str] = []
+    deactivated: List[str] = []
+
+
+def _validate_bulk_tags(
+    entities: Sequence[Tuple[str, str]],
+    tag_names: Sequence[str],
+    tag_category: str,
+    account_id: str,
+    created_by_user_id: str,
+    tag_values: Dict[str, str],
+) -> None:
+    """Run EntityTagModel validation once per distinct entity type and tag name."""
+    for entity_type, entity_id in dict(entities).items():
+        for tag_name in tag_names:
+            EntityTagModel(
+                entity_type=entity_type,
+                entity_id=entity_id,
+                tag_name=tag_name,
+                tag_category=tag_category,
+                tag_value=tag_values.get(tag_name),
+                account_id=account_id,
+                created_by_user_id=created_by_user_id,
+            )
+
+
+def _upsert_tags(
+    db_session: Session,
+    entities: Sequence[Tuple[str, str]],
+    tag_names: Sequence[str],
+    tag_category: str,
+    account_id: str,
+    created_by_user_id: str,
+    tag_values: Dict[str, str],
+    result: BulkTagResultModel,
+) -> None:
+    """Insert entity x tag rows with ON CONFLICT DO UPDATE, reactivating deleted tags.
+
+    Rows are recorded in result.created or result.updated using Postgres' xmax,
+    which is 0 only for freshly inserted tuples.
+    """
+    now = datetime.now(timezone.utc)
+    rows = [
+        {
+            "tag_id": str(uuid4()),
+            "entity_type": entity_type,
+            "entity_id": entity_id,
+            "tag_name": tag_name,
+            "tag_category": tag_category,
+            "tag_value": tag_values.get(tag_name),
+            "account_id": account_id,
+            "created_by_user_id": created_by_user_id,
+            "is_active": True,
+            "created_at": now,
+        }
+        for entity_type, entity_id in entities
+        for tag_name in tag_names
+    ]
+    table = EntityTagTable.__table__
+    for start in range(0, len(rows), _BULK_TAG_BATCH_SIZE):
+        stmt = pg_insert(table).values(rows[start : start + _BULK_TAG_BATCH_SIZE])
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_entitytag_entity_name_account",
+            set_={
+                "tag_category": stmt.excluded.tag_category,
+                "tag_value": stmt.excluded.tag_value,
+                "is_active": True,
+                "deactivated_at": None,
+                "deactivated_by_user_id": None,
+                "updated_at": now,
+            },
+            where=or_(
+                table.c.is_active == False,
+                table.c.tag_category != stmt.excluded.tag_category,
+                table.c.tag_value.is_distinct_from(stmt.excluded.tag_value),
+            ),
+        ).returning(table.c.tag_id, literal_column("xmax = 0").label("inserted"))
+        for tag_id, inserted in db_session.execute(stmt).tuples():
+            (result.created if inserted else result.updated).append(tag_id)
+
+
+def _deactivate_other_tags(
+    db_session: Session,
+    entities: Sequence[Tuple[str, str]],
+    keep_tag_names: Sequence[str],
+    tag_category: str,
+    account_id: str,
+    deactivated_by_user_id: str,
+    result: BulkTagResultModel,
+) -> None:
+    """Deactivate active tags in tag_category on the entities that are not kept."""
+    now = datetime.now(timezone.utc)
+    for start in range(0, len(entities), _BULK_TAG_BATCH_SIZE):
+        chunk = entities[start : start + _BULK_TAG_BATCH_SIZE]
+        stmt = (
+            update(EntityTagTable)
+            .where(
+                tuple_(EntityTagTable.entity_type, EntityTagTable.entity_id).in_(chunk),
+                EntityTagTable.account_id == account_id,
+                EntityTagTable.tag_category == tag_category,
+                EntityTagTable.is_active == True,
+            )
+            .values(
+                is_active=False,
+                deactivated_at=now,
+                deactivated_by_user_id=deactivated_by_user_id,
+                updated_at=now,
+            )
+            .returning(EntityTagTable.tag_id)
+        )
+        if keep_tag_names:
+            stmt = stmt.where(EntityTagTable.tag_name.not_in(keep_tag_names))
+        result.deactivated.extend(db_session.scalars(stmt))
+
+
+def bulk_tag_entities(
+    entities: Sequence[Tuple[str, str]],
+    tag_names: List[str],
+    tag_category: str,
+    account_id: str,
+    created_by_user_id: str,
+    engine: Engine,
+    tag_values: Optional[Dict[str, str]] = None,
+    replace: bool = False,
+) -> BulkTagResultModel:
+    """Apply the same tags to many entities in a single transaction.
+
+    Every entity x tag pair is written with multi-row INSERT ... ON CONFLICT DO
+    UPDATE on (entity_type, entity_id, tag_name, account_id), so soft-deleted
+    tags are reactivated instead of duplicated. With replace=True, the entities'
+    other active tags in tag_category are deactivated with one UPDATE.
+
+    Args:
+        entities: (entity_type, entity_id) pairs to tag
+        tag_names: Tag names to apply to every entity
+        tag_category: Category for all tags
+        account_id: Account ID
+        created_by_user_id: User creating (and, for replace, deactivating) tags
+        engine: Database engine
+        tag_values: Optional dict mapping tag_name -> tag_value
+        replace: Deactivate the entities' other tags in tag_category
+
+    Returns:
+        BulkTagResultModel with created, updated and deactivated tag IDs
+
+    Raises:
+        ValueError: If validation fails
+        SQLAlchemyError: If database operation fails
+    """
+    entities = list(dict.fromkeys((t, i) for t, i in entities))
+    tag_names = list(dict.fromkeys(tag_names))
+    tag_values = tag_values or {}
+    _validate_bulk_tags(
+        entities, tag_names, tag_category, account_id, created_by_user_id, tag_values
+    )
+
+    result = BulkTagResultModel()
+    with session(engine) as db_session:
+        if replace:
+            _deactivate_other_tags(
+                db_session,
+                entities,
+                tag_names,
+                tag_category,
+                account_id,
+                created_by_user_id,
+                result,
+            )
+        _upsert_tags(
+            db_session,
+            entities,
+            tag_names,
+            tag_category,
+            account_id,
+            created_by_user_id,
+            tag_values,
+            result,
+        )
+        db_session.commit()
+    return result
+
+
 def add_tags_to_entity(
     entity_type: str,
     entity_id: str,
@@ -648,6 +1138,8 @@ def add_tags_to_entity(
 ) -> List[str]:
     """Add multiple tags to an entity in a single transaction.
 
+    Previously deactivated tags with the same name are reactivated.
+
     Args:
         entity_type: Type of entity
         entity_id: Entity's primary key
@@ -656,37 +1148,25 @@ def add_tags_to_entity(
         account_id: Account ID
         created_by_user_id: User creating tags
         engine: Database engine
-        session: Active database session
         tag_values: Optional dict mapping tag_name -> tag_value
 
     Returns:
-        List of created tag_ids
+        List of created or reactivated tag_ids
 
     Raises:
         ValueError: If validation fails
         SQLAlchemyError: If database operation fails
     """
-    tag_ids = []
-    tag_values = tag_values or {}
-
-    with session(engine) as db_session:
-        for tag_name in tag_names:
-            tag_model = EntityTagModel(
-                entity_type=entity_type,
-                entity_id=entity_id,
-                tag_name=tag_name,
-                tag_category=tag_category,
-                tag_value=tag_values.get(tag_name),
-                account_id=account_id,
-                created_by_user_id=created_by_user_id,
-            )
-
-            new_tag = EntityTagTable(**tag_model.model_dump(exclude_unset=True))
-            db_session.add(new_tag)
-            tag_ids.append(new_tag.tag_id)
-
-        db_session.commit()
-        return tag_ids
+    result = bulk_tag_entities(
+        entities=[(entity_type, entity_id)],
+        tag_names=tag_names,
+        tag_category=tag_category,
+        account_id=account_id,
+        created_by_user_id=created_by_user_id,
+        engine=engine,
+        tag_values=tag_values,
+    )
+    return result.created + result.updated
 
 
 def replace_entity_tags(
@@ -700,7 +1180,9 @@ def replace_entity_tags(
     engine: Engine,
     tag_values: Optional[Dict[str, str]] = None,
 ) -> Dict[str, List[str]]:
-    """Replace all tags for an entity (deactivate old, add new).
+    """Replace all tags in a category for an entity (deactivate old, add new).
+
+    Tags present in both the old and new sets stay active and untouched.
 
     Args:
         entity_type: Type of entity
@@ -714,52 +1196,43 @@ def replace_entity_tags(
         tag_values: Optional dict mapping tag_name -> tag_value
 
     Returns:
-        Dict with 'deactivated' and 'created' tag_id lists
+        Dict with 'deactivated' and 'created' tag_id lists ('created' includes
+        reactivated tags)
 
     Raises:
         ValueError: If validation fails
         SQLAlchemyError: If database operation fails
     """
-    result = {"deactivated": [], "created": []}
+    entities = [(entity_type, entity_id)]
+    tag_names = list(dict.fromkeys(new_tag_names))
     tag_values = tag_values or {}
+    _validate_bulk_tags(
+        entities, tag_names, tag_category, account_id, created_by_user_id, tag_values
+    )
 
+    result = BulkTagResultModel()
     with session(engine) as db_session:
-        # Deactivate existing tags
-        existing_tags = (
-            db_session.query(EntityTagTable)
-            .filter(
-                and_(
-                    EntityTagTable.entity_type == entity_type,
-                    EntityTagTable.entity_id == entity_id,
-                    EntityTagTable.account_id == account_id,
-                    EntityTagTable.tag_category == tag_category,
-                    EntityTagTable.is_active == True,
-                )
-            )
-            .all()
+        _deactivate_other_tags(
+            db_session,
+            entities,
+            tag_names,
+            tag_category,
+            account_id,
+            deactivated_by_user_id,
+            result,
+        )
+        _upsert_tags(
+            db_session,
+            entities,
+            tag_names,
+            tag_category,
+            account_id,
+            created_by_user_id,
+            tag_values,
+            result,
         )
-
-        for tag in existing_tags:
-            tag.is_active = False
-            tag.deactivated_at = datetime.now(timezone.utc)
-            tag.deactivated_by_user_id = deactivated_by_user_id
-            result["deactivated"].append(tag.tag_id)
-
-        # Create new tags
-        for tag_name in new_tag_names:
-            tag_model = EntityTagModel(
-                entity_type=entity_type,
-                entity_id=entity_id,
-                tag_name=tag_name,
-                tag_category=tag_category,
-                tag_value=tag_values.get(tag_name),
-                account_id=account_id,
-                created_by_user_id=created_by_user_id,
-            )
-
-            new_tag = EntityTagTable(**tag_model.model_dump(exclude_unset=True))
-            db_session.add(new_tag)
-            result["created"].append(new_tag.tag_id)
-
         db_session.commit()
-        return result
+    return {
+        "deactivated": result.deactivated,
+        "created": result.created + result.updated,
+    }
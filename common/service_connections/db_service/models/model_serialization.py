@@ -0,0 +1,59 @@
+"""
+Shared conversion of database rows to Pydantic models for list reads.
+
+Model(**orm_obj.__dict__) builds an identity-mapped ORM object per row, copies
+its _sa_instance_state into the model constructor and re-runs every field
+validator (each calling should_validate_write) on data that was validated when
+it was written. For list reads this module instead:
+
+- select_model_columns() projects only the table columns the model declares, so
+  rows come back as plain Core rows with no ORM instances
+- construct_models() builds models from the row mappings with model_construct,
+  skipping validation for trusted database reads
+- validate_model() is the from_attributes path for ORM objects already loaded
+"""
+
+from typing import Dict, List, Tuple, Type, TypeVar
+
+from pydantic import BaseModel
+from sqlalchemy import Column, Select, select
+from sqlalchemy.engine import Result
+
+M = TypeVar("M", bound=BaseModel)
+
+# (model, table) -> columns of table that are fields of model
+_model_columns: Dict[Tuple[type, type], Tuple[Column, ...]] = {}
+
+
+def model_columns(model_cls: Type[BaseModel], table_cls: type) -> Tuple[Column, ...]:
+    """Columns of table_cls that model_cls declares as fields, in field order."""
+    key = (model_cls, table_cls)
+    columns = _model_columns.get(key)
+    if columns is None:
+        table_columns = table_cls.__table__.c
+        columns = _model_columns[key] = tuple(
+            table_columns[name]
+            for name in model_cls.model_fields
+            if name in table_columns
+        )
+    return columns
+
+
+def select_model_columns(model_cls: Type[BaseModel], table_cls: type) -> Select:
+    """SELECT of exactly the columns model_cls needs from table_cls."""
+    return select(*model_columns(model_cls, table_cls))
+
+
+def construct_models(model_cls: Type[M], result: Result) -> List[M]:
+    """Build models from a projected result without running validators.
+
+    Only use for rows read from the database, which were validated on write.
+    Fields not in the projection take their defaults.
+    """
+    construct = model_cls.model_construct
+    return [construct(**row) for row in result.mappings()]
+
+
+def validate_model(model_cls: Type[M], obj: object) -> M:
+    """Validate a model from an ORM object's attributes (no __dict__ copy)."""
+    return model_cls.model_validate(obj, from_attributes=True)
@@ -17,6 +17,7 @@ from common.service_connections.db_service.database.tables.in_app_notification i
 from common.service_connections.db_service.database.engine import (
     get_database_session as session,
 )
+from common.service_connections.db_service.models.row_count_model import count_rows
 
 
 class InAppNotificationModel(BaseModel):
@@ -44,6 +45,7 @@ class NotificationSummary(BaseModel):
     total: int
     unread: int
     notifications: list[InAppNotificationModel]
+    approximate: bool = False  # total/unread are planner estimates
 
 
 # CRUD Operations
@@ -142,6 +144,7 @@ def query_user_notifications(
     unread_only: bool = False,
     limit: int = 50,
     offset: int = 0,
+    approximate_counts: bool = False,
 ) -> NotificationSummary:
     """
     Query a user's notifications with pagination.
@@ -153,6 +156,7 @@ def query_user_notifications(
         unread_only: If True, only return unread notifications
         limit: Maximum number of notifications to return
         offset: Number of notifications to skip (for pagination)
+        approximate_counts: Estimate total and unread when they are large
 
     Returns:
         NotificationSummary: Summary with total, unread count, and notifications
@@ -166,14 +170,14 @@ def query_user_notifications(
         query = query.filter(InAppNotificationTable.is_read == False)
 
     # Get total count
-    total = query.count()
+    total = count_rows(db_session, query, approximate=approximate_counts)
 
     # Get unread count (separate query to avoid interference with filters)
     unread_query = db_session.query(InAppNotificationTable).filter(
         InAppNotificationTable.auth_user_id == auth_user_id,
         InAppNotificationTable.is_read == False,
     )
-    unread = unread_query.count()
+    unread = count_rows(db_session, unread_query, approximate=approximate_counts)
 
     # Get paginated results ordered by priority and creation date
     priority_order = {
@@ -198,9 +202,10 @@ def query_user_notifications(
     ]
 
     return NotificationSummary(
-        total=total,
-        unread=unread,
+        total=total.count,
+        unread=unread.count,
         notifications=notification_models,
+        approximate=total.approximate or unread.approximate,
     )
 
 
@@ -0,0 +1,413 @@
+"""
+Plan execution manifest: a plan expanded to suites and test cases in execution
+order, with tags and system under test, resolved in a single query.
+
+Runners previously called query_plan_with_suites, then query_suite_with_test_cases
+per suite, then fetched each test case. The manifest replaces that N+1 walk and
+is cached per plan under a version stamp derived from the updated_at/row counts
+of the plan, its associations, suites, test cases, their systems under test and
+tags, so an unchanged plan costs one cheap aggregate query.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from datetime import datetime
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from fastapi import HTTPException
+from pydantic import BaseModel
+from sqlalchemy import and_, func, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from common.service_connections.db_service.database.tables.entity_tag import (
+    EntityTagTable,
+)
+from common.service_connections.db_service.database.tables.plan import PlanTable
+from common.service_connections.db_service.database.tables.plan_suite_association import (
+    PlanSuiteAssociation,
+)
+from common.service_connections.db_service.database.tables.suite import SuiteTable
+from common.service_connections.db_service.database.tables.suite_test_case_association import (
+    SuiteTestCaseAssociation,
+)
+from common.service_connections.db_service.database.tables.system_under_test import (
+    SystemUnderTestTable,
+)
+from common.service_connections.db_service.database.tables.test_case import (
+    TestCaseTable,
+)
+
+if TYPE_CHECKING:
+    from app.models.auth_models import TokenPayload
+
+
+class ManifestTestCaseModel(BaseModel):
+    """A test case entry in a plan manifest."""
+
+    test_case_id: str
+    test_name: str
+    test_type: str
+    execution_order: int
+    sut_id: str
+    system_name: Optional[str] = None
+    tags: List[str] = []
+
+
+class ManifestSuiteModel(BaseModel):
+    """A suite entry in a plan manifest with its ordered test cases."""
+
+    suite_id: str
+    suite_name: str
+    execution_order: int
+    sut_id: str
+    system_name: Optional[str] = None
+    tags: List[str] = []
+    test_cases: List[ManifestTestCaseModel] = []
+
+
+class PlanManifestModel(BaseModel):
+    """Everything a runner needs to execute a plan, in execution order."""
+
+    plan_id: str
+    plan_name: str
+    account_id: Optional[str] = None
+    status: Optional[str] = None
+    version: str
+    test_case_count: int = 0
+    suites: List[ManifestSuiteModel] = []
+
+
+# ============================================================================
+# Manifest Queries
+# ============================================================================
+
+
+def _active_tags_subquery(entity_type: str):
+    """entity_id -> array of active tag names for one entity type."""
+    return (
+        select(
+            EntityTagTable.entity_id.label("entity_id"),
+            func.array_agg(EntityTagTable.tag_name).label("tags"),
+        )
+        .where(
+            EntityTagTable.entity_type == entity_type,
+            EntityTagTable.is_active == True,
+        )
+        .group_by(EntityTagTable.entity_id)
+        .subquery()
+    )
+
+
+def query_plan_manifest_version(
+    plan_id: str, db_session: Session, engine: Engine
+) -> Optional[str]:
+    """Compute the manifest version stamp for a plan in one aggregate query.
+
+    The stamp changes whenever the plan, a plan/suite or suite/test case
+    association, a suite, a test case, a referenced system under test or one of
+    their tags is inserted, updated, deactivated or hard deleted (row counts
+    catch deletes).
+
+    Args:
+        plan_id: Plan ID to stamp
+        db_session: Active database session
+        engine: Database engine
+
+    Returns:
+        Short hex version string, or None if the plan does not exist
+    """
+    plan_suite_ids = select(PlanSuiteAssociation.suite_id).where(
+        PlanSuiteAssociation.plan_id == plan_id
+    )
+    plan_test_case_ids = select(SuiteTestCaseAssociation.test_case_id).where(
+        SuiteTestCaseAssociation.suite_id.in_(plan_suite_ids)
+    )
+    plan_sut_ids = (
+        select(SuiteTable.sut_id)
+        .where(SuiteTable.suite_id.in_(plan_suite_ids))
+        .union(
+            select(TestCaseTable.sut_id).where(
+                TestCaseTable.test_case_id.in_(plan_test_case_ids)
+            )
+        )
+    )
+
+    def stamp(columns, *where):
+        return select(*columns).where(*where).scalar_subquery()
+
+    row = db_session.execute(
+        select(
+            PlanTable.updated_at,
+            PlanTable.is_active,
+            stamp(
+                [func.max(PlanSuiteAssociation.updated_at)],
+                PlanSuiteAssociation.plan_id == plan_id,
+            ),
+            stamp(
+                [func.count(PlanSuiteAssociation.association_id)],
+                PlanSuiteAssociation.plan_id == plan_id,
+            ),
+            stamp(
+                [func.max(SuiteTable.updated_at)],
+                SuiteTable.suite_id.in_(plan_suite_ids),
+            ),
+            stamp(
+                [func.max(SuiteTestCaseAssociation.updated_at)],
+                SuiteTestCaseAssociation.suite_id.in_(plan_suite_ids),
+            ),
+            stamp(
+                [func.count(SuiteTestCaseAssociation.association_id)],
+                SuiteTestCaseAssociation.suite_id.in_(plan_suite_ids),
+            ),
+            stamp(
+                [func.max(TestCaseTable.updated_at)],
+                TestCaseTable.test_case_id.in_(plan_test_case_ids),
+            ),
+            stamp(
+                [func.max(SystemUnderTestTable.updated_at)],
+                SystemUnderTestTable.sut_id.in_(plan_sut_ids),
+            ),
+            stamp(
+                [
+                    func.max(
+                        func.coalesce(
+                            EntityTagTable.updated_at, EntityTagTable.created_at
+                        )
+                    )
+                ],
+                EntityTagTable.entity_id.in_(plan_suite_ids.union(plan_test_case_ids)),
+            ),
+            stamp(
+                [func.count(EntityTagTable.tag_id)],
+                EntityTagTable.entity_id.in_(plan_suite_ids.union(plan_test_case_ids)),
+            ),
+        ).where(PlanTable.plan_id == plan_id)
+    ).first()
+    if row is None:
+        return None
+
+    raw = "|".join(
+        value.isoformat() if isinstance(value, datetime) else str(value)
+        for value in row
+    )
+    return hashlib.sha1(raw.encode()).hexdigest()[:16]
+
+
+def query_plan_manifest(
+    plan_id: str, db_session: Session, engine: Engine, version: Optional[str] = None
+) -> Optional[PlanManifestModel]:
+    """Expand a plan to suites and test cases in a single query.
+
+    Only active associations, suites and test cases are included. Suites are
+    ordered by the plan's execution_order, test cases by the suite's.
+
+    Args:
+        plan_id: Plan ID to expand
+        db_session: Active database session
+        engine: Database engine
+        version: Precomputed version stamp; computed when omitted
+
+    Returns:
+        PlanManifestModel, or None if the plan does not exist
+    """
+    suite_tags = _active_tags_subquery("suite")
+    test_case_tags = _active_tags_subquery("test_case")
+    suite_system = SystemUnderTestTable.__table__.alias("suite_system")
+    test_case_system = SystemUnderTestTable.__table__.alias("test_case_system")
+
+    rows = db_session.execute(
+        select(
+            PlanTable.plan_id,
+            PlanTable.plan_name,
+            PlanTable.account_id,
+            PlanTable.status,
+            SuiteTable.suite_id,
+            SuiteTable.suite_name,
+            SuiteTable.sut_id.label("suite_sut_id"),
+            suite_system.c.system_name.label("suite_system_name"),
+            suite_tags.c.tags.label("suite_tags"),
+            PlanSuiteAssociation.execution_order.label("suite_order"),
+            TestCaseTable.test_case_id,
+            TestCaseTable.test_name,
+            TestCaseTable.test_type,
+            TestCaseTable.sut_id.label("test_case_sut_id"),
+            test_case_system.c.system_name.label("test_case_system_name"),
+            test_case_tags.c.tags.label("test_case_tags"),
+            SuiteTestCaseAssociation.execution_order.label("test_case_order"),
+        )
+        .select_from(PlanTable)
+        .outerjoin(
+            PlanSuiteAssociation,
+            and_(
+                PlanSuiteAssociation.plan_id == PlanTable.plan_id,
+                PlanSuiteAssociation.is_active == True,
+            ),
+        )
+        .outerjoin(
+            SuiteTable,
+            and_(
+                SuiteTable.suite_id == PlanSuiteAssociation.suite_id,
+                SuiteTable.is_active == True,
+            ),
+        )
+        .outerjoin(suite_system, suite_system.c.sut_id == SuiteTable.sut_id)
+        .outerjoin(suite_tags, suite_tags.c.entity_id == SuiteTable.suite_id)
+        .outerjoin(
+            SuiteTestCaseAssociation,
+            and_(
+                SuiteTestCaseAssociation.suite_id == SuiteTable.suite_id,
+                SuiteTestCaseAssociation.is_active == True,
+            ),
+        )
+        .outerjoin(
+            TestCaseTable,
+            and_(
+                TestCaseTable.test_case_id == SuiteTestCaseAssociation.test_case_id,
+                TestCaseTable.is_active == True,
+            ),
+        )
+        .outerjoin(
+            test_case_system, test_case_system.c.sut_id == TestCaseTable.sut_id
+        )
+        .outerjoin(
+            test_case_tags, test_case_tags.c.entity_id == TestCaseTable.test_case_id
+        )
+        .where(PlanTable.plan_id == plan_id)
+        .order_by(
+            PlanSuiteAssociation.execution_order,
+            SuiteTable.suite_id,
+            SuiteTestCaseAssociation.execution_order,
+            TestCaseTable.test_case_id,
+        )
+    ).all()
+    if not rows:
+        return None
+
+    first = rows[0]
+    suites: Dict[str, ManifestSuiteModel] = {}
+    for row in rows:
+        if row.suite_id is None:
+            continue
+        suite = suites.get(row.suite_id)
+        if suite is None:
+            suite = suites[row.suite_id] = ManifestSuiteModel(
+                suite_id=row.suite_id,
+                suite_name=row.suite_name,
+                execution_order=row.suite_order,
+                sut_id=row.suite_sut_id,
+                system_name=row.suite_system_name,
+                tags=sorted(row.suite_tags or []),
+            )
+        if row.test_case_id is not None:
+            suite.test_cases.append(
+                ManifestTestCaseModel(
+                    test_case_id=row.test_case_id,
+                    test_name=row.test_name,
+                    test_type=row.test_type,
+                    execution_order=row.test_case_order,
+                    sut_id=row.test_case_sut_id,
+                    system_name=row.test_case_system_name,
+                    tags=sorted(row.test_case_tags or []),
+                )
+            )
+
+    return PlanManifestModel(
+        plan_id=first.plan_id,
+        plan_name=first.plan_name,
+        account_id=first.account_id,
+        status=first.status,
+        version=version or query_plan_manifest_version(plan_id, db_session, engine),
+        test_case_count=sum(len(suite.test_cases) for suite in suites.values()),
+        suites=list(suites.values()),
+    )
+
+
+# ============================================================================
+# Manifest Cache
+# ============================================================================
+
+
+class PlanManifestCache:
+    """
+    Cache of plan manifests keyed by plan_id and validated by version stamp.
+
+    Every lookup runs query_plan_manifest_version (one aggregate query); the full
+    manifest query only runs when the stamp changed.
+    """
+
+    # plan_id -> (version, manifest)
+    _cache: Dict[str, Tuple[str, PlanManifestModel]] = {}
+    _lock = threading.Lock()
+    hits = 0
+    misses = 0
+
+    @classmethod
+    def get(
+        cls, plan_id: str, db_session: Session, engine: Engine
+    ) -> Optional[PlanManifestModel]:
+        """Return the current manifest for a plan, rebuilding it only when stale."""
+        version = query_plan_manifest_version(plan_id, db_session, engine)
+        if version is None:
+            cls.invalidate(plan_id)
+            return None
+
+        with cls._lock:
+            cached = cls._cache.get(plan_id)
+        if cached is not None and cached[0] == version:
+            cls.hits += 1
+            return cached[1]
+
+        cls.misses += 1
+        manifest = query_plan_manifest(plan_id, db_session, engine, version=version)
+        if manifest is not None:
+            with cls._lock:
+                cls._cache[plan_id] = (version, manifest)
+        return manifest
+
+    @classmethod
+    def invalidate(cls, plan_id: Optional[str] = None) -> None:
+        """Drop one plan's manifest, or every manifest when plan_id is None."""
+        with cls._lock:
+            if plan_id is None:
+                cls._cache.clear()
+            else:
+                cls._cache.pop(plan_id, None)
+
+
+def get_plan_manifest(
+    plan_id: str, token: TokenPayload, db_session: Session, engine: Engine
+) -> Optional[PlanManifestModel]:
+    """Get a plan's execution manifest through the version-stamped cache.
+
+    The plan's account is checked before the cache is consulted, so a cached
+    manifest is never handed to a caller from another account.
+
+    Args:
+        plan_id: Plan ID to resolve
+        token: JWT token payload for authorization
+        db_session: Active database session
+        engine: Database engine
+
+    Returns:
+        PlanManifestModel, or None if the plan does not exist
+
+    Raises:
+        HTTPException: 403 if user attempts to access another account's plan
+    """
+    plan = db_session.execute(
+        select(PlanTable.account_id).where(PlanTable.plan_id == plan_id)
+    ).first()
+    if plan is None:
+        return None
+
+    # Validate account access (defense-in-depth)
+    if not token.is_super_admin and token.account_id != plan.account_id:
+        raise HTTPException(
+            status_code=403,
+            detail="Access denied: Cannot query plans for a different account",
+        )
+
+    return PlanManifestCache.get(plan_id, db_session, engine)
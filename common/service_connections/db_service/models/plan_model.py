@@ -25,6 +25,10 @@ from common.service_connections.db_service.database.engine import (
     get_database_session as session,
 )
 from common.service_connections.db_service.database.tables.plan import PlanTable
+from common.service_connections.db_service.models.catalog_cache import (
+    PLAN,
+    CatalogCache,
+)
 from common.service_connections.db_service.models.plan_suite_helpers import (
     add_suite_to_plan,
 )
@@ -165,12 +169,12 @@ def insert_plan(model: PlanModel, engine: Engine, migrate_suites: bool = True) -
                 f"to PlanSuiteAssociation for plan_id={plan_id}"
             )
 
-            for i, suite_id in enumerate(model._migrated_suite_ids):
+            for suite_id in model._migrated_suite_ids:
                 try:
+                    # Appended in order with gap-spaced execution_order keys
                     add_suite_to_plan(
                         plan_id=plan_id,
                         suite_id=suite_id,
-                        execution_order=i,
                         engine=engine,
                     )
                 except ValueError as e:
@@ -182,7 +186,8 @@ def insert_plan(model: PlanModel, engine: Engine, migrate_suites: bool = True) -
             new_plan.suites_ids = ""
             db_session.commit()
 
-        return plan_id
+    CatalogCache.invalidate(PLAN, plan_dict.get("account_id"))
+    return plan_id
 
 
 def query_plan_by_id(
@@ -247,10 +252,12 @@ def update_plan(plan_id: str, updates: PlanModel, engine: Engine) -> bool:
         if not plan:
             return False
 
+        previous_account_id = plan.account_id
         for key, value in update_dict.items():
             setattr(plan, key, value)
 
         db_session.commit()
+        CatalogCache.invalidate(PLAN, previous_account_id, plan.account_id)
         return True
 
 
@@ -271,8 +278,10 @@ def drop_plan(plan_id: str, engine: Engine, db_session: Session) -> bool:
         if not plan:
             return False
 
+        account_id = plan.account_id
         db_session.delete(plan)
         db_session.commit()
+        CatalogCache.invalidate(PLAN, account_id)
         return True
 
 
@@ -299,6 +308,7 @@ def deactivate_plan(plan_id: str, deactivated_by_user_id: str, engine: Engine) -
         plan.updated_at = datetime.now(timezone.utc)
 
         db_session.commit()
+        CatalogCache.invalidate(PLAN, plan.account_id)
         return True
 
 
@@ -324,6 +334,7 @@ def reactivate_plan(plan_id: str, engine: Engine) -> bool:
         plan.updated_at = datetime.now(timezone.utc)
 
         db_session.commit()
+        CatalogCache.invalidate(PLAN, plan.account_id)
         return True
 
 
@@ -361,14 +372,20 @@ def query_plans_by_account(
             detail="Access denied: Cannot query plans for a different account",
         )
 
-    with session(engine) as db_session:
-        query = db_session.query(PlanTable).filter(PlanTable.account_id == account_id)
+    def load() -> List[PlanModel]:
+        with session(engine) as db_session:
+            query = db_session.query(PlanTable).filter(
+                PlanTable.account_id == account_id
+            )
 
-        if active_only:
-            query = query.filter(PlanTable.is_active == True)
+            if active_only:
+                query = query.filter(PlanTable.is_active == True)
 
-        plans = query.all()
-        return [PlanModel(**plan.__dict__) for plan in plans]
+            plans = query.all()
+            return [PlanModel(**plan.__dict__) for plan in plans]
+
+    query_key = "active" if active_only else "all"
+    return CatalogCache.get_or_load(PLAN, account_id, query_key, PlanModel, load)
 
 
 def query_plans_by_owner(
@@ -448,4 +465,5 @@ def update_plan_status(plan_id: str, new_status: str, engine: Engine) -> bool:
         plan.updated_at = datetime.now(timezone.utc)
 
         db_session.commit()
+        CatalogCache.invalidate(PLAN, plan.account_id)
         return True
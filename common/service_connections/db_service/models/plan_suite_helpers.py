@@ -17,6 +17,17 @@ from common.config import should_validate_write
 from common.service_connections.db_service.database.engine import (
     get_database_session as session,
 )
+from common.service_connections.db_service.models.association_ops import (
+    ORDER_GAP,
+    AssociationSpec,
+    move_association,
+    order_key_for_position,
+    rebalance_crowded_associations,
+    reorder_associations,
+    replace_associations,
+    upsert_associations,
+    verify_ids_exist,
+)
 from common.service_connections.db_service.database.tables.plan import PlanTable
 from common.service_connections.db_service.database.tables.plan_suite_association import (
     PlanSuiteAssociation,
@@ -56,6 +67,14 @@ class PlanWithSuitesModel(BaseModel):
     suites: List[Dict] = []  # List of suite dicts with execution_order
 
 
+_PLAN_SUITES = AssociationSpec(
+    table=PlanSuiteAssociation.__table__,
+    parent_column="plan_id",
+    child_column="suite_id",
+    child_label="Suite",
+)
+
+
 # ============================================================================
 # Association Management
 # ============================================================================
@@ -64,8 +83,10 @@ class PlanWithSuitesModel(BaseModel):
 def add_suite_to_plan(
     plan_id: str,
     suite_id: str,
-    execution_order: int,
     engine: Engine,
+    *,
+    execution_order: Optional[int] = None,
+    position: Optional[int] = None,
     is_enabled: bool = True,
 ) -> str:
     """Add a suite to a plan with specified execution order.
@@ -73,22 +94,29 @@ def add_suite_to_plan(
     Args:
         plan_id: Plan to add suite to
         suite_id: Suite to add
-        execution_order: Order for execution (0-indexed)
         engine: Database engine
+        execution_order: Raw ordering key stored as given (keys are gap-spaced,
+            not 0-based positions)
+        position: 0-based position among the plan's active suites;
+            use this to insert at a position. With neither, the suite is appended.
         is_enabled: Whether association is active
 
     Returns:
         association_id of created record
 
     Raises:
-        ValueError: If validation fails or entities don't exist
+        ValueError: If validation fails, entities don't exist, or both
+            execution_order and position are given
         SQLAlchemyError: If database operation fails
     """
+    if execution_order is not None and position is not None:
+        raise ValueError("Pass either execution_order or position, not both")
+
     # Validate model
     model = PlanSuiteAssociationModel(
         plan_id=plan_id,
         suite_id=suite_id,
-        execution_order=execution_order,
+        execution_order=execution_order or 0,
         is_active=is_enabled,
     )
 
@@ -103,13 +131,31 @@ def add_suite_to_plan(
         if not suite:
             raise ValueError(f"Suite not found: {suite_id}")
 
-        # Create association
-        assoc_dict = model.model_dump(exclude_unset=True)
-        new_assoc = PlanSuiteAssociation(**assoc_dict)
-        db_session.add(new_assoc)
+        if execution_order is None:
+            model.execution_order = order_key_for_position(
+                db_session, _PLAN_SUITES, plan_id, position, exclude_child=suite_id
+            )
+
+        # Create association, or reactivate/reorder an existing one
+        written = upsert_associations(
+            db_session,
+            _PLAN_SUITES,
+            plan_id,
+            [(suite_id, model.execution_order)],
+            is_active=model.is_active,
+        )
         db_session.commit()
 
-        return new_assoc.association_id
+        if suite_id in written:
+            return written[suite_id]
+        return (
+            db_session.query(PlanSuiteAssociation.association_id)
+            .filter(
+                PlanSuiteAssociation.plan_id == plan_id,
+                PlanSuiteAssociation.suite_id == suite_id,
+            )
+            .scalar()
+        )
 
 
 def remove_suite_from_plan(
@@ -167,42 +213,20 @@ def reorder_plan_suites(
         ordered_suite_ids: List of suite IDs in desired execution order
         engine: Database engine
 
+    Only associations whose position changes are written, in a single
+    UPDATE ... FROM (VALUES ...) per batch.
+
     Returns:
         Number of associations updated
 
     Raises:
-        ValueError: If suite IDs don't match existing associations
+        ValueError: If suite IDs don't match existing associations or repeat
         SQLAlchemyError: If database operation fails
     """
     with session(engine) as db_session:
-        # Get all active associations for plan
-        assocs = (
-            db_session.query(PlanSuiteAssociation)
-            .filter(
-                and_(
-                    PlanSuiteAssociation.plan_id == plan_id,
-                    PlanSuiteAssociation.is_active == True,
-                )
-            )
-            .all()
+        update_count = reorder_associations(
+            db_session, _PLAN_SUITES, plan_id, ordered_suite_ids
         )
-
-        # Build lookup map
-        assoc_map = {assoc.suite_id: assoc for assoc in assocs}
-
-        # Validate all provided IDs exist
-        missing_ids = set(ordered_suite_ids) - set(assoc_map.keys())
-        if missing_ids:
-            raise ValueError(f"Suite IDs not found in plan associations: {missing_ids}")
-
-        # Update execution order
-        update_count = 0
-        for new_order, suite_id in enumerate(ordered_suite_ids):
-            assoc = assoc_map[suite_id]
-            if assoc.execution_order != new_order:
-                assoc.execution_order = new_order
-                update_count += 1
-
         db_session.commit()
         return update_count
 
@@ -252,6 +276,44 @@ def update_suite_execution_order(
         return True
 
 
+def move_suite_in_plan(
+    plan_id: str, suite_id: str, position: int, engine: Engine
+) -> bool:
+    """Move a suite to a new position, rewriting only its own execution_order.
+
+    Args:
+        plan_id: Plan containing the suite
+        suite_id: Suite to move
+        position: 0-based target position among the other active suites
+        engine: Database engine
+
+    Returns:
+        True if moved, False if the suite has no active association
+    """
+    with session(engine) as db_session:
+        moved = move_association(db_session, _PLAN_SUITES, plan_id, suite_id, position)
+        db_session.commit()
+        return moved
+
+
+def rebalance_plan_suite_orders(engine: Engine) -> Dict[str, int]:
+    """Renumber the suites of every plan whose execution_order keys are crowded.
+
+    Run periodically (python manage_db.py rebalance-orders) so inserts and moves
+    rarely have to rebalance inline.
+
+    Args:
+        engine: Database engine
+
+    Returns:
+        Mapping of plan_id to number of associations renumbered
+    """
+    with session(engine) as db_session:
+        rebalanced = rebalance_crowded_associations(db_session, _PLAN_SUITES)
+        db_session.commit()
+        return rebalanced
+
+
 # ============================================================================
 # Query Helpers
 # ============================================================================
@@ -407,49 +469,49 @@ def bulk_add_suites_to_plan(
     plan_id: str,
     suite_ids: List[str],
     engine: Engine,
-    starting_order: int = 0,
+    starting_order: Optional[int] = None,
 ) -> List[str]:
     """Add multiple suites to a plan in a single transaction.
 
+    Uses one multi-row INSERT ... ON CONFLICT per batch; suites already in the
+    plan are reactivated and moved to their new position.
+
     Args:
         plan_id: Plan to add suites to
         suite_ids: List of suite IDs to add
         engine: Database engine
-        starting_order: Starting execution_order value (increments for each suite)
+        starting_order: execution_order of the first suite, later ones are spaced
+            ORDER_GAP apart; None appends after the current last suite
 
     Returns:
-        List of created association_ids
+        List of created or updated association_ids
 
     Raises:
-        ValueError: If plan doesn't exist or any suite doesn't exist
+        ValueError: If plan doesn't exist, any suite doesn't exist or repeats
         SQLAlchemyError: If database operation fails
     """
-    assoc_ids = []
-
     with session(engine) as db_session:
         # Verify plan exists
         plan = db_session.get(PlanTable, plan_id)
         if not plan:
             raise ValueError(f"Plan not found: {plan_id}")
 
-        # Verify all suites exist
-        for suite_id in suite_ids:
-            suite = db_session.get(SuiteTable, suite_id)
-            if not suite:
-                raise ValueError(f"Suite not found: {suite_id}")
+        verify_ids_exist(db_session, SuiteTable.suite_id, suite_ids, "Suite")
 
-        # Create associations
-        for i, suite_id in enumerate(suite_ids):
-            model = PlanSuiteAssociationModel(
-                plan_id=plan_id, suite_id=suite_id, execution_order=starting_order + i
-            )
-
-            new_assoc = PlanSuiteAssociation(**model.model_dump(exclude_unset=True))
-            db_session.add(new_assoc)
-            assoc_ids.append(new_assoc.association_id)
+        if starting_order is None:
+            starting_order = order_key_for_position(db_session, _PLAN_SUITES, plan_id)
 
+        written = upsert_associations(
+            db_session,
+            _PLAN_SUITES,
+            plan_id,
+            [
+                (suite_id, starting_order + i * ORDER_GAP)
+                for i, suite_id in enumerate(suite_ids)
+            ],
+        )
         db_session.commit()
-        return assoc_ids
+        return [written[suite_id] for suite_id in suite_ids if suite_id in written]
 
 
 def replace_plan_suites(
@@ -460,6 +522,9 @@ def replace_plan_suites(
 ) -> Dict[str, List[str]]:
     """Replace all suites in a plan.
 
+    Diffs against the current associations: only removed, added and moved
+    suites are written.
+
     Args:
         plan_id: Plan to update
         new_suite_ids: New list of suite IDs (in execution order)
@@ -467,53 +532,22 @@ def replace_plan_suites(
         soft_delete_old: If True, soft delete old associations; if False, hard delete
 
     Returns:
-        Dict with 'removed' and 'added' association_id lists
+        Dict with 'removed', 'added' and 'reordered' association_id lists
 
     Raises:
-        ValueError: If plan doesn't exist or any suite doesn't exist
+        ValueError: If plan doesn't exist, any suite doesn't exist or repeats
         SQLAlchemyError: If database operation fails
     """
-    result = {"removed": [], "added": []}
-
     with session(engine) as db_session:
         # Verify plan exists
         plan = db_session.get(PlanTable, plan_id)
         if not plan:
             raise ValueError(f"Plan not found: {plan_id}")
 
-        # Remove old associations
-        old_assocs = (
-            db_session.query(PlanSuiteAssociation)
-            .filter(
-                and_(
-                    PlanSuiteAssociation.plan_id == plan_id,
-                    PlanSuiteAssociation.is_active == True,
-                )
-            )
-            .all()
-        )
-
-        for assoc in old_assocs:
-            if soft_delete_old:
-                assoc.is_active = False
-            else:
-                db_session.delete(assoc)
-            result["removed"].append(assoc.association_id)
-
-        # Add new associations
-        for i, suite_id in enumerate(new_suite_ids):
-            # Verify suite exists
-            suite = db_session.get(SuiteTable, suite_id)
-            if not suite:
-                raise ValueError(f"Suite not found: {suite_id}")
-
-            model = PlanSuiteAssociationModel(
-                plan_id=plan_id, suite_id=suite_id, execution_order=i
-            )
-
-            new_assoc = PlanSuiteAssociation(**model.model_dump(exclude_unset=True))
-            db_session.add(new_assoc)
-            result["added"].append(new_assoc.association_id)
+        verify_ids_exist(db_session, SuiteTable.suite_id, new_suite_ids, "Suite")
 
+        result = replace_associations(
+            db_session, _PLAN_SUITES, plan_id, new_suite_ids, soft_delete_old
+        )
         db_session.commit()
         return result
@@ -0,0 +1,92 @@
+"""
+Cheap version stamps for conditional GETs of catalog resources.
+
+A resource's version is the number of rows it covers, the latest
+coalesce(updated_at, created_at) among them and the sum of their xmin. All three
+come from a single aggregate query, so a client revalidating with If-None-Match
+is answered without loading or serializing any rows.
+
+updated_at is stamped in Python at flush time, not at commit, so a transaction
+that flushes early and commits late can leave the count and latest timestamp
+unchanged. xmin is the ID of the transaction that wrote the row version, so any
+committed insert or update changes the sum whatever order transactions commit
+in. updated_at is kept for Last-Modified.
+
+Versions of resources that embed rows from several tables (a page and its
+identifiers) are combined with combine_resource_versions().
+"""
+
+import hashlib
+from datetime import datetime, timezone
+from typing import Optional
+
+from pydantic import BaseModel
+from sqlalchemy import BigInteger, Text, cast, func, literal_column, select
+from sqlalchemy.orm import Session
+
+
+class ResourceVersionModel(BaseModel):
+    """
+    Version stamp of one resource (a list or a single row).
+
+    Fields:
+    - etag: str - Opaque validator for the ETag header (unquoted)
+    - last_modified: datetime | None - Latest row change, UTC; None when empty
+    - row_count: int - Rows covered by the resource
+    """
+
+    etag: str
+    last_modified: Optional[datetime] = None
+    row_count: int = 0
+
+
+def _make_etag(*parts: object) -> str:
+    digest = hashlib.sha1("|".join(str(part) for part in parts).encode())
+    return digest.hexdigest()[:16]
+
+
+def query_resource_version(
+    db_session: Session, table_cls: type, *criteria
+) -> ResourceVersionModel:
+    """
+    Version stamp of the rows of table_cls matching criteria.
+
+    Args:
+        db_session: Active database session
+        table_cls: Table with created_at and updated_at columns (PostgreSQL)
+        *criteria: WHERE clauses selecting the resource's rows
+
+    Returns:
+        ResourceVersionModel for the matching rows
+    """
+    # xid has no integer cast; go through text
+    xmin = literal_column(f'"{table_cls.__tablename__}".xmin')
+    stmt = select(
+        func.count(),
+        func.max(func.coalesce(table_cls.updated_at, table_cls.created_at)),
+        func.sum(cast(cast(xmin, Text), BigInteger)),
+    ).select_from(table_cls)
+    if criteria:
+        stmt = stmt.where(*criteria)
+    row_count, last_modified, xmin_sum = db_session.execute(stmt).one()
+
+    if last_modified is not None:
+        if last_modified.tzinfo is None:
+            last_modified = last_modified.replace(tzinfo=timezone.utc)
+        last_modified = last_modified.astimezone(timezone.utc)
+    stamp = last_modified.isoformat() if last_modified else ""
+    return ResourceVersionModel(
+        etag=_make_etag(table_cls.__tablename__, row_count, stamp, xmin_sum or 0),
+        last_modified=last_modified,
+        row_count=row_count,
+    )
+
+
+def combine_resource_versions(*versions: ResourceVersionModel) -> ResourceVersionModel:
+    """Version of a resource built from the rows behind all of versions."""
+    modified = [v.last_modified for v in versions if v.last_modified is not None]
+    return ResourceVersionModel(
+        etag=_make_etag(*(v.etag for v in versions)),
+        last_modified=max(modified) if modified else None,
+        row_count=sum(v.row_count for v in versions),
+    )
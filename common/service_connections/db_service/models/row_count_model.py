@@ -0,0 +1,104 @@
+"""
+Row counts that fall back to planner estimates on large tables.
+
+An exact count(*) has to visit every matching row, which on a large table costs
+more than fetching the page it is paging over. count_rows() asks the planner
+first: an unfiltered single-table query is estimated from pg_class.reltuples,
+anything else from the top row estimate of EXPLAIN. Below the threshold the
+estimate is thrown away and an exact count is run; above it the estimate is
+returned with approximate=True so responses can say so.
+
+Estimates are only as fresh as the last ANALYZE (autovacuum keeps them close).
+Counting is exact unless a caller passes approximate=True, so each endpoint
+opts in separately.
+"""
+
+import json
+from typing import Optional, Union
+
+from pydantic import BaseModel
+from sqlalchemy import Select, Table, func, select, text
+from sqlalchemy.orm import Query, Session
+
+# Estimates below this are replaced by an exact count
+EXACT_COUNT_THRESHOLD = 10_000
+
+
+class RowCountModel(BaseModel):
+    """
+    Number of rows matched by a query.
+
+    Fields:
+    - count: int - Exact count, or the planner's estimate when approximate
+    - approximate: bool - True when count is an estimate
+    """
+
+    count: int
+    approximate: bool = False
+
+
+def _as_select(query: Union[Query, Select]) -> Select:
+    return query.statement if isinstance(query, Query) else query
+
+
+def estimate_table_rows(db_session: Session, table: Table) -> Optional[int]:
+    """Row estimate of a whole table from pg_class, or None if never analyzed."""
+    reltuples = db_session.execute(
+        text("SELECT reltuples FROM pg_class WHERE oid = to_regclass(:name)"),
+        {"name": f'"{table.schema or "public"}"."{table.name}"'},
+    ).scalar()
+    # -1 (PostgreSQL 14+) or 0 (older) until the first VACUUM/ANALYZE
+    if reltuples is None or reltuples <= 0:
+        return None
+    return int(reltuples)
+
+
+def estimate_query_rows(db_session: Session, query: Union[Query, Select]) -> int:
+    """Planner row estimate for query from EXPLAIN, without executing it."""
+    connection = db_session.connection()
+    compiled = _as_select(query).compile(
+        dialect=connection.dialect, compile_kwargs={"render_postcompile": True}
+    )
+    plan = connection.exec_driver_sql(
+        f"EXPLAIN (FORMAT JSON) {compiled}", compiled.params
+    ).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def _estimate_rows(db_session: Session, stmt: Select) -> Optional[int]:
+    froms = stmt.get_final_froms()
+    if stmt.whereclause is None and len(froms) == 1 and isinstance(froms[0], Table):
+        return estimate_table_rows(db_session, froms[0])
+    return estimate_query_rows(db_session, stmt)
+
+
+def count_rows(
+    db_session: Session,
+    query: Union[Query, Select],
+    approximate: bool = False,
+    threshold: int = EXACT_COUNT_THRESHOLD,
+) -> RowCountModel:
+    """
+    Count the rows query matches, estimating on large results if allowed.
+
+    Args:
+        db_session: Active database session
+        query: ORM Query or Select to count (ordering is ignored)
+        approximate: Return the planner estimate when it reaches threshold
+        threshold: Smallest estimate that is returned instead of counted
+
+    Returns:
+        RowCountModel with the count and whether it is an estimate
+    """
+    stmt = _as_select(query).order_by(None)
+    if approximate:
+        estimate = _estimate_rows(db_session, stmt)
+        if estimate is not None and estimate >= threshold:
+            return RowCountModel(count=estimate, approximate=True)
+
+    count = db_session.execute(
+        select(func.count()).select_from(stmt.subquery())
+    ).scalar_one()
+    return RowCountModel(count=count)
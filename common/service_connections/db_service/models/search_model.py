@@ -0,0 +1,218 @@
+"""
+Ranked full-text search across the test catalog.
+
+Test cases, suites, plans and action chains each carry a generated
+search_vector column (name weighted A, description weighted B) backed by a GIN
+index. search_catalog() matches the query against those vectors with
+websearch_to_tsquery, so quoted phrases, "or" and -exclusions work as users
+expect, and unions the per-entity matches into one ranked, paginated list.
+
+Words that are only partially typed do not match a tsquery, so names are also
+matched with ILIKE and pg_trgm word similarity (backed by the *_name_trgm
+indexes). When pg_trgm is not installed the search falls back to full-text and
+ILIKE matching.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple
+
+from fastapi import HTTPException
+from pydantic import BaseModel
+from sqlalchemy import Select, String, func, literal, null, or_, select, union_all
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from common.service_connections.db_service.database.tables.action_chain import (
+    ActionChainTable,
+)
+from common.service_connections.db_service.database.tables.plan import PlanTable
+from common.service_connections.db_service.database.tables.suite import SuiteTable
+from common.service_connections.db_service.database.tables.test_case import (
+    TestCaseTable,
+)
+
+if TYPE_CHECKING:
+    from app.models.auth_models import TokenPayload
+
+logger = logging.getLogger(__name__)
+
+# entity_type -> (table, id column, name column, description column or None)
+SEARCHABLE_ENTITIES: Dict[str, Tuple] = {
+    "test_case": (
+        TestCaseTable,
+        TestCaseTable.test_case_id,
+        TestCaseTable.test_name,
+        TestCaseTable.description,
+    ),
+    "suite": (
+        SuiteTable,
+        SuiteTable.suite_id,
+        SuiteTable.suite_name,
+        SuiteTable.description,
+    ),
+    "plan": (PlanTable, PlanTable.plan_id, PlanTable.plan_name, None),
+    "action_chain": (
+        ActionChainTable,
+        ActionChainTable.action_chain_id,
+        ActionChainTable.chain_name,
+        ActionChainTable.description,
+    ),
+}
+
+
+class SearchResultModel(BaseModel):
+    """A catalog entity matching a search query."""
+
+    entity_type: str
+    entity_id: str
+    name: str
+    description: Optional[str] = None
+    rank: float
+
+
+class SearchResultsModel(BaseModel):
+    """One page of search results, best match first."""
+
+    query: str
+    items: List[SearchResultModel]
+    total: int
+    page: int
+    page_size: int
+    total_pages: int
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _entity_matches(
+    entity_type: str, query: str, account_id: str, fuzzy: bool
+) -> Select:
+    """Active rows of one entity type matching query, with their rank."""
+    table_cls, id_column, name_column, description_column = SEARCHABLE_ENTITIES[
+        entity_type
+    ]
+    tsquery = func.websearch_to_tsquery("english", query)
+    rank = func.ts_rank_cd(table_cls.search_vector, tsquery)
+    conditions = [
+        table_cls.search_vector.op("@@")(tsquery),
+        name_column.ilike(f"%{_escape_like(query)}%", escape="\\"),
+    ]
+    if fuzzy:
+        rank = rank + func.word_similarity(query, name_column)
+        conditions.append(literal(query).op("<%")(name_column))
+
+    description = (
+        description_column if description_column is not None else null().cast(String)
+    )
+    return select(
+        literal(entity_type).label("entity_type"),
+        id_column.label("entity_id"),
+        name_column.label("name"),
+        description.label("description"),
+        rank.label("rank"),
+    ).where(
+        table_cls.account_id == account_id,
+        table_cls.is_active == True,
+        or_(*conditions),
+    )
+
+
+def _search_page(
+    query: str,
+    account_id: str,
+    entity_types: Sequence[str],
+    page: int,
+    page_size: int,
+    fuzzy: bool,
+    db_session: Session,
+) -> Tuple[int, List[SearchResultModel]]:
+    matches = union_all(
+        *(
+            _entity_matches(entity_type, query, account_id, fuzzy)
+            for entity_type in entity_types
+        )
+    ).subquery()
+    total = db_session.execute(select(func.count()).select_from(matches)).scalar_one()
+    rows = db_session.execute(
+        select(matches)
+        .order_by(matches.c.rank.desc(), matches.c.name)
+        .offset((page - 1) * page_size)
+        .limit(page_size)
+    ).mappings()
+    return total, [SearchResultModel(**row) for row in rows]
+
+
+def search_catalog(
+    query: str,
+    account_id: str,
+    token: TokenPayload,
+    db_session: Session,
+    engine: Engine,
+    entity_types: Optional[List[str]] = None,
+    page: int = 1,
+    page_size: int = 20,
+) -> SearchResultsModel:
+    """Search active test cases, suites, plans and action chains of an account.
+
+    Results from all requested entity types are ranked together by full-text
+    rank (name matches outweigh description matches) plus name similarity.
+
+    Args:
+        query: Search text (websearch syntax: "phrases", or, -exclusions)
+        account_id: Account ID for multi-tenant filtering
+        token: JWT token payload for authorization
+        db_session: Active database session
+        engine: Database engine
+        entity_types: Entity types to search (default: all searchable types)
+        page: 1-based page number
+        page_size: Results per page
+
+    Returns:
+        SearchResultsModel with one page of results and the total match count
+
+    Raises:
+        HTTPException: 403 if user attempts to access another account's data
+        ValueError: If query is blank or an entity type is not searchable
+    """
+    # Validate account access (defense-in-depth)
+    if not token.is_super_admin and token.account_id != account_id:
+        raise HTTPException(
+            status_code=403,
+            detail="Access denied: Cannot search a different account",
+        )
+
+    query = query.strip()
+    if not query:
+        raise ValueError("Search query cannot be empty")
+    entity_types = list(entity_types or SEARCHABLE_ENTITIES)
+    unknown = sorted(set(entity_types) - set(SEARCHABLE_ENTITIES))
+    if unknown:
+        raise ValueError(
+            f"Cannot search entity types: {', '.join(unknown)}. "
+            f"Must be one of: {', '.join(SEARCHABLE_ENTITIES)}"
+        )
+
+    try:
+        total, items = _search_page(
+            query, account_id, entity_types, page, page_size, True, db_session
+        )
+    except SQLAlchemyError as e:
+        # pg_trgm not installed: match on full text and ILIKE only
+        logger.warning(f"Fuzzy catalog search unavailable: {e}")
+        db_session.rollback()
+        total, items = _search_page(
+            query, account_id, entity_types, page, page_size, False, db_session
+        )
+
+    return SearchResultsModel(
+        query=query,
+        items=items,
+        total=total,
+        page=page,
+        page_size=page_size,
+        total_pages=(total + page_size - 1) // page_size,
+    )
@@ -20,6 +20,10 @@ from common.service_connections.db_service.database import SuiteTable
 from common.service_connections.db_service.database.engine import (
     get_database_session as session,
 )
+from common.service_connections.db_service.models.catalog_cache import (
+    SUITE,
+    CatalogCache,
+)
 from common.config import should_validate_write
 
 if TYPE_CHECKING:
@@ -92,6 +96,7 @@ def insert_suite(suite: SuiteModel, engine: Engine) -> str:
         db_session.refresh(db_suite)
         suite_id = db_suite.suite_id
 
+    CatalogCache.invalidate(SUITE, suite.account_id)
     return suite_id
 
 
@@ -120,6 +125,7 @@ def update_suite_by_id(
         if not db_suite:
             raise ValueError(f"Suite ID {suite_id} not found.")
 
+        previous_account_id = db_suite.account_id
         suite.updated_at = datetime.now(timezone.utc)
         suite_data = suite.model_dump(exclude_unset=True)
 
@@ -129,6 +135,7 @@ def update_suite_by_id(
         db_session.commit()
         db_session.refresh(db_suite)
 
+    CatalogCache.invalidate(SUITE, previous_account_id, db_suite.account_id)
     return SuiteModel(**db_suite.__dict__)
 
 
@@ -138,9 +145,11 @@ def drop_suite_by_id(suite_id: str, session: Session, engine: Engine) -> int:
         db_suite = db_session.get(SuiteTable, suite_id)
         if not db_suite:
             raise ValueError(f"Suite ID {suite_id} not found.")
+        account_id = db_suite.account_id
         db_session.delete(db_suite)
         db_session.commit()
         logging.info(f"Suite ID {suite_id} deleted.")
+    CatalogCache.invalidate(SUITE, account_id)
     return 1
 
 
@@ -171,13 +180,16 @@ def query_suites_by_account(
             detail="Access denied: Cannot query suites for a different account",
         )
 
-    suites = (
-        session.query(SuiteTable)
-        .filter(SuiteTable.account_id == account_id)
-        .filter(SuiteTable.is_active == True)
-        .all()
-    )
-    return [SuiteModel(**suite.__dict__) for suite in suites]
+    def load() -> List[SuiteModel]:
+        suites = (
+            session.query(SuiteTable)
+            .filter(SuiteTable.account_id == account_id)
+            .filter(SuiteTable.is_active == True)
+            .all()
+        )
+        return [SuiteModel(**suite.__dict__) for suite in suites]
+
+    return CatalogCache.get_or_load(SUITE, account_id, "active", SuiteModel, load)
 
 
 def query_suites_by_owner(
@@ -224,6 +236,7 @@ def deactivate_suite_by_id(
         db_session.commit()
         db_session.refresh(db_suite)
 
+    CatalogCache.invalidate(SUITE, db_suite.account_id)
     return SuiteModel(**db_suite.__dict__)
 
 
@@ -242,4 +255,5 @@ def reactivate_suite_by_id(suite_id: str, session: Session, engine: Engine) -> S
         db_session.commit()
         db_session.refresh(db_suite)
 
+    CatalogCache.invalidate(SUITE, db_suite.account_id)
     return SuiteModel(**db_suite.__dict__)
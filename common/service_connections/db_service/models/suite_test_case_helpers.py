@@ -17,6 +17,17 @@ from common.config import should_validate_write
 from common.service_connections.db_service.database.engine import (
     get_database_session as session,
 )
+from common.service_connections.db_service.models.association_ops import (
+    ORDER_GAP,
+    AssociationSpec,
+    move_association,
+    order_key_for_position,
+    rebalance_crowded_associations,
+    reorder_associations,
+    replace_associations,
+    upsert_associations,
+    verify_ids_exist,
+)
 
 from common.service_connections.db_service.database.tables.suite import SuiteTable
 from common.service_connections.db_service.database.tables.suite_test_case_association import (
@@ -59,6 +70,14 @@ class SuiteWithTestCasesModel(BaseModel):
     test_cases: List[Dict] = []  # List of test case dicts with execution_order
 
 
+_SUITE_TEST_CASES = AssociationSpec(
+    table=SuiteTestCaseAssociation.__table__,
+    parent_column="suite_id",
+    child_column="test_case_id",
+    child_label="Test case",
+)
+
+
 # ============================================================================
 # Association Management
 # ============================================================================
@@ -67,8 +86,10 @@ class SuiteWithTestCasesModel(BaseModel):
 def add_test_case_to_suite(
     suite_id: str,
     test_case_id: str,
-    execution_order: int,
     engine: Engine,
+    *,
+    execution_order: Optional[int] = None,
+    position: Optional[int] = None,
     is_enabled: bool = True,
 ) -> str:
     """Add a test case to a suite with specified execution order.
@@ -76,22 +97,29 @@ def add_test_case_to_suite(
     Args:
         suite_id: Suite to add test case to
         test_case_id: Test case to add
-        execution_order: Order for execution (0-indexed)
         engine: Database engine
+        execution_order: Raw ordering key stored as given (keys are gap-spaced,
+            not 0-based positions)
+        position: 0-based position among the suite's active test cases;
+            use this to insert at a position. With neither, the test case is appended.
         is_enabled: Whether association is active
 
     Returns:
         association_id of created record
 
     Raises:
-        ValueError: If validation fails or entities don't exist
+        ValueError: If validation fails, entities don't exist, or both
+            execution_order and position are given
         SQLAlchemyError: If database operation fails
     """
+    if execution_order is not None and position is not None:
+        raise ValueError("Pass either execution_order or position, not both")
+
     # Validate model
     model = SuiteTestCaseAssociationModel(
         suite_id=suite_id,
         test_case_id=test_case_id,
-        execution_order=execution_order,
+        execution_order=execution_order or 0,
         is_active=is_enabled,
     )
 
@@ -106,13 +134,31 @@ def add_test_case_to_suite(
         if not test_case:
             raise ValueError(f"Test case not found: {test_case_id}")
 
-        # Create association
-        assoc_dict = model.model_dump(exclude_unset=True)
-        new_assoc = SuiteTestCaseAssociation(**assoc_dict)
-        db_session.add(new_assoc)
+        if execution_order is None:
+            model.execution_order = order_key_for_position(
+                db_session, _SUITE_TEST_CASES, suite_id, position, exclude_child=test_case_id
+            )
+
+        # Create association, or reactivate/reorder an existing one
+        written = upsert_associations(
+            db_session,
+            _SUITE_TEST_CASES,
+            suite_id,
+            [(test_case_id, model.execution_order)],
+            is_active=model.is_active,
+        )
         db_session.commit()
 
-        return new_assoc.association_id
+        if test_case_id in written:
+            return written[test_case_id]
+        return (
+            db_session.query(SuiteTestCaseAssociation.association_id)
+            .filter(
+                SuiteTestCaseAssociation.suite_id == suite_id,
+                SuiteTestCaseAssociation.test_case_id == test_case_id,
+            )
+            .scalar()
+        )
 
 
 def remove_test_case_from_suite(
@@ -172,44 +218,20 @@ def reorder_suite_test_cases(
         engine: Database engine
         session: Active database session
 
+    Only associations whose position changes are written, in a single
+    UPDATE ... FROM (VALUES ...) per batch.
+
     Returns:
         Number of associations updated
 
     Raises:
-        ValueError: If test case IDs don't match existing associations
+        ValueError: If test case IDs don't match existing associations or repeat
         SQLAlchemyError: If database operation fails
     """
     with session(engine) as db_session:
-        # Get all active associations for suite
-        assocs = (
-            db_session.query(SuiteTestCaseAssociation)
-            .filter(
-                and_(
-                    SuiteTestCaseAssociation.suite_id == suite_id,
-                    SuiteTestCaseAssociation.is_active == True,
-                )
-            )
-            .all()
+        update_count = reorder_associations(
+            db_session, _SUITE_TEST_CASES, suite_id, ordered_test_case_ids
         )
-
-        # Build lookup map
-        assoc_map = {assoc.test_case_id: assoc for assoc in assocs}
-
-        # Validate all provided IDs exist
-        missing_ids = set(ordered_test_case_ids) - set(assoc_map.keys())
-        if missing_ids:
-            raise ValueError(
-                f"Test case IDs not found in suite associations: {missing_ids}"
-            )
-
-        # Update execution order
-        update_count = 0
-        for new_order, test_case_id in enumerate(ordered_test_case_ids):
-            assoc = assoc_map[test_case_id]
-            if assoc.execution_order != new_order:
-                assoc.execution_order = new_order
-                update_count += 1
-
         db_session.commit()
         return update_count
 
@@ -260,6 +282,44 @@ def update_test_case_execution_order(
         return True
 
 
+def move_test_case_in_suite(
+    suite_id: str, test_case_id: str, position: int, engine: Engine
+) -> bool:
+    """Move a test case to a new position, rewriting only its own execution_order.
+
+    Args:
+        suite_id: Suite containing the test case
+        test_case_id: Test case to move
+        position: 0-based target position among the other active test cases
+        engine: Database engine
+
+    Returns:
+        True if moved, False if the test case has no active association
+    """
+    with session(engine) as db_session:
+        moved = move_association(db_session, _SUITE_TEST_CASES, suite_id, test_case_id, position)
+        db_session.commit()
+        return moved
+
+
+def rebalance_suite_test_case_orders(engine: Engine) -> Dict[str, int]:
+    """Renumber the test cases of every suite whose execution_order keys are crowded.
+
+    Run periodically (python manage_db.py rebalance-orders) so inserts and moves
+    rarely have to rebalance inline.
+
+    Args:
+        engine: Database engine
+
+    Returns:
+        Mapping of suite_id to number of associations renumbered
+    """
+    with session(engine) as db_session:
+        rebalanced = rebalance_crowded_associations(db_session, _SUITE_TEST_CASES)
+        db_session.commit()
+        return rebalanced
+
+
 # ============================================================================
 # Query Helpers
 # ============================================================================
@@ -420,52 +480,58 @@ def bulk_add_test_cases_to_suite(
     suite_id: str,
     test_case_ids: List[str],
     engine: Engine,
-    starting_order: int = 0,
+    starting_order: Optional[int] = None,
 ) -> List[str]:
     """Add multiple test cases to a suite in a single transaction.
 
+    Uses one multi-row INSERT ... ON CONFLICT per batch; test cases already in
+    the suite are reactivated and moved to their new position.
+
     Args:
         suite_id: Suite to add test cases to
         test_case_ids: List of test case IDs to add
         engine: Database engine
         session: Active database session
-        starting_order: Starting execution_order value (increments for each test case)
+        starting_order: execution_order of the first test case, later ones are spaced
+            ORDER_GAP apart; None appends after the current last test case
 
     Returns:
-        List of created association_ids
+        List of created or updated association_ids
 
     Raises:
-        ValueError: If suite doesn't exist or any test case doesn't exist
+        ValueError: If suite doesn't exist, any test case doesn't exist or repeats
         SQLAlchemyError: If database operation fails
     """
-    assoc_ids = []
-
     with session(engine) as db_session:
         # Verify suite exists
         suite = db_session.get(SuiteTable, suite_id)
         if not suite:
             raise ValueError(f"Suite not found: {suite_id}")
 
-        # Verify all test cases exist
-        for test_case_id in test_case_ids:
-            test_case = db_session.get(TestCaseTable, test_case_id)
-            if not test_case:
-                raise ValueError(f"Test case not found: {test_case_id}")
-
-        # Create associations
-        for i, test_case_id in enumerate(test_case_ids):
-            model = SuiteTestCaseAssociationModel(
-                suite_id=suite_id,
-                test_case_id=test_case_id,
-                execution_order=starting_order + i,
-            )
+        verify_ids_exist(
+            db_session, TestCaseTable.test_case_id, test_case_ids, "Test case"
+        )
 
-            new_assoc = SuiteTestCaseAssociation(**model.model_dump(exclude_unset=True))
-            db_session.add(new_assoc)
-            assoc_ids.append(new_assoc.association_id)
+        if starting_order is None:
+            starting_order = order_key_for_position(
+                db_session, _SUITE_TEST_CASES, suite_id
+            )
 
+        written = upsert_associations(
+            db_session,
+            _SUITE_TEST_CASES,
+            suite_id,
+            [
+                (test_case_id, starting_order + i * ORDER_GAP)
+                for i, test_case_id in enumerate(test_case_ids)
+            ],
+        )
         db_session.commit()
-        return assoc_ids
+        return [
+            written[test_case_id]
+            for test_case_id in test_case_ids
+            if test_case_id in written
+        ]
 
 
 def replace_suite_test_cases(
@@ -476,6 +542,9 @@ def replace_suite_test_cases(
 ) -> Dict[str, List[str]]:
     """Replace all test cases in a suite.
 
+    Diffs against the current associations: only removed, added and moved
+    test cases are written.
+
     Args:
         suite_id: Suite to update
         new_test_case_ids: New list of test case IDs (in execution order)
@@ -484,53 +553,24 @@ def replace_suite_test_cases(
         soft_delete_old: If True, soft delete old associations; if False, hard delete
 
     Returns:
-        Dict with 'removed' and 'added' association_id lists
+        Dict with 'removed', 'added' and 'reordered' association_id lists
 
     Raises:
-        ValueError: If suite doesn't exist or any test case doesn't exist
+        ValueError: If suite doesn't exist, any test case doesn't exist or repeats
         SQLAlchemyError: If database operation fails
     """
-    result = {"removed": [], "added": []}
-
     with session(engine) as db_session:
         # Verify suite exists
         suite = db_session.get(SuiteTable, suite_id)
         if not suite:
             raise ValueError(f"Suite not found: {suite_id}")
 
-        # Remove old associations
-        old_assocs = (
-            db_session.query(SuiteTestCaseAssociation)
-            .filter(
-                and_(
-                    SuiteTestCaseAssociation.suite_id == suite_id,
-                    SuiteTestCaseAssociation.is_active == True,
-                )
-            )
-            .all()
+        verify_ids_exist(
+            db_session, TestCaseTable.test_case_id, new_test_case_ids, "Test case"
         )
 
-        for assoc in old_assocs:
-            if soft_delete_old:
-                assoc.is_active = False
-            else:
-                db_session.delete(assoc)
-            result["removed"].append(assoc.association_id)
-
-        # Add new associations
-        for i, test_case_id in enumerate(new_test_case_ids):
-            # Verify test case exists
-            test_case = db_session.get(TestCaseTable, test_case_id)
-            if not test_case:
-                raise ValueError(f"Test case not found: {test_case_id}")
-
-            model = SuiteTestCaseAssociationModel(
-                suite_id=suite_id, test_case_id=test_case_id, execution_order=i
-            )
-
-            new_assoc = SuiteTestCaseAssociation(**model.model_dump(exclude_unset=True))
-            db_session.add(new_assoc)
-            result["added"].append(new_assoc.association_id)
-
+        result = replace_associations(
+            db_session, _SUITE_TEST_CASES, suite_id, new_test_case_ids, soft_delete_old
+        )
         db_session.commit()
         return result
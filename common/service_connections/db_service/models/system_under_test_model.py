@@ -20,6 +20,10 @@ from common.service_connections.db_service.database import SystemUnderTestTable
 from common.service_connections.db_service.database.engine import (
     get_database_session as session,
 )
+from common.service_connections.db_service.models.catalog_cache import (
+    SYSTEM_UNDER_TEST,
+    CatalogCache,
+)
 from common.config import should_validate_write
 
 if TYPE_CHECKING:
@@ -94,6 +98,7 @@ def insert_system_under_test(
         db_session.commit()
         db_session.refresh(db_sut)
 
+    CatalogCache.invalidate(SYSTEM_UNDER_TEST, db_sut.account_id)
     return db_sut.sut_id
 
 
@@ -137,6 +142,7 @@ def update_system_under_test_by_id(
         if not db_sut:
             raise ValueError(f"System Under Test ID {sut_id} not found.")
 
+        previous_account_id = db_sut.account_id
         system_under_test.updated_at = datetime.now(timezone.utc)
         sut_data = system_under_test.model_dump(exclude_unset=True)
 
@@ -146,6 +152,7 @@ def update_system_under_test_by_id(
         db_session.commit()
         db_session.refresh(db_sut)
 
+    CatalogCache.invalidate(SYSTEM_UNDER_TEST, previous_account_id, db_sut.account_id)
     return True
 
 
@@ -154,9 +161,11 @@ def drop_system_under_test_by_id(sut_id: str, session: Session, engine: Engine)
     db_sut = session.get(SystemUnderTestTable, sut_id)
     if not db_sut:
         raise ValueError(f"System Under Test ID {sut_id} not found.")
+    account_id = db_sut.account_id
     session.delete(db_sut)
     session.commit()
     logging.info(f"System Under Test ID {sut_id} deleted.")
+    CatalogCache.invalidate(SYSTEM_UNDER_TEST, account_id)
     return 1
 
 
@@ -187,13 +196,18 @@ def query_systems_under_test_by_account(
             detail="Access denied: Cannot query systems for a different account",
         )
 
-    systems = (
-        session.query(SystemUnderTestTable)
-        .filter(SystemUnderTestTable.account_id == account_id)
-        .filter(SystemUnderTestTable.is_active == True)
-        .all()
+    def load() -> List[SystemUnderTestModel]:
+        systems = (
+            session.query(SystemUnderTestTable)
+            .filter(SystemUnderTestTable.account_id == account_id)
+            .filter(SystemUnderTestTable.is_active == True)
+            .all()
+        )
+        return [SystemUnderTestModel(**sut.__dict__) for sut in systems]
+
+    return CatalogCache.get_or_load(
+        SYSTEM_UNDER_TEST, account_id, "active", SystemUnderTestModel, load
     )
-    return [SystemUnderTestModel(**sut.__dict__) for sut in systems]
 
 
 def query_systems_under_test_by_owner(
@@ -213,14 +227,24 @@ def query_systems_under_test_by_account_and_owner(
     account_id: str, owner_user_id: str, session: Session, engine: Engine
 ) -> List[SystemUnderTestModel]:
     """Query active systems under test by account and owner (combined filter)."""
-    systems = (
-        session.query(SystemUnderTestTable)
-        .filter(SystemUnderTestTable.account_id == account_id)
-        .filter(SystemUnderTestTable.owner_user_id == owner_user_id)
-        .filter(SystemUnderTestTable.is_active == True)
-        .all()
+
+    def load() -> List[SystemUnderTestModel]:
+        systems = (
+            session.query(SystemUnderTestTable)
+            .filter(SystemUnderTestTable.account_id == account_id)
+            .filter(SystemUnderTestTable.owner_user_id == owner_user_id)
+            .filter(SystemUnderTestTable.is_active == True)
+            .all()
+        )
+        return [SystemUnderTestModel(**sut.__dict__) for sut in systems]
+
+    return CatalogCache.get_or_load(
+        SYSTEM_UNDER_TEST,
+        account_id,
+        f"owner:{owner_user_id}",
+        SystemUnderTestModel,
+        load,
     )
-    return [SystemUnderTestModel(**sut.__dict__) for sut in systems]
 
 
 def deactivate_system_under_test_by_id(
@@ -243,6 +267,7 @@ def deactivate_system_under_test_by_id(
         db_session.commit()
         db_session.refresh(db_sut)
 
+    CatalogCache.invalidate(SYSTEM_UNDER_TEST, db_sut.account_id)
     return True
 
 
@@ -265,4 +290,5 @@ def reactivate_system_under_test_by_id(sut_id: str, engine: Engine) -> bool:
         db_session.commit()
         db_session.refresh(db_sut)
 
+    CatalogCache.invalidate(SYSTEM_UNDER_TEST, db_sut.account_id)
     return True
@@ -0,0 +1,297 @@
+"""
+Tag name autocomplete served from a per-account in-memory index.
+
+query_unique_tag_names runs SELECT DISTINCT and sorts in Python, which is too
+slow to call on every keystroke. TagAutocompleteIndex keeps, per account, the
+active tag names sorted by casefolded name together with their usage counts
+(number of active tag rows). A prefix lookup is a bisect into that list and
+results are memoized per (prefix, limit) until the index changes.
+
+The index is refreshed incrementally: at most every _REFRESH_SECONDS a lookup
+runs one aggregate over the account's entity_tag rows, and only tag names whose
+rows were created or updated since the last refresh are recounted. A shrinking
+row count (hard deletes) or an index older than _REBUILD_SECONDS triggers a
+full rebuild.
+
+When the prefix matches fewer than the requested number of names, a pg_trgm
+word-similarity query (backed by idx_entitytag_tag_name_trgm) fills the rest
+with fuzzy matches.
+"""
+
+from __future__ import annotations
+
+import heapq
+import logging
+import threading
+import time
+from bisect import bisect_left, insort
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from fastapi import HTTPException
+from pydantic import BaseModel
+from sqlalchemy import func, literal, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from common.service_connections.db_service.database.tables.entity_tag import (
+    EntityTagTable,
+)
+
+if TYPE_CHECKING:
+    from app.models.auth_models import TokenPayload
+
+logger = logging.getLogger(__name__)
+
+# How often a lookup checks the database for tag changes
+_REFRESH_SECONDS = 2.0
+# Full rebuild interval, which also picks up hard deletes hidden by inserts
+_REBUILD_SECONDS = 300.0
+# Re-scan window for rows committed late with an earlier timestamp
+_COMMIT_SKEW = timedelta(seconds=5)
+# Fuzzy matching needs a few characters to produce useful trigrams
+_FUZZY_MIN_LENGTH = 3
+
+
+class TagSuggestionModel(BaseModel):
+    """A suggested tag name and how many active tags use it."""
+
+    tag_name: str
+    usage_count: int
+    fuzzy: bool = False
+
+
+class TagAutocompleteResultModel(BaseModel):
+    """Tag name suggestions for a prefix, most used first."""
+
+    prefix: str
+    suggestions: List[TagSuggestionModel] = []
+
+
+class _AccountTagIndex:
+    """Sorted tag names and usage counts for one account."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.counts: Dict[str, int] = {}
+        # (casefolded name, name), sorted
+        self.keys: List[Tuple[str, str]] = []
+        self.memo: Dict[Tuple[str, int], List[Tuple[str, int]]] = {}
+        self.stamp: Optional[datetime] = None
+        self.row_count = 0
+        self.checked_at = 0.0
+        self.built_at = 0.0
+
+    def replace_all(self, counts: Dict[str, int]) -> None:
+        self.counts = dict(counts)
+        self.keys = sorted((name.casefold(), name) for name in self.counts)
+        self.memo.clear()
+
+    def update_counts(self, counts: Dict[str, int]) -> None:
+        """Apply absolute counts for some names; a count of 0 removes the name."""
+        for name, count in counts.items():
+            key = (name.casefold(), name)
+            if count > 0 and name not in self.counts:
+                insort(self.keys, key)
+            elif count <= 0 and name in self.counts:
+                del self.keys[bisect_left(self.keys, key)]
+            if count > 0:
+                self.counts[name] = count
+            else:
+                self.counts.pop(name, None)
+        if counts:
+            self.memo.clear()
+
+    def suggest(self, prefix: str, limit: int) -> List[Tuple[str, int]]:
+        folded = prefix.casefold()
+        cached = self.memo.get((folded, limit))
+        if cached is not None:
+            return cached
+
+        start = bisect_left(self.keys, (folded,))
+        end = bisect_left(self.keys, (folded + "\U0010ffff",))
+        best = heapq.nsmallest(
+            limit,
+            self.keys[start:end],
+            key=lambda key: (-self.counts[key[1]], key[0]),
+        )
+        result = [(name, self.counts[name]) for _, name in best]
+        self.memo[(folded, limit)] = result
+        return result
+
+
+class TagAutocompleteIndex:
+    """
+    Process-wide registry of per-account tag name indexes.
+
+    Indexes are built lazily on the first lookup for an account and refreshed
+    incrementally from entity_tag timestamps on later lookups.
+    """
+
+    _indexes: Dict[str, _AccountTagIndex] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def suggest(
+        cls, account_id: str, prefix: str, db_session: Session, limit: int = 10
+    ) -> List[Tuple[str, int]]:
+        """Return up to limit (tag_name, usage_count) pairs starting with prefix."""
+        with cls._lock:
+            index = cls._indexes.setdefault(account_id, _AccountTagIndex())
+        with index.lock:
+            cls._refresh(account_id, index, db_session)
+            return index.suggest(prefix, limit)
+
+    @classmethod
+    def invalidate(cls, account_id: Optional[str] = None) -> None:
+        """Drop one account's index, or every index when account_id is None."""
+        with cls._lock:
+            if account_id is None:
+                cls._indexes.clear()
+            else:
+                cls._indexes.pop(account_id, None)
+
+    @staticmethod
+    def _active_counts(db_session: Session, account_id: str, *where) -> Dict[str, int]:
+        result = db_session.execute(
+            select(EntityTagTable.tag_name, func.count())
+            .where(
+                EntityTagTable.account_id == account_id,
+                EntityTagTable.is_active == True,
+                *where,
+            )
+            .group_by(EntityTagTable.tag_name)
+        )
+        return {name: count for name, count in result}
+
+    @classmethod
+    def _refresh(
+        cls, account_id: str, index: _AccountTagIndex, db_session: Session
+    ) -> None:
+        now = time.monotonic()
+        if index.built_at and now - index.checked_at < _REFRESH_SECONDS:
+            return
+
+        changed_at = func.coalesce(EntityTagTable.updated_at, EntityTagTable.created_at)
+        row_count, stamp = db_session.execute(
+            select(func.count(), func.max(changed_at)).where(
+                EntityTagTable.account_id == account_id
+            )
+        ).one()
+
+        if (
+            not index.built_at
+            or not index.row_count
+            or row_count < index.row_count
+            or now - index.built_at > _REBUILD_SECONDS
+        ):
+            index.replace_all(cls._active_counts(db_session, account_id))
+            index.built_at = now
+        elif stamp != index.stamp or row_count != index.row_count:
+            touched = set(
+                db_session.scalars(
+                    select(EntityTagTable.tag_name)
+                    .where(
+                        EntityTagTable.account_id == account_id,
+                        changed_at >= index.stamp - _COMMIT_SKEW,
+                    )
+                    .distinct()
+                )
+            )
+            if touched:
+                counts = cls._active_counts(
+                    db_session, account_id, EntityTagTable.tag_name.in_(touched)
+                )
+                index.update_counts({name: counts.get(name, 0) for name in touched})
+
+        index.stamp = stamp
+        index.row_count = row_count
+        index.checked_at = now
+
+
+def _fuzzy_tag_names(
+    prefix: str,
+    account_id: str,
+    exclude: List[str],
+    limit: int,
+    db_session: Session,
+) -> List[Tuple[str, int]]:
+    """Trigram word-similarity matches for prefix, best match first."""
+    similarity = func.word_similarity(prefix, EntityTagTable.tag_name)
+    try:
+        return list(
+            db_session.execute(
+                select(EntityTagTable.tag_name, func.count())
+                .where(
+                    EntityTagTable.account_id == account_id,
+                    EntityTagTable.is_active == True,
+                    literal(prefix).op("<%")(EntityTagTable.tag_name),
+                    EntityTagTable.tag_name.not_in(exclude),
+                )
+                .group_by(EntityTagTable.tag_name)
+                .order_by(func.max(similarity).desc(), func.count().desc())
+                .limit(limit)
+            ).tuples()
+        )
+    except SQLAlchemyError as e:
+        # pg_trgm not installed: serve prefix matches only
+        logger.warning(f"Fuzzy tag autocomplete unavailable: {e}")
+        db_session.rollback()
+        return []
+
+
+def suggest_tag_names(
+    prefix: str,
+    account_id: str,
+    token: TokenPayload,
+    db_session: Session,
+    engine: Engine,
+    limit: int = 10,
+    fuzzy: bool = True,
+) -> TagAutocompleteResultModel:
+    """Suggest active tag names for an account, ranked by usage.
+
+    Prefix matches (case-insensitive) come from TagAutocompleteIndex. If there
+    are fewer than limit of them and fuzzy is set, trigram matches are appended.
+
+    Args:
+        prefix: Text typed so far
+        account_id: Account ID for multi-tenant filtering
+        token: JWT token payload for authorization
+        db_session: Active database session
+        engine: Database engine
+        limit: Maximum suggestions to return
+        fuzzy: Fill remaining slots with trigram matches
+
+    Returns:
+        TagAutocompleteResultModel with suggestions, prefix matches first
+
+    Raises:
+        HTTPException: 403 if user attempts to access another account's data
+    """
+    # Validate account access (defense-in-depth)
+    if not token.is_super_admin and token.account_id != account_id:
+        raise HTTPException(
+            status_code=403,
+            detail="Access denied: Cannot query tags for a different account",
+        )
+
+    suggestions = [
+        TagSuggestionModel(tag_name=name, usage_count=count)
+        for name, count in TagAutocompleteIndex.suggest(
+            account_id, prefix, db_session, limit
+        )
+    ]
+    if fuzzy and len(suggestions) < limit and len(prefix) >= _FUZZY_MIN_LENGTH:
+        suggestions.extend(
+            TagSuggestionModel(tag_name=name, usage_count=count, fuzzy=True)
+            for name, count in _fuzzy_tag_names(
+                prefix,
+                account_id,
+                [s.tag_name for s in suggestions],
+                limit - len(suggestions),
+                db_session,
+            )
+        )
+    return TagAutocompleteResultModel(prefix=prefix, suggestions=suggestions)
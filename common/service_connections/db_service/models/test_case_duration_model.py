@@ -0,0 +1,154 @@
+"""
+Historical test case durations used for duration-aware test sharding.
+
+Each run of a test case records one sample; estimates are the median of the most
+recent samples so a single slow run or a fixed regression does not dominate.
+"""
+
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+from pydantic import BaseModel
+from sqlalchemy import Engine, func, insert
+from sqlalchemy.orm import Session
+
+from common.service_connections.db_service.database.engine import (
+    get_database_session as session,
+)
+from common.service_connections.db_service.database.tables.suite_test_case_association import (
+    SuiteTestCaseAssociation,
+)
+from common.service_connections.db_service.database.tables.test_case_duration import (
+    TestCaseDurationTable,
+)
+
+
+class TestCaseDurationModel(BaseModel):
+    """
+    TestCaseDurationModel represents one recorded test case run.
+    Fields match TestCaseDurationTable database schema.
+
+    Fields:
+    - duration_id (int): The unique identifier for the sample.
+    - test_case_id (str): The test case that ran.
+    - duration_seconds (float): Wall-clock duration of setup, call and teardown.
+    - outcome (str): passed, failed or skipped.
+    - worker (str | None): pytest-xdist worker or grid node that ran the test.
+    - recorded_at (datetime): When the sample was recorded.
+    """
+
+    duration_id: Optional[int] = None
+    test_case_id: str
+    duration_seconds: float
+    outcome: str = "passed"
+    worker: Optional[str] = None
+    recorded_at: Optional[datetime] = None
+
+
+################ Test Case Duration Queries ################
+
+
+def insert_test_case_durations(
+    durations: List[TestCaseDurationModel], engine: Engine
+) -> int:
+    """Insert duration samples in one statement and return how many were written."""
+    if not durations:
+        return 0
+    now = datetime.now(timezone.utc)
+    rows = [
+        {
+            **duration.model_dump(exclude={"duration_id"}),
+            "recorded_at": duration.recorded_at or now,
+        }
+        for duration in durations
+    ]
+    with session(engine) as db_session:
+        db_session.execute(insert(TestCaseDurationTable), rows)
+        db_session.commit()
+    return len(rows)
+
+
+def query_test_case_duration_estimates(
+    test_case_ids: List[str],
+    session: Session,
+    engine: Engine,
+    sample_window: int = 10,
+    include_skipped: bool = False,
+) -> Dict[str, float]:
+    """
+    Estimate each test case's duration as the median of its latest samples.
+
+    Args:
+        test_case_ids: Test cases to estimate
+        session: Active database session
+        engine: Database engine
+        sample_window: Number of most recent samples per test case to consider
+        include_skipped: Whether skipped runs count towards the estimate
+
+    Returns:
+        Mapping of test_case_id to estimated seconds. Test cases without samples
+        are absent.
+    """
+    if not test_case_ids:
+        return {}
+
+    recent = session.query(
+        TestCaseDurationTable.test_case_id,
+        TestCaseDurationTable.duration_seconds,
+        func.row_number()
+        .over(
+            partition_by=TestCaseDurationTable.test_case_id,
+            order_by=TestCaseDurationTable.recorded_at.desc(),
+        )
+        .label("recency"),
+    ).filter(TestCaseDurationTable.test_case_id.in_(test_case_ids))
+    if not include_skipped:
+        recent = recent.filter(TestCaseDurationTable.outcome != "skipped")
+    recent = recent.subquery()
+
+    rows = (
+        session.query(
+            recent.c.test_case_id,
+            func.percentile_cont(0.5).within_group(recent.c.duration_seconds),
+        )
+        .filter(recent.c.recency <= sample_window)
+        .group_by(recent.c.test_case_id)
+        .all()
+    )
+    return {test_case_id: float(estimate) for test_case_id, estimate in rows}
+
+
+def query_test_case_suite_orders(
+    test_case_ids: List[str], session: Session, engine: Engine
+) -> List[Tuple[str, str, int]]:
+    """
+    Query the active suite memberships of test cases.
+
+    Args:
+        test_case_ids: Test cases to look up
+        session: Active database session
+        engine: Database engine
+
+    Returns:
+        List of (test_case_id, suite_id, execution_order) tuples ordered by suite
+        and execution order.
+    """
+    if not test_case_ids:
+        return []
+    rows = (
+        session.query(
+            SuiteTestCaseAssociation.test_case_id,
+            SuiteTestCaseAssociation.suite_id,
+            SuiteTestCaseAssociation.execution_order,
+        )
+        .filter(
+            SuiteTestCaseAssociation.test_case_id.in_(test_case_ids),
+            SuiteTestCaseAssociation.is_active == True,
+        )
+        .order_by(
+            SuiteTestCaseAssociation.suite_id,
+            SuiteTestCaseAssociation.execution_order,
+        )
+        .all()
+    )
+    return [tuple(row) for row in rows]
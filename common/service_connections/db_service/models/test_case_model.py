@@ -21,6 +21,14 @@ from common.service_connections.db_service.database.enums import TestTypeEnum
 from common.service_connections.db_service.database.engine import (
     get_database_session as session,
 )
+from common.service_connections.db_service.models.catalog_cache import (
+    TEST_CASE,
+    CatalogCache,
+)
+from common.service_connections.db_service.models.model_serialization import (
+    construct_models,
+    select_model_columns,
+)
 from common.config import should_validate_write
 
 if TYPE_CHECKING:
@@ -109,6 +117,7 @@ def insert_test_case(test_case: TestCaseModel, engine: Engine) -> str:
         db_session.refresh(db_test_case)
         test_case_id = db_test_case.test_case_id
 
+    CatalogCache.invalidate(TEST_CASE, test_case.account_id)
     return test_case_id
 
 
@@ -145,6 +154,7 @@ def update_test_case_by_id(
         if not db_test_case:
             raise ValueError(f"Test Case ID {test_case_id} not found.")
 
+        previous_account_id = db_test_case.account_id
         test_case.updated_at = datetime.now(timezone.utc)
         test_case_data = test_case.model_dump(exclude_unset=True)
 
@@ -154,6 +164,7 @@ def update_test_case_by_id(
         db_session.commit()
         db_session.refresh(db_test_case)
 
+    CatalogCache.invalidate(TEST_CASE, previous_account_id, db_test_case.account_id)
     return TestCaseModel(**db_test_case.__dict__)
 
 
@@ -163,9 +174,11 @@ def drop_test_case_by_id(test_case_id: str, session: Session, engine: Engine) ->
         db_test_case = db_session.get(TestCaseTable, test_case_id)
         if not db_test_case:
             raise ValueError(f"Test Case ID {test_case_id} not found.")
+        account_id = db_test_case.account_id
         db_session.delete(db_test_case)
         db_session.commit()
         logging.info(f"Test Case ID {test_case_id} deleted.")
+    CatalogCache.invalidate(TEST_CASE, account_id)
     return 1
 
 
@@ -196,13 +209,21 @@ def query_test_cases_by_account(
             detail="Access denied: Cannot query test cases for a different account",
         )
 
-    test_cases = (
-        session.query(TestCaseTable)
-        .filter(TestCaseTable.account_id == account_id)
-        .filter(TestCaseTable.is_active == True)
-        .all()
+    return CatalogCache.get_or_load(
+        TEST_CASE,
+        account_id,
+        "active",
+        TestCaseModel,
+        lambda: construct_models(
+            TestCaseModel,
+            session.execute(
+                select_model_columns(TestCaseModel, TestCaseTable).where(
+                    TestCaseTable.account_id == account_id,
+                    TestCaseTable.is_active == True,
+                )
+            ),
+        ),
     )
-    return [TestCaseModel(**tc.__dict__) for tc in test_cases]
 
 
 def query_test_cases_by_owner(
@@ -223,27 +244,37 @@ def query_test_cases_by_sut(
     sut_id: str, session: Session, engine: Engine
 ) -> List[TestCaseModel]:
     """Query active test cases for a specific system under test."""
-    test_cases = (
-        session.query(TestCaseTable)
-        .filter(TestCaseTable.sut_id == sut_id)
-        .filter(TestCaseTable.is_active == True)
-        .all()
+    return construct_models(
+        TestCaseModel,
+        session.execute(
+            select_model_columns(TestCaseModel, TestCaseTable).where(
+                TestCaseTable.sut_id == sut_id,
+                TestCaseTable.is_active == True,
+            )
+        ),
     )
-    return [TestCaseModel(**tc.__dict__) for tc in test_cases]
 
 
 def query_test_cases_by_type(
     test_type: str, account_id: str, session: Session, engine: Engine
 ) -> List[TestCaseModel]:
     """Query active test cases filtered by test type and account."""
-    test_cases = (
-        session.query(TestCaseTable)
-        .filter(TestCaseTable.test_type == test_type)
-        .filter(TestCaseTable.account_id == account_id)
-        .filter(TestCaseTable.is_active == True)
-        .all()
+    return CatalogCache.get_or_load(
+        TEST_CASE,
+        account_id,
+        f"type:{test_type}",
+        TestCaseModel,
+        lambda: construct_models(
+            TestCaseModel,
+            session.execute(
+                select_model_columns(TestCaseModel, TestCaseTable).where(
+                    TestCaseTable.test_type == test_type,
+                    TestCaseTable.account_id == account_id,
+                    TestCaseTable.is_active == True,
+                )
+            ),
+        ),
     )
-    return [TestCaseModel(**tc.__dict__) for tc in test_cases]
 
 
 def deactivate_test_case_by_id(
@@ -262,6 +293,7 @@ def deactivate_test_case_by_id(
         db_session.commit()
         db_session.refresh(db_test_case)
 
+    CatalogCache.invalidate(TEST_CASE, db_test_case.account_id)
     return TestCaseModel(**db_test_case.__dict__)
 
 
@@ -282,4 +314,5 @@ def reactivate_test_case_by_id(
         db_session.commit()
         db_session.refresh(db_test_case)
 
+    CatalogCache.invalidate(TEST_CASE, db_test_case.account_id)
     return TestCaseModel(**db_test_case.__dict__)
@@ -7,6 +7,8 @@ from common.service_connections.db_service.models.user_interface_models.identifi
     query_all_identifiers,
     update_identifier_by_id,
     drop_identifier_by_id,
+    query_identifier_locators,
+    query_identifier_locator_count,
 )
 from common.service_connections.db_service.models.user_interface_models.page_model import (
     PageModel,
@@ -16,6 +18,15 @@ from common.service_connections.db_service.models.user_interface_models.page_mod
     update_page_by_id,
     drop_page_by_id,
 )
+from common.service_connections.db_service.models.user_interface_models.page_performance_model import (
+    PagePerformanceMetricModel,
+    PagePerformanceTrendModel,
+    PagePerformanceRegressionModel,
+    insert_page_performance_metric,
+    query_page_performance_metrics,
+    query_page_performance_trend,
+    query_page_performance_regressions,
+)
 
 __all__ = [
     # Identifier
@@ -25,6 +36,8 @@ __all__ = [
     "query_all_identifiers",
     "update_identifier_by_id",
     "drop_identifier_by_id",
+    "query_identifier_locators",
+    "query_identifier_locator_count",
     # Page
     "PageModel",
     "insert_page",
@@ -32,4 +45,12 @@ __all__ = [
     "query_all_pages",
     "update_page_by_id",
     "drop_page_by_id",
+    # Page performance
+    "PagePerformanceMetricModel",
+    "PagePerformanceTrendModel",
+    "PagePerformanceRegressionModel",
+    "insert_page_performance_metric",
+    "query_page_performance_metrics",
+    "query_page_performance_trend",
+    "query_page_performance_regressions",
 ]
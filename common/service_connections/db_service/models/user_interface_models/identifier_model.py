@@ -5,15 +5,15 @@ This module provides the IdentifierModel Pydantic model and database operations
 for managing web element identifiers that are used in Selenium automation.
 """
 
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from datetime import datetime
 
-from sqlalchemy import Engine
+from sqlalchemy import Engine, and_, func, or_
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
 
 # Import centralized database components
-from common.service_connections.db_service.database import IdentifierTable
+from common.service_connections.db_service.database import IdentifierTable, PageTable
 from common.service_connections.db_service.database.engine import (
     get_database_session as session,
 )
@@ -174,3 +174,74 @@ def query_identifier_by_identifier_value(
     if not db_identifier:
         return None
     return _convert_identifier_table_to_model(db_identifier)
+
+
+def query_identifier_locators(
+    session: Session,
+    engine: Engine,
+    page_names: Optional[List[str]] = None,
+    environment: Optional[str] = None,
+    updated_since: Optional[datetime] = None,
+) -> List[Tuple[str, str, str, str, bool, datetime]]:
+    """
+    Query page/element locator rows for the runtime locator cache.
+
+    Projects only the columns needed to resolve a locator so a whole page or
+    environment can be loaded in one round-trip instead of one query per element.
+
+    Args:
+        session: Active database session
+        engine: Database engine
+        page_names: Optional list of page names to restrict the load to
+        environment: Optional environment key that pages must be enabled for
+        updated_since: When set, return rows (active or not) where either the
+            identifier or its page changed after this timestamp
+
+    Returns:
+        List of (page_name, element_name, locator_strategy, locator_query,
+        is_active, updated_at) tuples.
+    """
+    is_active = and_(IdentifierTable.is_active == True, PageTable.is_active == True)
+    query = session.query(
+        PageTable.page_name,
+        IdentifierTable.element_name,
+        IdentifierTable.locator_strategy,
+        IdentifierTable.locator_query,
+        is_active,
+        func.greatest(IdentifierTable.updated_at, PageTable.updated_at),
+    ).join(PageTable, IdentifierTable.page_id == PageTable.page_id)
+
+    if page_names:
+        query = query.filter(PageTable.page_name.in_(page_names))
+    if environment:
+        query = query.filter(PageTable.environments.has_key(environment))
+    if updated_since is not None:
+        query = query.filter(
+            or_(
+                IdentifierTable.updated_at > updated_since,
+                PageTable.updated_at > updated_since,
+            )
+        )
+    else:
+        query = query.filter(is_active)
+
+    return [tuple(row) for row in query.all()]
+
+
+def query_identifier_locator_count(
+    session: Session,
+    engine: Engine,
+    page_names: Optional[List[str]] = None,
+    environment: Optional[str] = None,
+) -> int:
+    """Count active locators in the same scope as query_identifier_locators."""
+    query = (
+        session.query(func.count(IdentifierTable.identifier_id))
+        .join(PageTable, IdentifierTable.page_id == PageTable.page_id)
+        .filter(IdentifierTable.is_active == True, PageTable.is_active == True)
+    )
+    if page_names:
+        query = query.filter(PageTable.page_name.in_(page_names))
+    if environment:
+        query = query.filter(PageTable.environments.has_key(environment))
+    return query.scalar() or 0
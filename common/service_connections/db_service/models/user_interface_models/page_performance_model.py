@@ -0,0 +1,299 @@
+"""
+The page performance model stores browser timing samples collected while UI tests
+drive a page, and exposes trend and regression queries per page and environment.
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+
+from pydantic import BaseModel
+from sqlalchemy import Engine, func
+from sqlalchemy.orm import Session
+
+from common.service_connections.db_service.database import (
+    PagePerformanceMetricTable,
+    PageTable,
+)
+from common.service_connections.db_service.database.engine import (
+    get_database_session as session,
+)
+
+TREND_BUCKETS = ("hour", "day", "week")
+
+# Metrics that trend and regression queries aggregate.
+TRENDED_METRICS = (
+    "time_to_first_byte_ms",
+    "dom_content_loaded_ms",
+    "load_event_ms",
+    "first_contentful_paint_ms",
+)
+
+
+class PagePerformanceMetricModel(BaseModel):
+    """
+    PagePerformanceMetricModel represents one browser timing sample for a page.
+    Fields match PagePerformanceMetricTable database schema.
+
+    Fields:
+    - metric_id (int): The unique identifier for the sample.
+    - page_id (int): The page the sample was collected on.
+    - environment_id (str | None): The environment under test.
+    - url (str): The URL that was loaded.
+    - browser (str | None): Browser name (BrowserEnum value).
+    - navigation_type (str | None): navigate, reload, back_forward or prerender.
+    - time_to_first_byte_ms (float | None): responseStart relative to navigation start.
+    - dom_interactive_ms (float | None): domInteractive relative to navigation start.
+    - dom_content_loaded_ms (float | None): domContentLoadedEventEnd relative to navigation start.
+    - load_event_ms (float | None): loadEventEnd relative to navigation start.
+    - transfer_size_bytes (int | None): Bytes transferred for the document.
+    - first_paint_ms (float | None): Paint Timing first-paint.
+    - first_contentful_paint_ms (float | None): Paint Timing first-contentful-paint.
+    - resource_count (int | None): Number of resource timing entries.
+    - resource_transfer_bytes (int | None): Bytes transferred for all resources.
+    - slowest_resources (list): The slowest resource entries (name, initiator_type, duration_ms, transfer_size).
+    - cdp_metrics (dict | None): Chrome DevTools Performance.getMetrics name/value pairs.
+    - collected_at (datetime): When the sample was collected.
+    """
+
+    metric_id: Optional[int] = None
+    page_id: int
+    environment_id: Optional[str] = None
+    url: str
+    browser: Optional[str] = None
+    navigation_type: Optional[str] = None
+    time_to_first_byte_ms: Optional[float] = None
+    dom_interactive_ms: Optional[float] = None
+    dom_content_loaded_ms: Optional[float] = None
+    load_event_ms: Optional[float] = None
+    transfer_size_bytes: Optional[int] = None
+    first_paint_ms: Optional[float] = None
+    first_contentful_paint_ms: Optional[float] = None
+    resource_count: Optional[int] = None
+    resource_transfer_bytes: Optional[int] = None
+    slowest_resources: list = []
+    cdp_metrics: Optional[dict] = None
+    collected_at: Optional[datetime] = None
+
+
+class PagePerformanceTrendModel(BaseModel):
+    """
+    Aggregated samples for one time bucket.
+
+    Fields:
+    - bucket (datetime): Start of the bucket.
+    - samples (int): Number of samples in the bucket.
+    - <metric>_p50 / <metric>_p95 (float | None): Median and 95th percentile for each trended metric.
+    """
+
+    bucket: datetime
+    samples: int
+    time_to_first_byte_ms_p50: Optional[float] = None
+    time_to_first_byte_ms_p95: Optional[float] = None
+    dom_content_loaded_ms_p50: Optional[float] = None
+    dom_content_loaded_ms_p95: Optional[float] = None
+    load_event_ms_p50: Optional[float] = None
+    load_event_ms_p95: Optional[float] = None
+    first_contentful_paint_ms_p50: Optional[float] = None
+    first_contentful_paint_ms_p95: Optional[float] = None
+
+
+class PagePerformanceRegressionModel(BaseModel):
+    """
+    A page/environment whose recent median is slower than its baseline median.
+
+    Fields:
+    - page_id (int): The page.
+    - page_name (str): The page name.
+    - environment_id (str | None): The environment.
+    - metric (str): The regressed metric.
+    - baseline_p50 (float): Median over the baseline window.
+    - recent_p50 (float): Median over the recent window.
+    - ratio (float): recent_p50 / baseline_p50.
+    - recent_samples (int): Samples in the recent window.
+    """
+
+    page_id: int
+    page_name: str
+    environment_id: Optional[str] = None
+    metric: str
+    baseline_p50: float
+    recent_p50: float
+    ratio: float
+    recent_samples: int
+
+
+################ Page Performance Queries ################
+
+
+def insert_page_performance_metric(
+    metric: PagePerformanceMetricModel, engine: Engine
+) -> int:
+    """Insert a performance sample and return its ID."""
+    with session(engine) as db_session:
+        metric_data = metric.model_dump(exclude={"metric_id"})
+        metric_data["collected_at"] = metric.collected_at or datetime.now(timezone.utc)
+        db_metric = PagePerformanceMetricTable(**metric_data)
+        db_session.add(db_metric)
+        db_session.commit()
+        db_session.refresh(db_metric)
+    return db_metric.metric_id
+
+
+def query_page_performance_metrics(
+    page_id: int,
+    session: Session,
+    engine: Engine,
+    environment_id: Optional[str] = None,
+    limit: int = 100,
+) -> List[PagePerformanceMetricModel]:
+    """Query the most recent samples for a page, newest first."""
+    query = session.query(PagePerformanceMetricTable).filter(
+        PagePerformanceMetricTable.page_id == page_id
+    )
+    if environment_id:
+        query = query.filter(PagePerformanceMetricTable.environment_id == environment_id)
+    metrics = (
+        query.order_by(PagePerformanceMetricTable.collected_at.desc()).limit(limit).all()
+    )
+    return [PagePerformanceMetricModel(**metric.__dict__) for metric in metrics]
+
+
+def query_page_performance_trend(
+    page_id: int,
+    session: Session,
+    engine: Engine,
+    environment_id: Optional[str] = None,
+    bucket: str = "day",
+    days: int = 30,
+) -> List[PagePerformanceTrendModel]:
+    """
+    Aggregate samples for a page into p50/p95 per time bucket.
+
+    Args:
+        page_id: The page to trend
+        session: Active database session
+        engine: Database engine
+        environment_id: Optional environment filter
+        bucket: date_trunc unit, one of "hour", "day" or "week"
+        days: How far back to look
+
+    Returns:
+        List of PagePerformanceTrendModel ordered by bucket.
+
+    Raises:
+        ValueError: If bucket is not supported.
+    """
+    if bucket not in TREND_BUCKETS:
+        raise ValueError(f"Invalid bucket '{bucket}'. Expected one of: {TREND_BUCKETS}")
+
+    bucket_column = func.date_trunc(bucket, PagePerformanceMetricTable.collected_at)
+    columns = [
+        bucket_column.label("bucket"),
+        func.count(PagePerformanceMetricTable.metric_id).label("samples"),
+    ]
+    for metric in TRENDED_METRICS:
+        column = getattr(PagePerformanceMetricTable, metric)
+        columns.append(
+            func.percentile_cont(0.5).within_group(column).label(f"{metric}_p50")
+        )
+        columns.append(
+            func.percentile_cont(0.95).within_group(column).label(f"{metric}_p95")
+        )
+
+    since = datetime.now(timezone.utc) - timedelta(days=days)
+    query = session.query(*columns).filter(
+        PagePerformanceMetricTable.page_id == page_id,
+        PagePerformanceMetricTable.collected_at >= since,
+    )
+    if environment_id:
+        query = query.filter(PagePerformanceMetricTable.environment_id == environment_id)
+    rows = query.group_by(bucket_column).order_by(bucket_column).all()
+    return [PagePerformanceTrendModel(**row._asdict()) for row in rows]
+
+
+def query_page_performance_regressions(
+    session: Session,
+    engine: Engine,
+    environment_id: Optional[str] = None,
+    metric: str = "load_event_ms",
+    recent_days: int = 1,
+    baseline_days: int = 14,
+    threshold: float = 1.2,
+    min_samples: int = 3,
+) -> List[PagePerformanceRegressionModel]:
+    """
+    Find pages whose recent median for a metric exceeds the baseline median.
+
+    The baseline window is the baseline_days immediately before the recent window,
+    so a regression keeps showing until it has been in place for baseline_days.
+
+    Args:
+        session: Active database session
+        engine: Database engine
+        environment_id: Optional environment filter
+        metric: One of TRENDED_METRICS
+        recent_days: Size of the recent window
+        baseline_days: Size of the baseline window
+        threshold: Minimum recent/baseline ratio to report
+        min_samples: Minimum samples required in each window
+
+    Returns:
+        List of PagePerformanceRegressionModel, worst ratio first.
+
+    Raises:
+        ValueError: If metric is not trended.
+    """
+    if metric not in TRENDED_METRICS:
+        raise ValueError(f"Invalid metric '{metric}'. Expected one of: {TRENDED_METRICS}")
+
+    column = getattr(PagePerformanceMetricTable, metric)
+    now = datetime.now(timezone.utc)
+    recent_start = now - timedelta(days=recent_days)
+    baseline_start = recent_start - timedelta(days=baseline_days)
+    is_recent = PagePerformanceMetricTable.collected_at >= recent_start
+    is_baseline = PagePerformanceMetricTable.collected_at < recent_start
+
+    baseline_p50 = func.percentile_cont(0.5).within_group(column).filter(is_baseline)
+    recent_p50 = func.percentile_cont(0.5).within_group(column).filter(is_recent)
+    baseline_count = func.count(column).filter(is_baseline)
+    recent_count = func.count(column).filter(is_recent)
+
+    query = (
+        session.query(
+            PagePerformanceMetricTable.page_id,
+            PageTable.page_name,
+            PagePerformanceMetricTable.environment_id,
+            baseline_p50.label("baseline_p50"),
+            recent_p50.label("recent_p50"),
+            recent_count.label("recent_samples"),
+        )
+        .join(PageTable, PagePerformanceMetricTable.page_id == PageTable.page_id)
+        .filter(PagePerformanceMetricTable.collected_at >= baseline_start)
+    )
+    if environment_id:
+        query = query.filter(PagePerformanceMetricTable.environment_id == environment_id)
+    rows = (
+        query.group_by(
+            PagePerformanceMetricTable.page_id,
+            PageTable.page_name,
+            PagePerformanceMetricTable.environment_id,
+        )
+        .having(baseline_count >= min_samples, recent_count >= min_samples)
+        .having(recent_p50 > baseline_p50 * threshold)
+        .all()
+    )
+
+    regressions = [
+        PagePerformanceRegressionModel(
+            page_id=row.page_id,
+            page_name=row.page_name,
+            environment_id=row.environment_id,
+            metric=metric,
+            baseline_p50=row.baseline_p50,
+            recent_p50=row.recent_p50,
+            ratio=row.recent_p50 / row.baseline_p50 if row.baseline_p50 else 0.0,
+            recent_samples=row.recent_samples,
+        )
+        for row in rows
+    ]
+    return sorted(regressions, key=lambda regression: -regression.ratio)
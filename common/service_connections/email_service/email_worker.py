@@ -0,0 +1,150 @@
+"""
+Email processor worker that drains emailProcessorTable concurrently.
+
+Each batch is claimed with SELECT ... FOR UPDATE SKIP LOCKED inside one
+transaction. The claimed items are sent on a thread pool (Azure DevOps
+attachment download, MIME build, SMTP send) while that transaction keeps them
+locked. The results are written in the same transaction. Another worker,
+in this process or on another host, skips the locked rows and claims the next
+batch, so two workers never send the same item concurrently.
+
+Delivery is at-least-once, not exactly-once. The SMTP send happens before the
+transaction commits. If a worker dies, or the commit fails, after an item was
+sent, the transaction rolls back, the item becomes claimable again and it is
+sent a second time.
+
+Failed items stay queued. Their last_processed_at records the attempt, and they
+are retried after EMAIL_WORKER_RETRY_SECONDS.
+
+Run a worker with:
+    python -m common.service_connections.email_service.email_worker
+"""
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, List, Optional
+
+from pydantic import BaseModel
+from sqlalchemy.engine import Engine
+
+from common.config import EmailWorkerConfig, get_email_worker_config
+from common.service_connections.db_service.database.engine import (
+    get_database_session as session,
+)
+from common.service_connections.db_service.models.email_processor_model import (
+    EmailProcessorModel,
+    claim_unprocessed_email_items,
+    mark_email_item_results,
+)
+from common.service_connections.email_service.gmail_service import (
+    send_email_for_work_item,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class EmailBatchResultModel(BaseModel):
+    """
+    Outcome of one claimed batch.
+
+    Fields:
+    - claimed: int - Items claimed by this worker
+    - sent: List[int] - email_processor_ids emailed and marked processed
+    - failed: List[int] - email_processor_ids left queued for a retry
+    """
+
+    claimed: int = 0
+    sent: List[int] = []
+    failed: List[int] = []
+
+
+class EmailProcessorWorker:
+    """
+    Claims batches of unprocessed email items and sends them on a thread pool.
+
+    send_item sends one item and returns the emailed file names; it runs on the
+    pool threads and must not use the claiming session.
+    """
+
+    def __init__(
+        self,
+        engine: Engine,
+        config: Optional[EmailWorkerConfig] = None,
+        send_item: Callable[
+            [EmailProcessorModel], List[str]
+        ] = send_email_for_work_item,
+    ):
+        self.engine = engine
+        self.config = config or get_email_worker_config()
+        self.send_item = send_item
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.config.max_workers, thread_name_prefix="email-worker"
+        )
+
+    def run_once(self) -> EmailBatchResultModel:
+        """Claim, send and mark one batch; returns an empty result when idle."""
+        with session(self.engine) as db_session:
+            items = claim_unprocessed_email_items(
+                db_session,
+                batch_size=self.config.batch_size,
+                retry_after_seconds=self.config.retry_after_seconds,
+            )
+            if not items:
+                return EmailBatchResultModel()
+
+            futures = {
+                self._executor.submit(self.send_item, item): item for item in items
+            }
+            sent: Dict[int, List[str]] = {}
+            failed: List[int] = []
+            for future in as_completed(futures):
+                item = futures[future]
+                try:
+                    sent[item.email_processor_id] = future.result()
+                except Exception as e:
+                    logger.error(
+                        f"Email item {item.email_item_id} "
+                        f"(id {item.email_processor_id}) failed: {e}"
+                    )
+                    failed.append(item.email_processor_id)
+
+            mark_email_item_results(db_session, sent=sent, failed=failed)
+
+        logger.info(
+            f"Email batch: {len(items)} claimed, {len(sent)} sent, "
+            f"{len(failed)} failed"
+        )
+        return EmailBatchResultModel(
+            claimed=len(items), sent=sorted(sent), failed=sorted(failed)
+        )
+
+    def run_forever(self, stop_event: Optional[threading.Event] = None) -> None:
+        """Drain the queue, sleeping poll_interval_seconds when it is empty."""
+        stop_event = stop_event or threading.Event()
+        while not stop_event.is_set():
+            try:
+                result = self.run_once()
+            except Exception as e:
+                logger.error(f"Email batch failed: {e}")
+                result = EmailBatchResultModel()
+            # A full batch suggests more work is waiting, so skip the sleep
+            if result.claimed < self.config.batch_size:
+                stop_event.wait(self.config.poll_interval_seconds)
+
+    def close(self) -> None:
+        """Wait for in-flight sends and stop the thread pool."""
+        self._executor.shutdown(wait=True)
+
+
+if __name__ == "__main__":
+    from common.service_connections.db_service.db_manager import DB_ENGINE
+
+    logging.basicConfig(level=logging.INFO)
+    worker = EmailProcessorWorker(DB_ENGINE)
+    try:
+        worker.run_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        worker.close()
@@ -29,7 +29,7 @@ from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from sqlalchemy.orm import Session
 
-from service_connections.db_service.db_manager import DB_ENGINE
+from common.service_connections.db_service.db_manager import DB_ENGINE
 from common.config import EmailServiceConfig, get_email_service_config
 from common.service_connections.db_service.models.email_processor_model import (
     SystemEnum,
@@ -117,7 +117,9 @@ def fetch_and_write_attachment(
     file path and file name.
 
     The underlying writer uses create_pdf_file which accepts raw bytes. The
-    caller-specified extension is preserved for the resulting filename.
+    caller-specified extension is preserved for the resulting filename. The
+    attachment id keeps names unique when several attachments are written in
+    the same second (multi-attachment items, concurrent workers).
 
     Args:
         attachment_id (int): Identifier for the remote attachment to fetch.
@@ -128,7 +130,8 @@ def fetch_and_write_attachment(
         tuple[str, str]: A tuple of (file_path, file_name) for the created file.
     """
     attachment_bytes = get_attachment_data(attachment_id=attachment_id)
-    file_name = f"AUTO-{datetime.now().strftime(_DATETIME_FORMAT)}.{file_extension}"
+    timestamp = datetime.now().strftime(_DATETIME_FORMAT)
+    file_name = f"AUTO-{timestamp}-{attachment_id}.{file_extension}"
     file_path = create_pdf_file(f"{os.getcwd()}/{file_name}", attachment_bytes)
     return file_path, file_name
 
@@ -276,9 +279,9 @@ def send_email_with_attachment(
         return None
 
 
-def process_work_item_single_attachment(work_item: EmailProcessorModel) -> None:
+def send_single_attachment_email(work_item: EmailProcessorModel) -> List[str]:
     """
-    Process a work item that has a single attachment: fetch, write, email, update DB.
+    Send the email for a work item with a single attachment, without touching the DB.
 
     Args:
         work_item (WorkItemModel): The work item to process, including work item id,
@@ -290,11 +293,14 @@ def process_work_item_single_attachment(work_item: EmailProcessorModel) -> None:
         3. Load the file as a MIME attachment part.
         4. Compose the email body.
         5. Send the email with the attachment to the system-specific recipient.
-        6. Update the work item in the database with the sent filename.
+
+    Returns:
+        list[str]: The name of the file that was emailed.
 
     Raises:
         ValueError: If the work item is missing a system recipient.
         FileNotFoundError: If the created file cannot be read for attachment.
+        smtplib.SMTPException: If the email could not be sent.
     """
 
     attachment_id = get_attachment_id(work_item.email_item_id)
@@ -314,20 +320,36 @@ def process_work_item_single_attachment(work_item: EmailProcessorModel) -> None:
 
     email_config = get_email_service_config()
 
-    send_email_with_attachment(
+    sent_subject = send_email_with_attachment(
         subject=file_name,
         body=email_body,
         file_data=file_data,
         email_config=email_config,
         system_recipient=system_recipient,
     )
+    if sent_subject is None:
+        raise smtplib.SMTPException(f"Email with attachment {file_name} not sent")
     logging.info(f"Email sent with attachment: {file_name}")
+    return [file_name]
+
+
+def process_work_item_single_attachment(work_item: EmailProcessorModel) -> None:
+    """
+    Process a work item that has a single attachment: fetch, write, email, update DB.
+
+    Args:
+        work_item (WorkItemModel): The work item to process, including work item id,
+            test name, and the target system.
+    """
+    file_names = send_single_attachment_email(work_item)
     processed_work_item = build_processed_work_item(
-        work_item=work_item, file_names=[file_name]
+        work_item=work_item, file_names=file_names
+    )
+    logging.info(
+        f"Updating work item {work_item.email_processor_id} with processed details."
     )
-    logging.info(f"Updating work item {work_item.id} with processed details.")
     update_email_item_by_id(
-        email_item_id=work_item.id,
+        email_item_id=work_item.email_processor_id,
         work_item=processed_work_item,
         engine=DB_ENGINE,
         session=Session,
@@ -336,9 +358,9 @@ def process_work_item_single_attachment(work_item: EmailProcessorModel) -> None:
     return
 
 
-def process_multiple_attachments(work_item: EmailProcessorModel) -> None:
+def send_multiple_attachments_email(work_item: EmailProcessorModel) -> List[str]:
     """
-    Process a work item that has multiple attachments: fetch, write, email, update DB.
+    Send one email with all of a work item's attachments, without touching the DB.
 
     Args:
         work_item (WorkItemModel): The work item containing details such as work item id
@@ -350,7 +372,12 @@ def process_multiple_attachments(work_item: EmailProcessorModel) -> None:
         3. Build the email body summarizing all attachments.
         4. Load each file as a MIME attachment part.
         5. Send the email with all attachments to the system-specific recipient.
-        6. Update the work item in the database with the sent filenames.
+
+    Returns:
+        list[str]: The names of the files that were emailed.
+
+    Raises:
+        smtplib.SMTPException: If the email could not be sent.
     """
 
     if work_item.email_item_id == 30103:
@@ -382,20 +409,35 @@ def process_multiple_attachments(work_item: EmailProcessorModel) -> None:
 
     email_config = get_email_service_config()
 
-    send_email_with_attachment(
+    sent_subject = send_email_with_attachment(
         subject=attachment_file_names,
         body=email_body,
         file_data=file_data,
         email_config=email_config,
         system_recipient=system_recipient,
     )
-    file_names_only = [file.split("/")[-1] for file in attachment_file_names]
+    if sent_subject is None:
+        raise smtplib.SMTPException(
+            f"Email for work item {work_item.email_item_id} not sent"
+        )
+    return [file.split("/")[-1] for file in attachment_file_names]
+
+
+def process_multiple_attachments(work_item: EmailProcessorModel) -> None:
+    """
+    Process a work item that has multiple attachments: fetch, write, email, update DB.
+
+    Args:
+        work_item (WorkItemModel): The work item containing details such as work item id
+            and test name.
+    """
+    file_names = send_multiple_attachments_email(work_item)
     processed_work_item = build_processed_work_item(
-        work_item=work_item, file_names=file_names_only
+        work_item=work_item, file_names=file_names
     )
 
     update_email_item_by_id(
-        email_item_id=work_item.id,
+        email_item_id=work_item.email_processor_id,
         work_item=processed_work_item,
         engine=DB_ENGINE,
         session=Session,
@@ -404,6 +446,27 @@ def process_multiple_attachments(work_item: EmailProcessorModel) -> None:
     return
 
 
+def send_email_for_work_item(work_item: EmailProcessorModel) -> List[str]:
+    """
+    Send the email for a work item based on its attachment flags, without
+    touching the DB. Used by the email processor worker.
+
+    Args:
+        work_item (WorkItemModel): The work item to send.
+
+    Returns:
+        list[str]: The names of the files that were emailed.
+
+    Raises:
+        ValueError: If the work item is flagged with multiple emails.
+    """
+    if work_item.multi_attachment_flag:
+        return send_multiple_attachments_email(work_item)
+    if work_item.multi_email_flag:
+        raise ValueError("Multiple emails per work item are not supported.")
+    return send_single_attachment_email(work_item)
+
+
 def evaluate_email_and_send_based_on_attachment_flag(
     work_item: EmailProcessorModel,
 ) -> None:
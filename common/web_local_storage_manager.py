@@ -1,14 +1,20 @@
 from selenium.webdriver.remote.webdriver import WebDriver
 
-class WebLocalStorageManager:
+from common.web_storage_manager import WebStorageManager
+
+class WebLocalStorageManager(WebStorageManager):
     """
     A class for interacting with the local storage of a web application.
     """
 
-    def __init__(self, driver: WebDriver):
-        self.driver = driver
+    storage_name = "localStorage"
+
+    def __init__(self, driver: WebDriver, use_cache: bool = False):
+        super().__init__(driver, use_cache=use_cache)
 
     def __len__(self):
+        if self.use_cache:
+            return len(self.cached_items())
         return self.driver.execute_script("return window.localStorage.length;")
 
     def items(self):
@@ -18,6 +24,8 @@ class WebLocalStorageManager:
         :return: A dictionary with key-value pairs representing the items in the local storage.
         :retype: dict
         """
+        if self.use_cache:
+            return dict(self.cached_items())
         return self.driver.execute_script(
             "var ls = window.localStorage, items = {}; "
             "for (var i = 0, k; i < ls.length; ++i) "
@@ -32,6 +40,8 @@ class WebLocalStorageManager:
         :return: A list of keys stored in the local storage.
         :retype: list
         """
+        if self.use_cache:
+            return list(self.cached_items())
         return self.driver.execute_script(
             "var ls = window.localStorage, keys = []; "
             "for (var i = 0; i < ls.length; ++i) "
@@ -49,6 +59,8 @@ class WebLocalStorageManager:
         Returns:
             Any: The value associated with the given key in the local storage.
         """
+        if self.use_cache:
+            return self.cached_items().get(key)
         return self.driver.execute_script(
             "return window.localStorage.getItem(arguments[0]);", key
         )
@@ -64,17 +76,20 @@ class WebLocalStorageManager:
         Returns:
         None
         """
+        self.invalidate()
         self.driver.execute_script(
             "window.localStorage.setItem(arguments[0], arguments[1]);", key, value
         )
 
     def has(self, key):
-        return key in self.keys()
+        return self._contains(key)
 
     def remove(self, key):
+        self.invalidate()
         self.driver.execute_script("window.localStorage.removeItem(arguments[0]);", key)
 
     def clear(self):
+        self.invalidate()
         self.driver.execute_script("window.localStorage.clear();")
 
     def __getitem__(self, key):
@@ -87,7 +102,7 @@ class WebLocalStorageManager:
         self.set(key, value)
 
     def __contains__(self, key):
-        return key in self.keys()
+        return self._contains(key)
 
     def __iter__(self):
         return self.items().__iter__()
@@ -104,9 +119,9 @@ def get_access_token_from_local_storage(storage: WebLocalStorageManager) -> str:
         str: The access token if found, otherwise None.
     """
 
-    for item in storage.items():
-        if "accessToken" in item:
-            return storage.get(item)
+    for key, value in storage.items().items():
+        if "accessToken" in key:
+            return value
 
 
 def get_id_token_from_local_storage(storage: WebLocalStorageManager) -> str:
@@ -118,7 +133,7 @@ def get_id_token_from_local_storage(storage: WebLocalStorageManager) -> str:
         str: The ID token if found, otherwise None.
     """
 
-    for item in storage.items():
-        if "idToken" in item:
-            return storage.get(item)
+    for key, value in storage.items().items():
+        if "idToken" in key:
+            return value
 
@@ -4,15 +4,21 @@ import time
 
 from selenium.webdriver.remote.webdriver import WebDriver
 
-class WebSessionStorageManager:
+from common.web_storage_manager import WebStorageManager
+
+class WebSessionStorageManager(WebStorageManager):
     """
     A class for interacting with the session storage of a web application.
     """
 
-    def __init__(self, driver: WebDriver):
-        self.driver = driver
+    storage_name = "sessionStorage"
+
+    def __init__(self, driver: WebDriver, use_cache: bool = False):
+        super().__init__(driver, use_cache=use_cache)
 
     def __len__(self):
+        if self.use_cache:
+            return len(self.cached_items())
         return self.driver.execute_script("return window.sessionStorage.length;")
 
     def get_storage(self):
@@ -25,6 +31,8 @@ class WebSessionStorageManager:
         """
         Gets the items in the session storage.
         """
+        if self.use_cache:
+            return dict(self.cached_items())
         return self.driver.execute_script(
             """
                 function deepCopy(obj) {
@@ -48,6 +56,8 @@ class WebSessionStorageManager:
 
         :return: A list of keys.
         """
+        if self.use_cache:
+            return list(self.cached_items())
         keys = self.driver.execute_script(
             "var ls = window.sessionStorage, keys = []; "
             "for (var i = 0; i < ls.length; ++i) "
@@ -64,6 +74,8 @@ class WebSessionStorageManager:
         Returns:
         - str: The value associated with the given key.
         """
+        if self.use_cache:
+            return self.cached_items().get(key)
         return self.driver.execute_script(
             "return window.sessionStorage.getItem(arguments[0]);", key
         )
@@ -77,6 +89,7 @@ class WebSessionStorageManager:
         Returns:
             None
         """
+        self.invalidate()
         self.driver.execute_script(
             "window.sessionStorage.setItem(arguments[0], arguments[1]);", key, value
         )
@@ -90,7 +103,7 @@ class WebSessionStorageManager:
         - True if the key exists in the keys of the frontend driver, False otherwise.
         """
 
-        return key in self.keys()
+        return self._contains(key)
 
     def remove(self, key):
         """
@@ -101,6 +114,7 @@ class WebSessionStorageManager:
         None
         """
 
+        self.invalidate()
         self.driver.execute_script("window.sessionStorage.removeItem(arguments[0]);", key)
 
     def clear(self):
@@ -115,6 +129,7 @@ class WebSessionStorageManager:
         Returns:
             None
         """
+        self.invalidate()
         self.driver.execute_script("window.sessionStorage.clear();")
 
     def __getitem__(self, key):
@@ -127,7 +142,7 @@ class WebSessionStorageManager:
         self.set(key, value)
 
     def __contains__(self, key):
-        return key in self.keys()
+        return self._contains(key)
 
     def __iter__(self):
         return self.items().__iter__()
@@ -158,11 +173,12 @@ def get_access_token_from_session_storage(storage: WebSessionStorageManager) ->
         """
         Get Access Token from the session storage.
         """
-        for item in storage.items():
+        storage.invalidate()
+        for item, value in storage.items().items():
             if item.__contains__("accessToken"):
-                return storage.get(item)
+                return value
             if item.__contains__("accesstoken"):
-                return json.loads(storage.get(item))["secret"]
+                return json.loads(value)["secret"]
 
     while retry < 5:
         token = get_access_token()
@@ -195,11 +211,12 @@ def get_refresh_token_from_session_storage(storage: WebSessionStorageManager) ->
         """
         Retrieves the refresh token from the session storage.
         """
-        for item in storage.items():
+        storage.invalidate()
+        for item, value in storage.items().items():
             if item.__contains__("refresh"):
-                return storage.get(item)
+                return value
             if item.__contains__("refresh"):
-                return json.loads(storage.get(item))["secret"]
+                return json.loads(value)["secret"]
         else:
             raise KeyError("No refresh token found in session storage")
 
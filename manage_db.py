@@ -15,6 +15,7 @@ Usage:
     python manage_db.py create-all   # Create all tables (bypass migrations)
     python manage_db.py drop-all     # Drop all tables (DANGEROUS!)
     python manage_db.py seed-admin   # Seed admin user from .env EMAIL_RECIPIENT
+    python manage_db.py rebalance-orders  # Respace crowded plan/suite execution orders
 """
 
 import sys
@@ -142,6 +143,21 @@ def drop_tables() -> None:
         sys.exit(1)
 
 
+def rebalance_execution_orders() -> None:
+    """Respace execution_order keys of plans and suites that are running out of gaps."""
+    from common.service_connections.db_service.db_manager import DB_ENGINE
+    from common.service_connections.db_service.models.plan_suite_helpers import (
+        rebalance_plan_suite_orders,
+    )
+    from common.service_connections.db_service.models.suite_test_case_helpers import (
+        rebalance_suite_test_case_orders,
+    )
+
+    plans = rebalance_plan_suite_orders(DB_ENGINE)
+    suites = rebalance_suite_test_case_orders(DB_ENGINE)
+    print(f"✅ Rebalanced {len(plans)} plans and {len(suites)} suites")
+
+
 async def seed_admin_user() -> None:
     """Seed admin user from .env configuration."""
     print("🌱 Seeding admin user from .env configuration...")
@@ -231,6 +247,8 @@ def main():
         drop_tables()
     elif command == "seed-admin":
         asyncio.run(seed_admin_user())
+    elif command == "rebalance-orders":
+        rebalance_execution_orders()
     else:
         print(f"Unknown command: {command}")
         print(__doc__)
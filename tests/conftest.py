@@ -16,6 +16,9 @@ from dotenv import load_dotenv
 
 # Disable rate limiting for tests BEFORE importing app modules
 os.environ["RATE_LIMIT_ENABLED"] = "false"
+# Factories write rows directly, bypassing the catalog cache's invalidation hooks;
+# tests that exercise the cache configure it explicitly
+os.environ["CATALOG_CACHE_BACKEND"] = "none"
 
 # Load environment variables for database connection
 load_dotenv()
@@ -10,7 +10,7 @@ Provides factory fixtures for all database models with:
 """
 
 import threading
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 from uuid import uuid4
 
@@ -18,6 +18,7 @@ import pytest
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session
 
+from app.models.auth_models import TokenPayload
 from common.service_connections.db_service.database.tables.account_tables.account import (
     AccountTable,
 )
@@ -27,6 +28,9 @@ from common.service_connections.db_service.database.tables.account_tables.auth_u
 from common.service_connections.db_service.database.tables.action_chain import (
     ActionChainTable,
 )
+from common.service_connections.db_service.database.tables.action_tables.user_interface_action.page import (
+    PageTable,
+)
 from common.service_connections.db_service.database.tables.audit_log import (
     AuditLogTable,
 )
@@ -186,6 +190,31 @@ def auth_user_factory(engine: Engine, session: Session):
         db_session.commit()
 
 
+@pytest.fixture(scope="function")
+def member_token():
+    """Factory fixture for member TokenPayloads scoped to one account.
+
+    Usage:
+        def test_something(member_token, account_factory):
+            token = member_token(account_factory())
+
+    Yields:
+        Factory function(account_id: str) -> TokenPayload (not a super admin)
+    """
+
+    def _create_member_token(account_id: str) -> TokenPayload:
+        return TokenPayload(
+            user_id="test-user",
+            email="test@example.com",
+            is_admin=False,
+            exp=datetime.now(timezone.utc) + timedelta(hours=1),
+            jti="test-jti",
+            account_id=account_id,
+        )
+
+    yield _create_member_token
+
+
 @pytest.fixture(scope="function")
 def system_under_test_factory(
     engine: Engine, session: Session, account_factory, auth_user_factory
@@ -647,6 +676,48 @@ def entity_tag_factory(
         db_session.commit()
 
 
+@pytest.fixture(scope="function")
+def page_factory(engine: Engine, session: Session):
+    """Factory fixture for creating Page records.
+
+    Deleting a page cascades to its performance samples, so tests that insert
+    samples for a factory page need no extra cleanup.
+
+    Yields:
+        Factory function(page_name: Optional[str] = None,
+                        page_url: str = "https://example.com/perf") -> int (page_id)
+    """
+    created_page_ids = []
+
+    def _create_page(
+        page_name: Optional[str] = None,
+        page_url: str = "https://example.com/perf",
+    ) -> int:
+        """Create Page with synthetic data."""
+        counter = _get_fixture_counter()
+
+        with session() as db_session:
+            page = PageTable(
+                page_name=page_name or f"Test Page {counter:03d} {uuid4().hex[:8]}",
+                page_url=page_url,
+                environments={},
+            )
+            db_session.add(page)
+            db_session.commit()
+            created_page_ids.append(page.page_id)
+            return page.page_id
+
+    yield _create_page
+
+    # Cleanup
+    with session() as db_session:
+        for page_id in created_page_ids:
+            page = db_session.get(PageTable, page_id)
+            if page:
+                db_session.delete(page)
+        db_session.commit()
+
+
 # ============================================================================
 # Admin/System Fixtures
 # ============================================================================
@@ -8,6 +8,7 @@ Tests cover:
 - Composite queries (suite with test cases, plan with suites)
 """
 
+import pytest
 from sqlalchemy.engine import Engine
 
 from common.service_connections.db_service.database.engine import (
@@ -28,6 +29,12 @@ from common.service_connections.db_service.models.plan_suite_helpers import (
     query_plan_with_suites,
     query_suites_for_plan,
     bulk_add_suites_to_plan,
+    replace_plan_suites,
+    move_suite_in_plan,
+)
+from common.service_connections.db_service.models.association_ops import (
+    ORDER_GAP,
+    order_key_between,
 )
 
 
@@ -154,8 +161,8 @@ class TestSuiteTestCaseAssociations:
         # Add initial test cases
         old_tc1 = test_case_factory(account_id=account_id, sut_id=sut_id, name="Old 1")
         old_tc2 = test_case_factory(account_id=account_id, sut_id=sut_id, name="Old 2")
-        add_test_case_to_suite(suite_id, old_tc1, 0, engine)
-        add_test_case_to_suite(suite_id, old_tc2, 1, engine)
+        add_test_case_to_suite(suite_id, old_tc1, engine, execution_order=0)
+        add_test_case_to_suite(suite_id, old_tc2, engine, execution_order=1)
 
         # Create new test cases
         new_tc1 = test_case_factory(account_id=account_id, sut_id=sut_id, name="New 1")
@@ -182,6 +189,53 @@ class TestSuiteTestCaseAssociations:
         assert len(active_tests) == 3
         assert new_tc1 in active_tests
 
+    def test_reorder_only_updates_moved_rows(
+        self, suite_factory, test_case_factory, engine: Engine
+    ):
+        """Test that reordering leaves rows already in position untouched."""
+        # Arrange
+        suite_id = suite_factory()
+        tc1, tc2, tc3 = (test_case_factory() for _ in range(3))
+        bulk_add_test_cases_to_suite(suite_id, [tc1, tc2, tc3], engine)
+
+        # Act - Swap the first two, keep the third
+        update_count = reorder_suite_test_cases(suite_id, [tc2, tc1, tc3], engine)
+
+        # Assert
+        assert update_count == 2
+
+    def test_replace_suite_test_cases_diffs_existing(
+        self, suite_factory, test_case_factory, engine: Engine
+    ):
+        """Test that replace keeps surviving associations and only moves them."""
+        # Arrange
+        suite_id = suite_factory()
+        tc1, tc2, tc3 = (test_case_factory() for _ in range(3))
+        tc1_assoc, tc2_assoc = bulk_add_test_cases_to_suite(suite_id, [tc1, tc2], engine)
+
+        # Act
+        result = replace_suite_test_cases(suite_id, [tc2, tc3], engine)
+
+        # Assert
+        assert result["removed"] == [tc1_assoc]
+        assert result["reordered"] == [tc2_assoc]
+        assert len(result["added"]) == 1
+
+        with session(engine) as db_session:
+            ordered_ids = query_test_cases_for_suite(suite_id, db_session, engine)
+
+        assert ordered_ids == [tc2, tc3]
+
+    def test_replace_rejects_duplicate_test_cases(
+        self, suite_factory, test_case_factory, engine: Engine
+    ):
+        """Test that a test case cannot appear twice in a suite."""
+        suite_id = suite_factory()
+        tc1 = test_case_factory()
+
+        with pytest.raises(ValueError, match="Duplicate"):
+            replace_suite_test_cases(suite_id, [tc1, tc1], engine)
+
 
 class TestPlanSuiteAssociations:
     """Test plan-suite relationship management."""
@@ -222,9 +276,9 @@ class TestPlanSuiteAssociations:
         suite2 = suite_factory(account_id=account_id, name="Suite 2")
         suite3 = suite_factory(account_id=account_id, name="Suite 3")
 
-        add_suite_to_plan(plan_id, suite1, 0, engine)
-        add_suite_to_plan(plan_id, suite2, 1, engine)
-        add_suite_to_plan(plan_id, suite3, 2, engine)
+        add_suite_to_plan(plan_id, suite1, engine, execution_order=0)
+        add_suite_to_plan(plan_id, suite2, engine, execution_order=1)
+        add_suite_to_plan(plan_id, suite3, engine, execution_order=2)
 
         # Act - Reverse order
         new_order = [suite3, suite2, suite1]
@@ -263,6 +317,111 @@ class TestPlanSuiteAssociations:
 
         assert len(plan_with_suites.suites) == 4
 
+    def test_bulk_add_reactivates_removed_suite(
+        self, plan_factory, suite_factory, engine: Engine
+    ):
+        """Test that re-adding a removed suite reuses its association row."""
+        # Arrange
+        plan_id = plan_factory()
+        suite_id = suite_factory()
+        (assoc_id,) = bulk_add_suites_to_plan(plan_id, [suite_id], engine)
+        replace_plan_suites(plan_id, [], engine, soft_delete_old=True)
+
+        # Act
+        readded = bulk_add_suites_to_plan(plan_id, [suite_id], engine)
+
+        # Assert
+        assert readded == [assoc_id]
+
+        with session(engine) as db_session:
+            assert query_suites_for_plan(plan_id, db_session, engine) == [suite_id]
+
+
+class TestGapOrdering:
+    """Test gap-based execution_order keys for positional inserts and moves."""
+
+    def test_order_key_between(self):
+        """Test key selection between neighbours and at the ends."""
+        assert order_key_between(None, None) == ORDER_GAP
+        assert order_key_between(ORDER_GAP, None) == 2 * ORDER_GAP
+        assert order_key_between(None, ORDER_GAP) == (ORDER_GAP - 1) // 2
+        assert order_key_between(0, 10) == 5
+        assert order_key_between(4, 5) is None
+
+    def test_add_test_case_at_position(
+        self, suite_factory, test_case_factory, engine: Engine
+    ):
+        """Test inserting in the middle places the test case between neighbours."""
+        suite_id = suite_factory()
+        tc1, tc2, tc3 = (test_case_factory() for _ in range(3))
+        bulk_add_test_cases_to_suite(suite_id, [tc1, tc2], engine)
+
+        add_test_case_to_suite(suite_id, tc3, engine, position=1)
+
+        with session(engine) as db_session:
+            ordered_ids = query_test_cases_for_suite(suite_id, db_session, engine)
+
+        assert ordered_ids == [tc1, tc3, tc2]
+
+    def test_add_rejects_order_key_with_position(
+        self, plan_factory, suite_factory, engine: Engine
+    ):
+        """Test a raw key and a position cannot both be given."""
+        plan_id = plan_factory()
+        suite_id = suite_factory()
+
+        with pytest.raises(ValueError):
+            add_suite_to_plan(plan_id, suite_id, engine, execution_order=0, position=0)
+
+    def test_insert_rebalances_when_gap_exhausted(
+        self, suite_factory, test_case_factory, engine: Engine
+    ):
+        """Test adjacent keys trigger a rebalance instead of a collision."""
+        suite_id = suite_factory()
+        tc1, tc2, tc3 = (test_case_factory() for _ in range(3))
+        add_test_case_to_suite(suite_id, tc1, engine, execution_order=0)
+        add_test_case_to_suite(suite_id, tc2, engine, execution_order=1)
+
+        add_test_case_to_suite(suite_id, tc3, engine, position=1)
+
+        with session(engine) as db_session:
+            suite_with_tests = query_suite_with_test_cases(suite_id, db_session, engine)
+
+        orders = [tc["execution_order"] for tc in suite_with_tests.test_cases]
+        assert [tc["test_case_id"] for tc in suite_with_tests.test_cases] == [
+            tc1,
+            tc3,
+            tc2,
+        ]
+        assert len(set(orders)) == 3
+
+    def test_move_suite_touches_only_moved_row(
+        self, plan_factory, suite_factory, engine: Engine
+    ):
+        """Test moving a suite leaves every other execution_order unchanged."""
+        plan_id = plan_factory()
+        suite_ids = [suite_factory() for _ in range(3)]
+        bulk_add_suites_to_plan(plan_id, suite_ids, engine)
+
+        with session(engine) as db_session:
+            before = {
+                suite["suite_id"]: suite["execution_order"]
+                for suite in query_plan_with_suites(plan_id, db_session, engine).suites
+            }
+
+        assert move_suite_in_plan(plan_id, suite_ids[2], 0, engine)
+
+        with session(engine) as db_session:
+            after = query_plan_with_suites(plan_id, db_session, engine).suites
+
+        assert [suite["suite_id"] for suite in after] == [
+            suite_ids[2],
+            suite_ids[0],
+            suite_ids[1],
+        ]
+        for suite in after[1:]:
+            assert suite["execution_order"] == before[suite["suite_id"]]
+
 
 class TestCompositeQueries:
     """Test composite queries that join across associations."""
@@ -294,8 +453,8 @@ class TestCompositeQueries:
             test_type="performance",
         )
 
-        add_test_case_to_suite(suite_id, tc1, 0, engine)
-        add_test_case_to_suite(suite_id, tc2, 1, engine)
+        add_test_case_to_suite(suite_id, tc1, engine, execution_order=0)
+        add_test_case_to_suite(suite_id, tc2, engine, execution_order=1)
 
         # Act
         with session(engine) as db_session:
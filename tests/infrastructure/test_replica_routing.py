@@ -0,0 +1,115 @@
+"""
+Tests for read-replica routing of read_only sessions.
+
+The "replica" is a second engine pointing at the test database.
+
+Tests cover:
+- Healthy replicas serve reads; unreachable or lagging ones fall back to primary
+- Read-your-writes pinning after a committed write
+- RoutingSession sending writes to the primary
+"""
+
+import time
+
+import pytest
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.engine import Engine
+
+from common.service_connections.db_service.database.engine import (
+    get_database_session as session,
+)
+from common.service_connections.db_service.database.replica_routing import (
+    ReplicaRouter,
+    RoutingSession,
+    bind_read_your_writes_key,
+    reset_read_your_writes_key,
+    set_replica_router,
+)
+from common.service_connections.db_service.database.tables.entity_tag import (
+    EntityTagTable,
+)
+
+
+@pytest.fixture
+def replica_engine(engine: Engine):
+    replica = create_engine(engine.url.render_as_string(hide_password=False))
+    yield replica
+    replica.dispose()
+
+
+@pytest.fixture
+def client_key():
+    token = bind_read_your_writes_key("client-a")
+    yield "client-a"
+    reset_read_your_writes_key(token)
+
+
+class TestReplicaRouter:
+    """Test replica selection, health checks and pinning."""
+
+    def test_reads_use_healthy_replica(self, engine: Engine, replica_engine):
+        """Test a reachable, caught-up replica is chosen for reads."""
+        router = ReplicaRouter([replica_engine])
+        assert router.read_engine(engine) is replica_engine
+
+    def test_unreachable_or_lagging_replica_falls_back(
+        self, engine: Engine, replica_engine
+    ):
+        """Test reads go to the primary when no replica qualifies."""
+        unreachable = create_engine("postgresql+psycopg2://user:pw@127.0.0.1:1/none")
+        assert ReplicaRouter([unreachable]).read_engine(engine) is engine
+
+        lagging = ReplicaRouter([replica_engine], max_lag_seconds=-1)
+        assert lagging.read_engine(engine) is engine
+
+    def test_pin_expires(self, engine: Engine, replica_engine, client_key):
+        """Test a pinned key reads from the primary until the window passes."""
+        router = ReplicaRouter([replica_engine], read_your_writes_seconds=0.2)
+        router.pin(client_key)
+        assert router.read_engine(engine) is engine
+
+        time.sleep(0.3)
+        assert router.read_engine(engine) is replica_engine
+
+
+class TestRoutingSession:
+    """Test read_only sessions route reads and writes."""
+
+    @pytest.fixture
+    def router(self, replica_engine):
+        router = ReplicaRouter([replica_engine])
+        set_replica_router(router)
+        yield router
+        set_replica_router(None)
+
+    def test_read_only_session_routes_reads_and_writes(
+        self, engine: Engine, replica_engine, router
+    ):
+        """Test SELECTs use the replica and DML uses the primary."""
+        with session(engine, read_only=True) as db_session:
+            assert isinstance(db_session, RoutingSession)
+            assert db_session.get_bind(clause=select(EntityTagTable)) is replica_engine
+            assert db_session.get_bind(clause=insert(EntityTagTable)) is engine
+            assert (
+                db_session.get_bind(clause=select(EntityTagTable).with_for_update())
+                is engine
+            )
+
+    def test_committed_write_pins_client(
+        self,
+        engine: Engine,
+        router,
+        client_key,
+        entity_tag_factory,
+        suite_factory,
+    ):
+        """Test a write committed under a key pins that key to the primary."""
+        suite_id = suite_factory()
+        tag_id = entity_tag_factory("suite", suite_id, "smoke", "labels")
+
+        with session(engine) as db_session:
+            db_session.get(EntityTagTable, tag_id).tag_value = "pinned"
+
+        assert router.is_pinned(client_key)
+        with session(engine, read_only=True) as db_session:
+            assert not isinstance(db_session, RoutingSession)
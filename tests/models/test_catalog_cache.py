@@ -0,0 +1,150 @@
+"""
+Tests for the per-account catalog list cache.
+
+Tests cover:
+- Memory backend LRU eviction and TTL expiry
+- SQLite backend shared between instances
+- Read-through account lists invalidated by model-layer writes
+- Per-account invalidation and hit ratio
+"""
+
+import time
+
+import pytest
+from sqlalchemy.engine import Engine
+
+from common.service_connections.db_service.database.engine import (
+    get_database_session as session,
+)
+from common.service_connections.db_service.models.catalog_cache import (
+    SUITE,
+    CatalogCache,
+    MemoryCacheBackend,
+    SQLiteCacheBackend,
+)
+from common.service_connections.db_service.models.suite_model import (
+    SuiteModel,
+    deactivate_suite_by_id,
+    query_suites_by_account,
+)
+
+
+def _suites(token, engine):
+    with session(engine) as db_session:
+        return query_suites_by_account(
+            account_id=token.account_id,
+            token=token,
+            session=db_session,
+            engine=engine,
+        )
+
+
+@pytest.fixture
+def memory_cache():
+    CatalogCache.configure(MemoryCacheBackend(), ttl_seconds=300)
+    yield CatalogCache
+    CatalogCache.configure(None)
+
+
+class TestCacheBackends:
+    """Test backend storage, expiry and generations."""
+
+    def test_memory_backend_evicts_lru_and_expires(self):
+        """Test the least recently used entry is evicted and TTL is honoured."""
+        backend = MemoryCacheBackend(max_entries=2)
+        backend.set("a", [1], 300)
+        backend.set("b", [2], 300)
+        backend.get("a")
+        backend.set("c", [3], 300)
+
+        assert backend.get("a") == [1]
+        assert backend.get("b") is None
+        assert backend.get("c") == [3]
+
+        backend.set("d", [4], 0.05)
+        time.sleep(0.1)
+        assert backend.get("d") is None
+
+    def test_sqlite_backend_is_shared(self, tmp_path):
+        """Test entries and generations are visible to another instance."""
+        path = str(tmp_path / "catalog.sqlite3")
+        writer = SQLiteCacheBackend(path)
+        reader = SQLiteCacheBackend(path)
+
+        writer.set("key", b"[]", 300)
+        writer.bump_generation(f"{SUITE}:account")
+
+        assert reader.get("key") == b"[]"
+        assert reader.generation(f"{SUITE}:account") == 1
+        assert reader.get("missing") is None
+
+
+class TestCatalogCache:
+    """Test read-through account lists and invalidation hooks."""
+
+    def test_list_cached_until_write(
+        self,
+        memory_cache,
+        suite_factory,
+        account_factory,
+        auth_user_factory,
+        member_token,
+        engine: Engine,
+    ):
+        """Test a second read is a hit and a model-layer write invalidates it."""
+        account_id = account_factory()
+        user_id = auth_user_factory()
+        suite_id = suite_factory(account_id=account_id)
+
+        first = _suites(member_token(account_id), engine)
+        second = _suites(member_token(account_id), engine)
+        assert [s.suite_id for s in second] == [s.suite_id for s in first]
+        assert (memory_cache.hits, memory_cache.misses) == (1, 1)
+        assert memory_cache.hit_ratio() == 0.5
+
+        deactivate_suite_by_id(suite_id, user_id, session=session, engine=engine)
+        assert suite_id not in {
+            s.suite_id for s in _suites(member_token(account_id), engine)
+        }
+        assert memory_cache.misses == 2
+
+    def test_invalidation_is_per_account(
+        self,
+        memory_cache,
+        suite_factory,
+        account_factory,
+        auth_user_factory,
+        member_token,
+        engine: Engine,
+    ):
+        """Test a write in one account leaves other accounts cached."""
+        account_a, account_b = account_factory(), account_factory()
+        user_id = auth_user_factory()
+        suite_a = suite_factory(account_id=account_a)
+        suite_factory(account_id=account_b)
+        _suites(member_token(account_a), engine)
+        _suites(member_token(account_b), engine)
+
+        deactivate_suite_by_id(suite_a, user_id, session=session, engine=engine)
+        _suites(member_token(account_a), engine)
+        _suites(member_token(account_b), engine)
+
+        assert (memory_cache.hits, memory_cache.misses) == (1, 3)
+
+    def test_sqlite_backend_round_trips_models(
+        self, suite_factory, account_factory, member_token, engine: Engine, tmp_path
+    ):
+        """Test lists cached as JSON come back as equal models."""
+        CatalogCache.configure(SQLiteCacheBackend(str(tmp_path / "catalog.sqlite3")))
+        try:
+            account_id = account_factory()
+            suite_factory(account_id=account_id)
+
+            loaded = _suites(member_token(account_id), engine)
+            cached = _suites(member_token(account_id), engine)
+
+            assert CatalogCache.hits == 1
+            assert all(isinstance(suite, SuiteModel) for suite in cached)
+            assert cached == loaded
+        finally:
+            CatalogCache.configure(None)
@@ -4,12 +4,17 @@ Tests for EntityTag model with polymorphic queries and RLS context manager.
 Tests cover:
 - Polymorphic tagging (tags on different entity types)
 - Tag queries by entity, category, name
-- AccountRLSContext thread safety and stack limits
-- Bulk tag operations
+- AccountRLSContext thread/task isolation, SET LOCAL scoping and stack limits
+- Bulk tag operations, including upsert-based multi-entity tagging
+- Boolean tag expression parsing and search with facets
 """
 
+import asyncio
 import threading
+
 import pytest
+from fastapi import HTTPException
+from sqlalchemy import func, select
 from sqlalchemy.engine import Engine
 
 from common.service_connections.db_service.database.engine import (
@@ -17,14 +22,22 @@ from common.service_connections.db_service.database.engine import (
 )
 from common.service_connections.db_service.models.entity_tag_model import (
     AccountRLSContext,
+    current_rls_account_id,
     query_entity_tag_by_id,
     query_tags_for_entity,
     query_entities_by_tag,
     query_tags_by_category,
     query_unique_tag_names,
     add_tags_to_entity,
+    bulk_tag_entities,
     replace_entity_tags,
     deactivate_entity_tag,
+    TagAnd,
+    TagNot,
+    TagOr,
+    TagTerm,
+    parse_tag_expression,
+    search_entities_by_tags,
 )
 
 
@@ -316,6 +329,228 @@ class TestBulkTagOperations:
         active_names = {tag.tag_name for tag in active_tags}
         assert active_names == {"new1", "new2", "new3"}
 
+    def test_bulk_tag_many_entities_reactivates_and_replaces(
+        self,
+        entity_tag_factory,
+        test_case_factory,
+        account_factory,
+        auth_user_factory,
+        member_token,
+        engine: Engine,
+    ):
+        """Test bulk tagging upserts, reactivates soft-deleted tags and replaces."""
+        # Arrange
+        user_id = auth_user_factory()
+        account_id = account_factory(owner_user_id=user_id)
+        test_case_ids = [test_case_factory(account_id=account_id) for _ in range(3)]
+        stale_id = entity_tag_factory(
+            entity_type="test_case",
+            entity_id=test_case_ids[0],
+            tag_name="stale",
+            tag_category="labels",
+            account_id=account_id,
+        )
+        deleted_id = entity_tag_factory(
+            entity_type="test_case",
+            entity_id=test_case_ids[1],
+            tag_name="smoke",
+            tag_category="labels",
+            account_id=account_id,
+        )
+        deactivate_entity_tag(
+            tag_id=deleted_id, deactivated_by_user_id=user_id, engine=engine
+        )
+
+        # Act
+        result = bulk_tag_entities(
+            entities=[("test_case", test_case_id) for test_case_id in test_case_ids],
+            tag_names=["smoke", "nightly"],
+            tag_category="labels",
+            account_id=account_id,
+            created_by_user_id=user_id,
+            engine=engine,
+            replace=True,
+        )
+        repeat = bulk_tag_entities(
+            entities=[("test_case", test_case_ids[0])],
+            tag_names=["smoke"],
+            tag_category="labels",
+            account_id=account_id,
+            created_by_user_id=user_id,
+            engine=engine,
+        )
+
+        # Assert
+        assert len(result.created) == 5
+        assert result.updated == [deleted_id]
+        assert result.deactivated == [stale_id]
+        assert repeat.created == repeat.updated == repeat.deactivated == []
+
+        with session(engine) as db_session:
+            for test_case_id in test_case_ids:
+                tags = query_tags_for_entity(
+                    entity_type="test_case",
+                    entity_id=test_case_id,
+                    account_id=account_id,
+                    token=member_token(account_id),
+                    db_session=db_session,
+                    engine=engine,
+                    active_only=True,
+                )
+                assert {tag.tag_name for tag in tags} == {"smoke", "nightly"}
+            assert query_entity_tag_by_id(deleted_id, db_session, engine).is_active
+
+    def test_bulk_tag_rejects_invalid_entity_type(
+        self, account_factory, auth_user_factory, engine: Engine
+    ):
+        """Test validation runs before anything is written."""
+        user_id = auth_user_factory()
+        account_id = account_factory(owner_user_id=user_id)
+
+        with pytest.raises(ValueError):
+            bulk_tag_entities(
+                entities=[("not_a_type", "entity-1")],
+                tag_names=["smoke"],
+                tag_category="labels",
+                account_id=account_id,
+                created_by_user_id=user_id,
+                engine=engine,
+            )
+
+
+class TestTagExpressionParsing:
+    """Test parsing of boolean tag expressions."""
+
+    def test_precedence_and_grouping(self):
+        """Test NOT binds tighter than AND, which binds tighter than OR."""
+        assert parse_tag_expression("smoke AND (login OR checkout) AND NOT flaky") == (
+            TagAnd(
+                (
+                    TagTerm("smoke"),
+                    TagOr((TagTerm("login"), TagTerm("checkout"))),
+                    TagNot(TagTerm("flaky")),
+                )
+            )
+        )
+        assert parse_tag_expression("a or b and c") == TagOr(
+            (TagTerm("a"), TagAnd((TagTerm("b"), TagTerm("c"))))
+        )
+
+    def test_implicit_and_and_shorthand_negation(self):
+        """Test adjacent terms are ANDed and -tag means NOT tag."""
+        assert parse_tag_expression('smoke -flaky "release 2"') == TagAnd(
+            (TagTerm("smoke"), TagNot(TagTerm("flaky")), TagTerm("release 2"))
+        )
+
+    @pytest.mark.parametrize("expression", ["", "smoke AND", "(smoke", "smoke)", "AND"])
+    def test_malformed_expressions_rejected(self, expression):
+        """Test malformed expressions raise ValueError."""
+        with pytest.raises(ValueError):
+            parse_tag_expression(expression)
+
+
+class TestTagExpressionSearch:
+    """Test entity search by boolean tag expression."""
+
+    def test_search_with_and_or_not_and_facets(
+        self,
+        entity_tag_factory,
+        test_case_factory,
+        account_factory,
+        member_token,
+        engine: Engine,
+    ):
+        """Test AND/OR/NOT matching and facet counts over the matches."""
+        # Arrange
+        account_id = account_factory()
+        login = test_case_factory(account_id=account_id)
+        checkout = test_case_factory(account_id=account_id)
+        flaky_login = test_case_factory(account_id=account_id)
+        for test_case_id, tags in (
+            (login, ["smoke", "login"]),
+            (checkout, ["smoke", "checkout", "payments"]),
+            (flaky_login, ["smoke", "login", "flaky"]),
+        ):
+            for tag_name in tags:
+                entity_tag_factory(
+                    entity_type="test_case",
+                    entity_id=test_case_id,
+                    tag_name=tag_name,
+                    tag_category="feature",
+                    account_id=account_id,
+                )
+
+        # Act
+        with session(engine) as db_session:
+            result = search_entities_by_tags(
+                expression="smoke AND (login OR checkout) AND NOT flaky",
+                entity_type="test_case",
+                account_id=account_id,
+                token=member_token(account_id),
+                db_session=db_session,
+                engine=engine,
+            )
+
+        # Assert
+        assert sorted(result.entity_ids) == sorted([login, checkout])
+        assert result.total == 2
+        facets = {facet.tag_name: facet.count for facet in result.facets}
+        assert facets == {"smoke": 2, "login": 1, "checkout": 1, "payments": 1}
+
+    def test_search_pagination_keeps_total(
+        self,
+        entity_tag_factory,
+        suite_factory,
+        account_factory,
+        member_token,
+        engine: Engine,
+    ):
+        """Test limit/offset page the IDs while total counts every match."""
+        # Arrange
+        account_id = account_factory()
+        for _ in range(3):
+            entity_tag_factory(
+                entity_type="suite",
+                entity_id=suite_factory(account_id=account_id),
+                tag_name="regression",
+                tag_category="type",
+                account_id=account_id,
+            )
+
+        # Act
+        with session(engine) as db_session:
+            result = search_entities_by_tags(
+                expression="regression",
+                entity_type="suite",
+                account_id=account_id,
+                token=member_token(account_id),
+                db_session=db_session,
+                engine=engine,
+                limit=2,
+                offset=2,
+            )
+
+        # Assert
+        assert len(result.entity_ids) == 1
+        assert result.total == 3
+
+    def test_search_rejects_other_account(
+        self, account_factory, member_token, engine: Engine
+    ):
+        """Test searching another account's tags is forbidden."""
+        account_id = account_factory()
+        with session(engine) as db_session:
+            with pytest.raises(HTTPException) as exc_info:
+                search_entities_by_tags(
+                    expression="smoke",
+                    entity_type="suite",
+                    account_id=account_id,
+                    token=member_token("other-account"),
+                    db_session=db_session,
+                    engine=engine,
+                )
+        assert exc_info.value.status_code == 403
+
 
 class TestAccountRLSContext:
     """Test AccountRLSContext for row-level security."""
@@ -376,7 +611,7 @@ class TestAccountRLSContext:
             try:
                 with session(engine) as db_session:
                     with AccountRLSContext(db_session, account_id=account_id):
-                        # Each thread should have independent stack
+                        # Each thread has its own context stack
                         results[thread_id] = "success"
             except Exception as e:
                 results[thread_id] = f"error: {e}"
@@ -395,6 +630,47 @@ class TestAccountRLSContext:
         # Assert - All threads should succeed independently
         assert all(v == "success" for v in results.values())
 
+    def test_rls_context_set_local_per_transaction(self, engine: Engine):
+        """Test the account is applied per transaction and restored on exit."""
+
+        def current_setting(db_session):
+            return db_session.execute(
+                select(func.current_setting("app.current_account_id", True))
+            ).scalar()
+
+        with session(engine) as db_session:
+            with AccountRLSContext(db_session, account_id="account-a"):
+                # Applied by after_begin when the first statement opens a transaction
+                assert current_setting(db_session) == "account-a"
+                with AccountRLSContext(db_session, account_id="account-b"):
+                    assert current_setting(db_session) == "account-b"
+                assert current_setting(db_session) == "account-a"
+
+                # SET LOCAL ends with the transaction; the next one re-applies it
+                db_session.commit()
+                assert current_setting(db_session) == "account-a"
+
+            assert current_setting(db_session) in (None, "")
+            db_session.commit()
+            assert current_setting(db_session) in (None, "")
+
+    def test_rls_context_isolated_per_asyncio_task(self, engine: Engine):
+        """Test concurrent asyncio tasks each see their own account."""
+
+        async def scoped(db_session, account_id):
+            with AccountRLSContext(db_session, account_id=account_id):
+                await asyncio.sleep(0)
+                return current_rls_account_id()
+
+        async def run_tasks(db_session):
+            return await asyncio.gather(
+                scoped(db_session, "account-1"), scoped(db_session, "account-2")
+            )
+
+        with session(engine) as db_session:
+            assert asyncio.run(run_tasks(db_session)) == ["account-1", "account-2"]
+        assert current_rls_account_id() is None
+
 
 class TestTagSoftDelete:
     """Test soft delete operations for tags."""
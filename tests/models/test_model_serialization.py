@@ -0,0 +1,71 @@
+"""
+Tests for the shared row-to-model serialization path.
+
+Tests cover:
+- Column projection limited to declared model fields
+- model_construct results matching validated models
+- JSON list responses
+"""
+
+import json
+
+from sqlalchemy.engine import Engine
+
+from app.responses import model_list_response
+from common.service_connections.db_service.database.engine import (
+    get_database_session as session,
+)
+from common.service_connections.db_service.database.tables.test_case import (
+    TestCaseTable,
+)
+from common.service_connections.db_service.models.model_serialization import (
+    construct_models,
+    model_columns,
+    select_model_columns,
+    validate_model,
+)
+from common.service_connections.db_service.models.test_case_model import (
+    TestCaseModel,
+)
+
+
+class TestModelSerialization:
+    """Test projected reads and fast list responses."""
+
+    def test_projection_uses_model_fields(self):
+        """Test only columns declared on the model are selected."""
+        columns = model_columns(TestCaseModel, TestCaseTable)
+        table_columns = TestCaseTable.__table__.c
+        assert [column.name for column in columns] == [
+            name for name in TestCaseModel.model_fields if name in table_columns
+        ]
+
+    def test_constructed_models_match_validated(
+        self, test_case_factory, account_factory, engine: Engine
+    ):
+        """Test constructed rows equal from_attributes validation."""
+        account_id = account_factory()
+        test_case_ids = {test_case_factory(account_id=account_id) for _ in range(3)}
+
+        with session(engine) as db_session:
+            constructed = construct_models(
+                TestCaseModel,
+                db_session.execute(
+                    select_model_columns(TestCaseModel, TestCaseTable).where(
+                        TestCaseTable.account_id == account_id
+                    )
+                ),
+            )
+            validated = {
+                tc.test_case_id: validate_model(TestCaseModel, tc)
+                for tc in db_session.query(TestCaseTable).filter(
+                    TestCaseTable.account_id == account_id
+                )
+            }
+
+        assert {tc.test_case_id for tc in constructed} == test_case_ids
+        for test_case in constructed:
+            assert test_case == validated[test_case.test_case_id]
+
+        body = json.loads(model_list_response(TestCaseModel, constructed).body)
+        assert {item["test_case_id"] for item in body} == test_case_ids
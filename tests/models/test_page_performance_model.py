@@ -0,0 +1,141 @@
+"""
+Tests for browser performance samples and their trend/regression queries.
+
+Tests cover:
+- Inserting and querying samples per page
+- p50/p95 aggregation per time bucket
+- Regression detection against the baseline window
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy.engine import Engine
+
+from common.service_connections.db_service.database.engine import (
+    get_database_session as session,
+)
+from common.service_connections.db_service.models.user_interface_models.page_performance_model import (
+    PagePerformanceMetricModel,
+    insert_page_performance_metric,
+    query_page_performance_metrics,
+    query_page_performance_regressions,
+    query_page_performance_trend,
+)
+
+
+def _insert_samples(page_id, load_times, collected_at, engine):
+    for load_event_ms in load_times:
+        insert_page_performance_metric(
+            PagePerformanceMetricModel(
+                page_id=page_id,
+                url="https://example.com/perf",
+                load_event_ms=load_event_ms,
+                collected_at=collected_at,
+            ),
+            engine=engine,
+        )
+
+
+class TestPagePerformanceQueries:
+    """Test sample storage and aggregation."""
+
+    def test_insert_and_query_metrics(self, page_factory, engine: Engine):
+        """Test an inserted sample is returned for its page."""
+        page_id = page_factory()
+
+        metric_id = insert_page_performance_metric(
+            PagePerformanceMetricModel(
+                page_id=page_id,
+                url="https://example.com/perf",
+                browser="chrome",
+                load_event_ms=420.0,
+                slowest_resources=[{"name": "app.js", "duration_ms": 120.0}],
+            ),
+            engine=engine,
+        )
+
+        with session(engine) as db_session:
+            metrics = query_page_performance_metrics(
+                page_id, session=db_session, engine=engine
+            )
+
+        assert [m.metric_id for m in metrics] == [metric_id]
+        assert metrics[0].load_event_ms == 420.0
+        assert metrics[0].collected_at is not None
+        assert metrics[0].slowest_resources[0]["name"] == "app.js"
+
+    def test_trend_aggregates_per_bucket(self, page_factory, engine: Engine):
+        """Test samples in one day collapse into a single p50/p95 bucket."""
+        page_id = page_factory()
+        collected_at = datetime.now(timezone.utc).replace(
+            hour=12, minute=0, second=0, microsecond=0
+        ) - timedelta(days=1)
+        _insert_samples(page_id, [100.0, 200.0, 300.0], collected_at, engine)
+
+        with session(engine) as db_session:
+            trend = query_page_performance_trend(
+                page_id, session=db_session, engine=engine, bucket="day"
+            )
+
+        assert len(trend) == 1
+        assert trend[0].samples == 3
+        assert trend[0].load_event_ms_p50 == 200.0
+        assert 280.0 <= trend[0].load_event_ms_p95 <= 300.0
+        assert trend[0].time_to_first_byte_ms_p50 is None
+
+    def test_trend_rejects_unknown_bucket(self, engine: Engine):
+        """Test an unsupported bucket raises ValueError."""
+        with session(engine) as db_session:
+            with pytest.raises(ValueError):
+                query_page_performance_trend(
+                    1, session=db_session, engine=engine, bucket="minute"
+                )
+
+
+class TestPagePerformanceRegressions:
+    """Test recent vs. baseline median comparison."""
+
+    def test_reports_slower_recent_median(self, page_factory, engine: Engine):
+        """Test only the page whose recent median exceeds the threshold is reported."""
+        slower_page, stable_page = page_factory(), page_factory()
+        now = datetime.now(timezone.utc)
+        for page_id, recent_ms in ((slower_page, 200.0), (stable_page, 105.0)):
+            _insert_samples(
+                page_id, [100.0, 100.0, 100.0], now - timedelta(days=3), engine
+            )
+            _insert_samples(page_id, [recent_ms] * 3, now - timedelta(hours=1), engine)
+
+        with session(engine) as db_session:
+            regressions = query_page_performance_regressions(
+                session=db_session, engine=engine
+            )
+
+        ours = [r for r in regressions if r.page_id in (slower_page, stable_page)]
+        assert [r.page_id for r in ours] == [slower_page]
+        assert ours[0].metric == "load_event_ms"
+        assert (ours[0].baseline_p50, ours[0].recent_p50) == (100.0, 200.0)
+        assert ours[0].ratio == 2.0
+        assert ours[0].recent_samples == 3
+
+    def test_requires_min_samples(self, page_factory, engine: Engine):
+        """Test a page with too few recent samples is not reported."""
+        page_id = page_factory()
+        now = datetime.now(timezone.utc)
+        _insert_samples(page_id, [100.0] * 3, now - timedelta(days=3), engine)
+        _insert_samples(page_id, [500.0], now - timedelta(hours=1), engine)
+
+        with session(engine) as db_session:
+            regressions = query_page_performance_regressions(
+                session=db_session, engine=engine
+            )
+
+        assert page_id not in {r.page_id for r in regressions}
+
+    def test_rejects_untrended_metric(self, engine: Engine):
+        """Test an unknown metric raises ValueError."""
+        with session(engine) as db_session:
+            with pytest.raises(ValueError):
+                query_page_performance_regressions(
+                    session=db_session, engine=engine, metric="resource_count"
+                )
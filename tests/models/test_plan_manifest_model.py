@@ -0,0 +1,197 @@
+"""
+Tests for the plan execution manifest.
+
+Tests cover:
+- Suites and test cases resolved in execution order with tags
+- Missing plans
+- Version stamp changes on association updates
+- Version stamp changes on system under test updates
+- Version-stamped manifest cache hits and rebuilds
+- Account access validation before the cache lookup
+"""
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.engine import Engine
+
+from common.service_connections.db_service.database.engine import (
+    get_database_session as session,
+)
+from common.service_connections.db_service.database.tables.suite_test_case_association import (
+    SuiteTestCaseAssociation,
+)
+from common.service_connections.db_service.database.tables.system_under_test import (
+    SystemUnderTestTable,
+)
+from common.service_connections.db_service.models.plan_manifest_model import (
+    PlanManifestCache,
+    get_plan_manifest,
+    query_plan_manifest,
+    query_plan_manifest_version,
+)
+
+
+class TestPlanManifest:
+    """Test single-query plan manifest resolution."""
+
+    def test_manifest_orders_suites_and_test_cases(
+        self,
+        plan_factory,
+        suite_factory,
+        test_case_factory,
+        plan_suite_association_factory,
+        suite_test_case_association_factory,
+        entity_tag_factory,
+        engine: Engine,
+    ):
+        """Test suites and test cases follow execution_order and carry tags."""
+        plan_id = plan_factory()
+        first_suite = suite_factory()
+        second_suite = suite_factory()
+        plan_suite_association_factory(plan_id, second_suite, execution_order=1)
+        plan_suite_association_factory(plan_id, first_suite, execution_order=0)
+
+        login = test_case_factory()
+        checkout = test_case_factory()
+        suite_test_case_association_factory(first_suite, checkout, execution_order=1)
+        suite_test_case_association_factory(first_suite, login, execution_order=0)
+        entity_tag_factory("test_case", login, "smoke", "priority")
+
+        with session(engine) as db_session:
+            manifest = query_plan_manifest(plan_id, db_session=db_session, engine=engine)
+
+        assert [suite.suite_id for suite in manifest.suites] == [
+            first_suite,
+            second_suite,
+        ]
+        assert [tc.test_case_id for tc in manifest.suites[0].test_cases] == [
+            login,
+            checkout,
+        ]
+        assert manifest.suites[0].test_cases[0].tags == ["smoke"]
+        assert manifest.suites[1].test_cases == []
+        assert manifest.test_case_count == 2
+        assert manifest.version
+
+    def test_manifest_missing_plan(self, engine: Engine):
+        """Test a nonexistent plan yields no manifest or version."""
+        with session(engine) as db_session:
+            assert query_plan_manifest("missing", db_session, engine) is None
+            assert query_plan_manifest_version("missing", db_session, engine) is None
+
+    def test_version_changes_on_reorder(
+        self,
+        plan_factory,
+        suite_factory,
+        test_case_factory,
+        plan_suite_association_factory,
+        suite_test_case_association_factory,
+        engine: Engine,
+    ):
+        """Test updating an association produces a new version stamp."""
+        plan_id = plan_factory()
+        suite_id = suite_factory()
+        plan_suite_association_factory(plan_id, suite_id)
+        association_id = suite_test_case_association_factory(
+            suite_id, test_case_factory()
+        )
+
+        with session(engine) as db_session:
+            before = query_plan_manifest_version(plan_id, db_session, engine)
+            association = db_session.get(SuiteTestCaseAssociation, association_id)
+            association.execution_order = 5
+            db_session.commit()
+            after = query_plan_manifest_version(plan_id, db_session, engine)
+
+        assert before != after
+
+    def test_version_changes_on_system_under_test_update(
+        self,
+        plan_factory,
+        suite_factory,
+        test_case_factory,
+        system_under_test_factory,
+        plan_suite_association_factory,
+        suite_test_case_association_factory,
+        engine: Engine,
+    ):
+        """Test renaming a test case's system under test produces a new stamp."""
+        plan_id = plan_factory()
+        suite_id = suite_factory()
+        plan_suite_association_factory(plan_id, suite_id)
+        sut_id = system_under_test_factory()
+        suite_test_case_association_factory(suite_id, test_case_factory(sut_id=sut_id))
+
+        with session(engine) as db_session:
+            before = query_plan_manifest_version(plan_id, db_session, engine)
+            system = db_session.get(SystemUnderTestTable, sut_id)
+            system.system_name = f"{system.system_name} renamed"
+            db_session.commit()
+            after = query_plan_manifest_version(plan_id, db_session, engine)
+
+        assert before != after
+
+
+class TestPlanManifestCache:
+    """Test the version-stamped manifest cache."""
+
+    def test_cache_hit_until_version_changes(
+        self,
+        account_factory,
+        plan_factory,
+        suite_factory,
+        test_case_factory,
+        plan_suite_association_factory,
+        suite_test_case_association_factory,
+        member_token,
+        engine: Engine,
+    ):
+        """Test unchanged plans are served from cache and changed plans rebuilt."""
+        PlanManifestCache.invalidate()
+        account_id = account_factory()
+        token = member_token(account_id)
+        plan_id = plan_factory(account_id=account_id)
+        suite_id = suite_factory()
+        plan_suite_association_factory(plan_id, suite_id)
+
+        with session(engine) as db_session:
+            first = get_plan_manifest(plan_id, token, db_session, engine)
+            second = get_plan_manifest(plan_id, token, db_session, engine)
+        assert second is first
+
+        suite_test_case_association_factory(suite_id, test_case_factory())
+        with session(engine) as db_session:
+            third = get_plan_manifest(plan_id, token, db_session, engine)
+
+        assert third is not first
+        assert third.version != first.version
+        assert third.test_case_count == 1
+
+    def test_cached_manifest_denied_to_other_account(
+        self,
+        account_factory,
+        plan_factory,
+        member_token,
+        engine: Engine,
+    ):
+        """Test a cached manifest is not served to a member of another account."""
+        PlanManifestCache.invalidate()
+        account_id = account_factory()
+        plan_id = plan_factory(account_id=account_id)
+
+        with session(engine) as db_session:
+            assert get_plan_manifest(plan_id, member_token(account_id), db_session, engine)
+            with pytest.raises(HTTPException) as exc_info:
+                get_plan_manifest(
+                    plan_id, member_token(account_factory()), db_session, engine
+                )
+
+        assert exc_info.value.status_code == 403
+
+    def test_missing_plan_has_no_manifest(self, member_token, engine: Engine):
+        """Test a nonexistent plan yields None rather than an access error."""
+        with session(engine) as db_session:
+            assert (
+                get_plan_manifest("missing", member_token("other"), db_session, engine)
+                is None
+            )
@@ -0,0 +1,93 @@
+"""
+Tests for conditional GET version stamps.
+
+Tests cover:
+- Stamps are stable while the rows are unchanged
+- Late commits with an earlier updated_at still change the stamp
+- Combining versions of several tables
+"""
+
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy.engine import Engine
+
+from common.service_connections.db_service.database.engine import (
+    get_database_session as session,
+)
+from common.service_connections.db_service.database.tables.suite import SuiteTable
+from common.service_connections.db_service.models.resource_version_model import (
+    combine_resource_versions,
+    query_resource_version,
+)
+
+
+def _version(account_id, engine):
+    with session(engine) as db_session:
+        return query_resource_version(
+            db_session, SuiteTable, SuiteTable.account_id == account_id
+        )
+
+
+class TestResourceVersion:
+    """Test version stamps of catalog rows."""
+
+    def test_stable_until_write(self, suite_factory, account_factory, engine: Engine):
+        """Test the stamp only changes when a row changes."""
+        account_id = account_factory()
+        suite_factory(account_id=account_id)
+
+        first = _version(account_id, engine)
+        assert _version(account_id, engine) == first
+        assert first.row_count == 1
+
+        suite_factory(account_id=account_id)
+        assert _version(account_id, engine).etag != first.etag
+
+    def test_late_commit_with_older_timestamp_changes_stamp(
+        self, suite_factory, account_factory, engine: Engine
+    ):
+        """Test an update whose updated_at is older than the newest row is seen."""
+        account_id = account_factory()
+        older = suite_factory(account_id=account_id)
+        suite_factory(account_id=account_id)
+        now = datetime.now(timezone.utc)
+        with session(engine) as db_session:
+            db_session.get(SuiteTable, older).updated_at = now - timedelta(days=2)
+            db_session.commit()
+            newest = db_session.query(SuiteTable).filter(
+                SuiteTable.account_id == account_id, SuiteTable.suite_id != older
+            )
+            newest.one().updated_at = now
+            db_session.commit()
+        before = _version(account_id, engine)
+
+        # Flushed before the newest row but committed after it
+        with session(engine) as db_session:
+            suite = db_session.get(SuiteTable, older)
+            suite.suite_name = f"{suite.suite_name} (renamed)"
+            suite.updated_at = now - timedelta(days=1)
+            db_session.commit()
+        after = _version(account_id, engine)
+
+        assert (after.row_count, after.last_modified) == (
+            before.row_count,
+            before.last_modified,
+        )
+        assert after.etag != before.etag
+
+    def test_combine_resource_versions(
+        self, suite_factory, account_factory, engine: Engine
+    ):
+        """Test a combined version sums rows and keeps the latest change."""
+        account_a, account_b = account_factory(), account_factory()
+        suite_factory(account_id=account_a)
+        suite_factory(account_id=account_b)
+        version_a, version_b = _version(account_a, engine), _version(account_b, engine)
+
+        combined = combine_resource_versions(version_a, version_b)
+
+        assert combined.row_count == 2
+        assert combined.last_modified == max(
+            version_a.last_modified, version_b.last_modified
+        )
+        assert combined.etag != version_a.etag
@@ -0,0 +1,73 @@
+"""
+Tests for exact and planner-estimated row counts.
+
+Tests cover:
+- Exact counts by default and below the threshold
+- Planner estimates at or above the threshold
+- Whole-table estimates from pg_class
+"""
+
+from sqlalchemy import select, text
+from sqlalchemy.engine import Engine
+
+from common.service_connections.db_service.database.engine import (
+    get_database_session as session,
+)
+from common.service_connections.db_service.database.tables.suite import SuiteTable
+from common.service_connections.db_service.models.row_count_model import (
+    count_rows,
+    estimate_table_rows,
+)
+
+
+class TestCountRows:
+    """Test counting with opt-in estimates."""
+
+    def test_exact_unless_opted_in(
+        self, suite_factory, account_factory, engine: Engine
+    ):
+        """Test counts are exact by default and when the estimate is small."""
+        account_id = account_factory()
+        for _ in range(3):
+            suite_factory(account_id=account_id)
+        stmt = select(SuiteTable).where(SuiteTable.account_id == account_id)
+
+        with session(engine) as db_session:
+            exact = count_rows(db_session, stmt, threshold=0)
+            small = count_rows(db_session, stmt, approximate=True)
+
+        assert (exact.count, exact.approximate) == (3, False)
+        assert (small.count, small.approximate) == (3, False)
+
+    def test_estimate_at_threshold(
+        self, suite_factory, account_factory, engine: Engine
+    ):
+        """Test a filtered query is estimated with EXPLAIN at the threshold."""
+        account_id = account_factory()
+        suite_factory(account_id=account_id)
+
+        with session(engine) as db_session:
+            result = count_rows(
+                db_session,
+                db_session.query(SuiteTable).filter(
+                    SuiteTable.account_id == account_id
+                ),
+                approximate=True,
+                threshold=0,
+            )
+
+        assert result.approximate is True
+        assert result.count >= 0
+
+    def test_whole_table_uses_reltuples(self, suite_factory, engine: Engine):
+        """Test an unfiltered count is estimated from pg_class after ANALYZE."""
+        suite_factory()
+        with session(engine) as db_session:
+            db_session.execute(text("ANALYZE suite"))
+            estimate = estimate_table_rows(db_session, SuiteTable.__table__)
+            result = count_rows(
+                db_session, select(SuiteTable), approximate=True, threshold=1
+            )
+
+        assert estimate is not None and estimate >= 1
+        assert (result.count, result.approximate) == (estimate, True)
@@ -0,0 +1,112 @@
+"""
+Tests for catalog full-text search.
+
+Tests cover:
+- Ranking name matches above description matches across entity types
+- Partial-name matches and entity type filtering
+- Pagination and account access validation
+"""
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.engine import Engine
+
+from common.service_connections.db_service.database.engine import (
+    get_database_session as session,
+)
+from common.service_connections.db_service.models.search_model import (
+    search_catalog,
+)
+
+
+def _search(query, token, engine, **kwargs):
+    with session(engine) as db_session:
+        return search_catalog(
+            query=query,
+            account_id=token.account_id,
+            token=token,
+            db_session=db_session,
+            engine=engine,
+            **kwargs,
+        )
+
+
+class TestSearchCatalog:
+    """Test ranked, account-scoped catalog search."""
+
+    def test_ranks_across_entity_types(
+        self,
+        test_case_factory,
+        suite_factory,
+        plan_factory,
+        account_factory,
+        member_token,
+        engine: Engine,
+    ):
+        """Test name matches of any entity type outrank description matches."""
+        account_id = account_factory()
+        suite_id = suite_factory(
+            account_id=account_id, description="Covers the checkout flow"
+        )
+        test_case_id = test_case_factory(account_id=account_id, name="Checkout login")
+        plan_id = plan_factory(account_id=account_id, name="Nightly checkout")
+        suite_factory(account_id=account_factory(), name="Checkout elsewhere")
+
+        results = _search("checkout", member_token(account_id), engine)
+
+        assert results.total == 3
+        found = [(item.entity_type, item.entity_id) for item in results.items]
+        assert set(found[:2]) == {("test_case", test_case_id), ("plan", plan_id)}
+        assert found[2] == ("suite", suite_id)
+
+    def test_partial_names_and_entity_filter(
+        self,
+        test_case_factory,
+        suite_factory,
+        account_factory,
+        member_token,
+        engine: Engine,
+    ):
+        """Test unfinished words match names and entity_types narrows results."""
+        account_id = account_factory()
+        test_case_factory(account_id=account_id, name="Registration happy path")
+        suite_id = suite_factory(account_id=account_id, name="Registration regression")
+
+        assert _search("registr", member_token(account_id), engine).total == 2
+        results = _search(
+            "registr", member_token(account_id), engine, entity_types=["suite"]
+        )
+        assert [item.entity_id for item in results.items] == [suite_id]
+
+        with pytest.raises(ValueError):
+            _search("registr", member_token(account_id), engine, entity_types=["page"])
+
+    def test_pagination(
+        self, suite_factory, account_factory, member_token, engine: Engine
+    ):
+        """Test pages are disjoint and total_pages is rounded up."""
+        account_id = account_factory()
+        for index in range(5):
+            suite_factory(account_id=account_id, name=f"Paged suite {index}")
+
+        first = _search("paged", member_token(account_id), engine, page=1, page_size=2)
+        last = _search("paged", member_token(account_id), engine, page=3, page_size=2)
+
+        assert (first.total, first.total_pages) == (5, 3)
+        assert len(first.items) == 2 and len(last.items) == 1
+        assert not {i.entity_id for i in first.items} & {
+            i.entity_id for i in last.items
+        }
+
+    def test_rejects_other_account(self, account_factory, member_token, engine: Engine):
+        """Test a member cannot search another account."""
+        with session(engine) as db_session:
+            with pytest.raises(HTTPException) as exc_info:
+                search_catalog(
+                    query="anything",
+                    account_id=account_factory(),
+                    token=member_token("other-account"),
+                    db_session=db_session,
+                    engine=engine,
+                )
+        assert exc_info.value.status_code == 403
@@ -0,0 +1,122 @@
+"""
+Tests for tag name autocomplete.
+
+Tests cover:
+- Case-insensitive prefix matches ranked by usage count
+- Incremental refresh after tags are added and deactivated
+- Account access validation
+"""
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.engine import Engine
+
+from common.service_connections.db_service.database.engine import (
+    get_database_session as session,
+)
+from common.service_connections.db_service.models import tag_autocomplete_model
+from common.service_connections.db_service.models.entity_tag_model import (
+    deactivate_entity_tag,
+)
+from common.service_connections.db_service.models.tag_autocomplete_model import (
+    TagAutocompleteIndex,
+    suggest_tag_names,
+)
+
+
+def _suggest(prefix, token, engine, **kwargs):
+    with session(engine) as db_session:
+        result = suggest_tag_names(
+            prefix=prefix,
+            account_id=token.account_id,
+            token=token,
+            db_session=db_session,
+            engine=engine,
+            fuzzy=False,
+            **kwargs,
+        )
+    return [(s.tag_name, s.usage_count) for s in result.suggestions]
+
+
+class TestTagAutocomplete:
+    """Test prefix suggestions from the in-memory tag index."""
+
+    @pytest.fixture(autouse=True)
+    def always_refresh(self, monkeypatch):
+        monkeypatch.setattr(tag_autocomplete_model, "_REFRESH_SECONDS", 0.0)
+        TagAutocompleteIndex.invalidate()
+        yield
+        TagAutocompleteIndex.invalidate()
+
+    def test_prefix_matches_ranked_by_usage(
+        self,
+        entity_tag_factory,
+        test_case_factory,
+        account_factory,
+        member_token,
+        engine: Engine,
+    ):
+        """Test matches are case-insensitive and most used first."""
+        account_id = account_factory()
+        for tag_name, uses in (("Smoke", 1), ("smoke-ui", 3), ("slow", 2)):
+            for _ in range(uses):
+                entity_tag_factory(
+                    "test_case",
+                    test_case_factory(account_id=account_id),
+                    tag_name,
+                    "labels",
+                    account_id=account_id,
+                )
+
+        assert _suggest("SM", member_token(account_id), engine) == [
+            ("smoke-ui", 3),
+            ("Smoke", 1),
+        ]
+        assert _suggest("s", member_token(account_id), engine, limit=2) == [
+            ("smoke-ui", 3),
+            ("slow", 2),
+        ]
+        assert _suggest("x", member_token(account_id), engine) == []
+
+    def test_incremental_refresh(
+        self,
+        entity_tag_factory,
+        test_case_factory,
+        account_factory,
+        auth_user_factory,
+        member_token,
+        engine: Engine,
+    ):
+        """Test new and deactivated tags are reflected without a rebuild."""
+        user_id = auth_user_factory()
+        account_id = account_factory(owner_user_id=user_id)
+        test_case_id = test_case_factory(account_id=account_id)
+        login_id = entity_tag_factory(
+            "test_case", test_case_id, "login", "feature", account_id=account_id
+        )
+        assert _suggest("lo", member_token(account_id), engine) == [("login", 1)]
+
+        entity_tag_factory(
+            "test_case", test_case_id, "logout", "feature", account_id=account_id
+        )
+        deactivate_entity_tag(
+            tag_id=login_id, deactivated_by_user_id=user_id, engine=engine
+        )
+
+        assert _suggest("lo", member_token(account_id), engine) == [("logout", 1)]
+
+    def test_other_account_rejected(
+        self, account_factory, member_token, engine: Engine
+    ):
+        """Test suggestions for another account are forbidden."""
+        account_id = account_factory()
+        with session(engine) as db_session:
+            with pytest.raises(HTTPException) as exc_info:
+                suggest_tag_names(
+                    prefix="sm",
+                    account_id=account_id,
+                    token=member_token("other-account"),
+                    db_session=db_session,
+                    engine=engine,
+                )
+        assert exc_info.value.status_code == 403
@@ -0,0 +1,163 @@
+"""
+Tests for test case duration history used by duration-aware sharding.
+
+Tests cover:
+- Bulk insert of duration samples
+- Median estimates over the most recent samples
+- Skipped runs excluded from estimates by default
+- Suite execution order lookup
+- Shard planning from database estimates
+"""
+
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy.engine import Engine
+
+from common.duration_sharding import ShardItem, plan_shards
+from common.service_connections.db_service.database.engine import (
+    get_database_session as session,
+)
+from common.service_connections.db_service.models.test_case_duration_model import (
+    TestCaseDurationModel,
+    insert_test_case_durations,
+    query_test_case_duration_estimates,
+    query_test_case_suite_orders,
+)
+
+
+class TestTestCaseDurationQueries:
+    """Test duration sample storage and estimates."""
+
+    def test_insert_test_case_durations(self, test_case_factory, engine: Engine):
+        """Test inserting several samples in one call."""
+        test_case_id = test_case_factory()
+
+        written = insert_test_case_durations(
+            [
+                TestCaseDurationModel(test_case_id=test_case_id, duration_seconds=1.5),
+                TestCaseDurationModel(test_case_id=test_case_id, duration_seconds=2.5),
+            ],
+            engine=engine,
+        )
+
+        assert written == 2
+
+    def test_insert_empty_list_is_noop(self, engine: Engine):
+        """Test that no statement is issued for an empty batch."""
+        assert insert_test_case_durations([], engine=engine) == 0
+
+    def test_estimate_uses_median_of_recent_window(
+        self, test_case_factory, engine: Engine
+    ):
+        """Test that only the latest samples feed the median."""
+        test_case_id = test_case_factory()
+        now = datetime.now(timezone.utc)
+        # One old outlier followed by three recent samples
+        samples = [(100.0, now - timedelta(days=10))] + [
+            (seconds, now - timedelta(minutes=index))
+            for index, seconds in enumerate([4.0, 6.0, 5.0])
+        ]
+        insert_test_case_durations(
+            [
+                TestCaseDurationModel(
+                    test_case_id=test_case_id,
+                    duration_seconds=seconds,
+                    recorded_at=recorded_at,
+                )
+                for seconds, recorded_at in samples
+            ],
+            engine=engine,
+        )
+
+        with session(engine) as db_session:
+            estimates = query_test_case_duration_estimates(
+                [test_case_id], session=db_session, engine=engine, sample_window=3
+            )
+
+        assert estimates == {test_case_id: 5.0}
+
+    def test_estimate_excludes_skipped_runs(self, test_case_factory, engine: Engine):
+        """Test that skipped runs do not drag estimates down."""
+        test_case_id = test_case_factory()
+        insert_test_case_durations(
+            [
+                TestCaseDurationModel(test_case_id=test_case_id, duration_seconds=10.0),
+                TestCaseDurationModel(
+                    test_case_id=test_case_id, duration_seconds=0.01, outcome="skipped"
+                ),
+            ],
+            engine=engine,
+        )
+
+        with session(engine) as db_session:
+            estimates = query_test_case_duration_estimates(
+                [test_case_id], session=db_session, engine=engine
+            )
+
+        assert estimates[test_case_id] == 10.0
+
+    def test_estimate_missing_history(self, test_case_factory, engine: Engine):
+        """Test that test cases without samples are absent from the estimates."""
+        test_case_id = test_case_factory()
+
+        with session(engine) as db_session:
+            estimates = query_test_case_duration_estimates(
+                [test_case_id], session=db_session, engine=engine
+            )
+
+        assert estimates == {}
+
+    def test_query_test_case_suite_orders(
+        self,
+        test_case_factory,
+        suite_factory,
+        suite_test_case_association_factory,
+        engine: Engine,
+    ):
+        """Test suite membership lookup returns execution order."""
+        suite_id = suite_factory()
+        first = test_case_factory()
+        second = test_case_factory()
+        suite_test_case_association_factory(suite_id, first, execution_order=0)
+        suite_test_case_association_factory(suite_id, second, execution_order=1)
+
+        with session(engine) as db_session:
+            rows = query_test_case_suite_orders(
+                [first, second], session=db_session, engine=engine
+            )
+
+        assert rows == [(first, suite_id, 0), (second, suite_id, 1)]
+
+
+class TestShardPlanning:
+    """Test bin-packing of duration estimates onto shards."""
+
+    def test_plan_balances_shards(self):
+        """Test LPT keeps the slowest shard close to the even split."""
+        items = [
+            ShardItem(key=f"test_{index}", estimated_seconds=seconds)
+            for index, seconds in enumerate([8, 7, 6, 5, 4, 3, 2, 1])
+        ]
+
+        plan = plan_shards(items, shard_count=2)
+
+        assert plan.total_seconds == 36
+        assert plan.makespan == 18
+
+    def test_ordered_suite_stays_on_one_shard(self):
+        """Test suites with an execution order are scheduled as one chain."""
+        items = [
+            ShardItem(
+                key=f"step_{order}",
+                estimated_seconds=1,
+                suite_id="suite",
+                execution_order=order,
+            )
+            for order in (2, 0, 1)
+        ] + [ShardItem(key="independent", estimated_seconds=3)]
+
+        plan = plan_shards(items, shard_count=2)
+
+        shard = plan.shards[plan.shard_of("step_0")]
+        assert shard == ["step_0", "step_1", "step_2"]
+        assert plan.shard_of("independent") != plan.shard_of("step_0")
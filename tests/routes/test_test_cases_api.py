@@ -5,6 +5,7 @@ Tests cover:
 - GET endpoints require member role
 - POST/PUT/DELETE endpoints require admin role
 - Account access validation for account-scoped endpoints
+- Conditional GET with ETag / If-None-Match
 """
 
 import pytest
@@ -12,6 +13,7 @@ from uuid import uuid4
 from fastapi.testclient import TestClient
 
 from app.fenrir_app import app
+from app.responses import ResponseCache
 from app.services.user_auth_service import get_user_auth_service
 from common.service_connections.db_service.database.engine import (
     get_database_session as session,
@@ -146,6 +148,81 @@ class TestTestCaseAuthorizationGET:
         assert response.status_code == 200
 
 
+class TestTestCaseConditionalGET:
+    """Test GETs carry validators and answer revalidation with 304."""
+
+    def test_if_none_match_returns_304_until_changed(
+        self, create_user_with_role, test_case_factory
+    ):
+        _, account_id, token = create_user_with_role(AccountRoleEnum.MEMBER)
+        test_case_factory(account_id=account_id)
+        url = f"/v1/api/test-cases/account/{account_id}"
+        headers = {"Authorization": f"Bearer {token}"}
+
+        first = client.get(url, headers=headers)
+        assert first.status_code == 200
+        etag = first.headers["ETag"]
+        assert first.headers["Last-Modified"]
+        assert first.headers["Cache-Control"] == "private, no-cache"
+
+        unchanged = client.get(url, headers={**headers, "If-None-Match": etag})
+        assert unchanged.status_code == 304
+        assert unchanged.headers["ETag"] == etag
+        assert unchanged.content == b""
+
+        hits = ResponseCache.hits
+        cached = client.get(url, headers=headers)
+        assert cached.status_code == 200
+        assert cached.content == first.content
+        assert ResponseCache.hits == hits + 1
+
+        test_case_factory(account_id=account_id)
+        changed = client.get(url, headers={**headers, "If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.headers["ETag"] != etag
+        assert len(changed.json()) == len(first.json()) + 1
+
+    def test_if_modified_since_returns_304(
+        self, create_user_with_role, test_case_factory
+    ):
+        _, account_id, token = create_user_with_role(AccountRoleEnum.MEMBER)
+        test_case_id = test_case_factory(account_id=account_id)
+        url = f"/v1/api/test-cases/{test_case_id}"
+        headers = {"Authorization": f"Bearer {token}"}
+
+        first = client.get(url, headers=headers)
+        assert first.status_code == 200
+        assert first.json()["test_case_id"] == test_case_id
+
+        response = client.get(
+            url,
+            headers={**headers, "If-Modified-Since": first.headers["Last-Modified"]},
+        )
+        assert response.status_code == 304
+
+    def test_missing_test_case_is_404_for_any_validator(
+        self, create_user_with_role, test_case_factory
+    ):
+        _, account_id, token = create_user_with_role(AccountRoleEnum.MEMBER)
+        test_case_id = test_case_factory(account_id=account_id)
+        headers = {"Authorization": f"Bearer {token}"}
+
+        existing = client.get(
+            f"/v1/api/test-cases/{test_case_id}",
+            headers={**headers, "If-None-Match": "*"},
+        )
+        assert existing.status_code == 304
+
+        url = f"/v1/api/test-cases/{uuid4()}"
+        missing = client.get(url, headers=headers)
+        assert missing.status_code == 404
+        for if_none_match in ("*", '"e3b0c44298fc1c14"'):
+            response = client.get(
+                url, headers={**headers, "If-None-Match": if_none_match}
+            )
+            assert response.status_code == 404
+
+
 class TestTestCaseAuthorizationPOST:
     """Test POST endpoints require admin role."""
 
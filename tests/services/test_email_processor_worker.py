@@ -0,0 +1,133 @@
+"""
+Tests for the concurrent email processor worker.
+
+Tests verify:
+- Sent items are marked processed with their file names in the claiming transaction
+- Failed items stay queued and are not reclaimed before the retry delay
+- Concurrent workers never send the same item twice
+"""
+
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from common.config import EmailWorkerConfig
+from common.service_connections.db_service.database.engine import (
+    get_database_session as session,
+)
+from common.service_connections.db_service.database.tables.email_processor import (
+    EmailProcessorTable,
+)
+from common.service_connections.db_service.db_manager import DB_ENGINE
+from common.service_connections.email_service.email_worker import (
+    EmailProcessorWorker,
+)
+
+
+@pytest.fixture
+def email_items():
+    """Create queued email items; returns their email_processor_ids."""
+    created = []
+
+    def _create(count=1):
+        with session(DB_ENGINE) as db_session:
+            rows = [
+                EmailProcessorTable(
+                    email_item_id=random.randint(10**8, 10**9),
+                    system="MINER_OCR",
+                    test_name="email worker test",
+                    requires_processing=True,
+                )
+                for _ in range(count)
+            ]
+            db_session.add_all(rows)
+            db_session.commit()
+            ids = [row.email_processor_id for row in rows]
+        created.extend(ids)
+        return ids
+
+    yield _create
+
+    with session(DB_ENGINE) as db_session:
+        db_session.query(EmailProcessorTable).filter(
+            EmailProcessorTable.email_processor_id.in_(created)
+        ).delete(synchronize_session=False)
+        db_session.commit()
+
+
+def _worker(send_item, batch_size=10, max_workers=4):
+    config = EmailWorkerConfig(
+        max_workers=max_workers, batch_size=batch_size, retry_after_seconds=300
+    )
+    return EmailProcessorWorker(DB_ENGINE, config=config, send_item=send_item)
+
+
+def _rows(ids):
+    with session(DB_ENGINE) as db_session:
+        return {
+            row.email_processor_id: (
+                row.requires_processing,
+                row.multi_item_email_ids,
+                row.last_processed_at,
+            )
+            for row in db_session.query(EmailProcessorTable).filter(
+                EmailProcessorTable.email_processor_id.in_(ids)
+            )
+        }
+
+
+class TestEmailProcessorWorker:
+    """Test batch claiming, result marking and concurrency."""
+
+    def test_marks_sent_and_failed_items(self, email_items):
+        """Test sent items are processed and failed items wait for a retry."""
+        ok_id, failing_id = email_items(2)
+
+        def send_item(item):
+            if item.email_processor_id == failing_id:
+                raise RuntimeError("SMTP unavailable")
+            return [f"AUTO-{item.email_item_id}.pdf"]
+
+        worker = _worker(send_item)
+        try:
+            result = worker.run_once()
+            retry = worker.run_once()
+        finally:
+            worker.close()
+
+        assert ok_id in result.sent and failing_id in result.failed
+        assert failing_id not in retry.sent + retry.failed
+        rows = _rows([ok_id, failing_id])
+        assert rows[ok_id][0] is False and rows[ok_id][1][0].startswith("AUTO-")
+        assert rows[failing_id][0] is True and rows[failing_id][2] is not None
+
+    def test_concurrent_workers_send_each_item_once(self, email_items):
+        """Test SKIP LOCKED hands every item to exactly one worker."""
+        ids = set(email_items(12))
+        sent = []
+        lock = threading.Lock()
+
+        def send_item(item):
+            time.sleep(0.05)
+            with lock:
+                sent.append(item.email_processor_id)
+            return ["file.pdf"]
+
+        workers = [_worker(send_item, batch_size=3) for _ in range(3)]
+
+        def drain(worker):
+            while worker.run_once().claimed:
+                pass
+
+        try:
+            with ThreadPoolExecutor(max_workers=len(workers)) as pool:
+                list(pool.map(drain, workers))
+        finally:
+            for worker in workers:
+                worker.close()
+
+        assert sorted(i for i in sent if i in ids) == sorted(ids)
+        assert all(not row[0] for row in _rows(list(ids)).values())